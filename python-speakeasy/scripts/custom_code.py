@@ -0,0 +1,180 @@
+"""Carries the hand-written code of tofupilot/v2 over SDK regenerations.
+
+`generate-sdk.sh` deletes tofupilot/v2 and generates it again from scratch in a
+temporary directory, where Speakeasy's persistentEdits and custom code regions
+can't see our changes. The files listed in `custom-code.txt` are carried over
+by this script instead:
+
+- `keep` files are hand-written and copied back as they are.
+- `merge` files are generated files edited by hand. Our edits are replayed on
+  the new output with a 3-way merge (`git merge-file`), the base being the
+  previous generator output kept in python-speakeasy/src/tofupilot/v2.
+
+The `serialize_model` methods of the generated models are rewritten to call
+`tofupilot.v2.types.serialize_fields` (see `apply-serializer-plans`), so the
+models don't need to be listed.
+
+    python3 python-speakeasy/scripts/custom_code.py check tofupilot/v2 python-speakeasy/src/tofupilot/v2
+    python3 python-speakeasy/scripts/custom_code.py apply-serializer-plans tofupilot/v2
+    python3 python-speakeasy/scripts/custom_code.py restore BACKUP OLD_BASE tofupilot/v2
+"""
+
+import filecmp
+import re
+import shutil
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+from typing import Dict, List
+
+MANIFEST = Path(__file__).with_name("custom-code.txt")
+
+_SERIALIZER_BODY = re.compile(
+    r"\n        m = \{\}\n\n        for n, f in type\(self\)\.model_fields\.items\(\):\n"
+    r".*?\n        return m\n",
+    re.DOTALL,
+)
+_SERIALIZER_CALL = (
+    "\n        return serialize_fields(\n"
+    "            self, serialized, optional_fields, nullable_fields, null_default_fields\n"
+    "        )\n"
+)
+_FIELD_LIST = re.compile(
+    r"^(        (?:optional|nullable|null_default)_fields = )\[(.*?)\]$",
+    re.DOTALL | re.MULTILINE,
+)
+
+
+def _read_manifest() -> Dict[str, str]:
+    """Returns the mode (`keep` or `merge`) of every listed path."""
+    modes = {}
+    for line in MANIFEST.read_text().splitlines():
+        line = line.split("#", 1)[0].strip()
+        if line:
+            mode, path = line.split()
+            if mode not in ("keep", "merge"):
+                raise ValueError(f"Unknown mode {mode!r} in {MANIFEST}")
+            modes[path] = mode
+    return modes
+
+
+def _as_tuple(match: "re.Match[str]") -> str:
+    items = match.group(2)
+    if items and "\n" not in items and "," not in items:
+        items += ","
+    return f"{match.group(1)}({items})"
+
+
+def serializer_plans(source: str) -> str:
+    """Rewrites the generated `serialize_model` bodies of a module into `serialize_fields` calls."""
+    if "def serialize_model(self, handler):" not in source:
+        return source
+    source = _SERIALIZER_BODY.sub(_SERIALIZER_CALL, source)
+    source = _FIELD_LIST.sub(_as_tuple, source)
+    source = source.replace("    UNSET_SENTINEL,\n", "    serialize_fields,\n")
+    return re.sub(
+        r"^(from tofupilot\.v2\.types import .*)UNSET_SENTINEL$",
+        r"\1serialize_fields",
+        source,
+        flags=re.MULTILINE,
+    )
+
+
+def apply_serializer_plans(v2: Path) -> None:
+    for path in sorted((v2 / "models").glob("*.py")):
+        source = path.read_text()
+        rewritten = serializer_plans(source)
+        if rewritten != source:
+            path.write_text(rewritten)
+
+
+def _files(root: Path) -> List[str]:
+    return sorted(
+        str(path.relative_to(root))
+        for path in root.rglob("*")
+        if path.is_file() and "__pycache__" not in path.parts
+    )
+
+
+def _generated(base: Path, path: str) -> str:
+    return serializer_plans((base / path).read_text())
+
+
+def check(v2: Path, base: Path) -> int:
+    """Fails if a file of `v2` differs from the generator output without being listed."""
+    modes = _read_manifest()
+    errors = []
+    for path in _files(v2):
+        mode = modes.get(path)
+        if not (base / path).exists():
+            if mode != "keep":
+                errors.append(f"{path}: hand-written, list it as `keep`")
+        elif _generated(base, path) != (v2 / path).read_text():
+            if mode is None:
+                errors.append(f"{path}: edited generated file, list it as `merge`")
+    for path in sorted(modes):
+        if not (v2 / path).exists():
+            errors.append(f"{path}: listed but missing")
+    for error in errors:
+        print(f"❌ {error}", file=sys.stderr)
+    if errors:
+        print(f"Update {MANIFEST} before regenerating, or these changes are lost.", file=sys.stderr)
+    return 1 if errors else 0
+
+
+def restore(backup: Path, old_base: Path, v2: Path) -> int:
+    """Copies the `keep` files of `backup` into `v2` and merges its `merge` files."""
+    conflicts = []
+    with tempfile.TemporaryDirectory() as tmp:
+        for path, mode in sorted(_read_manifest().items()):
+            target = v2 / path
+            target.parent.mkdir(parents=True, exist_ok=True)
+            if mode == "keep":
+                shutil.copyfile(backup / path, target)
+                continue
+            if not target.exists():
+                conflicts.append(f"{path}: no longer generated")
+                shutil.copyfile(backup / path, target)
+                continue
+            base = Path(tmp) / "base"
+            base.write_text(_generated(old_base, path))
+            if filecmp.cmp(base, target, shallow=False):
+                # The generator output didn't change, keep our version as is
+                shutil.copyfile(backup / path, target)
+                continue
+            ours = Path(tmp) / "ours"
+            shutil.copyfile(backup / path, ours)
+            result = subprocess.run(
+                [
+                    "git", "merge-file", "-p",
+                    "-L", "hand-written", "-L", "previous generation", "-L", "new generation",
+                    str(ours), str(base), str(target),
+                ],
+                capture_output=True,
+                text=True,
+            )
+            if result.returncode < 0 or result.returncode > 127:
+                raise RuntimeError(result.stderr)
+            target.write_text(result.stdout)
+            if result.returncode:
+                conflicts.append(f"{path}: {result.returncode} conflict(s)")
+    for conflict in conflicts:
+        print(f"❌ {conflict}", file=sys.stderr)
+    return 1 if conflicts else 0
+
+
+def main(argv: List[str]) -> int:
+    command, *args = argv
+    if command == "check":
+        return check(Path(args[0]), Path(args[1]))
+    if command == "apply-serializer-plans":
+        apply_serializer_plans(Path(args[0]))
+        return 0
+    if command == "restore":
+        return restore(Path(args[0]), Path(args[1]), Path(args[2]))
+    raise SystemExit(f"Unknown command {command!r}")
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
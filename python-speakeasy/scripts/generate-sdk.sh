@@ -31,6 +31,18 @@ else
     INIT_BACKUP_EXISTS=false
 fi
 
+# Backup every other hand-written v2 file, and the output of the previous
+# generation they are merged against (see python-speakeasy/scripts/custom-code.txt)
+if [ -d "tofupilot/v2" ]; then
+    python3 python-speakeasy/scripts/custom_code.py check tofupilot/v2 python-speakeasy/src/tofupilot/v2
+    rm -rf /tmp/v2-custom.backup /tmp/v2-base.backup
+    cp -r tofupilot/v2 /tmp/v2-custom.backup
+    cp -r python-speakeasy/src/tofupilot/v2 /tmp/v2-base.backup
+    CUSTOM_BACKUP_EXISTS=true
+else
+    CUSTOM_BACKUP_EXISTS=false
+fi
+
 # Backup README.md (Speakeasy overwrites it with auto-generated content)
 cp README.md /tmp/root-readme.backup
 
@@ -131,8 +143,14 @@ cd ..
 
 # Step 5: Move generated SDK to final location
 echo "📁 Moving generated SDK..."
+# The pristine output is the base hand-written edits are merged against next time
+rm -rf python-speakeasy/src/tofupilot/v2
+cp -r .tmp/src/tofupilot/v2 python-speakeasy/src/tofupilot/v2
 mv .tmp/src/tofupilot/v2 tofupilot/v2
 
+# Make the generated models call types.serialize_fields
+python3 python-speakeasy/scripts/custom_code.py apply-serializer-plans tofupilot/v2
+
 # Step 6: Clean up temp directory
 rm -rf .tmp
 
@@ -228,6 +246,15 @@ __all__ = [
 EOF
 fi
 
+# Restore the hand-written v2 files and merge the edits of generated ones
+CUSTOM_CODE_MERGED=true
+if [ "$CUSTOM_BACKUP_EXISTS" = true ]; then
+    echo "📦 Restoring hand-written v2 code..."
+    python3 python-speakeasy/scripts/custom_code.py restore /tmp/v2-custom.backup /tmp/v2-base.backup tofupilot/v2 \
+        || CUSTOM_CODE_MERGED=false
+    rm -rf /tmp/v2-custom.backup /tmp/v2-base.backup
+fi
+
 # Restore README.md (prevents Speakeasy from replacing our custom README)
 echo "📦 Restoring README.md..."
 cp /tmp/root-readme.backup README.md
@@ -238,4 +265,9 @@ echo "📦 Restoring root pyproject.toml..."
 cp /tmp/root-pyproject.toml.backup pyproject.toml
 rm /tmp/root-pyproject.toml.backup
 
+if [ "$CUSTOM_CODE_MERGED" = false ]; then
+    echo "❌ Hand-written edits conflict with the new generation, resolve the conflict markers in the files above"
+    exit 1
+fi
+
 echo "✅ SDK generation complete with error tracking preserved!"
@@ -1,6 +1,7 @@
 """Code generated by Speakeasy (https://speakeasy.com). DO NOT EDIT."""
 
 from .basesdk import BaseSDK
+from datetime import datetime
 from tofupilot.v2 import errors, models, utils
 from tofupilot.v2._hooks import HookContext
 from tofupilot.v2.types import OptionalNullable, UNSET
@@ -637,8 +638,8 @@ class Batches(BaseSDK):
         *,
         ids: Optional[List[str]] = None,
         numbers: Optional[List[str]] = None,
-        created_after: Optional[str] = None,
-        created_before: Optional[str] = None,
+        created_after: Optional[datetime] = None,
+        created_before: Optional[datetime] = None,
         limit: Optional[int] = 50,
         cursor: Optional[int] = None,
         search_query: Optional[str] = None,
@@ -766,8 +767,8 @@ class Batches(BaseSDK):
         *,
         ids: Optional[List[str]] = None,
         numbers: Optional[List[str]] = None,
-        created_after: Optional[str] = None,
-        created_before: Optional[str] = None,
+        created_after: Optional[datetime] = None,
+        created_before: Optional[datetime] = None,
         limit: Optional[int] = 50,
         cursor: Optional[int] = None,
         search_query: Optional[str] = None,
@@ -12,8 +12,6 @@ if TYPE_CHECKING:
     )
     from .attachment_finalizeop import (
         AttachmentFinalizeRequest,
-        AttachmentFinalizeRequestBody,
-        AttachmentFinalizeRequestBodyTypedDict,
         AttachmentFinalizeRequestTypedDict,
         AttachmentFinalizeResponse,
         AttachmentFinalizeResponseTypedDict,
@@ -257,18 +255,14 @@ if TYPE_CHECKING:
         ProcedureUpdateResponseTypedDict,
     )
     from .run_createop import (
-        Measurements,
-        MeasurementsAggregationsOutcome,
-        MeasurementsAggregationsValidatorsOutcome,
-        MeasurementsOutcome,
-        MeasurementsTypedDict,
-        MeasurementsValidatorsOutcome,
-        RunCreateAggregations,
-        RunCreateAggregationsExpectedValue,
-        RunCreateAggregationsExpectedValueTypedDict,
-        RunCreateAggregationsTypedDict,
-        RunCreateAggregationsValidators,
-        RunCreateAggregationsValidatorsTypedDict,
+        RunCreateAggregation,
+        RunCreateAggregationExpectedValue,
+        RunCreateAggregationExpectedValueTypedDict,
+        RunCreateAggregationOutcome,
+        RunCreateAggregationTypedDict,
+        RunCreateAggregationValidator,
+        RunCreateAggregationValidatorOutcome,
+        RunCreateAggregationValidatorTypedDict,
         RunCreateExpectedValue,
         RunCreateExpectedValueTypedDict,
         RunCreateLevel,
@@ -278,6 +272,9 @@ if TYPE_CHECKING:
         RunCreateMeasuredValue1TypedDict,
         RunCreateMeasuredValue2,
         RunCreateMeasuredValue2TypedDict,
+        RunCreateMeasurement,
+        RunCreateMeasurementOutcome,
+        RunCreateMeasurementTypedDict,
         RunCreateOutcome,
         RunCreatePhase,
         RunCreatePhaseOutcome,
@@ -288,46 +285,45 @@ if TYPE_CHECKING:
         RunCreateResponseTypedDict,
         RunCreateUnits,
         RunCreateUnitsTypedDict,
-        RunCreateValidators,
-        RunCreateValidatorsTypedDict,
+        RunCreateValidator,
+        RunCreateValidatorOutcome,
+        RunCreateValidatorTypedDict,
         RunCreateValue,
         RunCreateValueTypedDict,
-        Validators,
-        ValidatorsTypedDict,
         XAxis,
-        XAxisAggregations,
-        XAxisAggregationsExpectedValue,
-        XAxisAggregationsExpectedValueTypedDict,
-        XAxisAggregationsOutcome,
-        XAxisAggregationsTypedDict,
-        XAxisAggregationsValidators,
-        XAxisAggregationsValidatorsOutcome,
-        XAxisAggregationsValidatorsTypedDict,
+        XAxisAggregation,
+        XAxisAggregationExpectedValue,
+        XAxisAggregationExpectedValueTypedDict,
+        XAxisAggregationOutcome,
+        XAxisAggregationTypedDict,
+        XAxisAggregationValidator,
+        XAxisAggregationValidatorOutcome,
+        XAxisAggregationValidatorTypedDict,
         XAxisExpectedValue,
         XAxisExpectedValueTypedDict,
         XAxisTypedDict,
-        XAxisValidators,
-        XAxisValidatorsOutcome,
-        XAxisValidatorsTypedDict,
+        XAxisValidator,
+        XAxisValidatorOutcome,
+        XAxisValidatorTypedDict,
         XAxisValue,
         XAxisValueTypedDict,
-        YAxis,
-        YAxisAggregations,
-        YAxisAggregationsExpectedValue,
-        YAxisAggregationsExpectedValueTypedDict,
-        YAxisAggregationsOutcome,
-        YAxisAggregationsTypedDict,
-        YAxisAggregationsValidators,
-        YAxisAggregationsValidatorsOutcome,
-        YAxisAggregationsValidatorsTypedDict,
-        YAxisExpectedValue,
-        YAxisExpectedValueTypedDict,
-        YAxisTypedDict,
-        YAxisValidators,
-        YAxisValidatorsOutcome,
-        YAxisValidatorsTypedDict,
-        YAxisValue,
-        YAxisValueTypedDict,
+        YAxi,
+        YAxiAggregation,
+        YAxiAggregationExpectedValue,
+        YAxiAggregationExpectedValueTypedDict,
+        YAxiAggregationOutcome,
+        YAxiAggregationTypedDict,
+        YAxiAggregationValidator,
+        YAxiAggregationValidatorOutcome,
+        YAxiAggregationValidatorTypedDict,
+        YAxiExpectedValue,
+        YAxiExpectedValueTypedDict,
+        YAxiTypedDict,
+        YAxiValidator,
+        YAxiValidatorOutcome,
+        YAxiValidatorTypedDict,
+        YAxiValue,
+        YAxiValueTypedDict,
     )
     from .run_deleteop import (
         RunDeleteRequest,
@@ -336,33 +332,31 @@ if TYPE_CHECKING:
         RunDeleteResponseTypedDict,
     )
     from .run_getop import (
-        AggregationsDataSeryExpectedValue,
-        AggregationsDataSeryExpectedValueTypedDict,
-        AggregationsDataSeryOutcome,
-        AggregationsDataSeryValidators,
-        AggregationsDataSeryValidatorsTypedDict,
-        AggregationsMeasurementOutcome,
-        AggregationsValidatorsDataSeryOutcome,
-        AggregationsValidatorsMeasurementOutcome,
         DataSery,
-        DataSeryAggregations,
-        DataSeryAggregationsTypedDict,
+        DataSeryAggregation,
+        DataSeryAggregationExpectedValue,
+        DataSeryAggregationExpectedValueTypedDict,
+        DataSeryAggregationOutcome,
+        DataSeryAggregationTypedDict,
+        DataSeryAggregationValidator,
+        DataSeryAggregationValidatorOutcome,
+        DataSeryAggregationValidatorTypedDict,
         DataSeryExpectedValue,
         DataSeryExpectedValueTypedDict,
         DataSeryTypedDict,
-        DataSeryValidators,
-        DataSeryValidatorsTypedDict,
+        DataSeryValidator,
+        DataSeryValidatorOutcome,
+        DataSeryValidatorTypedDict,
         DataSeryValue,
         DataSeryValueTypedDict,
-        Measurement,
-        MeasurementOutcome,
-        MeasurementTypedDict,
-        RunGetAggregations,
-        RunGetAggregationsExpectedValue,
-        RunGetAggregationsExpectedValueTypedDict,
-        RunGetAggregationsTypedDict,
-        RunGetAggregationsValidators,
-        RunGetAggregationsValidatorsTypedDict,
+        RunGetAggregation,
+        RunGetAggregationExpectedValue,
+        RunGetAggregationExpectedValueTypedDict,
+        RunGetAggregationOutcome,
+        RunGetAggregationTypedDict,
+        RunGetAggregationValidator,
+        RunGetAggregationValidatorOutcome,
+        RunGetAggregationValidatorTypedDict,
         RunGetAttachment,
         RunGetAttachmentTypedDict,
         RunGetBatch,
@@ -378,6 +372,9 @@ if TYPE_CHECKING:
         RunGetLogTypedDict,
         RunGetMeasuredValue,
         RunGetMeasuredValueTypedDict,
+        RunGetMeasurement,
+        RunGetMeasurementOutcome,
+        RunGetMeasurementTypedDict,
         RunGetOperatedBy,
         RunGetOperatedByTypedDict,
         RunGetOutcome,
@@ -396,16 +393,15 @@ if TYPE_CHECKING:
         RunGetRevisionTypedDict,
         RunGetUnit,
         RunGetUnitTypedDict,
-        RunGetValidators,
-        RunGetValidatorsTypedDict,
+        RunGetValidator,
+        RunGetValidatorOutcome,
+        RunGetValidatorTypedDict,
         RunGetValue,
         RunGetValueTypedDict,
         RunGetVersion,
         RunGetVersionTypedDict,
         SubUnit,
         SubUnitTypedDict,
-        ValidatorsDataSeryOutcome,
-        ValidatorsMeasurementOutcome,
     )
     from .run_listop import (
         RunListBatch,
@@ -625,21 +621,11 @@ if TYPE_CHECKING:
     )
 
 __all__ = [
-    "AggregationsDataSeryExpectedValue",
-    "AggregationsDataSeryExpectedValueTypedDict",
-    "AggregationsDataSeryOutcome",
-    "AggregationsDataSeryValidators",
-    "AggregationsDataSeryValidatorsTypedDict",
-    "AggregationsMeasurementOutcome",
-    "AggregationsValidatorsDataSeryOutcome",
-    "AggregationsValidatorsMeasurementOutcome",
     "AttachmentDeleteRequest",
     "AttachmentDeleteRequestTypedDict",
     "AttachmentDeleteResponse",
     "AttachmentDeleteResponseTypedDict",
     "AttachmentFinalizeRequest",
-    "AttachmentFinalizeRequestBody",
-    "AttachmentFinalizeRequestBodyTypedDict",
     "AttachmentFinalizeRequestTypedDict",
     "AttachmentFinalizeResponse",
     "AttachmentFinalizeResponseTypedDict",
@@ -696,13 +682,20 @@ __all__ = [
     "CreatedDuring",
     "CreatedDuringTypedDict",
     "DataSery",
-    "DataSeryAggregations",
-    "DataSeryAggregationsTypedDict",
+    "DataSeryAggregation",
+    "DataSeryAggregationExpectedValue",
+    "DataSeryAggregationExpectedValueTypedDict",
+    "DataSeryAggregationOutcome",
+    "DataSeryAggregationTypedDict",
+    "DataSeryAggregationValidator",
+    "DataSeryAggregationValidatorOutcome",
+    "DataSeryAggregationValidatorTypedDict",
     "DataSeryExpectedValue",
     "DataSeryExpectedValueTypedDict",
     "DataSeryTypedDict",
-    "DataSeryValidators",
-    "DataSeryValidatorsTypedDict",
+    "DataSeryValidator",
+    "DataSeryValidatorOutcome",
+    "DataSeryValidatorTypedDict",
     "DataSeryValue",
     "DataSeryValueTypedDict",
     "ErrorBADGATEWAYIssue",
@@ -726,15 +719,6 @@ __all__ = [
     "LastRunTypedDict",
     "LinkedRepository",
     "LinkedRepositoryTypedDict",
-    "Measurement",
-    "MeasurementOutcome",
-    "MeasurementTypedDict",
-    "Measurements",
-    "MeasurementsAggregationsOutcome",
-    "MeasurementsAggregationsValidatorsOutcome",
-    "MeasurementsOutcome",
-    "MeasurementsTypedDict",
-    "MeasurementsValidatorsOutcome",
     "ParentPart",
     "ParentPartTypedDict",
     "ParentRevision",
@@ -863,12 +847,14 @@ __all__ = [
     "RecentRun",
     "RecentRunTypedDict",
     "Run",
-    "RunCreateAggregations",
-    "RunCreateAggregationsExpectedValue",
-    "RunCreateAggregationsExpectedValueTypedDict",
-    "RunCreateAggregationsTypedDict",
-    "RunCreateAggregationsValidators",
-    "RunCreateAggregationsValidatorsTypedDict",
+    "RunCreateAggregation",
+    "RunCreateAggregationExpectedValue",
+    "RunCreateAggregationExpectedValueTypedDict",
+    "RunCreateAggregationOutcome",
+    "RunCreateAggregationTypedDict",
+    "RunCreateAggregationValidator",
+    "RunCreateAggregationValidatorOutcome",
+    "RunCreateAggregationValidatorTypedDict",
     "RunCreateExpectedValue",
     "RunCreateExpectedValueTypedDict",
     "RunCreateLevel",
@@ -878,6 +864,9 @@ __all__ = [
     "RunCreateMeasuredValue1TypedDict",
     "RunCreateMeasuredValue2",
     "RunCreateMeasuredValue2TypedDict",
+    "RunCreateMeasurement",
+    "RunCreateMeasurementOutcome",
+    "RunCreateMeasurementTypedDict",
     "RunCreateOutcome",
     "RunCreatePhase",
     "RunCreatePhaseOutcome",
@@ -888,20 +877,23 @@ __all__ = [
     "RunCreateResponseTypedDict",
     "RunCreateUnits",
     "RunCreateUnitsTypedDict",
-    "RunCreateValidators",
-    "RunCreateValidatorsTypedDict",
+    "RunCreateValidator",
+    "RunCreateValidatorOutcome",
+    "RunCreateValidatorTypedDict",
     "RunCreateValue",
     "RunCreateValueTypedDict",
     "RunDeleteRequest",
     "RunDeleteRequestTypedDict",
     "RunDeleteResponse",
     "RunDeleteResponseTypedDict",
-    "RunGetAggregations",
-    "RunGetAggregationsExpectedValue",
-    "RunGetAggregationsExpectedValueTypedDict",
-    "RunGetAggregationsTypedDict",
-    "RunGetAggregationsValidators",
-    "RunGetAggregationsValidatorsTypedDict",
+    "RunGetAggregation",
+    "RunGetAggregationExpectedValue",
+    "RunGetAggregationExpectedValueTypedDict",
+    "RunGetAggregationOutcome",
+    "RunGetAggregationTypedDict",
+    "RunGetAggregationValidator",
+    "RunGetAggregationValidatorOutcome",
+    "RunGetAggregationValidatorTypedDict",
     "RunGetAttachment",
     "RunGetAttachmentTypedDict",
     "RunGetBatch",
@@ -917,6 +909,9 @@ __all__ = [
     "RunGetLogTypedDict",
     "RunGetMeasuredValue",
     "RunGetMeasuredValueTypedDict",
+    "RunGetMeasurement",
+    "RunGetMeasurementOutcome",
+    "RunGetMeasurementTypedDict",
     "RunGetOperatedBy",
     "RunGetOperatedByTypedDict",
     "RunGetOutcome",
@@ -935,8 +930,9 @@ __all__ = [
     "RunGetRevisionTypedDict",
     "RunGetUnit",
     "RunGetUnitTypedDict",
-    "RunGetValidators",
-    "RunGetValidatorsTypedDict",
+    "RunGetValidator",
+    "RunGetValidatorOutcome",
+    "RunGetValidatorTypedDict",
     "RunGetValue",
     "RunGetValueTypedDict",
     "RunGetVersion",
@@ -1118,44 +1114,40 @@ __all__ = [
     "UserListRequestTypedDict",
     "UserListResponse",
     "UserListResponseTypedDict",
-    "Validators",
-    "ValidatorsDataSeryOutcome",
-    "ValidatorsMeasurementOutcome",
-    "ValidatorsTypedDict",
     "XAxis",
-    "XAxisAggregations",
-    "XAxisAggregationsExpectedValue",
-    "XAxisAggregationsExpectedValueTypedDict",
-    "XAxisAggregationsOutcome",
-    "XAxisAggregationsTypedDict",
-    "XAxisAggregationsValidators",
-    "XAxisAggregationsValidatorsOutcome",
-    "XAxisAggregationsValidatorsTypedDict",
+    "XAxisAggregation",
+    "XAxisAggregationExpectedValue",
+    "XAxisAggregationExpectedValueTypedDict",
+    "XAxisAggregationOutcome",
+    "XAxisAggregationTypedDict",
+    "XAxisAggregationValidator",
+    "XAxisAggregationValidatorOutcome",
+    "XAxisAggregationValidatorTypedDict",
     "XAxisExpectedValue",
     "XAxisExpectedValueTypedDict",
     "XAxisTypedDict",
-    "XAxisValidators",
-    "XAxisValidatorsOutcome",
-    "XAxisValidatorsTypedDict",
+    "XAxisValidator",
+    "XAxisValidatorOutcome",
+    "XAxisValidatorTypedDict",
     "XAxisValue",
     "XAxisValueTypedDict",
-    "YAxis",
-    "YAxisAggregations",
-    "YAxisAggregationsExpectedValue",
-    "YAxisAggregationsExpectedValueTypedDict",
-    "YAxisAggregationsOutcome",
-    "YAxisAggregationsTypedDict",
-    "YAxisAggregationsValidators",
-    "YAxisAggregationsValidatorsOutcome",
-    "YAxisAggregationsValidatorsTypedDict",
-    "YAxisExpectedValue",
-    "YAxisExpectedValueTypedDict",
-    "YAxisTypedDict",
-    "YAxisValidators",
-    "YAxisValidatorsOutcome",
-    "YAxisValidatorsTypedDict",
-    "YAxisValue",
-    "YAxisValueTypedDict",
+    "YAxi",
+    "YAxiAggregation",
+    "YAxiAggregationExpectedValue",
+    "YAxiAggregationExpectedValueTypedDict",
+    "YAxiAggregationOutcome",
+    "YAxiAggregationTypedDict",
+    "YAxiAggregationValidator",
+    "YAxiAggregationValidatorOutcome",
+    "YAxiAggregationValidatorTypedDict",
+    "YAxiExpectedValue",
+    "YAxiExpectedValueTypedDict",
+    "YAxiTypedDict",
+    "YAxiValidator",
+    "YAxiValidatorOutcome",
+    "YAxiValidatorTypedDict",
+    "YAxiValue",
+    "YAxiValueTypedDict",
 ]
 
 _dynamic_imports: dict[str, str] = {
@@ -1164,8 +1156,6 @@ _dynamic_imports: dict[str, str] = {
     "AttachmentDeleteResponse": ".attachment_deleteop",
     "AttachmentDeleteResponseTypedDict": ".attachment_deleteop",
     "AttachmentFinalizeRequest": ".attachment_finalizeop",
-    "AttachmentFinalizeRequestBody": ".attachment_finalizeop",
-    "AttachmentFinalizeRequestBodyTypedDict": ".attachment_finalizeop",
     "AttachmentFinalizeRequestTypedDict": ".attachment_finalizeop",
     "AttachmentFinalizeResponse": ".attachment_finalizeop",
     "AttachmentFinalizeResponseTypedDict": ".attachment_finalizeop",
@@ -1360,18 +1350,14 @@ _dynamic_imports: dict[str, str] = {
     "ProcedureUpdateRequestTypedDict": ".procedure_updateop",
     "ProcedureUpdateResponse": ".procedure_updateop",
     "ProcedureUpdateResponseTypedDict": ".procedure_updateop",
-    "Measurements": ".run_createop",
-    "MeasurementsAggregationsOutcome": ".run_createop",
-    "MeasurementsAggregationsValidatorsOutcome": ".run_createop",
-    "MeasurementsOutcome": ".run_createop",
-    "MeasurementsTypedDict": ".run_createop",
-    "MeasurementsValidatorsOutcome": ".run_createop",
-    "RunCreateAggregations": ".run_createop",
-    "RunCreateAggregationsExpectedValue": ".run_createop",
-    "RunCreateAggregationsExpectedValueTypedDict": ".run_createop",
-    "RunCreateAggregationsTypedDict": ".run_createop",
-    "RunCreateAggregationsValidators": ".run_createop",
-    "RunCreateAggregationsValidatorsTypedDict": ".run_createop",
+    "RunCreateAggregation": ".run_createop",
+    "RunCreateAggregationExpectedValue": ".run_createop",
+    "RunCreateAggregationExpectedValueTypedDict": ".run_createop",
+    "RunCreateAggregationOutcome": ".run_createop",
+    "RunCreateAggregationTypedDict": ".run_createop",
+    "RunCreateAggregationValidator": ".run_createop",
+    "RunCreateAggregationValidatorOutcome": ".run_createop",
+    "RunCreateAggregationValidatorTypedDict": ".run_createop",
     "RunCreateExpectedValue": ".run_createop",
     "RunCreateExpectedValueTypedDict": ".run_createop",
     "RunCreateLevel": ".run_createop",
@@ -1381,6 +1367,9 @@ _dynamic_imports: dict[str, str] = {
     "RunCreateMeasuredValue1TypedDict": ".run_createop",
     "RunCreateMeasuredValue2": ".run_createop",
     "RunCreateMeasuredValue2TypedDict": ".run_createop",
+    "RunCreateMeasurement": ".run_createop",
+    "RunCreateMeasurementOutcome": ".run_createop",
+    "RunCreateMeasurementTypedDict": ".run_createop",
     "RunCreateOutcome": ".run_createop",
     "RunCreatePhase": ".run_createop",
     "RunCreatePhaseOutcome": ".run_createop",
@@ -1391,77 +1380,74 @@ _dynamic_imports: dict[str, str] = {
     "RunCreateResponseTypedDict": ".run_createop",
     "RunCreateUnits": ".run_createop",
     "RunCreateUnitsTypedDict": ".run_createop",
-    "RunCreateValidators": ".run_createop",
-    "RunCreateValidatorsTypedDict": ".run_createop",
+    "RunCreateValidator": ".run_createop",
+    "RunCreateValidatorOutcome": ".run_createop",
+    "RunCreateValidatorTypedDict": ".run_createop",
     "RunCreateValue": ".run_createop",
     "RunCreateValueTypedDict": ".run_createop",
-    "Validators": ".run_createop",
-    "ValidatorsTypedDict": ".run_createop",
     "XAxis": ".run_createop",
-    "XAxisAggregations": ".run_createop",
-    "XAxisAggregationsExpectedValue": ".run_createop",
-    "XAxisAggregationsExpectedValueTypedDict": ".run_createop",
-    "XAxisAggregationsOutcome": ".run_createop",
-    "XAxisAggregationsTypedDict": ".run_createop",
-    "XAxisAggregationsValidators": ".run_createop",
-    "XAxisAggregationsValidatorsOutcome": ".run_createop",
-    "XAxisAggregationsValidatorsTypedDict": ".run_createop",
+    "XAxisAggregation": ".run_createop",
+    "XAxisAggregationExpectedValue": ".run_createop",
+    "XAxisAggregationExpectedValueTypedDict": ".run_createop",
+    "XAxisAggregationOutcome": ".run_createop",
+    "XAxisAggregationTypedDict": ".run_createop",
+    "XAxisAggregationValidator": ".run_createop",
+    "XAxisAggregationValidatorOutcome": ".run_createop",
+    "XAxisAggregationValidatorTypedDict": ".run_createop",
     "XAxisExpectedValue": ".run_createop",
     "XAxisExpectedValueTypedDict": ".run_createop",
     "XAxisTypedDict": ".run_createop",
-    "XAxisValidators": ".run_createop",
-    "XAxisValidatorsOutcome": ".run_createop",
-    "XAxisValidatorsTypedDict": ".run_createop",
+    "XAxisValidator": ".run_createop",
+    "XAxisValidatorOutcome": ".run_createop",
+    "XAxisValidatorTypedDict": ".run_createop",
     "XAxisValue": ".run_createop",
     "XAxisValueTypedDict": ".run_createop",
-    "YAxis": ".run_createop",
-    "YAxisAggregations": ".run_createop",
-    "YAxisAggregationsExpectedValue": ".run_createop",
-    "YAxisAggregationsExpectedValueTypedDict": ".run_createop",
-    "YAxisAggregationsOutcome": ".run_createop",
-    "YAxisAggregationsTypedDict": ".run_createop",
-    "YAxisAggregationsValidators": ".run_createop",
-    "YAxisAggregationsValidatorsOutcome": ".run_createop",
-    "YAxisAggregationsValidatorsTypedDict": ".run_createop",
-    "YAxisExpectedValue": ".run_createop",
-    "YAxisExpectedValueTypedDict": ".run_createop",
-    "YAxisTypedDict": ".run_createop",
-    "YAxisValidators": ".run_createop",
-    "YAxisValidatorsOutcome": ".run_createop",
-    "YAxisValidatorsTypedDict": ".run_createop",
-    "YAxisValue": ".run_createop",
-    "YAxisValueTypedDict": ".run_createop",
+    "YAxi": ".run_createop",
+    "YAxiAggregation": ".run_createop",
+    "YAxiAggregationExpectedValue": ".run_createop",
+    "YAxiAggregationExpectedValueTypedDict": ".run_createop",
+    "YAxiAggregationOutcome": ".run_createop",
+    "YAxiAggregationTypedDict": ".run_createop",
+    "YAxiAggregationValidator": ".run_createop",
+    "YAxiAggregationValidatorOutcome": ".run_createop",
+    "YAxiAggregationValidatorTypedDict": ".run_createop",
+    "YAxiExpectedValue": ".run_createop",
+    "YAxiExpectedValueTypedDict": ".run_createop",
+    "YAxiTypedDict": ".run_createop",
+    "YAxiValidator": ".run_createop",
+    "YAxiValidatorOutcome": ".run_createop",
+    "YAxiValidatorTypedDict": ".run_createop",
+    "YAxiValue": ".run_createop",
+    "YAxiValueTypedDict": ".run_createop",
     "RunDeleteRequest": ".run_deleteop",
     "RunDeleteRequestTypedDict": ".run_deleteop",
     "RunDeleteResponse": ".run_deleteop",
     "RunDeleteResponseTypedDict": ".run_deleteop",
-    "AggregationsDataSeryExpectedValue": ".run_getop",
-    "AggregationsDataSeryExpectedValueTypedDict": ".run_getop",
-    "AggregationsDataSeryOutcome": ".run_getop",
-    "AggregationsDataSeryValidators": ".run_getop",
-    "AggregationsDataSeryValidatorsTypedDict": ".run_getop",
-    "AggregationsMeasurementOutcome": ".run_getop",
-    "AggregationsValidatorsDataSeryOutcome": ".run_getop",
-    "AggregationsValidatorsMeasurementOutcome": ".run_getop",
     "DataSery": ".run_getop",
-    "DataSeryAggregations": ".run_getop",
-    "DataSeryAggregationsTypedDict": ".run_getop",
+    "DataSeryAggregation": ".run_getop",
+    "DataSeryAggregationExpectedValue": ".run_getop",
+    "DataSeryAggregationExpectedValueTypedDict": ".run_getop",
+    "DataSeryAggregationOutcome": ".run_getop",
+    "DataSeryAggregationTypedDict": ".run_getop",
+    "DataSeryAggregationValidator": ".run_getop",
+    "DataSeryAggregationValidatorOutcome": ".run_getop",
+    "DataSeryAggregationValidatorTypedDict": ".run_getop",
     "DataSeryExpectedValue": ".run_getop",
     "DataSeryExpectedValueTypedDict": ".run_getop",
     "DataSeryTypedDict": ".run_getop",
-    "DataSeryValidators": ".run_getop",
-    "DataSeryValidatorsTypedDict": ".run_getop",
+    "DataSeryValidator": ".run_getop",
+    "DataSeryValidatorOutcome": ".run_getop",
+    "DataSeryValidatorTypedDict": ".run_getop",
     "DataSeryValue": ".run_getop",
     "DataSeryValueTypedDict": ".run_getop",
-    "Measurement": ".run_getop",
-    "MeasurementOutcome": ".run_getop",
-    "MeasurementTypedDict": ".run_getop",
-    "RunGetAggregations": ".run_getop",
-    "RunGetAggregationsExpectedValue": ".run_getop",
-    "RunGetAggregationsExpectedValueTypedDict": ".run_getop",
-    "RunGetAggregationsTypedDict": ".run_getop",
-    "RunGetAggregationsValidators": ".run_getop",
-    "RunGetAggregationsValidatorsTypedDict": ".run_getop",
+    "RunGetAggregation": ".run_getop",
+    "RunGetAggregationExpectedValue": ".run_getop",
+    "RunGetAggregationExpectedValueTypedDict": ".run_getop",
+    "RunGetAggregationOutcome": ".run_getop",
+    "RunGetAggregationTypedDict": ".run_getop",
+    "RunGetAggregationValidator": ".run_getop",
+    "RunGetAggregationValidatorOutcome": ".run_getop",
+    "RunGetAggregationValidatorTypedDict": ".run_getop",
     "RunGetAttachment": ".run_getop",
     "RunGetAttachmentTypedDict": ".run_getop",
     "RunGetBatch": ".run_getop",
@@ -1477,6 +1463,9 @@ _dynamic_imports: dict[str, str] = {
     "RunGetLogTypedDict": ".run_getop",
     "RunGetMeasuredValue": ".run_getop",
     "RunGetMeasuredValueTypedDict": ".run_getop",
+    "RunGetMeasurement": ".run_getop",
+    "RunGetMeasurementOutcome": ".run_getop",
+    "RunGetMeasurementTypedDict": ".run_getop",
     "RunGetOperatedBy": ".run_getop",
     "RunGetOperatedByTypedDict": ".run_getop",
     "RunGetOutcome": ".run_getop",
@@ -1495,16 +1484,15 @@ _dynamic_imports: dict[str, str] = {
     "RunGetRevisionTypedDict": ".run_getop",
     "RunGetUnit": ".run_getop",
     "RunGetUnitTypedDict": ".run_getop",
-    "RunGetValidators": ".run_getop",
-    "RunGetValidatorsTypedDict": ".run_getop",
+    "RunGetValidator": ".run_getop",
+    "RunGetValidatorOutcome": ".run_getop",
+    "RunGetValidatorTypedDict": ".run_getop",
     "RunGetValue": ".run_getop",
     "RunGetValueTypedDict": ".run_getop",
     "RunGetVersion": ".run_getop",
     "RunGetVersionTypedDict": ".run_getop",
     "SubUnit": ".run_getop",
     "SubUnitTypedDict": ".run_getop",
-    "ValidatorsDataSeryOutcome": ".run_getop",
-    "ValidatorsMeasurementOutcome": ".run_getop",
     "RunListBatch": ".run_listop",
     "RunListBatchTypedDict": ".run_listop",
     "RunListCreatedByStation": ".run_listop",
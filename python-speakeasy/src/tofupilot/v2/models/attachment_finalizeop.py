@@ -2,22 +2,13 @@
 
 from __future__ import annotations
 from tofupilot.v2.types import BaseModel
-from tofupilot.v2.utils import FieldMetadata, PathParamMetadata, RequestMetadata
+from tofupilot.v2.utils import FieldMetadata, PathParamMetadata
 from typing_extensions import Annotated, TypedDict
 
 
-class AttachmentFinalizeRequestBodyTypedDict(TypedDict):
-    pass
-
-
-class AttachmentFinalizeRequestBody(BaseModel):
-    pass
-
-
 class AttachmentFinalizeRequestTypedDict(TypedDict):
     id: str
     r"""ID of the upload to finalize"""
-    request_body: AttachmentFinalizeRequestBodyTypedDict
 
 
 class AttachmentFinalizeRequest(BaseModel):
@@ -26,11 +17,6 @@ class AttachmentFinalizeRequest(BaseModel):
     ]
     r"""ID of the upload to finalize"""
 
-    request_body: Annotated[
-        AttachmentFinalizeRequestBody,
-        FieldMetadata(request=RequestMetadata(media_type="application/json")),
-    ]
-
 
 class AttachmentFinalizeResponseTypedDict(TypedDict):
     r"""Upload metadata updated successfully"""
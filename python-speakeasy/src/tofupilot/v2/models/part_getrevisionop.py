@@ -29,6 +29,8 @@ class PartGetRevisionRequest(BaseModel):
 
 
 class PartGetRevisionCreatedByUserTypedDict(TypedDict):
+    r"""User who created the revision."""
+
     id: str
     r"""Unique identifier of the user."""
     name: Nullable[str]
@@ -36,6 +38,8 @@ class PartGetRevisionCreatedByUserTypedDict(TypedDict):
 
 
 class PartGetRevisionCreatedByUser(BaseModel):
+    r"""User who created the revision."""
+
     id: str
     r"""Unique identifier of the user."""
 
@@ -74,6 +78,8 @@ class PartGetRevisionCreatedByUser(BaseModel):
 
 
 class PartGetRevisionCreatedByStationTypedDict(TypedDict):
+    r"""Station that created the revision."""
+
     id: str
     r"""Unique identifier of the station."""
     name: str
@@ -81,6 +87,8 @@ class PartGetRevisionCreatedByStationTypedDict(TypedDict):
 
 
 class PartGetRevisionCreatedByStation(BaseModel):
+    r"""Station that created the revision."""
+
     id: str
     r"""Unique identifier of the station."""
 
@@ -148,6 +148,8 @@ ProcedureListProvider = Literal["github", "gitlab"]
 
 
 class LinkedRepositoryTypedDict(TypedDict):
+    r"""Linked repository for this procedure."""
+
     id: str
     r"""Unique identifier for the linked repository."""
     name: str
@@ -158,6 +160,8 @@ class LinkedRepositoryTypedDict(TypedDict):
 
 
 class LinkedRepository(BaseModel):
+    r"""Linked repository for this procedure."""
+
     id: str
     r"""Unique identifier for the linked repository."""
 
@@ -21,25 +21,28 @@ r"""Overall test result. Use PASS when test succeeds, FAIL when test fails but s
 RunCreatePhaseOutcome = Literal["PASS", "FAIL", "SKIP", "ERROR"]
 r"""Overall result of the phase execution. Use PASS when phase succeeds, FAIL when phase fails but execution completed successfully, ERROR when phase execution fails, SKIP when phase was not executed."""
 
-MeasurementsOutcome = Literal["PASS", "FAIL", "UNSET"]
+RunCreateMeasurementOutcome = Literal["PASS", "FAIL", "UNSET"]
 r"""Result of the measurement validation. Use PASS when measurement meets all criteria, FAIL when measurement is outside acceptable limits or validation fails, UNSET when no validation was performed."""
 
-XAxisValidatorsOutcome = Literal["PASS", "FAIL", "UNSET"]
+XAxisValidatorOutcome = Literal["PASS", "FAIL", "UNSET"]
+r"""Pre-computed validation result from test framework. Server stores as-is, does not re-evaluate."""
 
 XAxisExpectedValueTypedDict = TypeAliasType(
     "XAxisExpectedValueTypedDict", Union[bool, float, str, List[float], List[str]]
 )
+r"""Expected value for comparison. Type depends on operator."""
 
 
 XAxisExpectedValue = TypeAliasType(
     "XAxisExpectedValue", Union[bool, float, str, List[float], List[str]]
 )
+r"""Expected value for comparison. Type depends on operator."""
 
 
-class XAxisValidatorsTypedDict(TypedDict):
+class XAxisValidatorTypedDict(TypedDict):
     r"""Structured validator specification with operator and expected value."""
 
-    outcome: NotRequired[Nullable[XAxisValidatorsOutcome]]
+    outcome: NotRequired[Nullable[XAxisValidatorOutcome]]
     r"""Pre-computed validation result from test framework. Server stores as-is, does not re-evaluate."""
     operator: NotRequired[Nullable[str]]
     r"""Comparison operator: \">\", \">=\", \"<\", \"<=\", \"==\", \"!=\", \"matches\", \"in\", \"range\" """
@@ -51,10 +54,10 @@ class XAxisValidatorsTypedDict(TypedDict):
     r"""Whether this validator is decisive (if it fails, measurement fails). False for marginal/warning validators. Defaults to true."""
 
 
-class XAxisValidators(BaseModel):
+class XAxisValidator(BaseModel):
     r"""Structured validator specification with operator and expected value."""
 
-    outcome: OptionalNullable[XAxisValidatorsOutcome] = UNSET
+    outcome: OptionalNullable[XAxisValidatorOutcome] = UNSET
     r"""Pre-computed validation result from test framework. Server stores as-is, does not re-evaluate."""
 
     operator: OptionalNullable[str] = UNSET
@@ -112,35 +115,41 @@ class XAxisValidators(BaseModel):
         return m
 
 
-XAxisAggregationsOutcome = Literal["PASS", "FAIL", "UNSET"]
+XAxisAggregationOutcome = Literal["PASS", "FAIL", "UNSET"]
+r"""Computed result of aggregation validation. Server stores as-is."""
 
 XAxisValueTypedDict = TypeAliasType("XAxisValueTypedDict", Union[float, str, bool])
+r"""Computed aggregation value."""
 
 
 XAxisValue = TypeAliasType("XAxisValue", Union[float, str, bool])
+r"""Computed aggregation value."""
 
 
-XAxisAggregationsValidatorsOutcome = Literal["PASS", "FAIL", "UNSET"]
+XAxisAggregationValidatorOutcome = Literal["PASS", "FAIL", "UNSET"]
+r"""Pre-computed validation result from test framework. Server stores as-is, does not re-evaluate."""
 
-XAxisAggregationsExpectedValueTypedDict = TypeAliasType(
-    "XAxisAggregationsExpectedValueTypedDict",
+XAxisAggregationExpectedValueTypedDict = TypeAliasType(
+    "XAxisAggregationExpectedValueTypedDict",
     Union[bool, float, str, List[float], List[str]],
 )
+r"""Expected value for comparison. Type depends on operator."""
 
 
-XAxisAggregationsExpectedValue = TypeAliasType(
-    "XAxisAggregationsExpectedValue", Union[bool, float, str, List[float], List[str]]
+XAxisAggregationExpectedValue = TypeAliasType(
+    "XAxisAggregationExpectedValue", Union[bool, float, str, List[float], List[str]]
 )
+r"""Expected value for comparison. Type depends on operator."""
 
 
-class XAxisAggregationsValidatorsTypedDict(TypedDict):
+class XAxisAggregationValidatorTypedDict(TypedDict):
     r"""Structured validator specification with operator, expected value, and outcome."""
 
-    outcome: NotRequired[Nullable[XAxisAggregationsValidatorsOutcome]]
+    outcome: NotRequired[Nullable[XAxisAggregationValidatorOutcome]]
     r"""Pre-computed validation result from test framework. Server stores as-is, does not re-evaluate."""
     operator: NotRequired[Nullable[str]]
     r"""Comparison operator: \">\", \">=\", \"<\", \"<=\", \"==\", \"!=\", \"matches\", \"in\", \"range\" """
-    expected_value: NotRequired[Nullable[XAxisAggregationsExpectedValueTypedDict]]
+    expected_value: NotRequired[Nullable[XAxisAggregationExpectedValueTypedDict]]
     r"""Expected value for comparison. Type depends on operator."""
     expression: NotRequired[Nullable[str]]
     r"""Original expression string for display/audit purposes."""
@@ -148,16 +157,16 @@ class XAxisAggregationsValidatorsTypedDict(TypedDict):
     r"""Whether this validator is decisive (if it fails, measurement fails). False for marginal/warning validators. Defaults to true."""
 
 
-class XAxisAggregationsValidators(BaseModel):
+class XAxisAggregationValidator(BaseModel):
     r"""Structured validator specification with operator, expected value, and outcome."""
 
-    outcome: OptionalNullable[XAxisAggregationsValidatorsOutcome] = UNSET
+    outcome: OptionalNullable[XAxisAggregationValidatorOutcome] = UNSET
     r"""Pre-computed validation result from test framework. Server stores as-is, does not re-evaluate."""
 
     operator: OptionalNullable[str] = UNSET
     r"""Comparison operator: \">\", \">=\", \"<\", \"<=\", \"==\", \"!=\", \"matches\", \"in\", \"range\" """
 
-    expected_value: OptionalNullable[XAxisAggregationsExpectedValue] = UNSET
+    expected_value: OptionalNullable[XAxisAggregationExpectedValue] = UNSET
     r"""Expected value for comparison. Type depends on operator."""
 
     expression: OptionalNullable[str] = UNSET
@@ -209,28 +218,28 @@ class XAxisAggregationsValidators(BaseModel):
         return m
 
 
-class XAxisAggregationsTypedDict(TypedDict):
+class XAxisAggregationTypedDict(TypedDict):
     r"""Aggregation specification with computed value and optional validators."""
 
     type: str
     r"""Aggregation function: \"min\", \"max\", \"avg\", \"sum\", \"count\", \"std\", \"median\", \"percentile_95\", etc."""
-    outcome: NotRequired[Nullable[XAxisAggregationsOutcome]]
+    outcome: NotRequired[Nullable[XAxisAggregationOutcome]]
     r"""Computed result of aggregation validation. Server stores as-is."""
     value: NotRequired[Nullable[XAxisValueTypedDict]]
     r"""Computed aggregation value."""
     unit: NotRequired[Nullable[str]]
     r"""Unit for the aggregated value."""
-    validators: NotRequired[Nullable[List[XAxisAggregationsValidatorsTypedDict]]]
+    validators: NotRequired[Nullable[List[XAxisAggregationValidatorTypedDict]]]
     r"""Validators applied to the aggregated value."""
 
 
-class XAxisAggregations(BaseModel):
+class XAxisAggregation(BaseModel):
     r"""Aggregation specification with computed value and optional validators."""
 
     type: str
     r"""Aggregation function: \"min\", \"max\", \"avg\", \"sum\", \"count\", \"std\", \"median\", \"percentile_95\", etc."""
 
-    outcome: OptionalNullable[XAxisAggregationsOutcome] = UNSET
+    outcome: OptionalNullable[XAxisAggregationOutcome] = UNSET
     r"""Computed result of aggregation validation. Server stores as-is."""
 
     value: OptionalNullable[XAxisValue] = UNSET
@@ -239,7 +248,7 @@ class XAxisAggregations(BaseModel):
     unit: OptionalNullable[str] = UNSET
     r"""Unit for the aggregated value."""
 
-    validators: OptionalNullable[List[XAxisAggregationsValidators]] = UNSET
+    validators: OptionalNullable[List[XAxisAggregationValidator]] = UNSET
     r"""Validators applied to the aggregated value."""
 
     @model_serializer(mode="wrap")
@@ -282,9 +291,9 @@ class XAxisTypedDict(TypedDict):
     r"""Unit for this axis."""
     description: NotRequired[Nullable[str]]
     r"""Description of this data series."""
-    validators: NotRequired[Nullable[List[XAxisValidatorsTypedDict]]]
+    validators: NotRequired[Nullable[List[XAxisValidatorTypedDict]]]
     r"""Validators for this specific axis/series."""
-    aggregations: NotRequired[Nullable[List[XAxisAggregationsTypedDict]]]
+    aggregations: NotRequired[Nullable[List[XAxisAggregationTypedDict]]]
     r"""Aggregations computed over this axis data (min, max, avg, etc.)."""
 
 
@@ -300,10 +309,10 @@ class XAxis(BaseModel):
     description: OptionalNullable[str] = UNSET
     r"""Description of this data series."""
 
-    validators: OptionalNullable[List[XAxisValidators]] = UNSET
+    validators: OptionalNullable[List[XAxisValidator]] = UNSET
     r"""Validators for this specific axis/series."""
 
-    aggregations: OptionalNullable[List[XAxisAggregations]] = UNSET
+    aggregations: OptionalNullable[List[XAxisAggregation]] = UNSET
     r"""Aggregations computed over this axis data (min, max, avg, etc.)."""
 
     @model_serializer(mode="wrap")
@@ -337,26 +346,29 @@ class XAxis(BaseModel):
         return m
 
 
-YAxisValidatorsOutcome = Literal["PASS", "FAIL", "UNSET"]
+YAxiValidatorOutcome = Literal["PASS", "FAIL", "UNSET"]
+r"""Pre-computed validation result from test framework. Server stores as-is, does not re-evaluate."""
 
-YAxisExpectedValueTypedDict = TypeAliasType(
-    "YAxisExpectedValueTypedDict", Union[bool, float, str, List[float], List[str]]
+YAxiExpectedValueTypedDict = TypeAliasType(
+    "YAxiExpectedValueTypedDict", Union[bool, float, str, List[float], List[str]]
 )
+r"""Expected value for comparison. Type depends on operator."""
 
 
-YAxisExpectedValue = TypeAliasType(
-    "YAxisExpectedValue", Union[bool, float, str, List[float], List[str]]
+YAxiExpectedValue = TypeAliasType(
+    "YAxiExpectedValue", Union[bool, float, str, List[float], List[str]]
 )
+r"""Expected value for comparison. Type depends on operator."""
 
 
-class YAxisValidatorsTypedDict(TypedDict):
+class YAxiValidatorTypedDict(TypedDict):
     r"""Structured validator specification with operator and expected value."""
 
-    outcome: NotRequired[Nullable[YAxisValidatorsOutcome]]
+    outcome: NotRequired[Nullable[YAxiValidatorOutcome]]
     r"""Pre-computed validation result from test framework. Server stores as-is, does not re-evaluate."""
     operator: NotRequired[Nullable[str]]
     r"""Comparison operator: \">\", \">=\", \"<\", \"<=\", \"==\", \"!=\", \"matches\", \"in\", \"range\" """
-    expected_value: NotRequired[Nullable[YAxisExpectedValueTypedDict]]
+    expected_value: NotRequired[Nullable[YAxiExpectedValueTypedDict]]
     r"""Expected value for comparison. Type depends on operator."""
     expression: NotRequired[Nullable[str]]
     r"""Original expression string for display/audit purposes."""
@@ -364,16 +376,16 @@ class YAxisValidatorsTypedDict(TypedDict):
     r"""Whether this validator is decisive (if it fails, measurement fails). False for marginal/warning validators. Defaults to true."""
 
 
-class YAxisValidators(BaseModel):
+class YAxiValidator(BaseModel):
     r"""Structured validator specification with operator and expected value."""
 
-    outcome: OptionalNullable[YAxisValidatorsOutcome] = UNSET
+    outcome: OptionalNullable[YAxiValidatorOutcome] = UNSET
     r"""Pre-computed validation result from test framework. Server stores as-is, does not re-evaluate."""
 
     operator: OptionalNullable[str] = UNSET
     r"""Comparison operator: \">\", \">=\", \"<\", \"<=\", \"==\", \"!=\", \"matches\", \"in\", \"range\" """
 
-    expected_value: OptionalNullable[YAxisExpectedValue] = UNSET
+    expected_value: OptionalNullable[YAxiExpectedValue] = UNSET
     r"""Expected value for comparison. Type depends on operator."""
 
     expression: OptionalNullable[str] = UNSET
@@ -425,35 +437,41 @@ class YAxisValidators(BaseModel):
         return m
 
 
-YAxisAggregationsOutcome = Literal["PASS", "FAIL", "UNSET"]
+YAxiAggregationOutcome = Literal["PASS", "FAIL", "UNSET"]
+r"""Computed result of aggregation validation. Server stores as-is."""
 
-YAxisValueTypedDict = TypeAliasType("YAxisValueTypedDict", Union[float, str, bool])
+YAxiValueTypedDict = TypeAliasType("YAxiValueTypedDict", Union[float, str, bool])
+r"""Computed aggregation value."""
 
 
-YAxisValue = TypeAliasType("YAxisValue", Union[float, str, bool])
+YAxiValue = TypeAliasType("YAxiValue", Union[float, str, bool])
+r"""Computed aggregation value."""
 
 
-YAxisAggregationsValidatorsOutcome = Literal["PASS", "FAIL", "UNSET"]
+YAxiAggregationValidatorOutcome = Literal["PASS", "FAIL", "UNSET"]
+r"""Pre-computed validation result from test framework. Server stores as-is, does not re-evaluate."""
 
-YAxisAggregationsExpectedValueTypedDict = TypeAliasType(
-    "YAxisAggregationsExpectedValueTypedDict",
+YAxiAggregationExpectedValueTypedDict = TypeAliasType(
+    "YAxiAggregationExpectedValueTypedDict",
     Union[bool, float, str, List[float], List[str]],
 )
+r"""Expected value for comparison. Type depends on operator."""
 
 
-YAxisAggregationsExpectedValue = TypeAliasType(
-    "YAxisAggregationsExpectedValue", Union[bool, float, str, List[float], List[str]]
+YAxiAggregationExpectedValue = TypeAliasType(
+    "YAxiAggregationExpectedValue", Union[bool, float, str, List[float], List[str]]
 )
+r"""Expected value for comparison. Type depends on operator."""
 
 
-class YAxisAggregationsValidatorsTypedDict(TypedDict):
+class YAxiAggregationValidatorTypedDict(TypedDict):
     r"""Structured validator specification with operator, expected value, and outcome."""
 
-    outcome: NotRequired[Nullable[YAxisAggregationsValidatorsOutcome]]
+    outcome: NotRequired[Nullable[YAxiAggregationValidatorOutcome]]
     r"""Pre-computed validation result from test framework. Server stores as-is, does not re-evaluate."""
     operator: NotRequired[Nullable[str]]
     r"""Comparison operator: \">\", \">=\", \"<\", \"<=\", \"==\", \"!=\", \"matches\", \"in\", \"range\" """
-    expected_value: NotRequired[Nullable[YAxisAggregationsExpectedValueTypedDict]]
+    expected_value: NotRequired[Nullable[YAxiAggregationExpectedValueTypedDict]]
     r"""Expected value for comparison. Type depends on operator."""
     expression: NotRequired[Nullable[str]]
     r"""Original expression string for display/audit purposes."""
@@ -461,16 +479,16 @@ class YAxisAggregationsValidatorsTypedDict(TypedDict):
     r"""Whether this validator is decisive (if it fails, measurement fails). False for marginal/warning validators. Defaults to true."""
 
 
-class YAxisAggregationsValidators(BaseModel):
+class YAxiAggregationValidator(BaseModel):
     r"""Structured validator specification with operator, expected value, and outcome."""
 
-    outcome: OptionalNullable[YAxisAggregationsValidatorsOutcome] = UNSET
+    outcome: OptionalNullable[YAxiAggregationValidatorOutcome] = UNSET
     r"""Pre-computed validation result from test framework. Server stores as-is, does not re-evaluate."""
 
     operator: OptionalNullable[str] = UNSET
     r"""Comparison operator: \">\", \">=\", \"<\", \"<=\", \"==\", \"!=\", \"matches\", \"in\", \"range\" """
 
-    expected_value: OptionalNullable[YAxisAggregationsExpectedValue] = UNSET
+    expected_value: OptionalNullable[YAxiAggregationExpectedValue] = UNSET
     r"""Expected value for comparison. Type depends on operator."""
 
     expression: OptionalNullable[str] = UNSET
@@ -522,37 +540,37 @@ class YAxisAggregationsValidators(BaseModel):
         return m
 
 
-class YAxisAggregationsTypedDict(TypedDict):
+class YAxiAggregationTypedDict(TypedDict):
     r"""Aggregation specification with computed value and optional validators."""
 
     type: str
     r"""Aggregation function: \"min\", \"max\", \"avg\", \"sum\", \"count\", \"std\", \"median\", \"percentile_95\", etc."""
-    outcome: NotRequired[Nullable[YAxisAggregationsOutcome]]
+    outcome: NotRequired[Nullable[YAxiAggregationOutcome]]
     r"""Computed result of aggregation validation. Server stores as-is."""
-    value: NotRequired[Nullable[YAxisValueTypedDict]]
+    value: NotRequired[Nullable[YAxiValueTypedDict]]
     r"""Computed aggregation value."""
     unit: NotRequired[Nullable[str]]
     r"""Unit for the aggregated value."""
-    validators: NotRequired[Nullable[List[YAxisAggregationsValidatorsTypedDict]]]
+    validators: NotRequired[Nullable[List[YAxiAggregationValidatorTypedDict]]]
     r"""Validators applied to the aggregated value."""
 
 
-class YAxisAggregations(BaseModel):
+class YAxiAggregation(BaseModel):
     r"""Aggregation specification with computed value and optional validators."""
 
     type: str
     r"""Aggregation function: \"min\", \"max\", \"avg\", \"sum\", \"count\", \"std\", \"median\", \"percentile_95\", etc."""
 
-    outcome: OptionalNullable[YAxisAggregationsOutcome] = UNSET
+    outcome: OptionalNullable[YAxiAggregationOutcome] = UNSET
     r"""Computed result of aggregation validation. Server stores as-is."""
 
-    value: OptionalNullable[YAxisValue] = UNSET
+    value: OptionalNullable[YAxiValue] = UNSET
     r"""Computed aggregation value."""
 
     unit: OptionalNullable[str] = UNSET
     r"""Unit for the aggregated value."""
 
-    validators: OptionalNullable[List[YAxisAggregationsValidators]] = UNSET
+    validators: OptionalNullable[List[YAxiAggregationValidator]] = UNSET
     r"""Validators applied to the aggregated value."""
 
     @model_serializer(mode="wrap")
@@ -586,7 +604,7 @@ class YAxisAggregations(BaseModel):
         return m
 
 
-class YAxisTypedDict(TypedDict):
+class YAxiTypedDict(TypedDict):
     r"""Data series with numeric data, unit, and optional validators/aggregations."""
 
     data: List[float]
@@ -595,13 +613,13 @@ class YAxisTypedDict(TypedDict):
     r"""Unit for this axis."""
     description: NotRequired[Nullable[str]]
     r"""Description of this data series."""
-    validators: NotRequired[Nullable[List[YAxisValidatorsTypedDict]]]
+    validators: NotRequired[Nullable[List[YAxiValidatorTypedDict]]]
     r"""Validators for this specific axis/series."""
-    aggregations: NotRequired[Nullable[List[YAxisAggregationsTypedDict]]]
+    aggregations: NotRequired[Nullable[List[YAxiAggregationTypedDict]]]
     r"""Aggregations computed over this axis data (min, max, avg, etc.)."""
 
 
-class YAxis(BaseModel):
+class YAxi(BaseModel):
     r"""Data series with numeric data, unit, and optional validators/aggregations."""
 
     data: List[float]
@@ -613,10 +631,10 @@ class YAxis(BaseModel):
     description: OptionalNullable[str] = UNSET
     r"""Description of this data series."""
 
-    validators: OptionalNullable[List[YAxisValidators]] = UNSET
+    validators: OptionalNullable[List[YAxiValidator]] = UNSET
     r"""Validators for this specific axis/series."""
 
-    aggregations: OptionalNullable[List[YAxisAggregations]] = UNSET
+    aggregations: OptionalNullable[List[YAxiAggregation]] = UNSET
     r"""Aggregations computed over this axis data (min, max, avg, etc.)."""
 
     @model_serializer(mode="wrap")
@@ -677,27 +695,32 @@ r"""The actual value captured. [LEGACY for multi-dim] For multi-dimensional with
 RunCreateUnitsTypedDict = TypeAliasType(
     "RunCreateUnitsTypedDict", Union[str, List[str]]
 )
+r"""[LEGACY for multi-dim] Units of measurement. For structured multi-dimensional, use units within x_axis/y_axis instead."""
 
 
 RunCreateUnits = TypeAliasType("RunCreateUnits", Union[str, List[str]])
+r"""[LEGACY for multi-dim] Units of measurement. For structured multi-dimensional, use units within x_axis/y_axis instead."""
 
 
-MeasurementsValidatorsOutcome = Literal["PASS", "FAIL", "UNSET"]
+RunCreateValidatorOutcome = Literal["PASS", "FAIL", "UNSET"]
+r"""Pre-computed validation result from test framework. Server stores as-is, does not re-evaluate."""
 
 RunCreateExpectedValueTypedDict = TypeAliasType(
     "RunCreateExpectedValueTypedDict", Union[bool, float, str, List[float], List[str]]
 )
+r"""Expected value for comparison. Type depends on operator."""
 
 
 RunCreateExpectedValue = TypeAliasType(
     "RunCreateExpectedValue", Union[bool, float, str, List[float], List[str]]
 )
+r"""Expected value for comparison. Type depends on operator."""
 
 
-class RunCreateValidatorsTypedDict(TypedDict):
+class RunCreateValidatorTypedDict(TypedDict):
     r"""Structured validator specification with operator and expected value."""
 
-    outcome: NotRequired[Nullable[MeasurementsValidatorsOutcome]]
+    outcome: NotRequired[Nullable[RunCreateValidatorOutcome]]
     r"""Pre-computed validation result from test framework. Server stores as-is, does not re-evaluate."""
     operator: NotRequired[Nullable[str]]
     r"""Comparison operator: \">\", \">=\", \"<\", \"<=\", \"==\", \"!=\", \"matches\", \"in\", \"range\" """
@@ -709,10 +732,10 @@ class RunCreateValidatorsTypedDict(TypedDict):
     r"""Whether this validator is decisive (if it fails, measurement fails). False for marginal/warning validators. Defaults to true."""
 
 
-class RunCreateValidators(BaseModel):
+class RunCreateValidator(BaseModel):
     r"""Structured validator specification with operator and expected value."""
 
-    outcome: OptionalNullable[MeasurementsValidatorsOutcome] = UNSET
+    outcome: OptionalNullable[RunCreateValidatorOutcome] = UNSET
     r"""Pre-computed validation result from test framework. Server stores as-is, does not re-evaluate."""
 
     operator: OptionalNullable[str] = UNSET
@@ -770,48 +793,43 @@ class RunCreateValidators(BaseModel):
         return m
 
 
-ValidatorsTypedDict = TypeAliasType(
-    "ValidatorsTypedDict", Union[List[RunCreateValidatorsTypedDict], List[str]]
-)
-r"""Validators for this measurement. Use structured ValidatorSpec objects with operator and expected_value. Legacy string format (e.g. \"x >= 3\") is also accepted and stored as expression."""
-
-
-Validators = TypeAliasType("Validators", Union[List[RunCreateValidators], List[str]])
-r"""Validators for this measurement. Use structured ValidatorSpec objects with operator and expected_value. Legacy string format (e.g. \"x >= 3\") is also accepted and stored as expression."""
-
-
-MeasurementsAggregationsOutcome = Literal["PASS", "FAIL", "UNSET"]
+RunCreateAggregationOutcome = Literal["PASS", "FAIL", "UNSET"]
+r"""Computed result of aggregation validation. Server stores as-is."""
 
 RunCreateValueTypedDict = TypeAliasType(
     "RunCreateValueTypedDict", Union[float, str, bool]
 )
+r"""Computed aggregation value."""
 
 
 RunCreateValue = TypeAliasType("RunCreateValue", Union[float, str, bool])
+r"""Computed aggregation value."""
 
 
-MeasurementsAggregationsValidatorsOutcome = Literal["PASS", "FAIL", "UNSET"]
+RunCreateAggregationValidatorOutcome = Literal["PASS", "FAIL", "UNSET"]
+r"""Pre-computed validation result from test framework. Server stores as-is, does not re-evaluate."""
 
-RunCreateAggregationsExpectedValueTypedDict = TypeAliasType(
-    "RunCreateAggregationsExpectedValueTypedDict",
+RunCreateAggregationExpectedValueTypedDict = TypeAliasType(
+    "RunCreateAggregationExpectedValueTypedDict",
     Union[bool, float, str, List[float], List[str]],
 )
+r"""Expected value for comparison. Type depends on operator."""
 
 
-RunCreateAggregationsExpectedValue = TypeAliasType(
-    "RunCreateAggregationsExpectedValue",
-    Union[bool, float, str, List[float], List[str]],
+RunCreateAggregationExpectedValue = TypeAliasType(
+    "RunCreateAggregationExpectedValue", Union[bool, float, str, List[float], List[str]]
 )
+r"""Expected value for comparison. Type depends on operator."""
 
 
-class RunCreateAggregationsValidatorsTypedDict(TypedDict):
+class RunCreateAggregationValidatorTypedDict(TypedDict):
     r"""Structured validator specification with operator, expected value, and outcome."""
 
-    outcome: NotRequired[Nullable[MeasurementsAggregationsValidatorsOutcome]]
+    outcome: NotRequired[Nullable[RunCreateAggregationValidatorOutcome]]
     r"""Pre-computed validation result from test framework. Server stores as-is, does not re-evaluate."""
     operator: NotRequired[Nullable[str]]
     r"""Comparison operator: \">\", \">=\", \"<\", \"<=\", \"==\", \"!=\", \"matches\", \"in\", \"range\" """
-    expected_value: NotRequired[Nullable[RunCreateAggregationsExpectedValueTypedDict]]
+    expected_value: NotRequired[Nullable[RunCreateAggregationExpectedValueTypedDict]]
     r"""Expected value for comparison. Type depends on operator."""
     expression: NotRequired[Nullable[str]]
     r"""Original expression string for display/audit purposes."""
@@ -819,16 +837,16 @@ class RunCreateAggregationsValidatorsTypedDict(TypedDict):
     r"""Whether this validator is decisive (if it fails, measurement fails). False for marginal/warning validators. Defaults to true."""
 
 
-class RunCreateAggregationsValidators(BaseModel):
+class RunCreateAggregationValidator(BaseModel):
     r"""Structured validator specification with operator, expected value, and outcome."""
 
-    outcome: OptionalNullable[MeasurementsAggregationsValidatorsOutcome] = UNSET
+    outcome: OptionalNullable[RunCreateAggregationValidatorOutcome] = UNSET
     r"""Pre-computed validation result from test framework. Server stores as-is, does not re-evaluate."""
 
     operator: OptionalNullable[str] = UNSET
     r"""Comparison operator: \">\", \">=\", \"<\", \"<=\", \"==\", \"!=\", \"matches\", \"in\", \"range\" """
 
-    expected_value: OptionalNullable[RunCreateAggregationsExpectedValue] = UNSET
+    expected_value: OptionalNullable[RunCreateAggregationExpectedValue] = UNSET
     r"""Expected value for comparison. Type depends on operator."""
 
     expression: OptionalNullable[str] = UNSET
@@ -880,28 +898,28 @@ class RunCreateAggregationsValidators(BaseModel):
         return m
 
 
-class RunCreateAggregationsTypedDict(TypedDict):
+class RunCreateAggregationTypedDict(TypedDict):
     r"""Aggregation specification with computed value and optional validators."""
 
     type: str
     r"""Aggregation function: \"min\", \"max\", \"avg\", \"sum\", \"count\", \"std\", \"median\", \"percentile_95\", etc."""
-    outcome: NotRequired[Nullable[MeasurementsAggregationsOutcome]]
+    outcome: NotRequired[Nullable[RunCreateAggregationOutcome]]
     r"""Computed result of aggregation validation. Server stores as-is."""
     value: NotRequired[Nullable[RunCreateValueTypedDict]]
     r"""Computed aggregation value."""
     unit: NotRequired[Nullable[str]]
     r"""Unit for the aggregated value."""
-    validators: NotRequired[Nullable[List[RunCreateAggregationsValidatorsTypedDict]]]
+    validators: NotRequired[Nullable[List[RunCreateAggregationValidatorTypedDict]]]
     r"""Validators applied to the aggregated value."""
 
 
-class RunCreateAggregations(BaseModel):
+class RunCreateAggregation(BaseModel):
     r"""Aggregation specification with computed value and optional validators."""
 
     type: str
     r"""Aggregation function: \"min\", \"max\", \"avg\", \"sum\", \"count\", \"std\", \"median\", \"percentile_95\", etc."""
 
-    outcome: OptionalNullable[MeasurementsAggregationsOutcome] = UNSET
+    outcome: OptionalNullable[RunCreateAggregationOutcome] = UNSET
     r"""Computed result of aggregation validation. Server stores as-is."""
 
     value: OptionalNullable[RunCreateValue] = UNSET
@@ -910,7 +928,7 @@ class RunCreateAggregations(BaseModel):
     unit: OptionalNullable[str] = UNSET
     r"""Unit for the aggregated value."""
 
-    validators: OptionalNullable[List[RunCreateAggregationsValidators]] = UNSET
+    validators: OptionalNullable[List[RunCreateAggregationValidator]] = UNSET
     r"""Validators applied to the aggregated value."""
 
     @model_serializer(mode="wrap")
@@ -944,41 +962,46 @@ class RunCreateAggregations(BaseModel):
         return m
 
 
-class MeasurementsTypedDict(TypedDict):
+class RunCreateMeasurementTypedDict(TypedDict):
     name: str
     r"""Name identifier for the measurement. Each measurement should have a descriptive name that identifies the specific data point being captured. Analytics at measurement level are computed using this name as unique identifier."""
-    outcome: MeasurementsOutcome
+    outcome: RunCreateMeasurementOutcome
     r"""Result of the measurement validation. Use PASS when measurement meets all criteria, FAIL when measurement is outside acceptable limits or validation fails, UNSET when no validation was performed."""
     x_axis: NotRequired[Nullable[XAxisTypedDict]]
-    r"""X-axis data series for multi-dimensional measurements. Use with y_axis for structured multi-dimensional data with per-axis validators/aggregations."""
-    y_axis: NotRequired[Nullable[List[YAxisTypedDict]]]
+    r"""Data series with numeric data, unit, and optional validators/aggregations."""
+    y_axis: NotRequired[Nullable[List[YAxiTypedDict]]]
     r"""Y-axis data series (one or more) for multi-dimensional measurements. Each series can have its own validators and aggregations."""
     measured_value: NotRequired[Nullable[RunCreateMeasuredValue1TypedDict]]
+    r"""The actual value captured. [LEGACY for multi-dim] For multi-dimensional with per-axis validators/aggregations, use x_axis/y_axis instead."""
     units: NotRequired[Nullable[RunCreateUnitsTypedDict]]
     r"""[LEGACY for multi-dim] Units of measurement. For structured multi-dimensional, use units within x_axis/y_axis instead."""
     lower_limit: NotRequired[float]
     r"""Use validators with operator \">=\" instead. Will be converted to a validator automatically."""
     upper_limit: NotRequired[float]
     r"""Use validators with operator \"<=\" instead. Will be converted to a validator automatically."""
-    validators: NotRequired[Nullable[ValidatorsTypedDict]]
-    aggregations: NotRequired[Nullable[List[RunCreateAggregationsTypedDict]]]
+    validators: NotRequired[Nullable[List[RunCreateValidatorTypedDict]]]
+    r"""Validators for this measurement. Use structured ValidatorSpec objects with operator and expected_value."""
+    aggregations: NotRequired[Nullable[List[RunCreateAggregationTypedDict]]]
+    r"""Aggregations computed over measurement values (min, max, avg, etc.). Each aggregation can have its own validators."""
     docstring: NotRequired[Nullable[str]]
+    r"""Additional notes or documentation about this measurement."""
 
 
-class Measurements(BaseModel):
+class RunCreateMeasurement(BaseModel):
     name: str
     r"""Name identifier for the measurement. Each measurement should have a descriptive name that identifies the specific data point being captured. Analytics at measurement level are computed using this name as unique identifier."""
 
-    outcome: MeasurementsOutcome
+    outcome: RunCreateMeasurementOutcome
     r"""Result of the measurement validation. Use PASS when measurement meets all criteria, FAIL when measurement is outside acceptable limits or validation fails, UNSET when no validation was performed."""
 
     x_axis: OptionalNullable[XAxis] = UNSET
-    r"""X-axis data series for multi-dimensional measurements. Use with y_axis for structured multi-dimensional data with per-axis validators/aggregations."""
+    r"""Data series with numeric data, unit, and optional validators/aggregations."""
 
-    y_axis: OptionalNullable[List[YAxis]] = UNSET
+    y_axis: OptionalNullable[List[YAxi]] = UNSET
     r"""Y-axis data series (one or more) for multi-dimensional measurements. Each series can have its own validators and aggregations."""
 
     measured_value: OptionalNullable[RunCreateMeasuredValue1] = UNSET
+    r"""The actual value captured. [LEGACY for multi-dim] For multi-dimensional with per-axis validators/aggregations, use x_axis/y_axis instead."""
 
     units: OptionalNullable[RunCreateUnits] = UNSET
     r"""[LEGACY for multi-dim] Units of measurement. For structured multi-dimensional, use units within x_axis/y_axis instead."""
@@ -999,11 +1022,14 @@ class Measurements(BaseModel):
     ] = None
     r"""Use validators with operator \"<=\" instead. Will be converted to a validator automatically."""
 
-    validators: OptionalNullable[Validators] = UNSET
+    validators: OptionalNullable[List[RunCreateValidator]] = UNSET
+    r"""Validators for this measurement. Use structured ValidatorSpec objects with operator and expected_value."""
 
-    aggregations: OptionalNullable[List[RunCreateAggregations]] = UNSET
+    aggregations: OptionalNullable[List[RunCreateAggregation]] = UNSET
+    r"""Aggregations computed over measurement values (min, max, avg, etc.). Each aggregation can have its own validators."""
 
     docstring: OptionalNullable[str] = UNSET
+    r"""Additional notes or documentation about this measurement."""
 
     @model_serializer(mode="wrap")
     def serialize_model(self, handler):
@@ -1064,7 +1090,11 @@ class RunCreatePhaseTypedDict(TypedDict):
     ended_at: datetime
     r"""ISO 8601 timestamp when the phase execution completed."""
     docstring: NotRequired[Nullable[str]]
-    measurements: NotRequired[Nullable[List[MeasurementsTypedDict]]]
+    r"""Additional notes or documentation about this test phase."""
+    measurements: NotRequired[Nullable[List[RunCreateMeasurementTypedDict]]]
+    r"""Array of measurements collected during this phase. Each measurement captures specific test data points with values, limits, and validation results. If no measurements are specified, the phase will be created without measurement data."""
+    retry_count: NotRequired[int]
+    r"""Zero-based retry attempt index for this phase. 0 = first attempt, 1 = first retry, etc. When a phase is retried, all attempts are stored with the same name and increasing retry_count."""
 
 
 class RunCreatePhase(BaseModel):
@@ -1081,12 +1111,17 @@ class RunCreatePhase(BaseModel):
     r"""ISO 8601 timestamp when the phase execution completed."""
 
     docstring: OptionalNullable[str] = UNSET
+    r"""Additional notes or documentation about this test phase."""
+
+    measurements: OptionalNullable[List[RunCreateMeasurement]] = UNSET
+    r"""Array of measurements collected during this phase. Each measurement captures specific test data points with values, limits, and validation results. If no measurements are specified, the phase will be created without measurement data."""
 
-    measurements: OptionalNullable[List[Measurements]] = UNSET
+    retry_count: Optional[int] = 0
+    r"""Zero-based retry attempt index for this phase. 0 = first attempt, 1 = first retry, etc. When a phase is retried, all attempts are stored with the same name and increasing retry_count."""
 
     @model_serializer(mode="wrap")
     def serialize_model(self, handler):
-        optional_fields = ["docstring", "measurements"]
+        optional_fields = ["docstring", "measurements", "retry_count"]
         nullable_fields = ["docstring", "measurements"]
         null_default_fields = []
 
@@ -1161,6 +1196,7 @@ class RunCreateRequestTypedDict(TypedDict):
     serial_number: str
     r"""Unique serial number of the unit under test. Matched case-insensitively. If no unit with this serial number exists, one will be created."""
     procedure_version: NotRequired[Nullable[str]]
+    r"""Specific version of the test procedure used for the run. Matched case-insensitively. If none exist, a procedure with this procedure version will be created. If no procedure version is specified, the run will not be linked to any specific version."""
     operated_by: NotRequired[str]
     r"""Email address of the operator who executed the test run. The operator must exist as a user in the system. The run will be linked to this user to track who performed the test."""
     part_number: NotRequired[str]
@@ -1196,6 +1232,7 @@ class RunCreateRequest(BaseModel):
     r"""Unique serial number of the unit under test. Matched case-insensitively. If no unit with this serial number exists, one will be created."""
 
     procedure_version: OptionalNullable[str] = UNSET
+    r"""Specific version of the test procedure used for the run. Matched case-insensitively. If none exist, a procedure with this procedure version will be created. If no procedure version is specified, the run will not be linked to any specific version."""
 
     operated_by: Optional[str] = None
     r"""Email address of the operator who executed the test run. The operator must exist as a user in the system. The run will be linked to this user to track who performed the test."""
@@ -32,19 +32,27 @@ r"""Final result of the run execution."""
 
 
 class RunGetCreatedByUserTypedDict(TypedDict):
+    r"""User whose API key was used to create this run. Only returned if `all` or `created_by` is included."""
+
     id: str
     r"""User ID."""
     name: Nullable[str]
+    r"""User display name."""
     email: Nullable[str]
+    r"""User email address."""
 
 
 class RunGetCreatedByUser(BaseModel):
+    r"""User whose API key was used to create this run. Only returned if `all` or `created_by` is included."""
+
     id: str
     r"""User ID."""
 
     name: Nullable[str]
+    r"""User display name."""
 
     email: Nullable[str]
+    r"""User email address."""
 
     @model_serializer(mode="wrap")
     def serialize_model(self, handler):
@@ -78,16 +86,22 @@ class RunGetCreatedByUser(BaseModel):
 
 
 class RunGetCreatedByStationTypedDict(TypedDict):
+    r"""Station whose API key was used to create this run. Only returned if `all` or `created_by` is included."""
+
     id: str
     r"""Station ID."""
     name: Nullable[str]
+    r"""Station name."""
 
 
 class RunGetCreatedByStation(BaseModel):
+    r"""Station whose API key was used to create this run. Only returned if `all` or `created_by` is included."""
+
     id: str
     r"""Station ID."""
 
     name: Nullable[str]
+    r"""Station name."""
 
     @model_serializer(mode="wrap")
     def serialize_model(self, handler):
@@ -121,19 +135,27 @@ class RunGetCreatedByStation(BaseModel):
 
 
 class RunGetOperatedByTypedDict(TypedDict):
+    r"""User who operated this run. Only returned if `all` or `operated_by` is included."""
+
     id: str
     r"""Operator ID."""
     name: Nullable[str]
+    r"""Operator display name."""
     email: Nullable[str]
+    r"""Operator email address."""
 
 
 class RunGetOperatedBy(BaseModel):
+    r"""User who operated this run. Only returned if `all` or `operated_by` is included."""
+
     id: str
     r"""Operator ID."""
 
     name: Nullable[str]
+    r"""Operator display name."""
 
     email: Nullable[str]
+    r"""Operator email address."""
 
     @model_serializer(mode="wrap")
     def serialize_model(self, handler):
@@ -167,6 +189,8 @@ class RunGetOperatedBy(BaseModel):
 
 
 class RunGetVersionTypedDict(TypedDict):
+    r"""Version of the procedure used for this run."""
+
     id: str
     r"""Procedure version ID."""
     tag: str
@@ -174,6 +198,8 @@ class RunGetVersionTypedDict(TypedDict):
 
 
 class RunGetVersion(BaseModel):
+    r"""Version of the procedure used for this run."""
+
     id: str
     r"""Procedure version ID."""
 
@@ -284,6 +310,8 @@ class RunGetPart(BaseModel):
 
 
 class RunGetBatchTypedDict(TypedDict):
+    r"""Batch information for this unit."""
+
     id: str
     r"""Batch ID."""
     number: str
@@ -291,6 +319,8 @@ class RunGetBatchTypedDict(TypedDict):
 
 
 class RunGetBatch(BaseModel):
+    r"""Batch information for this unit."""
+
     id: str
     r"""Batch ID."""
 
@@ -360,26 +390,28 @@ class RunGetUnit(BaseModel):
 RunGetPhaseOutcome = Literal["PASS", "FAIL", "SKIP", "ERROR"]
 r"""Phase execution result."""
 
-MeasurementOutcome = Literal["PASS", "FAIL", "UNSET"]
+RunGetMeasurementOutcome = Literal["PASS", "FAIL", "UNSET"]
 r"""Measurement validation result."""
 
-ValidatorsMeasurementOutcome = Literal["PASS", "FAIL", "UNSET"]
+RunGetValidatorOutcome = Literal["PASS", "FAIL", "UNSET"]
 r"""Validation result: PASS, FAIL, or UNSET."""
 
 RunGetExpectedValueTypedDict = TypeAliasType(
     "RunGetExpectedValueTypedDict", Union[bool, float, str, List[float], List[str]]
 )
+r"""Expected value for comparison. Type depends on measurement type."""
 
 
 RunGetExpectedValue = TypeAliasType(
     "RunGetExpectedValue", Union[bool, float, str, List[float], List[str]]
 )
+r"""Expected value for comparison. Type depends on measurement type."""
 
 
-class RunGetValidatorsTypedDict(TypedDict):
+class RunGetValidatorTypedDict(TypedDict):
     r"""Validator result with outcome and comparison details."""
 
-    outcome: ValidatorsMeasurementOutcome
+    outcome: RunGetValidatorOutcome
     r"""Validation result: PASS, FAIL, or UNSET."""
     operator: Nullable[str]
     r"""Comparison operator used for validation."""
@@ -397,10 +429,10 @@ class RunGetValidatorsTypedDict(TypedDict):
     r"""True if user provided a custom expression (shown in italic with analytics tooltip)."""
 
 
-class RunGetValidators(BaseModel):
+class RunGetValidator(BaseModel):
     r"""Validator result with outcome and comparison details."""
 
-    outcome: ValidatorsMeasurementOutcome
+    outcome: RunGetValidatorOutcome
     r"""Validation result: PASS, FAIL, or UNSET."""
 
     operator: Nullable[str]
@@ -460,36 +492,41 @@ class RunGetValidators(BaseModel):
         return m
 
 
-AggregationsMeasurementOutcome = Literal["PASS", "FAIL", "UNSET"]
+RunGetAggregationOutcome = Literal["PASS", "FAIL", "UNSET"]
+r"""Aggregation validation result: PASS, FAIL, UNSET, or null if no validators."""
 
 RunGetValueTypedDict = TypeAliasType("RunGetValueTypedDict", Union[float, str, bool])
+r"""Computed aggregation value. Type depends on aggregation type."""
 
 
 RunGetValue = TypeAliasType("RunGetValue", Union[float, str, bool])
+r"""Computed aggregation value. Type depends on aggregation type."""
 
 
-AggregationsValidatorsMeasurementOutcome = Literal["PASS", "FAIL", "UNSET"]
+RunGetAggregationValidatorOutcome = Literal["PASS", "FAIL", "UNSET"]
 r"""Validation result: PASS, FAIL, or UNSET."""
 
-RunGetAggregationsExpectedValueTypedDict = TypeAliasType(
-    "RunGetAggregationsExpectedValueTypedDict",
+RunGetAggregationExpectedValueTypedDict = TypeAliasType(
+    "RunGetAggregationExpectedValueTypedDict",
     Union[bool, float, str, List[float], List[str]],
 )
+r"""Expected value for comparison. Type depends on measurement type."""
 
 
-RunGetAggregationsExpectedValue = TypeAliasType(
-    "RunGetAggregationsExpectedValue", Union[bool, float, str, List[float], List[str]]
+RunGetAggregationExpectedValue = TypeAliasType(
+    "RunGetAggregationExpectedValue", Union[bool, float, str, List[float], List[str]]
 )
+r"""Expected value for comparison. Type depends on measurement type."""
 
 
-class RunGetAggregationsValidatorsTypedDict(TypedDict):
+class RunGetAggregationValidatorTypedDict(TypedDict):
     r"""Validator result with outcome and comparison details."""
 
-    outcome: AggregationsValidatorsMeasurementOutcome
+    outcome: RunGetAggregationValidatorOutcome
     r"""Validation result: PASS, FAIL, or UNSET."""
     operator: Nullable[str]
     r"""Comparison operator used for validation."""
-    expected_value: Nullable[RunGetAggregationsExpectedValueTypedDict]
+    expected_value: Nullable[RunGetAggregationExpectedValueTypedDict]
     r"""Expected value for comparison. Type depends on measurement type."""
     expression: str
     r"""Human-readable expression string for display."""
@@ -503,16 +540,16 @@ class RunGetAggregationsValidatorsTypedDict(TypedDict):
     r"""True if user provided a custom expression (shown in italic with analytics tooltip)."""
 
 
-class RunGetAggregationsValidators(BaseModel):
+class RunGetAggregationValidator(BaseModel):
     r"""Validator result with outcome and comparison details."""
 
-    outcome: AggregationsValidatorsMeasurementOutcome
+    outcome: RunGetAggregationValidatorOutcome
     r"""Validation result: PASS, FAIL, or UNSET."""
 
     operator: Nullable[str]
     r"""Comparison operator used for validation."""
 
-    expected_value: Nullable[RunGetAggregationsExpectedValue]
+    expected_value: Nullable[RunGetAggregationExpectedValue]
     r"""Expected value for comparison. Type depends on measurement type."""
 
     expression: str
@@ -566,24 +603,24 @@ class RunGetAggregationsValidators(BaseModel):
         return m
 
 
-class RunGetAggregationsTypedDict(TypedDict):
+class RunGetAggregationTypedDict(TypedDict):
     r"""Aggregation result with computed value and optional validators."""
 
     id: str
     r"""Unique identifier for the aggregation."""
     type: str
     r"""Aggregation type (e.g., MIN, MAX, MEAN, RANGE, STD_DEV)."""
-    outcome: Nullable[AggregationsMeasurementOutcome]
+    outcome: Nullable[RunGetAggregationOutcome]
     r"""Aggregation validation result: PASS, FAIL, UNSET, or null if no validators."""
     value: Nullable[RunGetValueTypedDict]
     r"""Computed aggregation value. Type depends on aggregation type."""
     unit: NotRequired[Nullable[str]]
     r"""Unit of measurement for the aggregated value."""
-    validators: NotRequired[Nullable[List[RunGetAggregationsValidatorsTypedDict]]]
+    validators: NotRequired[Nullable[List[RunGetAggregationValidatorTypedDict]]]
     r"""Validators applied to the aggregated value."""
 
 
-class RunGetAggregations(BaseModel):
+class RunGetAggregation(BaseModel):
     r"""Aggregation result with computed value and optional validators."""
 
     id: str
@@ -592,7 +629,7 @@ class RunGetAggregations(BaseModel):
     type: str
     r"""Aggregation type (e.g., MIN, MAX, MEAN, RANGE, STD_DEV)."""
 
-    outcome: Nullable[AggregationsMeasurementOutcome]
+    outcome: Nullable[RunGetAggregationOutcome]
     r"""Aggregation validation result: PASS, FAIL, UNSET, or null if no validators."""
 
     value: Nullable[RunGetValue]
@@ -601,7 +638,7 @@ class RunGetAggregations(BaseModel):
     unit: OptionalNullable[str] = UNSET
     r"""Unit of measurement for the aggregated value."""
 
-    validators: OptionalNullable[List[RunGetAggregationsValidators]] = UNSET
+    validators: OptionalNullable[List[RunGetAggregationValidator]] = UNSET
     r"""Validators applied to the aggregated value."""
 
     @model_serializer(mode="wrap")
@@ -649,23 +686,25 @@ RunGetMeasuredValue = TypeAliasType(
 r"""The actual measured value."""
 
 
-ValidatorsDataSeryOutcome = Literal["PASS", "FAIL", "UNSET"]
+DataSeryValidatorOutcome = Literal["PASS", "FAIL", "UNSET"]
 r"""Validation result: PASS, FAIL, or UNSET."""
 
 DataSeryExpectedValueTypedDict = TypeAliasType(
     "DataSeryExpectedValueTypedDict", Union[bool, float, str, List[float], List[str]]
 )
+r"""Expected value for comparison. Type depends on measurement type."""
 
 
 DataSeryExpectedValue = TypeAliasType(
     "DataSeryExpectedValue", Union[bool, float, str, List[float], List[str]]
 )
+r"""Expected value for comparison. Type depends on measurement type."""
 
 
-class DataSeryValidatorsTypedDict(TypedDict):
+class DataSeryValidatorTypedDict(TypedDict):
     r"""Validator result with outcome and comparison details."""
 
-    outcome: ValidatorsDataSeryOutcome
+    outcome: DataSeryValidatorOutcome
     r"""Validation result: PASS, FAIL, or UNSET."""
     operator: Nullable[str]
     r"""Comparison operator used for validation."""
@@ -683,10 +722,10 @@ class DataSeryValidatorsTypedDict(TypedDict):
     r"""True if user provided a custom expression (shown in italic with analytics tooltip)."""
 
 
-class DataSeryValidators(BaseModel):
+class DataSeryValidator(BaseModel):
     r"""Validator result with outcome and comparison details."""
 
-    outcome: ValidatorsDataSeryOutcome
+    outcome: DataSeryValidatorOutcome
     r"""Validation result: PASS, FAIL, or UNSET."""
 
     operator: Nullable[str]
@@ -746,38 +785,43 @@ class DataSeryValidators(BaseModel):
         return m
 
 
-AggregationsDataSeryOutcome = Literal["PASS", "FAIL", "UNSET"]
+DataSeryAggregationOutcome = Literal["PASS", "FAIL", "UNSET"]
+r"""Aggregation validation result: PASS, FAIL, UNSET, or null if no validators."""
 
 DataSeryValueTypedDict = TypeAliasType(
     "DataSeryValueTypedDict", Union[float, str, bool]
 )
+r"""Computed aggregation value. Type depends on aggregation type."""
 
 
 DataSeryValue = TypeAliasType("DataSeryValue", Union[float, str, bool])
+r"""Computed aggregation value. Type depends on aggregation type."""
 
 
-AggregationsValidatorsDataSeryOutcome = Literal["PASS", "FAIL", "UNSET"]
+DataSeryAggregationValidatorOutcome = Literal["PASS", "FAIL", "UNSET"]
 r"""Validation result: PASS, FAIL, or UNSET."""
 
-AggregationsDataSeryExpectedValueTypedDict = TypeAliasType(
-    "AggregationsDataSeryExpectedValueTypedDict",
+DataSeryAggregationExpectedValueTypedDict = TypeAliasType(
+    "DataSeryAggregationExpectedValueTypedDict",
     Union[bool, float, str, List[float], List[str]],
 )
+r"""Expected value for comparison. Type depends on measurement type."""
 
 
-AggregationsDataSeryExpectedValue = TypeAliasType(
-    "AggregationsDataSeryExpectedValue", Union[bool, float, str, List[float], List[str]]
+DataSeryAggregationExpectedValue = TypeAliasType(
+    "DataSeryAggregationExpectedValue", Union[bool, float, str, List[float], List[str]]
 )
+r"""Expected value for comparison. Type depends on measurement type."""
 
 
-class AggregationsDataSeryValidatorsTypedDict(TypedDict):
+class DataSeryAggregationValidatorTypedDict(TypedDict):
     r"""Validator result with outcome and comparison details."""
 
-    outcome: AggregationsValidatorsDataSeryOutcome
+    outcome: DataSeryAggregationValidatorOutcome
     r"""Validation result: PASS, FAIL, or UNSET."""
     operator: Nullable[str]
     r"""Comparison operator used for validation."""
-    expected_value: Nullable[AggregationsDataSeryExpectedValueTypedDict]
+    expected_value: Nullable[DataSeryAggregationExpectedValueTypedDict]
     r"""Expected value for comparison. Type depends on measurement type."""
     expression: str
     r"""Human-readable expression string for display."""
@@ -791,16 +835,16 @@ class AggregationsDataSeryValidatorsTypedDict(TypedDict):
     r"""True if user provided a custom expression (shown in italic with analytics tooltip)."""
 
 
-class AggregationsDataSeryValidators(BaseModel):
+class DataSeryAggregationValidator(BaseModel):
     r"""Validator result with outcome and comparison details."""
 
-    outcome: AggregationsValidatorsDataSeryOutcome
+    outcome: DataSeryAggregationValidatorOutcome
     r"""Validation result: PASS, FAIL, or UNSET."""
 
     operator: Nullable[str]
     r"""Comparison operator used for validation."""
 
-    expected_value: Nullable[AggregationsDataSeryExpectedValue]
+    expected_value: Nullable[DataSeryAggregationExpectedValue]
     r"""Expected value for comparison. Type depends on measurement type."""
 
     expression: str
@@ -854,24 +898,24 @@ class AggregationsDataSeryValidators(BaseModel):
         return m
 
 
-class DataSeryAggregationsTypedDict(TypedDict):
+class DataSeryAggregationTypedDict(TypedDict):
     r"""Aggregation result with computed value and optional validators."""
 
     id: str
     r"""Unique identifier for the aggregation."""
     type: str
     r"""Aggregation type (e.g., MIN, MAX, MEAN, RANGE, STD_DEV)."""
-    outcome: Nullable[AggregationsDataSeryOutcome]
+    outcome: Nullable[DataSeryAggregationOutcome]
     r"""Aggregation validation result: PASS, FAIL, UNSET, or null if no validators."""
     value: Nullable[DataSeryValueTypedDict]
     r"""Computed aggregation value. Type depends on aggregation type."""
     unit: NotRequired[Nullable[str]]
     r"""Unit of measurement for the aggregated value."""
-    validators: NotRequired[Nullable[List[AggregationsDataSeryValidatorsTypedDict]]]
+    validators: NotRequired[Nullable[List[DataSeryAggregationValidatorTypedDict]]]
     r"""Validators applied to the aggregated value."""
 
 
-class DataSeryAggregations(BaseModel):
+class DataSeryAggregation(BaseModel):
     r"""Aggregation result with computed value and optional validators."""
 
     id: str
@@ -880,7 +924,7 @@ class DataSeryAggregations(BaseModel):
     type: str
     r"""Aggregation type (e.g., MIN, MAX, MEAN, RANGE, STD_DEV)."""
 
-    outcome: Nullable[AggregationsDataSeryOutcome]
+    outcome: Nullable[DataSeryAggregationOutcome]
     r"""Aggregation validation result: PASS, FAIL, UNSET, or null if no validators."""
 
     value: Nullable[DataSeryValue]
@@ -889,7 +933,7 @@ class DataSeryAggregations(BaseModel):
     unit: OptionalNullable[str] = UNSET
     r"""Unit of measurement for the aggregated value."""
 
-    validators: OptionalNullable[List[AggregationsDataSeryValidators]] = UNSET
+    validators: OptionalNullable[List[DataSeryAggregationValidator]] = UNSET
     r"""Validators applied to the aggregated value."""
 
     @model_serializer(mode="wrap")
@@ -926,8 +970,8 @@ class DataSeryAggregations(BaseModel):
 class DataSeryTypedDict(TypedDict):
     data: List[float]
     units: Nullable[str]
-    validators: NotRequired[Nullable[List[DataSeryValidatorsTypedDict]]]
-    aggregations: NotRequired[Nullable[List[DataSeryAggregationsTypedDict]]]
+    validators: NotRequired[Nullable[List[DataSeryValidatorTypedDict]]]
+    aggregations: NotRequired[Nullable[List[DataSeryAggregationTypedDict]]]
 
 
 class DataSery(BaseModel):
@@ -935,9 +979,9 @@ class DataSery(BaseModel):
 
     units: Nullable[str]
 
-    validators: OptionalNullable[List[DataSeryValidators]] = UNSET
+    validators: OptionalNullable[List[DataSeryValidator]] = UNSET
 
-    aggregations: OptionalNullable[List[DataSeryAggregations]] = UNSET
+    aggregations: OptionalNullable[List[DataSeryAggregation]] = UNSET
 
     @model_serializer(mode="wrap")
     def serialize_model(self, handler):
@@ -970,18 +1014,18 @@ class DataSery(BaseModel):
         return m
 
 
-class MeasurementTypedDict(TypedDict):
+class RunGetMeasurementTypedDict(TypedDict):
     id: str
     r"""Measurement ID."""
     name: str
     r"""Measurement name."""
-    outcome: MeasurementOutcome
+    outcome: RunGetMeasurementOutcome
     r"""Measurement validation result."""
     units: Nullable[str]
     r"""Units of measurement."""
-    validators: Nullable[List[RunGetValidatorsTypedDict]]
+    validators: Nullable[List[RunGetValidatorTypedDict]]
     r"""Structured validation rules with outcome and expected values."""
-    aggregations: NotRequired[Nullable[List[RunGetAggregationsTypedDict]]]
+    aggregations: NotRequired[Nullable[List[RunGetAggregationTypedDict]]]
     r"""Aggregations computed over this measurement."""
     measured_value: NotRequired[RunGetMeasuredValueTypedDict]
     r"""The actual measured value."""
@@ -989,23 +1033,23 @@ class MeasurementTypedDict(TypedDict):
     r"""Multi-dimensional measurement data series."""
 
 
-class Measurement(BaseModel):
+class RunGetMeasurement(BaseModel):
     id: str
     r"""Measurement ID."""
 
     name: str
     r"""Measurement name."""
 
-    outcome: MeasurementOutcome
+    outcome: RunGetMeasurementOutcome
     r"""Measurement validation result."""
 
     units: Nullable[str]
     r"""Units of measurement."""
 
-    validators: Nullable[List[RunGetValidators]]
+    validators: Nullable[List[RunGetValidator]]
     r"""Structured validation rules with outcome and expected values."""
 
-    aggregations: OptionalNullable[List[RunGetAggregations]] = UNSET
+    aggregations: OptionalNullable[List[RunGetAggregation]] = UNSET
     r"""Aggregations computed over this measurement."""
 
     measured_value: Optional[RunGetMeasuredValue] = None
@@ -1058,7 +1102,9 @@ class RunGetPhaseTypedDict(TypedDict):
     r"""ISO 8601 timestamp when the phase ended."""
     duration: str
     r"""ISO 8601 duration of the phase (computed from started_at and ended_at)."""
-    measurements: List[MeasurementTypedDict]
+    retry_count: int
+    r"""Zero-based retry attempt index. 0 = first attempt, 1 = first retry, etc."""
+    measurements: List[RunGetMeasurementTypedDict]
     r"""Array of measurements taken during this phase."""
     docstring: NotRequired[Nullable[str]]
     r"""Phase documentation string."""
@@ -1083,7 +1129,10 @@ class RunGetPhase(BaseModel):
     duration: str
     r"""ISO 8601 duration of the phase (computed from started_at and ended_at)."""
 
-    measurements: List[Measurement]
+    retry_count: int
+    r"""Zero-based retry attempt index. 0 = first attempt, 1 = first retry, etc."""
+
+    measurements: List[RunGetMeasurement]
     r"""Array of measurements taken during this phase."""
 
     docstring: OptionalNullable[str] = UNSET
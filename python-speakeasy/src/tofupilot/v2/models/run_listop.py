@@ -192,19 +192,27 @@ r"""Final result of the run execution."""
 
 
 class RunListCreatedByUserTypedDict(TypedDict):
+    r"""User whose API key was used to create this run. Only returned if `all` or `created_by` is included."""
+
     id: str
     r"""User ID."""
     name: Nullable[str]
+    r"""User display name."""
     email: Nullable[str]
+    r"""User email address."""
 
 
 class RunListCreatedByUser(BaseModel):
+    r"""User whose API key was used to create this run. Only returned if `all` or `created_by` is included."""
+
     id: str
     r"""User ID."""
 
     name: Nullable[str]
+    r"""User display name."""
 
     email: Nullable[str]
+    r"""User email address."""
 
     @model_serializer(mode="wrap")
     def serialize_model(self, handler):
@@ -238,6 +246,8 @@ class RunListCreatedByUser(BaseModel):
 
 
 class RunListCreatedByStationTypedDict(TypedDict):
+    r"""Station whose API key was used to create this run. Only returned if `all` or `created_by` is included."""
+
     id: str
     r"""Station ID."""
     name: str
@@ -245,6 +255,8 @@ class RunListCreatedByStationTypedDict(TypedDict):
 
 
 class RunListCreatedByStation(BaseModel):
+    r"""Station whose API key was used to create this run. Only returned if `all` or `created_by` is included."""
+
     id: str
     r"""Station ID."""
 
@@ -253,19 +265,27 @@ class RunListCreatedByStation(BaseModel):
 
 
 class RunListOperatedByTypedDict(TypedDict):
+    r"""User who operated this run. Only returned if `all` or `operated_by` is included."""
+
     id: str
     r"""Operator ID."""
     name: Nullable[str]
+    r"""Operator display name."""
     email: Nullable[str]
+    r"""Operator email address."""
 
 
 class RunListOperatedBy(BaseModel):
+    r"""User who operated this run. Only returned if `all` or `operated_by` is included."""
+
     id: str
     r"""Operator ID."""
 
     name: Nullable[str]
+    r"""Operator display name."""
 
     email: Nullable[str]
+    r"""Operator email address."""
 
     @model_serializer(mode="wrap")
     def serialize_model(self, handler):
@@ -299,6 +319,8 @@ class RunListOperatedBy(BaseModel):
 
 
 class RunListVersionTypedDict(TypedDict):
+    r"""Version of the procedure used for this run."""
+
     id: str
     r"""Procedure version ID."""
     tag: str
@@ -306,6 +328,8 @@ class RunListVersionTypedDict(TypedDict):
 
 
 class RunListVersion(BaseModel):
+    r"""Version of the procedure used for this run."""
+
     id: str
     r"""Procedure version ID."""
 
@@ -416,6 +440,8 @@ class RunListPart(BaseModel):
 
 
 class RunListBatchTypedDict(TypedDict):
+    r"""Batch information for this unit."""
+
     id: str
     r"""Batch ID."""
     number: str
@@ -423,6 +449,8 @@ class RunListBatchTypedDict(TypedDict):
 
 
 class RunListBatch(BaseModel):
+    r"""Batch information for this unit."""
+
     id: str
     r"""Batch ID."""
 
@@ -123,6 +123,8 @@ class StationGetCurrentRepository(BaseModel):
 
 
 class StationGetCurrentDeploymentTypedDict(TypedDict):
+    r"""Deployment information for this procedure on this station"""
+
     deployed_at: str
     r"""When the procedure was deployed"""
     commit: Nullable[StationGetCurrentCommitTypedDict]
@@ -130,6 +132,8 @@ class StationGetCurrentDeploymentTypedDict(TypedDict):
 
 
 class StationGetCurrentDeployment(BaseModel):
+    r"""Deployment information for this procedure on this station"""
+
     deployed_at: str
     r"""When the procedure was deployed"""
 
@@ -229,14 +233,19 @@ class StationGetCurrentProcedure(BaseModel):
 
 
 StationGetCurrentConnectionStatus = Literal["connected", "disconnected"]
+r"""Current connection status of the station"""
 
 
 class StationGetCurrentTeamTypedDict(TypedDict):
+    r"""Team this station is assigned to"""
+
     id: str
     name: str
 
 
 class StationGetCurrentTeam(BaseModel):
+    r"""Team this station is assigned to"""
+
     id: str
 
     name: str
@@ -136,6 +136,8 @@ class StationGetRepository(BaseModel):
 
 
 class StationGetDeploymentTypedDict(TypedDict):
+    r"""Deployment information for this procedure on this station"""
+
     deployed_at: str
     r"""When the procedure was deployed"""
     commit: Nullable[StationGetCommitTypedDict]
@@ -143,6 +145,8 @@ class StationGetDeploymentTypedDict(TypedDict):
 
 
 class StationGetDeployment(BaseModel):
+    r"""Deployment information for this procedure on this station"""
+
     deployed_at: str
     r"""When the procedure was deployed"""
 
@@ -242,14 +246,19 @@ class StationGetProcedure(BaseModel):
 
 
 StationGetConnectionStatus = Literal["connected", "disconnected"]
+r"""Current connection status of the station"""
 
 
 class StationGetTeamTypedDict(TypedDict):
+    r"""Team this station is assigned to"""
+
     id: str
     name: str
 
 
 class StationGetTeam(BaseModel):
+    r"""Team this station is assigned to"""
+
     id: str
 
     name: str
@@ -90,6 +90,8 @@ class StationListProcedure(BaseModel):
 
 
 class StationListTeamTypedDict(TypedDict):
+    r"""Team this station belongs to"""
+
     id: str
     r"""Team ID"""
     name: str
@@ -97,6 +99,8 @@ class StationListTeamTypedDict(TypedDict):
 
 
 class StationListTeam(BaseModel):
+    r"""Team this station belongs to"""
+
     id: str
     r"""Team ID"""
 
@@ -28,16 +28,22 @@ class UnitGetRequest(BaseModel):
 
 
 class UnitGetCreatedByUserTypedDict(TypedDict):
+    r"""User who created this unit."""
+
     id: str
     r"""User ID."""
     name: Nullable[str]
+    r"""User display name."""
 
 
 class UnitGetCreatedByUser(BaseModel):
+    r"""User who created this unit."""
+
     id: str
     r"""User ID."""
 
     name: Nullable[str]
+    r"""User display name."""
 
     @model_serializer(mode="wrap")
     def serialize_model(self, handler):
@@ -71,6 +77,8 @@ class UnitGetCreatedByUser(BaseModel):
 
 
 class UnitGetCreatedByStationTypedDict(TypedDict):
+    r"""Station that created this unit."""
+
     id: str
     r"""Station ID."""
     name: str
@@ -78,6 +86,8 @@ class UnitGetCreatedByStationTypedDict(TypedDict):
 
 
 class UnitGetCreatedByStation(BaseModel):
+    r"""Station that created this unit."""
+
     id: str
     r"""Station ID."""
 
@@ -134,6 +144,8 @@ class UnitGetPart(BaseModel):
 
 
 class UnitGetBatchTypedDict(TypedDict):
+    r"""Batch information for this unit."""
+
     id: str
     r"""Batch ID."""
     number: str
@@ -141,6 +153,8 @@ class UnitGetBatchTypedDict(TypedDict):
 
 
 class UnitGetBatch(BaseModel):
+    r"""Batch information for this unit."""
+
     id: str
     r"""Batch ID."""
 
@@ -149,6 +163,8 @@ class UnitGetBatch(BaseModel):
 
 
 class ParentRevisionTypedDict(TypedDict):
+    r"""Part revision information."""
+
     id: str
     r"""Revision ID."""
     number: str
@@ -156,6 +172,8 @@ class ParentRevisionTypedDict(TypedDict):
 
 
 class ParentRevision(BaseModel):
+    r"""Part revision information."""
+
     id: str
     r"""Revision ID."""
 
@@ -164,6 +182,8 @@ class ParentRevision(BaseModel):
 
 
 class ParentPartTypedDict(TypedDict):
+    r"""Part information for the parent unit."""
+
     id: str
     r"""Part ID."""
     number: str
@@ -175,6 +195,8 @@ class ParentPartTypedDict(TypedDict):
 
 
 class ParentPart(BaseModel):
+    r"""Part information for the parent unit."""
+
     id: str
     r"""Part ID."""
 
@@ -219,6 +241,8 @@ class ParentPart(BaseModel):
 
 
 class UnitGetParentTypedDict(TypedDict):
+    r"""Parent unit information with part details and processed images."""
+
     id: str
     r"""Unit ID."""
     serial_number: str
@@ -228,6 +252,8 @@ class UnitGetParentTypedDict(TypedDict):
 
 
 class UnitGetParent(BaseModel):
+    r"""Parent unit information with part details and processed images."""
+
     id: str
     r"""Unit ID."""
 
@@ -269,6 +295,8 @@ class UnitGetParent(BaseModel):
 
 
 class ChildRevisionTypedDict(TypedDict):
+    r"""Part revision information."""
+
     id: str
     r"""Revision ID."""
     number: str
@@ -276,6 +304,8 @@ class ChildRevisionTypedDict(TypedDict):
 
 
 class ChildRevision(BaseModel):
+    r"""Part revision information."""
+
     id: str
     r"""Revision ID."""
 
@@ -284,6 +314,8 @@ class ChildRevision(BaseModel):
 
 
 class ChildPartTypedDict(TypedDict):
+    r"""Part information for the child unit."""
+
     id: str
     r"""Part ID."""
     number: str
@@ -295,6 +327,8 @@ class ChildPartTypedDict(TypedDict):
 
 
 class ChildPart(BaseModel):
+    r"""Part information for the child unit."""
+
     id: str
     r"""Part ID."""
 
@@ -412,6 +446,8 @@ class UnitGetProcedure(BaseModel):
 
 
 class CreatedDuringTypedDict(TypedDict):
+    r"""Run that created this unit."""
+
     id: str
     r"""Run ID."""
     created_at: datetime
@@ -429,6 +465,8 @@ class CreatedDuringTypedDict(TypedDict):
 
 
 class CreatedDuring(BaseModel):
+    r"""Run that created this unit."""
+
     id: str
     r"""Run ID."""
 
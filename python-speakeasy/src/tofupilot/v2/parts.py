@@ -22,30 +22,24 @@ class Parts(BaseSDK):
     def _init_sdks(self):
         self.revisions = Revisions(self.sdk_configuration)
 
-    def list(
+    def create(
         self,
         *,
-        limit: Optional[int] = 50,
-        cursor: Optional[int] = None,
-        search_query: Optional[str] = None,
-        procedure_ids: Optional[List[str]] = None,
-        sort_by: Optional[models.PartListSortBy] = "created_at",
-        sort_order: Optional[models.PartListSortOrder] = "desc",
+        number: str,
+        name: Optional[str] = None,
+        revision_number: Optional[str] = None,
         retries: OptionalNullable[utils.RetryConfig] = UNSET,
         server_url: Optional[str] = None,
         timeout_ms: Optional[int] = None,
         http_headers: Optional[Mapping[str, str]] = None,
-    ) -> models.PartListResponse:
-        r"""List and filter parts
+    ) -> models.PartCreateResponse:
+        r"""Create part
 
-        Retrieve a paginated list of parts and components in your organization. Filter and search by part name, number, or revision number for inventory management.
+        Create a new part. Optionally create with a revision. Part numbers are matched case-insensitively (e.g., \"PART-001\" and \"part-001\" are considered the same).
 
-        :param limit: Maximum number of parts to return in a single page.
-        :param cursor:
-        :param search_query:
-        :param procedure_ids:
-        :param sort_by: Field to sort results by.
-        :param sort_order: Sort order direction.
+        :param number: Unique identifier number for the part.
+        :param name: Human-readable name for the part. If not provided, a default name will be used.
+        :param revision_number: Revision identifier for the part version. If not provided, default revision identifier will be used.
         :param retries: Override the default retry configuration for this method
         :param server_url: Override the default server URL for this method
         :param timeout_ms: Override the default request timeout configuration for this method in milliseconds
@@ -61,28 +55,28 @@ class Parts(BaseSDK):
         else:
             base_url = self._get_url(base_url, url_variables)
 
-        request = models.PartListRequest(
-            limit=limit,
-            cursor=cursor,
-            search_query=search_query,
-            procedure_ids=procedure_ids,
-            sort_by=sort_by,
-            sort_order=sort_order,
+        request = models.PartCreateRequest(
+            number=number,
+            name=name,
+            revision_number=revision_number,
         )
 
         req = self._build_request(
-            method="GET",
+            method="POST",
             path="/v2/parts",
             base_url=base_url,
             url_variables=url_variables,
             request=request,
-            request_body_required=False,
+            request_body_required=True,
             request_has_path_params=False,
             request_has_query_params=True,
             user_agent_header="user-agent",
             accept_header_value="application/json",
             http_headers=http_headers,
             security=self.sdk_configuration.security,
+            get_serialized_body=lambda: utils.serialize_request_body(
+                request, False, False, "json", models.PartCreateRequest
+            ),
             timeout_ms=timeout_ms,
         )
 
@@ -98,25 +92,28 @@ class Parts(BaseSDK):
             hook_ctx=HookContext(
                 config=self.sdk_configuration,
                 base_url=base_url or "",
-                operation_id="part-list",
+                operation_id="part-create",
                 oauth2_scopes=[],
                 security_source=get_security_from_env(
                     self.sdk_configuration.security, models.Security
                 ),
             ),
             request=req,
-            error_status_codes=["401", "4XX", "500", "5XX"],
+            error_status_codes=["401", "409", "4XX", "500", "5XX"],
             retry_config=retry_config,
         )
 
         response_data: Any = None
         if utils.match_response(http_res, "200", "application/json"):
-            return unmarshal_json_response(models.PartListResponse, http_res)
+            return unmarshal_json_response(models.PartCreateResponse, http_res)
         if utils.match_response(http_res, "401", "application/json"):
             response_data = unmarshal_json_response(
                 errors.ErrorUNAUTHORIZEDData, http_res
             )
             raise errors.ErrorUNAUTHORIZED(response_data, http_res)
+        if utils.match_response(http_res, "409", "application/json"):
+            response_data = unmarshal_json_response(errors.ErrorCONFLICTData, http_res)
+            raise errors.ErrorCONFLICT(response_data, http_res)
         if utils.match_response(http_res, "500", "application/json"):
             response_data = unmarshal_json_response(
                 errors.ErrorINTERNALSERVERERRORData, http_res
@@ -131,30 +128,24 @@ class Parts(BaseSDK):
 
         raise errors.APIError("Unexpected response received", http_res)
 
-    async def list_async(
+    async def create_async(
         self,
         *,
-        limit: Optional[int] = 50,
-        cursor: Optional[int] = None,
-        search_query: Optional[str] = None,
-        procedure_ids: Optional[List[str]] = None,
-        sort_by: Optional[models.PartListSortBy] = "created_at",
-        sort_order: Optional[models.PartListSortOrder] = "desc",
+        number: str,
+        name: Optional[str] = None,
+        revision_number: Optional[str] = None,
         retries: OptionalNullable[utils.RetryConfig] = UNSET,
         server_url: Optional[str] = None,
         timeout_ms: Optional[int] = None,
         http_headers: Optional[Mapping[str, str]] = None,
-    ) -> models.PartListResponse:
-        r"""List and filter parts
+    ) -> models.PartCreateResponse:
+        r"""Create part
 
-        Retrieve a paginated list of parts and components in your organization. Filter and search by part name, number, or revision number for inventory management.
+        Create a new part. Optionally create with a revision. Part numbers are matched case-insensitively (e.g., \"PART-001\" and \"part-001\" are considered the same).
 
-        :param limit: Maximum number of parts to return in a single page.
-        :param cursor:
-        :param search_query:
-        :param procedure_ids:
-        :param sort_by: Field to sort results by.
-        :param sort_order: Sort order direction.
+        :param number: Unique identifier number for the part.
+        :param name: Human-readable name for the part. If not provided, a default name will be used.
+        :param revision_number: Revision identifier for the part version. If not provided, default revision identifier will be used.
         :param retries: Override the default retry configuration for this method
         :param server_url: Override the default server URL for this method
         :param timeout_ms: Override the default request timeout configuration for this method in milliseconds
@@ -170,28 +161,28 @@ class Parts(BaseSDK):
         else:
             base_url = self._get_url(base_url, url_variables)
 
-        request = models.PartListRequest(
-            limit=limit,
-            cursor=cursor,
-            search_query=search_query,
-            procedure_ids=procedure_ids,
-            sort_by=sort_by,
-            sort_order=sort_order,
+        request = models.PartCreateRequest(
+            number=number,
+            name=name,
+            revision_number=revision_number,
         )
 
         req = self._build_request_async(
-            method="GET",
+            method="POST",
             path="/v2/parts",
             base_url=base_url,
             url_variables=url_variables,
             request=request,
-            request_body_required=False,
+            request_body_required=True,
             request_has_path_params=False,
             request_has_query_params=True,
             user_agent_header="user-agent",
             accept_header_value="application/json",
             http_headers=http_headers,
             security=self.sdk_configuration.security,
+            get_serialized_body=lambda: utils.serialize_request_body(
+                request, False, False, "json", models.PartCreateRequest
+            ),
             timeout_ms=timeout_ms,
         )
 
@@ -207,25 +198,28 @@ class Parts(BaseSDK):
             hook_ctx=HookContext(
                 config=self.sdk_configuration,
                 base_url=base_url or "",
-                operation_id="part-list",
+                operation_id="part-create",
                 oauth2_scopes=[],
                 security_source=get_security_from_env(
                     self.sdk_configuration.security, models.Security
                 ),
             ),
             request=req,
-            error_status_codes=["401", "4XX", "500", "5XX"],
+            error_status_codes=["401", "409", "4XX", "500", "5XX"],
             retry_config=retry_config,
         )
 
         response_data: Any = None
         if utils.match_response(http_res, "200", "application/json"):
-            return unmarshal_json_response(models.PartListResponse, http_res)
+            return unmarshal_json_response(models.PartCreateResponse, http_res)
         if utils.match_response(http_res, "401", "application/json"):
             response_data = unmarshal_json_response(
                 errors.ErrorUNAUTHORIZEDData, http_res
             )
             raise errors.ErrorUNAUTHORIZED(response_data, http_res)
+        if utils.match_response(http_res, "409", "application/json"):
+            response_data = unmarshal_json_response(errors.ErrorCONFLICTData, http_res)
+            raise errors.ErrorCONFLICT(response_data, http_res)
         if utils.match_response(http_res, "500", "application/json"):
             response_data = unmarshal_json_response(
                 errors.ErrorINTERNALSERVERERRORData, http_res
@@ -240,24 +234,30 @@ class Parts(BaseSDK):
 
         raise errors.APIError("Unexpected response received", http_res)
 
-    def create(
+    def list(
         self,
         *,
-        number: str,
-        name: Optional[str] = None,
-        revision_number: Optional[str] = None,
+        limit: Optional[int] = 50,
+        cursor: Optional[int] = None,
+        search_query: Optional[str] = None,
+        procedure_ids: Optional[List[str]] = None,
+        sort_by: Optional[models.PartListSortBy] = "created_at",
+        sort_order: Optional[models.PartListSortOrder] = "desc",
         retries: OptionalNullable[utils.RetryConfig] = UNSET,
         server_url: Optional[str] = None,
         timeout_ms: Optional[int] = None,
         http_headers: Optional[Mapping[str, str]] = None,
-    ) -> models.PartCreateResponse:
-        r"""Create part
+    ) -> models.PartListResponse:
+        r"""List and filter parts
 
-        Create a new part. Optionally create with a revision. Part numbers are matched case-insensitively (e.g., \"PART-001\" and \"part-001\" are considered the same).
+        Retrieve a paginated list of parts and components in your organization. Filter and search by part name, number, or revision number for inventory management.
 
-        :param number: Unique identifier number for the part.
-        :param name: Human-readable name for the part. If not provided, a default name will be used.
-        :param revision_number: Revision identifier for the part version. If not provided, default revision identifier will be used.
+        :param limit: Maximum number of parts to return in a single page.
+        :param cursor:
+        :param search_query:
+        :param procedure_ids:
+        :param sort_by: Field to sort results by.
+        :param sort_order: Sort order direction.
         :param retries: Override the default retry configuration for this method
         :param server_url: Override the default server URL for this method
         :param timeout_ms: Override the default request timeout configuration for this method in milliseconds
@@ -273,28 +273,28 @@ class Parts(BaseSDK):
         else:
             base_url = self._get_url(base_url, url_variables)
 
-        request = models.PartCreateRequest(
-            number=number,
-            name=name,
-            revision_number=revision_number,
+        request = models.PartListRequest(
+            limit=limit,
+            cursor=cursor,
+            search_query=search_query,
+            procedure_ids=procedure_ids,
+            sort_by=sort_by,
+            sort_order=sort_order,
         )
 
         req = self._build_request(
-            method="POST",
+            method="GET",
             path="/v2/parts",
             base_url=base_url,
             url_variables=url_variables,
             request=request,
-            request_body_required=True,
+            request_body_required=False,
             request_has_path_params=False,
             request_has_query_params=True,
             user_agent_header="user-agent",
             accept_header_value="application/json",
             http_headers=http_headers,
             security=self.sdk_configuration.security,
-            get_serialized_body=lambda: utils.serialize_request_body(
-                request, False, False, "json", models.PartCreateRequest
-            ),
             timeout_ms=timeout_ms,
         )
 
@@ -310,28 +310,25 @@ class Parts(BaseSDK):
             hook_ctx=HookContext(
                 config=self.sdk_configuration,
                 base_url=base_url or "",
-                operation_id="part-create",
+                operation_id="part-list",
                 oauth2_scopes=[],
                 security_source=get_security_from_env(
                     self.sdk_configuration.security, models.Security
                 ),
             ),
             request=req,
-            error_status_codes=["401", "409", "4XX", "500", "5XX"],
+            error_status_codes=["401", "4XX", "500", "5XX"],
             retry_config=retry_config,
         )
 
         response_data: Any = None
         if utils.match_response(http_res, "200", "application/json"):
-            return unmarshal_json_response(models.PartCreateResponse, http_res)
+            return unmarshal_json_response(models.PartListResponse, http_res)
         if utils.match_response(http_res, "401", "application/json"):
             response_data = unmarshal_json_response(
                 errors.ErrorUNAUTHORIZEDData, http_res
             )
             raise errors.ErrorUNAUTHORIZED(response_data, http_res)
-        if utils.match_response(http_res, "409", "application/json"):
-            response_data = unmarshal_json_response(errors.ErrorCONFLICTData, http_res)
-            raise errors.ErrorCONFLICT(response_data, http_res)
         if utils.match_response(http_res, "500", "application/json"):
             response_data = unmarshal_json_response(
                 errors.ErrorINTERNALSERVERERRORData, http_res
@@ -346,24 +343,30 @@ class Parts(BaseSDK):
 
         raise errors.APIError("Unexpected response received", http_res)
 
-    async def create_async(
+    async def list_async(
         self,
         *,
-        number: str,
-        name: Optional[str] = None,
-        revision_number: Optional[str] = None,
+        limit: Optional[int] = 50,
+        cursor: Optional[int] = None,
+        search_query: Optional[str] = None,
+        procedure_ids: Optional[List[str]] = None,
+        sort_by: Optional[models.PartListSortBy] = "created_at",
+        sort_order: Optional[models.PartListSortOrder] = "desc",
         retries: OptionalNullable[utils.RetryConfig] = UNSET,
         server_url: Optional[str] = None,
         timeout_ms: Optional[int] = None,
         http_headers: Optional[Mapping[str, str]] = None,
-    ) -> models.PartCreateResponse:
-        r"""Create part
+    ) -> models.PartListResponse:
+        r"""List and filter parts
 
-        Create a new part. Optionally create with a revision. Part numbers are matched case-insensitively (e.g., \"PART-001\" and \"part-001\" are considered the same).
+        Retrieve a paginated list of parts and components in your organization. Filter and search by part name, number, or revision number for inventory management.
 
-        :param number: Unique identifier number for the part.
-        :param name: Human-readable name for the part. If not provided, a default name will be used.
-        :param revision_number: Revision identifier for the part version. If not provided, default revision identifier will be used.
+        :param limit: Maximum number of parts to return in a single page.
+        :param cursor:
+        :param search_query:
+        :param procedure_ids:
+        :param sort_by: Field to sort results by.
+        :param sort_order: Sort order direction.
         :param retries: Override the default retry configuration for this method
         :param server_url: Override the default server URL for this method
         :param timeout_ms: Override the default request timeout configuration for this method in milliseconds
@@ -379,28 +382,28 @@ class Parts(BaseSDK):
         else:
             base_url = self._get_url(base_url, url_variables)
 
-        request = models.PartCreateRequest(
-            number=number,
-            name=name,
-            revision_number=revision_number,
+        request = models.PartListRequest(
+            limit=limit,
+            cursor=cursor,
+            search_query=search_query,
+            procedure_ids=procedure_ids,
+            sort_by=sort_by,
+            sort_order=sort_order,
         )
 
         req = self._build_request_async(
-            method="POST",
+            method="GET",
             path="/v2/parts",
             base_url=base_url,
             url_variables=url_variables,
             request=request,
-            request_body_required=True,
+            request_body_required=False,
             request_has_path_params=False,
             request_has_query_params=True,
             user_agent_header="user-agent",
             accept_header_value="application/json",
             http_headers=http_headers,
             security=self.sdk_configuration.security,
-            get_serialized_body=lambda: utils.serialize_request_body(
-                request, False, False, "json", models.PartCreateRequest
-            ),
             timeout_ms=timeout_ms,
         )
 
@@ -416,28 +419,25 @@ class Parts(BaseSDK):
             hook_ctx=HookContext(
                 config=self.sdk_configuration,
                 base_url=base_url or "",
-                operation_id="part-create",
+                operation_id="part-list",
                 oauth2_scopes=[],
                 security_source=get_security_from_env(
                     self.sdk_configuration.security, models.Security
                 ),
             ),
             request=req,
-            error_status_codes=["401", "409", "4XX", "500", "5XX"],
+            error_status_codes=["401", "4XX", "500", "5XX"],
             retry_config=retry_config,
         )
 
         response_data: Any = None
         if utils.match_response(http_res, "200", "application/json"):
-            return unmarshal_json_response(models.PartCreateResponse, http_res)
+            return unmarshal_json_response(models.PartListResponse, http_res)
         if utils.match_response(http_res, "401", "application/json"):
             response_data = unmarshal_json_response(
                 errors.ErrorUNAUTHORIZEDData, http_res
             )
             raise errors.ErrorUNAUTHORIZED(response_data, http_res)
-        if utils.match_response(http_res, "409", "application/json"):
-            response_data = unmarshal_json_response(errors.ErrorCONFLICTData, http_res)
-            raise errors.ErrorCONFLICT(response_data, http_res)
         if utils.match_response(http_res, "500", "application/json"):
             response_data = unmarshal_json_response(
                 errors.ErrorINTERNALSERVERERRORData, http_res
@@ -646,20 +646,24 @@ class Parts(BaseSDK):
 
         raise errors.APIError("Unexpected response received", http_res)
 
-    def delete(
+    def update(
         self,
         *,
         number: str,
+        new_number: Optional[str] = None,
+        name: Optional[str] = None,
         retries: OptionalNullable[utils.RetryConfig] = UNSET,
         server_url: Optional[str] = None,
         timeout_ms: Optional[int] = None,
         http_headers: Optional[Mapping[str, str]] = None,
-    ) -> models.PartDeleteResponse:
-        r"""Delete part
+    ) -> models.PartUpdateResponse:
+        r"""Update part
 
-        Permanently delete a part and all its revisions. This removes all associated data and cannot be undone.
+        Update a part's number or name. Identifies the part by its current number in the URL with case-insensitive matching.
 
-        :param number: Part number to delete.
+        :param number: Part number of the part to update.
+        :param new_number: New unique identifier number for the part.
+        :param name: New human-readable name for the part.
         :param retries: Override the default retry configuration for this method
         :param server_url: Override the default server URL for this method
         :param timeout_ms: Override the default request timeout configuration for this method in milliseconds
@@ -675,23 +679,30 @@ class Parts(BaseSDK):
         else:
             base_url = self._get_url(base_url, url_variables)
 
-        request = models.PartDeleteRequest(
+        request = models.PartUpdateRequest(
             number=number,
+            request_body=models.PartUpdateRequestBody(
+                new_number=new_number,
+                name=name,
+            ),
         )
 
         req = self._build_request(
-            method="DELETE",
+            method="PATCH",
             path="/v2/parts/{number}",
             base_url=base_url,
             url_variables=url_variables,
             request=request,
-            request_body_required=False,
+            request_body_required=True,
             request_has_path_params=True,
             request_has_query_params=True,
             user_agent_header="user-agent",
             accept_header_value="application/json",
             http_headers=http_headers,
             security=self.sdk_configuration.security,
+            get_serialized_body=lambda: utils.serialize_request_body(
+                request.request_body, False, False, "json", models.PartUpdateRequestBody
+            ),
             timeout_ms=timeout_ms,
         )
 
@@ -707,20 +718,20 @@ class Parts(BaseSDK):
             hook_ctx=HookContext(
                 config=self.sdk_configuration,
                 base_url=base_url or "",
-                operation_id="part-delete",
+                operation_id="part-update",
                 oauth2_scopes=[],
                 security_source=get_security_from_env(
                     self.sdk_configuration.security, models.Security
                 ),
             ),
             request=req,
-            error_status_codes=["401", "404", "4XX", "500", "5XX"],
+            error_status_codes=["401", "404", "409", "4XX", "500", "5XX"],
             retry_config=retry_config,
         )
 
         response_data: Any = None
         if utils.match_response(http_res, "200", "application/json"):
-            return unmarshal_json_response(models.PartDeleteResponse, http_res)
+            return unmarshal_json_response(models.PartUpdateResponse, http_res)
         if utils.match_response(http_res, "401", "application/json"):
             response_data = unmarshal_json_response(
                 errors.ErrorUNAUTHORIZEDData, http_res
@@ -729,6 +740,9 @@ class Parts(BaseSDK):
         if utils.match_response(http_res, "404", "application/json"):
             response_data = unmarshal_json_response(errors.ErrorNOTFOUNDData, http_res)
             raise errors.ErrorNOTFOUND(response_data, http_res)
+        if utils.match_response(http_res, "409", "application/json"):
+            response_data = unmarshal_json_response(errors.ErrorCONFLICTData, http_res)
+            raise errors.ErrorCONFLICT(response_data, http_res)
         if utils.match_response(http_res, "500", "application/json"):
             response_data = unmarshal_json_response(
                 errors.ErrorINTERNALSERVERERRORData, http_res
@@ -743,20 +757,24 @@ class Parts(BaseSDK):
 
         raise errors.APIError("Unexpected response received", http_res)
 
-    async def delete_async(
+    async def update_async(
         self,
         *,
         number: str,
+        new_number: Optional[str] = None,
+        name: Optional[str] = None,
         retries: OptionalNullable[utils.RetryConfig] = UNSET,
         server_url: Optional[str] = None,
         timeout_ms: Optional[int] = None,
         http_headers: Optional[Mapping[str, str]] = None,
-    ) -> models.PartDeleteResponse:
-        r"""Delete part
+    ) -> models.PartUpdateResponse:
+        r"""Update part
 
-        Permanently delete a part and all its revisions. This removes all associated data and cannot be undone.
+        Update a part's number or name. Identifies the part by its current number in the URL with case-insensitive matching.
 
-        :param number: Part number to delete.
+        :param number: Part number of the part to update.
+        :param new_number: New unique identifier number for the part.
+        :param name: New human-readable name for the part.
         :param retries: Override the default retry configuration for this method
         :param server_url: Override the default server URL for this method
         :param timeout_ms: Override the default request timeout configuration for this method in milliseconds
@@ -772,23 +790,30 @@ class Parts(BaseSDK):
         else:
             base_url = self._get_url(base_url, url_variables)
 
-        request = models.PartDeleteRequest(
+        request = models.PartUpdateRequest(
             number=number,
+            request_body=models.PartUpdateRequestBody(
+                new_number=new_number,
+                name=name,
+            ),
         )
 
         req = self._build_request_async(
-            method="DELETE",
+            method="PATCH",
             path="/v2/parts/{number}",
             base_url=base_url,
             url_variables=url_variables,
             request=request,
-            request_body_required=False,
+            request_body_required=True,
             request_has_path_params=True,
             request_has_query_params=True,
             user_agent_header="user-agent",
             accept_header_value="application/json",
             http_headers=http_headers,
             security=self.sdk_configuration.security,
+            get_serialized_body=lambda: utils.serialize_request_body(
+                request.request_body, False, False, "json", models.PartUpdateRequestBody
+            ),
             timeout_ms=timeout_ms,
         )
 
@@ -804,20 +829,20 @@ class Parts(BaseSDK):
             hook_ctx=HookContext(
                 config=self.sdk_configuration,
                 base_url=base_url or "",
-                operation_id="part-delete",
+                operation_id="part-update",
                 oauth2_scopes=[],
                 security_source=get_security_from_env(
                     self.sdk_configuration.security, models.Security
                 ),
             ),
             request=req,
-            error_status_codes=["401", "404", "4XX", "500", "5XX"],
+            error_status_codes=["401", "404", "409", "4XX", "500", "5XX"],
             retry_config=retry_config,
         )
 
         response_data: Any = None
         if utils.match_response(http_res, "200", "application/json"):
-            return unmarshal_json_response(models.PartDeleteResponse, http_res)
+            return unmarshal_json_response(models.PartUpdateResponse, http_res)
         if utils.match_response(http_res, "401", "application/json"):
             response_data = unmarshal_json_response(
                 errors.ErrorUNAUTHORIZEDData, http_res
@@ -826,6 +851,9 @@ class Parts(BaseSDK):
         if utils.match_response(http_res, "404", "application/json"):
             response_data = unmarshal_json_response(errors.ErrorNOTFOUNDData, http_res)
             raise errors.ErrorNOTFOUND(response_data, http_res)
+        if utils.match_response(http_res, "409", "application/json"):
+            response_data = unmarshal_json_response(errors.ErrorCONFLICTData, http_res)
+            raise errors.ErrorCONFLICT(response_data, http_res)
         if utils.match_response(http_res, "500", "application/json"):
             response_data = unmarshal_json_response(
                 errors.ErrorINTERNALSERVERERRORData, http_res
@@ -840,24 +868,20 @@ class Parts(BaseSDK):
 
         raise errors.APIError("Unexpected response received", http_res)
 
-    def update(
+    def delete(
         self,
         *,
         number: str,
-        new_number: Optional[str] = None,
-        name: Optional[str] = None,
         retries: OptionalNullable[utils.RetryConfig] = UNSET,
         server_url: Optional[str] = None,
         timeout_ms: Optional[int] = None,
         http_headers: Optional[Mapping[str, str]] = None,
-    ) -> models.PartUpdateResponse:
-        r"""Update part
+    ) -> models.PartDeleteResponse:
+        r"""Delete part
 
-        Update a part's number or name. Identifies the part by its current number in the URL with case-insensitive matching.
+        Permanently delete a part and all its revisions. This removes all associated data and cannot be undone.
 
-        :param number: Part number of the part to update.
-        :param new_number: New unique identifier number for the part.
-        :param name: New human-readable name for the part.
+        :param number: Part number to delete.
         :param retries: Override the default retry configuration for this method
         :param server_url: Override the default server URL for this method
         :param timeout_ms: Override the default request timeout configuration for this method in milliseconds
@@ -873,30 +897,23 @@ class Parts(BaseSDK):
         else:
             base_url = self._get_url(base_url, url_variables)
 
-        request = models.PartUpdateRequest(
+        request = models.PartDeleteRequest(
             number=number,
-            request_body=models.PartUpdateRequestBody(
-                new_number=new_number,
-                name=name,
-            ),
         )
 
         req = self._build_request(
-            method="PATCH",
+            method="DELETE",
             path="/v2/parts/{number}",
             base_url=base_url,
             url_variables=url_variables,
             request=request,
-            request_body_required=True,
+            request_body_required=False,
             request_has_path_params=True,
             request_has_query_params=True,
             user_agent_header="user-agent",
             accept_header_value="application/json",
             http_headers=http_headers,
             security=self.sdk_configuration.security,
-            get_serialized_body=lambda: utils.serialize_request_body(
-                request.request_body, False, False, "json", models.PartUpdateRequestBody
-            ),
             timeout_ms=timeout_ms,
         )
 
@@ -912,20 +929,20 @@ class Parts(BaseSDK):
             hook_ctx=HookContext(
                 config=self.sdk_configuration,
                 base_url=base_url or "",
-                operation_id="part-update",
+                operation_id="part-delete",
                 oauth2_scopes=[],
                 security_source=get_security_from_env(
                     self.sdk_configuration.security, models.Security
                 ),
             ),
             request=req,
-            error_status_codes=["401", "404", "409", "4XX", "500", "5XX"],
+            error_status_codes=["401", "404", "4XX", "500", "5XX"],
             retry_config=retry_config,
         )
 
         response_data: Any = None
         if utils.match_response(http_res, "200", "application/json"):
-            return unmarshal_json_response(models.PartUpdateResponse, http_res)
+            return unmarshal_json_response(models.PartDeleteResponse, http_res)
         if utils.match_response(http_res, "401", "application/json"):
             response_data = unmarshal_json_response(
                 errors.ErrorUNAUTHORIZEDData, http_res
@@ -934,9 +951,6 @@ class Parts(BaseSDK):
         if utils.match_response(http_res, "404", "application/json"):
             response_data = unmarshal_json_response(errors.ErrorNOTFOUNDData, http_res)
             raise errors.ErrorNOTFOUND(response_data, http_res)
-        if utils.match_response(http_res, "409", "application/json"):
-            response_data = unmarshal_json_response(errors.ErrorCONFLICTData, http_res)
-            raise errors.ErrorCONFLICT(response_data, http_res)
         if utils.match_response(http_res, "500", "application/json"):
             response_data = unmarshal_json_response(
                 errors.ErrorINTERNALSERVERERRORData, http_res
@@ -951,24 +965,20 @@ class Parts(BaseSDK):
 
         raise errors.APIError("Unexpected response received", http_res)
 
-    async def update_async(
+    async def delete_async(
         self,
         *,
         number: str,
-        new_number: Optional[str] = None,
-        name: Optional[str] = None,
         retries: OptionalNullable[utils.RetryConfig] = UNSET,
         server_url: Optional[str] = None,
         timeout_ms: Optional[int] = None,
         http_headers: Optional[Mapping[str, str]] = None,
-    ) -> models.PartUpdateResponse:
-        r"""Update part
+    ) -> models.PartDeleteResponse:
+        r"""Delete part
 
-        Update a part's number or name. Identifies the part by its current number in the URL with case-insensitive matching.
+        Permanently delete a part and all its revisions. This removes all associated data and cannot be undone.
 
-        :param number: Part number of the part to update.
-        :param new_number: New unique identifier number for the part.
-        :param name: New human-readable name for the part.
+        :param number: Part number to delete.
         :param retries: Override the default retry configuration for this method
         :param server_url: Override the default server URL for this method
         :param timeout_ms: Override the default request timeout configuration for this method in milliseconds
@@ -984,30 +994,23 @@ class Parts(BaseSDK):
         else:
             base_url = self._get_url(base_url, url_variables)
 
-        request = models.PartUpdateRequest(
+        request = models.PartDeleteRequest(
             number=number,
-            request_body=models.PartUpdateRequestBody(
-                new_number=new_number,
-                name=name,
-            ),
         )
 
         req = self._build_request_async(
-            method="PATCH",
+            method="DELETE",
             path="/v2/parts/{number}",
             base_url=base_url,
             url_variables=url_variables,
             request=request,
-            request_body_required=True,
+            request_body_required=False,
             request_has_path_params=True,
             request_has_query_params=True,
             user_agent_header="user-agent",
             accept_header_value="application/json",
             http_headers=http_headers,
             security=self.sdk_configuration.security,
-            get_serialized_body=lambda: utils.serialize_request_body(
-                request.request_body, False, False, "json", models.PartUpdateRequestBody
-            ),
             timeout_ms=timeout_ms,
         )
 
@@ -1023,20 +1026,20 @@ class Parts(BaseSDK):
             hook_ctx=HookContext(
                 config=self.sdk_configuration,
                 base_url=base_url or "",
-                operation_id="part-update",
+                operation_id="part-delete",
                 oauth2_scopes=[],
                 security_source=get_security_from_env(
                     self.sdk_configuration.security, models.Security
                 ),
             ),
             request=req,
-            error_status_codes=["401", "404", "409", "4XX", "500", "5XX"],
+            error_status_codes=["401", "404", "4XX", "500", "5XX"],
             retry_config=retry_config,
         )
 
         response_data: Any = None
         if utils.match_response(http_res, "200", "application/json"):
-            return unmarshal_json_response(models.PartUpdateResponse, http_res)
+            return unmarshal_json_response(models.PartDeleteResponse, http_res)
         if utils.match_response(http_res, "401", "application/json"):
             response_data = unmarshal_json_response(
                 errors.ErrorUNAUTHORIZEDData, http_res
@@ -1045,9 +1048,6 @@ class Parts(BaseSDK):
         if utils.match_response(http_res, "404", "application/json"):
             response_data = unmarshal_json_response(errors.ErrorNOTFOUNDData, http_res)
             raise errors.ErrorNOTFOUND(response_data, http_res)
-        if utils.match_response(http_res, "409", "application/json"):
-            response_data = unmarshal_json_response(errors.ErrorCONFLICTData, http_res)
-            raise errors.ErrorCONFLICT(response_data, http_res)
         if utils.match_response(http_res, "500", "application/json"):
             response_data = unmarshal_json_response(
                 errors.ErrorINTERNALSERVERERRORData, http_res
@@ -23,28 +23,20 @@ class Procedures(BaseSDK):
     def _init_sdks(self):
         self.versions = Versions(self.sdk_configuration)
 
-    def list(
+    def create(
         self,
         *,
-        limit: Optional[int] = 50,
-        cursor: Optional[float] = None,
-        search_query: Optional[str] = None,
-        created_after: Optional[datetime] = None,
-        created_before: Optional[datetime] = None,
+        name: str,
         retries: OptionalNullable[utils.RetryConfig] = UNSET,
         server_url: Optional[str] = None,
         timeout_ms: Optional[int] = None,
         http_headers: Optional[Mapping[str, str]] = None,
-    ) -> models.ProcedureListResponse:
-        r"""List and filter procedures
+    ) -> models.ProcedureCreateResponse:
+        r"""Create procedure
 
-        Retrieve procedures with optional filtering and search. Returns all procedure data including creator, recent runs, and FPY (First Pass Yield) statistics.
+        Create a new test procedure that can be used to organize and track test runs. The procedure serves as a template or framework for organizing test execution.
 
-        :param limit: Maximum number of procedures to return per page.
-        :param cursor:
-        :param search_query:
-        :param created_after:
-        :param created_before:
+        :param name: Name of the procedure. Must be unique within the organization.
         :param retries: Override the default retry configuration for this method
         :param server_url: Override the default server URL for this method
         :param timeout_ms: Override the default request timeout configuration for this method in milliseconds
@@ -60,27 +52,26 @@ class Procedures(BaseSDK):
         else:
             base_url = self._get_url(base_url, url_variables)
 
-        request = models.ProcedureListRequest(
-            limit=limit,
-            cursor=cursor,
-            search_query=search_query,
-            created_after=created_after,
-            created_before=created_before,
+        request = models.ProcedureCreateRequest(
+            name=name,
         )
 
         req = self._build_request(
-            method="GET",
+            method="POST",
             path="/v2/procedures",
             base_url=base_url,
             url_variables=url_variables,
             request=request,
-            request_body_required=False,
+            request_body_required=True,
             request_has_path_params=False,
             request_has_query_params=True,
             user_agent_header="user-agent",
             accept_header_value="application/json",
             http_headers=http_headers,
             security=self.sdk_configuration.security,
+            get_serialized_body=lambda: utils.serialize_request_body(
+                request, False, False, "json", models.ProcedureCreateRequest
+            ),
             timeout_ms=timeout_ms,
         )
 
@@ -96,25 +87,20 @@ class Procedures(BaseSDK):
             hook_ctx=HookContext(
                 config=self.sdk_configuration,
                 base_url=base_url or "",
-                operation_id="procedure-list",
+                operation_id="procedure-create",
                 oauth2_scopes=[],
                 security_source=get_security_from_env(
                     self.sdk_configuration.security, models.Security
                 ),
             ),
             request=req,
-            error_status_codes=["400", "401", "4XX", "500", "5XX"],
+            error_status_codes=["401", "4XX", "500", "5XX"],
             retry_config=retry_config,
         )
 
         response_data: Any = None
         if utils.match_response(http_res, "200", "application/json"):
-            return unmarshal_json_response(models.ProcedureListResponse, http_res)
-        if utils.match_response(http_res, "400", "application/json"):
-            response_data = unmarshal_json_response(
-                errors.ErrorBADREQUESTData, http_res
-            )
-            raise errors.ErrorBADREQUEST(response_data, http_res)
+            return unmarshal_json_response(models.ProcedureCreateResponse, http_res)
         if utils.match_response(http_res, "401", "application/json"):
             response_data = unmarshal_json_response(
                 errors.ErrorUNAUTHORIZEDData, http_res
@@ -134,28 +120,20 @@ class Procedures(BaseSDK):
 
         raise errors.APIError("Unexpected response received", http_res)
 
-    async def list_async(
+    async def create_async(
         self,
         *,
-        limit: Optional[int] = 50,
-        cursor: Optional[float] = None,
-        search_query: Optional[str] = None,
-        created_after: Optional[datetime] = None,
-        created_before: Optional[datetime] = None,
+        name: str,
         retries: OptionalNullable[utils.RetryConfig] = UNSET,
         server_url: Optional[str] = None,
         timeout_ms: Optional[int] = None,
         http_headers: Optional[Mapping[str, str]] = None,
-    ) -> models.ProcedureListResponse:
-        r"""List and filter procedures
+    ) -> models.ProcedureCreateResponse:
+        r"""Create procedure
 
-        Retrieve procedures with optional filtering and search. Returns all procedure data including creator, recent runs, and FPY (First Pass Yield) statistics.
+        Create a new test procedure that can be used to organize and track test runs. The procedure serves as a template or framework for organizing test execution.
 
-        :param limit: Maximum number of procedures to return per page.
-        :param cursor:
-        :param search_query:
-        :param created_after:
-        :param created_before:
+        :param name: Name of the procedure. Must be unique within the organization.
         :param retries: Override the default retry configuration for this method
         :param server_url: Override the default server URL for this method
         :param timeout_ms: Override the default request timeout configuration for this method in milliseconds
@@ -171,27 +149,26 @@ class Procedures(BaseSDK):
         else:
             base_url = self._get_url(base_url, url_variables)
 
-        request = models.ProcedureListRequest(
-            limit=limit,
-            cursor=cursor,
-            search_query=search_query,
-            created_after=created_after,
-            created_before=created_before,
+        request = models.ProcedureCreateRequest(
+            name=name,
         )
 
         req = self._build_request_async(
-            method="GET",
+            method="POST",
             path="/v2/procedures",
             base_url=base_url,
             url_variables=url_variables,
             request=request,
-            request_body_required=False,
+            request_body_required=True,
             request_has_path_params=False,
             request_has_query_params=True,
             user_agent_header="user-agent",
             accept_header_value="application/json",
             http_headers=http_headers,
             security=self.sdk_configuration.security,
+            get_serialized_body=lambda: utils.serialize_request_body(
+                request, False, False, "json", models.ProcedureCreateRequest
+            ),
             timeout_ms=timeout_ms,
         )
 
@@ -207,25 +184,20 @@ class Procedures(BaseSDK):
             hook_ctx=HookContext(
                 config=self.sdk_configuration,
                 base_url=base_url or "",
-                operation_id="procedure-list",
+                operation_id="procedure-create",
                 oauth2_scopes=[],
                 security_source=get_security_from_env(
                     self.sdk_configuration.security, models.Security
                 ),
             ),
             request=req,
-            error_status_codes=["400", "401", "4XX", "500", "5XX"],
+            error_status_codes=["401", "4XX", "500", "5XX"],
             retry_config=retry_config,
         )
 
         response_data: Any = None
         if utils.match_response(http_res, "200", "application/json"):
-            return unmarshal_json_response(models.ProcedureListResponse, http_res)
-        if utils.match_response(http_res, "400", "application/json"):
-            response_data = unmarshal_json_response(
-                errors.ErrorBADREQUESTData, http_res
-            )
-            raise errors.ErrorBADREQUEST(response_data, http_res)
+            return unmarshal_json_response(models.ProcedureCreateResponse, http_res)
         if utils.match_response(http_res, "401", "application/json"):
             response_data = unmarshal_json_response(
                 errors.ErrorUNAUTHORIZEDData, http_res
@@ -245,20 +217,28 @@ class Procedures(BaseSDK):
 
         raise errors.APIError("Unexpected response received", http_res)
 
-    def create(
+    def list(
         self,
         *,
-        name: str,
+        limit: Optional[int] = 50,
+        cursor: Optional[float] = None,
+        search_query: Optional[str] = None,
+        created_after: Optional[datetime] = None,
+        created_before: Optional[datetime] = None,
         retries: OptionalNullable[utils.RetryConfig] = UNSET,
         server_url: Optional[str] = None,
         timeout_ms: Optional[int] = None,
         http_headers: Optional[Mapping[str, str]] = None,
-    ) -> models.ProcedureCreateResponse:
-        r"""Create procedure
+    ) -> models.ProcedureListResponse:
+        r"""List and filter procedures
 
-        Create a new test procedure that can be used to organize and track test runs. The procedure serves as a template or framework for organizing test execution.
+        Retrieve procedures with optional filtering and search. Returns all procedure data including creator, recent runs, and FPY (First Pass Yield) statistics.
 
-        :param name: Name of the procedure. Must be unique within the organization.
+        :param limit: Maximum number of procedures to return per page.
+        :param cursor:
+        :param search_query:
+        :param created_after:
+        :param created_before:
         :param retries: Override the default retry configuration for this method
         :param server_url: Override the default server URL for this method
         :param timeout_ms: Override the default request timeout configuration for this method in milliseconds
@@ -274,26 +254,27 @@ class Procedures(BaseSDK):
         else:
             base_url = self._get_url(base_url, url_variables)
 
-        request = models.ProcedureCreateRequest(
-            name=name,
+        request = models.ProcedureListRequest(
+            limit=limit,
+            cursor=cursor,
+            search_query=search_query,
+            created_after=created_after,
+            created_before=created_before,
         )
 
         req = self._build_request(
-            method="POST",
+            method="GET",
             path="/v2/procedures",
             base_url=base_url,
             url_variables=url_variables,
             request=request,
-            request_body_required=True,
+            request_body_required=False,
             request_has_path_params=False,
             request_has_query_params=True,
             user_agent_header="user-agent",
             accept_header_value="application/json",
             http_headers=http_headers,
             security=self.sdk_configuration.security,
-            get_serialized_body=lambda: utils.serialize_request_body(
-                request, False, False, "json", models.ProcedureCreateRequest
-            ),
             timeout_ms=timeout_ms,
         )
 
@@ -309,20 +290,25 @@ class Procedures(BaseSDK):
             hook_ctx=HookContext(
                 config=self.sdk_configuration,
                 base_url=base_url or "",
-                operation_id="procedure-create",
+                operation_id="procedure-list",
                 oauth2_scopes=[],
                 security_source=get_security_from_env(
                     self.sdk_configuration.security, models.Security
                 ),
             ),
             request=req,
-            error_status_codes=["401", "4XX", "500", "5XX"],
+            error_status_codes=["400", "401", "4XX", "500", "5XX"],
             retry_config=retry_config,
         )
 
         response_data: Any = None
         if utils.match_response(http_res, "200", "application/json"):
-            return unmarshal_json_response(models.ProcedureCreateResponse, http_res)
+            return unmarshal_json_response(models.ProcedureListResponse, http_res)
+        if utils.match_response(http_res, "400", "application/json"):
+            response_data = unmarshal_json_response(
+                errors.ErrorBADREQUESTData, http_res
+            )
+            raise errors.ErrorBADREQUEST(response_data, http_res)
         if utils.match_response(http_res, "401", "application/json"):
             response_data = unmarshal_json_response(
                 errors.ErrorUNAUTHORIZEDData, http_res
@@ -342,20 +328,28 @@ class Procedures(BaseSDK):
 
         raise errors.APIError("Unexpected response received", http_res)
 
-    async def create_async(
+    async def list_async(
         self,
         *,
-        name: str,
+        limit: Optional[int] = 50,
+        cursor: Optional[float] = None,
+        search_query: Optional[str] = None,
+        created_after: Optional[datetime] = None,
+        created_before: Optional[datetime] = None,
         retries: OptionalNullable[utils.RetryConfig] = UNSET,
         server_url: Optional[str] = None,
         timeout_ms: Optional[int] = None,
         http_headers: Optional[Mapping[str, str]] = None,
-    ) -> models.ProcedureCreateResponse:
-        r"""Create procedure
+    ) -> models.ProcedureListResponse:
+        r"""List and filter procedures
 
-        Create a new test procedure that can be used to organize and track test runs. The procedure serves as a template or framework for organizing test execution.
+        Retrieve procedures with optional filtering and search. Returns all procedure data including creator, recent runs, and FPY (First Pass Yield) statistics.
 
-        :param name: Name of the procedure. Must be unique within the organization.
+        :param limit: Maximum number of procedures to return per page.
+        :param cursor:
+        :param search_query:
+        :param created_after:
+        :param created_before:
         :param retries: Override the default retry configuration for this method
         :param server_url: Override the default server URL for this method
         :param timeout_ms: Override the default request timeout configuration for this method in milliseconds
@@ -371,26 +365,27 @@ class Procedures(BaseSDK):
         else:
             base_url = self._get_url(base_url, url_variables)
 
-        request = models.ProcedureCreateRequest(
-            name=name,
+        request = models.ProcedureListRequest(
+            limit=limit,
+            cursor=cursor,
+            search_query=search_query,
+            created_after=created_after,
+            created_before=created_before,
         )
 
         req = self._build_request_async(
-            method="POST",
+            method="GET",
             path="/v2/procedures",
             base_url=base_url,
             url_variables=url_variables,
             request=request,
-            request_body_required=True,
+            request_body_required=False,
             request_has_path_params=False,
             request_has_query_params=True,
             user_agent_header="user-agent",
             accept_header_value="application/json",
             http_headers=http_headers,
             security=self.sdk_configuration.security,
-            get_serialized_body=lambda: utils.serialize_request_body(
-                request, False, False, "json", models.ProcedureCreateRequest
-            ),
             timeout_ms=timeout_ms,
         )
 
@@ -406,20 +401,25 @@ class Procedures(BaseSDK):
             hook_ctx=HookContext(
                 config=self.sdk_configuration,
                 base_url=base_url or "",
-                operation_id="procedure-create",
+                operation_id="procedure-list",
                 oauth2_scopes=[],
                 security_source=get_security_from_env(
                     self.sdk_configuration.security, models.Security
                 ),
             ),
             request=req,
-            error_status_codes=["401", "4XX", "500", "5XX"],
+            error_status_codes=["400", "401", "4XX", "500", "5XX"],
             retry_config=retry_config,
         )
 
         response_data: Any = None
         if utils.match_response(http_res, "200", "application/json"):
-            return unmarshal_json_response(models.ProcedureCreateResponse, http_res)
+            return unmarshal_json_response(models.ProcedureListResponse, http_res)
+        if utils.match_response(http_res, "400", "application/json"):
+            response_data = unmarshal_json_response(
+                errors.ErrorBADREQUESTData, http_res
+            )
+            raise errors.ErrorBADREQUEST(response_data, http_res)
         if utils.match_response(http_res, "401", "application/json"):
             response_data = unmarshal_json_response(
                 errors.ErrorUNAUTHORIZEDData, http_res
@@ -210,22 +210,26 @@ class Revisions(BaseSDK):
 
         raise errors.APIError("Unexpected response received", http_res)
 
-    def delete(
+    def update(
         self,
         *,
         part_number: str,
         revision_number: str,
+        number: Optional[str] = None,
+        image_id: Optional[str] = None,
         retries: OptionalNullable[utils.RetryConfig] = UNSET,
         server_url: Optional[str] = None,
         timeout_ms: Optional[int] = None,
         http_headers: Optional[Mapping[str, str]] = None,
-    ) -> models.PartDeleteRevisionResponse:
-        r"""Delete part revision
+    ) -> models.PartUpdateRevisionResponse:
+        r"""Update part revision
 
-        Permanently delete a part revision by its part number and revision number. This action removes the revision and all associated data and cannot be undone.
+        Update a part revision's number or image. Identifies the revision by part number and revision number in the URL.
 
         :param part_number: Part number that the revision belongs to.
-        :param revision_number: Revision number to delete.
+        :param revision_number: Current revision number to update.
+        :param number: New revision number to set.
+        :param image_id: Upload ID for the revision image, or empty string to remove image
         :param retries: Override the default retry configuration for this method
         :param server_url: Override the default server URL for this method
         :param timeout_ms: Override the default request timeout configuration for this method in milliseconds
@@ -241,24 +245,35 @@ class Revisions(BaseSDK):
         else:
             base_url = self._get_url(base_url, url_variables)
 
-        request = models.PartDeleteRevisionRequest(
+        request = models.PartUpdateRevisionRequest(
             part_number=part_number,
             revision_number=revision_number,
+            request_body=models.PartUpdateRevisionRequestBody(
+                number=number,
+                image_id=image_id,
+            ),
         )
 
         req = self._build_request(
-            method="DELETE",
+            method="PATCH",
             path="/v2/parts/{part_number}/revisions/{revision_number}",
             base_url=base_url,
             url_variables=url_variables,
             request=request,
-            request_body_required=False,
+            request_body_required=True,
             request_has_path_params=True,
             request_has_query_params=True,
             user_agent_header="user-agent",
             accept_header_value="application/json",
             http_headers=http_headers,
             security=self.sdk_configuration.security,
+            get_serialized_body=lambda: utils.serialize_request_body(
+                request.request_body,
+                False,
+                False,
+                "json",
+                models.PartUpdateRevisionRequestBody,
+            ),
             timeout_ms=timeout_ms,
         )
 
@@ -274,20 +289,20 @@ class Revisions(BaseSDK):
             hook_ctx=HookContext(
                 config=self.sdk_configuration,
                 base_url=base_url or "",
-                operation_id="part-deleteRevision",
+                operation_id="part-updateRevision",
                 oauth2_scopes=[],
                 security_source=get_security_from_env(
                     self.sdk_configuration.security, models.Security
                 ),
             ),
             request=req,
-            error_status_codes=["401", "404", "4XX", "500", "5XX"],
+            error_status_codes=["401", "404", "409", "4XX", "500", "5XX"],
             retry_config=retry_config,
         )
 
         response_data: Any = None
         if utils.match_response(http_res, "200", "application/json"):
-            return unmarshal_json_response(models.PartDeleteRevisionResponse, http_res)
+            return unmarshal_json_response(models.PartUpdateRevisionResponse, http_res)
         if utils.match_response(http_res, "401", "application/json"):
             response_data = unmarshal_json_response(
                 errors.ErrorUNAUTHORIZEDData, http_res
@@ -296,6 +311,9 @@ class Revisions(BaseSDK):
         if utils.match_response(http_res, "404", "application/json"):
             response_data = unmarshal_json_response(errors.ErrorNOTFOUNDData, http_res)
             raise errors.ErrorNOTFOUND(response_data, http_res)
+        if utils.match_response(http_res, "409", "application/json"):
+            response_data = unmarshal_json_response(errors.ErrorCONFLICTData, http_res)
+            raise errors.ErrorCONFLICT(response_data, http_res)
         if utils.match_response(http_res, "500", "application/json"):
             response_data = unmarshal_json_response(
                 errors.ErrorINTERNALSERVERERRORData, http_res
@@ -310,22 +328,26 @@ class Revisions(BaseSDK):
 
         raise errors.APIError("Unexpected response received", http_res)
 
-    async def delete_async(
+    async def update_async(
         self,
         *,
         part_number: str,
         revision_number: str,
+        number: Optional[str] = None,
+        image_id: Optional[str] = None,
         retries: OptionalNullable[utils.RetryConfig] = UNSET,
         server_url: Optional[str] = None,
         timeout_ms: Optional[int] = None,
         http_headers: Optional[Mapping[str, str]] = None,
-    ) -> models.PartDeleteRevisionResponse:
-        r"""Delete part revision
+    ) -> models.PartUpdateRevisionResponse:
+        r"""Update part revision
 
-        Permanently delete a part revision by its part number and revision number. This action removes the revision and all associated data and cannot be undone.
+        Update a part revision's number or image. Identifies the revision by part number and revision number in the URL.
 
         :param part_number: Part number that the revision belongs to.
-        :param revision_number: Revision number to delete.
+        :param revision_number: Current revision number to update.
+        :param number: New revision number to set.
+        :param image_id: Upload ID for the revision image, or empty string to remove image
         :param retries: Override the default retry configuration for this method
         :param server_url: Override the default server URL for this method
         :param timeout_ms: Override the default request timeout configuration for this method in milliseconds
@@ -341,24 +363,35 @@ class Revisions(BaseSDK):
         else:
             base_url = self._get_url(base_url, url_variables)
 
-        request = models.PartDeleteRevisionRequest(
+        request = models.PartUpdateRevisionRequest(
             part_number=part_number,
             revision_number=revision_number,
+            request_body=models.PartUpdateRevisionRequestBody(
+                number=number,
+                image_id=image_id,
+            ),
         )
 
         req = self._build_request_async(
-            method="DELETE",
+            method="PATCH",
             path="/v2/parts/{part_number}/revisions/{revision_number}",
             base_url=base_url,
             url_variables=url_variables,
             request=request,
-            request_body_required=False,
+            request_body_required=True,
             request_has_path_params=True,
             request_has_query_params=True,
             user_agent_header="user-agent",
             accept_header_value="application/json",
             http_headers=http_headers,
             security=self.sdk_configuration.security,
+            get_serialized_body=lambda: utils.serialize_request_body(
+                request.request_body,
+                False,
+                False,
+                "json",
+                models.PartUpdateRevisionRequestBody,
+            ),
             timeout_ms=timeout_ms,
         )
 
@@ -374,20 +407,20 @@ class Revisions(BaseSDK):
             hook_ctx=HookContext(
                 config=self.sdk_configuration,
                 base_url=base_url or "",
-                operation_id="part-deleteRevision",
+                operation_id="part-updateRevision",
                 oauth2_scopes=[],
                 security_source=get_security_from_env(
                     self.sdk_configuration.security, models.Security
                 ),
             ),
             request=req,
-            error_status_codes=["401", "404", "4XX", "500", "5XX"],
+            error_status_codes=["401", "404", "409", "4XX", "500", "5XX"],
             retry_config=retry_config,
         )
 
         response_data: Any = None
         if utils.match_response(http_res, "200", "application/json"):
-            return unmarshal_json_response(models.PartDeleteRevisionResponse, http_res)
+            return unmarshal_json_response(models.PartUpdateRevisionResponse, http_res)
         if utils.match_response(http_res, "401", "application/json"):
             response_data = unmarshal_json_response(
                 errors.ErrorUNAUTHORIZEDData, http_res
@@ -396,6 +429,9 @@ class Revisions(BaseSDK):
         if utils.match_response(http_res, "404", "application/json"):
             response_data = unmarshal_json_response(errors.ErrorNOTFOUNDData, http_res)
             raise errors.ErrorNOTFOUND(response_data, http_res)
+        if utils.match_response(http_res, "409", "application/json"):
+            response_data = unmarshal_json_response(errors.ErrorCONFLICTData, http_res)
+            raise errors.ErrorCONFLICT(response_data, http_res)
         if utils.match_response(http_res, "500", "application/json"):
             response_data = unmarshal_json_response(
                 errors.ErrorINTERNALSERVERERRORData, http_res
@@ -410,26 +446,22 @@ class Revisions(BaseSDK):
 
         raise errors.APIError("Unexpected response received", http_res)
 
-    def update(
+    def delete(
         self,
         *,
         part_number: str,
         revision_number: str,
-        number: Optional[str] = None,
-        image_id: Optional[str] = None,
         retries: OptionalNullable[utils.RetryConfig] = UNSET,
         server_url: Optional[str] = None,
         timeout_ms: Optional[int] = None,
         http_headers: Optional[Mapping[str, str]] = None,
-    ) -> models.PartUpdateRevisionResponse:
-        r"""Update part revision
+    ) -> models.PartDeleteRevisionResponse:
+        r"""Delete part revision
 
-        Update a part revision's number or image. Identifies the revision by part number and revision number in the URL.
+        Permanently delete a part revision by its part number and revision number. This action removes the revision and all associated data and cannot be undone.
 
         :param part_number: Part number that the revision belongs to.
-        :param revision_number: Current revision number to update.
-        :param number: New revision number to set.
-        :param image_id: Upload ID for the revision image, or empty string to remove image
+        :param revision_number: Revision number to delete.
         :param retries: Override the default retry configuration for this method
         :param server_url: Override the default server URL for this method
         :param timeout_ms: Override the default request timeout configuration for this method in milliseconds
@@ -445,35 +477,24 @@ class Revisions(BaseSDK):
         else:
             base_url = self._get_url(base_url, url_variables)
 
-        request = models.PartUpdateRevisionRequest(
+        request = models.PartDeleteRevisionRequest(
             part_number=part_number,
             revision_number=revision_number,
-            request_body=models.PartUpdateRevisionRequestBody(
-                number=number,
-                image_id=image_id,
-            ),
         )
 
         req = self._build_request(
-            method="PATCH",
+            method="DELETE",
             path="/v2/parts/{part_number}/revisions/{revision_number}",
             base_url=base_url,
             url_variables=url_variables,
             request=request,
-            request_body_required=True,
+            request_body_required=False,
             request_has_path_params=True,
             request_has_query_params=True,
             user_agent_header="user-agent",
             accept_header_value="application/json",
             http_headers=http_headers,
             security=self.sdk_configuration.security,
-            get_serialized_body=lambda: utils.serialize_request_body(
-                request.request_body,
-                False,
-                False,
-                "json",
-                models.PartUpdateRevisionRequestBody,
-            ),
             timeout_ms=timeout_ms,
         )
 
@@ -489,20 +510,20 @@ class Revisions(BaseSDK):
             hook_ctx=HookContext(
                 config=self.sdk_configuration,
                 base_url=base_url or "",
-                operation_id="part-updateRevision",
+                operation_id="part-deleteRevision",
                 oauth2_scopes=[],
                 security_source=get_security_from_env(
                     self.sdk_configuration.security, models.Security
                 ),
             ),
             request=req,
-            error_status_codes=["401", "404", "409", "4XX", "500", "5XX"],
+            error_status_codes=["401", "404", "4XX", "500", "5XX"],
             retry_config=retry_config,
         )
 
         response_data: Any = None
         if utils.match_response(http_res, "200", "application/json"):
-            return unmarshal_json_response(models.PartUpdateRevisionResponse, http_res)
+            return unmarshal_json_response(models.PartDeleteRevisionResponse, http_res)
         if utils.match_response(http_res, "401", "application/json"):
             response_data = unmarshal_json_response(
                 errors.ErrorUNAUTHORIZEDData, http_res
@@ -511,9 +532,6 @@ class Revisions(BaseSDK):
         if utils.match_response(http_res, "404", "application/json"):
             response_data = unmarshal_json_response(errors.ErrorNOTFOUNDData, http_res)
             raise errors.ErrorNOTFOUND(response_data, http_res)
-        if utils.match_response(http_res, "409", "application/json"):
-            response_data = unmarshal_json_response(errors.ErrorCONFLICTData, http_res)
-            raise errors.ErrorCONFLICT(response_data, http_res)
         if utils.match_response(http_res, "500", "application/json"):
             response_data = unmarshal_json_response(
                 errors.ErrorINTERNALSERVERERRORData, http_res
@@ -528,26 +546,22 @@ class Revisions(BaseSDK):
 
         raise errors.APIError("Unexpected response received", http_res)
 
-    async def update_async(
+    async def delete_async(
         self,
         *,
         part_number: str,
         revision_number: str,
-        number: Optional[str] = None,
-        image_id: Optional[str] = None,
         retries: OptionalNullable[utils.RetryConfig] = UNSET,
         server_url: Optional[str] = None,
         timeout_ms: Optional[int] = None,
         http_headers: Optional[Mapping[str, str]] = None,
-    ) -> models.PartUpdateRevisionResponse:
-        r"""Update part revision
+    ) -> models.PartDeleteRevisionResponse:
+        r"""Delete part revision
 
-        Update a part revision's number or image. Identifies the revision by part number and revision number in the URL.
+        Permanently delete a part revision by its part number and revision number. This action removes the revision and all associated data and cannot be undone.
 
         :param part_number: Part number that the revision belongs to.
-        :param revision_number: Current revision number to update.
-        :param number: New revision number to set.
-        :param image_id: Upload ID for the revision image, or empty string to remove image
+        :param revision_number: Revision number to delete.
         :param retries: Override the default retry configuration for this method
         :param server_url: Override the default server URL for this method
         :param timeout_ms: Override the default request timeout configuration for this method in milliseconds
@@ -563,35 +577,24 @@ class Revisions(BaseSDK):
         else:
             base_url = self._get_url(base_url, url_variables)
 
-        request = models.PartUpdateRevisionRequest(
+        request = models.PartDeleteRevisionRequest(
             part_number=part_number,
             revision_number=revision_number,
-            request_body=models.PartUpdateRevisionRequestBody(
-                number=number,
-                image_id=image_id,
-            ),
         )
 
         req = self._build_request_async(
-            method="PATCH",
+            method="DELETE",
             path="/v2/parts/{part_number}/revisions/{revision_number}",
             base_url=base_url,
             url_variables=url_variables,
             request=request,
-            request_body_required=True,
+            request_body_required=False,
             request_has_path_params=True,
             request_has_query_params=True,
             user_agent_header="user-agent",
             accept_header_value="application/json",
             http_headers=http_headers,
             security=self.sdk_configuration.security,
-            get_serialized_body=lambda: utils.serialize_request_body(
-                request.request_body,
-                False,
-                False,
-                "json",
-                models.PartUpdateRevisionRequestBody,
-            ),
             timeout_ms=timeout_ms,
         )
 
@@ -607,20 +610,20 @@ class Revisions(BaseSDK):
             hook_ctx=HookContext(
                 config=self.sdk_configuration,
                 base_url=base_url or "",
-                operation_id="part-updateRevision",
+                operation_id="part-deleteRevision",
                 oauth2_scopes=[],
                 security_source=get_security_from_env(
                     self.sdk_configuration.security, models.Security
                 ),
             ),
             request=req,
-            error_status_codes=["401", "404", "409", "4XX", "500", "5XX"],
+            error_status_codes=["401", "404", "4XX", "500", "5XX"],
             retry_config=retry_config,
         )
 
         response_data: Any = None
         if utils.match_response(http_res, "200", "application/json"):
-            return unmarshal_json_response(models.PartUpdateRevisionResponse, http_res)
+            return unmarshal_json_response(models.PartDeleteRevisionResponse, http_res)
         if utils.match_response(http_res, "401", "application/json"):
             response_data = unmarshal_json_response(
                 errors.ErrorUNAUTHORIZEDData, http_res
@@ -629,9 +632,6 @@ class Revisions(BaseSDK):
         if utils.match_response(http_res, "404", "application/json"):
             response_data = unmarshal_json_response(errors.ErrorNOTFOUNDData, http_res)
             raise errors.ErrorNOTFOUND(response_data, http_res)
-        if utils.match_response(http_res, "409", "application/json"):
-            response_data = unmarshal_json_response(errors.ErrorCONFLICTData, http_res)
-            raise errors.ErrorCONFLICT(response_data, http_res)
         if utils.match_response(http_res, "500", "application/json"):
             response_data = unmarshal_json_response(
                 errors.ErrorINTERNALSERVERERRORData, http_res
@@ -11,66 +11,50 @@ from typing import Any, List, Mapping, Optional, Union
 
 
 class Runs(BaseSDK):
-    def list(
+    def create(
         self,
         *,
-        search_query: Optional[str] = None,
-        ids: Optional[List[str]] = None,
-        outcomes: Optional[List[models.RunListQueryParamOutcome]] = None,
-        procedure_ids: Optional[List[str]] = None,
-        procedure_versions: Optional[List[str]] = None,
-        serial_numbers: Optional[List[str]] = None,
-        part_numbers: Optional[List[str]] = None,
-        revision_numbers: Optional[List[str]] = None,
-        batch_numbers: Optional[List[str]] = None,
-        duration_min: Optional[str] = None,
-        duration_max: Optional[str] = None,
-        started_after: Optional[datetime] = None,
-        started_before: Optional[datetime] = None,
-        ended_after: Optional[datetime] = None,
-        ended_before: Optional[datetime] = None,
-        created_after: Optional[datetime] = None,
-        created_before: Optional[datetime] = None,
-        created_by_user_ids: Optional[List[str]] = None,
-        created_by_station_ids: Optional[List[str]] = None,
-        operated_by_ids: Optional[List[str]] = None,
-        limit: Optional[int] = 50,
-        cursor: Optional[float] = None,
-        sort_by: Optional[models.RunListSortBy] = "started_at",
-        sort_order: Optional[models.RunListSortOrder] = "desc",
+        outcome: models.RunCreateOutcome,
+        procedure_id: str,
+        started_at: datetime,
+        ended_at: datetime,
+        serial_number: str,
+        procedure_version: OptionalNullable[str] = UNSET,
+        operated_by: Optional[str] = None,
+        part_number: Optional[str] = None,
+        revision_number: Optional[str] = None,
+        batch_number: Optional[str] = None,
+        sub_units: Optional[List[str]] = None,
+        docstring: Optional[str] = None,
+        phases: Optional[
+            Union[List[models.RunCreatePhase], List[models.RunCreatePhaseTypedDict]]
+        ] = None,
+        logs: Optional[
+            Union[List[models.RunCreateLog], List[models.RunCreateLogTypedDict]]
+        ] = None,
         retries: OptionalNullable[utils.RetryConfig] = UNSET,
         server_url: Optional[str] = None,
         timeout_ms: Optional[int] = None,
         http_headers: Optional[Mapping[str, str]] = None,
-    ) -> models.RunListResponse:
-        r"""List and filter runs
+    ) -> models.RunCreateResponse:
+        r"""Create run
 
-        Retrieve a paginated list of test runs with filtering by unit, procedure, date range, outcome, and station.
+        Create a new test run, linking it to a procedure and unit. Existing entities are reused automatically.
 
-        :param search_query:
-        :param ids:
-        :param outcomes:
-        :param procedure_ids:
-        :param procedure_versions:
-        :param serial_numbers:
-        :param part_numbers:
-        :param revision_numbers:
-        :param batch_numbers:
-        :param duration_min:
-        :param duration_max:
-        :param started_after:
-        :param started_before:
-        :param ended_after:
-        :param ended_before:
-        :param created_after:
-        :param created_before:
-        :param created_by_user_ids:
-        :param created_by_station_ids:
-        :param operated_by_ids:
-        :param limit: Maximum number of runs to return per page.
-        :param cursor:
-        :param sort_by: Field to sort results by.
-        :param sort_order: Sort order direction.
+        :param outcome: Overall test result. Use PASS when test succeeds, FAIL when test fails but script execution completed successfully, ERROR when script execution fails, TIMEOUT when test exceeds time limit, ABORTED for manual script interruption.
+        :param procedure_id: Procedure ID. Create the procedure in the app first, then find the auto-generated ID on the procedure page.
+        :param started_at: ISO 8601 timestamp when the test run began execution. This timestamp will be used to track when the test execution started and for historical analysis of test runs. A separate created_at timestamp is stored internally server side to track upload date.
+        :param ended_at: ISO 8601 timestamp when the test run finished execution.
+        :param serial_number: Unique serial number of the unit under test. Matched case-insensitively. If no unit with this serial number exists, one will be created.
+        :param procedure_version: Specific version of the test procedure used for the run. Matched case-insensitively. If none exist, a procedure with this procedure version will be created. If no procedure version is specified, the run will not be linked to any specific version.
+        :param operated_by: Email address of the operator who executed the test run. The operator must exist as a user in the system. The run will be linked to this user to track who performed the test.
+        :param part_number: Component part number for the unit. Matched case-insensitively. This field is required if the part number cannot be extracted from the serial number (as set in the settings). This field takes precedence over extraction from serial number. A component with the provided or extracted part number will be created if one does not exist.
+        :param revision_number: Hardware revision identifier for the unit. Matched case-insensitively. If none exist, a revision with this number will be created. If no revision is specified, the unit will be linked to the default revision of the part number.
+        :param batch_number: Production batch identifier for grouping units manufactured together. Matched case-insensitively. If none exist, a batch with this batch number will be created. If no batch number is specified, the unit will not be linked to any batch.
+        :param sub_units: Array of sub-unit serial numbers that are part of this main unit. Matched case-insensitively. Each sub-unit must already exist and will be linked as a sub-component of the main unit under test. If no sub-units are specified, the unit will be created without sub-unit relationships.
+        :param docstring: Additional notes or documentation about this test run.
+        :param phases: Array of test phases with measurements and results. Each phase represents a distinct stage of the test execution with timing information, outcome status, and optional measurements. If no phases are specified, the run will be created without phase-level organization of test data.
+        :param logs: Array of log messages generated during the test execution. Each log entry captures events, errors, and diagnostic information with severity levels and source code references. If no logs are specified, the run will be created without log entries.
         :param retries: Override the default retry configuration for this method
         :param server_url: Override the default server URL for this method
         :param timeout_ms: Override the default request timeout configuration for this method in milliseconds
@@ -86,46 +70,41 @@ class Runs(BaseSDK):
         else:
             base_url = self._get_url(base_url, url_variables)
 
-        request = models.RunListRequest(
-            search_query=search_query,
-            ids=ids,
-            outcomes=outcomes,
-            procedure_ids=procedure_ids,
-            procedure_versions=procedure_versions,
-            serial_numbers=serial_numbers,
-            part_numbers=part_numbers,
-            revision_numbers=revision_numbers,
-            batch_numbers=batch_numbers,
-            duration_min=duration_min,
-            duration_max=duration_max,
-            started_after=started_after,
-            started_before=started_before,
-            ended_after=ended_after,
-            ended_before=ended_before,
-            created_after=created_after,
-            created_before=created_before,
-            created_by_user_ids=created_by_user_ids,
-            created_by_station_ids=created_by_station_ids,
-            operated_by_ids=operated_by_ids,
-            limit=limit,
-            cursor=cursor,
-            sort_by=sort_by,
-            sort_order=sort_order,
+        request = models.RunCreateRequest(
+            outcome=outcome,
+            procedure_id=procedure_id,
+            procedure_version=procedure_version,
+            operated_by=operated_by,
+            started_at=started_at,
+            ended_at=ended_at,
+            serial_number=serial_number,
+            part_number=part_number,
+            revision_number=revision_number,
+            batch_number=batch_number,
+            sub_units=sub_units,
+            docstring=docstring,
+            phases=utils.get_pydantic_model(
+                phases, Optional[List[models.RunCreatePhase]]
+            ),
+            logs=utils.get_pydantic_model(logs, Optional[List[models.RunCreateLog]]),
         )
 
         req = self._build_request(
-            method="GET",
+            method="POST",
             path="/v2/runs",
             base_url=base_url,
             url_variables=url_variables,
             request=request,
-            request_body_required=False,
+            request_body_required=True,
             request_has_path_params=False,
             request_has_query_params=True,
             user_agent_header="user-agent",
             accept_header_value="application/json",
             http_headers=http_headers,
             security=self.sdk_configuration.security,
+            get_serialized_body=lambda: utils.serialize_request_body(
+                request, False, False, "json", models.RunCreateRequest
+            ),
             timeout_ms=timeout_ms,
         )
 
@@ -141,20 +120,20 @@ class Runs(BaseSDK):
             hook_ctx=HookContext(
                 config=self.sdk_configuration,
                 base_url=base_url or "",
-                operation_id="run-list",
+                operation_id="run-create",
                 oauth2_scopes=[],
                 security_source=get_security_from_env(
                     self.sdk_configuration.security, models.Security
                 ),
             ),
             request=req,
-            error_status_codes=["400", "401", "4XX", "500", "5XX"],
+            error_status_codes=["400", "401", "403", "404", "422", "4XX", "500", "5XX"],
             retry_config=retry_config,
         )
 
         response_data: Any = None
         if utils.match_response(http_res, "200", "application/json"):
-            return unmarshal_json_response(models.RunListResponse, http_res)
+            return unmarshal_json_response(models.RunCreateResponse, http_res)
         if utils.match_response(http_res, "400", "application/json"):
             response_data = unmarshal_json_response(
                 errors.ErrorBADREQUESTData, http_res
@@ -165,6 +144,17 @@ class Runs(BaseSDK):
                 errors.ErrorUNAUTHORIZEDData, http_res
             )
             raise errors.ErrorUNAUTHORIZED(response_data, http_res)
+        if utils.match_response(http_res, "403", "application/json"):
+            response_data = unmarshal_json_response(errors.ErrorFORBIDDENData, http_res)
+            raise errors.ErrorFORBIDDEN(response_data, http_res)
+        if utils.match_response(http_res, "404", "application/json"):
+            response_data = unmarshal_json_response(errors.ErrorNOTFOUNDData, http_res)
+            raise errors.ErrorNOTFOUND(response_data, http_res)
+        if utils.match_response(http_res, "422", "application/json"):
+            response_data = unmarshal_json_response(
+                errors.ErrorUNPROCESSABLECONTENTData, http_res
+            )
+            raise errors.ErrorUNPROCESSABLECONTENT(response_data, http_res)
         if utils.match_response(http_res, "500", "application/json"):
             response_data = unmarshal_json_response(
                 errors.ErrorINTERNALSERVERERRORData, http_res
@@ -179,66 +169,50 @@ class Runs(BaseSDK):
 
         raise errors.APIError("Unexpected response received", http_res)
 
-    async def list_async(
+    async def create_async(
         self,
         *,
-        search_query: Optional[str] = None,
-        ids: Optional[List[str]] = None,
-        outcomes: Optional[List[models.RunListQueryParamOutcome]] = None,
-        procedure_ids: Optional[List[str]] = None,
-        procedure_versions: Optional[List[str]] = None,
-        serial_numbers: Optional[List[str]] = None,
-        part_numbers: Optional[List[str]] = None,
-        revision_numbers: Optional[List[str]] = None,
-        batch_numbers: Optional[List[str]] = None,
-        duration_min: Optional[str] = None,
-        duration_max: Optional[str] = None,
-        started_after: Optional[datetime] = None,
-        started_before: Optional[datetime] = None,
-        ended_after: Optional[datetime] = None,
-        ended_before: Optional[datetime] = None,
-        created_after: Optional[datetime] = None,
-        created_before: Optional[datetime] = None,
-        created_by_user_ids: Optional[List[str]] = None,
-        created_by_station_ids: Optional[List[str]] = None,
-        operated_by_ids: Optional[List[str]] = None,
-        limit: Optional[int] = 50,
-        cursor: Optional[float] = None,
-        sort_by: Optional[models.RunListSortBy] = "started_at",
-        sort_order: Optional[models.RunListSortOrder] = "desc",
+        outcome: models.RunCreateOutcome,
+        procedure_id: str,
+        started_at: datetime,
+        ended_at: datetime,
+        serial_number: str,
+        procedure_version: OptionalNullable[str] = UNSET,
+        operated_by: Optional[str] = None,
+        part_number: Optional[str] = None,
+        revision_number: Optional[str] = None,
+        batch_number: Optional[str] = None,
+        sub_units: Optional[List[str]] = None,
+        docstring: Optional[str] = None,
+        phases: Optional[
+            Union[List[models.RunCreatePhase], List[models.RunCreatePhaseTypedDict]]
+        ] = None,
+        logs: Optional[
+            Union[List[models.RunCreateLog], List[models.RunCreateLogTypedDict]]
+        ] = None,
         retries: OptionalNullable[utils.RetryConfig] = UNSET,
         server_url: Optional[str] = None,
         timeout_ms: Optional[int] = None,
         http_headers: Optional[Mapping[str, str]] = None,
-    ) -> models.RunListResponse:
-        r"""List and filter runs
+    ) -> models.RunCreateResponse:
+        r"""Create run
 
-        Retrieve a paginated list of test runs with filtering by unit, procedure, date range, outcome, and station.
+        Create a new test run, linking it to a procedure and unit. Existing entities are reused automatically.
 
-        :param search_query:
-        :param ids:
-        :param outcomes:
-        :param procedure_ids:
-        :param procedure_versions:
-        :param serial_numbers:
-        :param part_numbers:
-        :param revision_numbers:
-        :param batch_numbers:
-        :param duration_min:
-        :param duration_max:
-        :param started_after:
-        :param started_before:
-        :param ended_after:
-        :param ended_before:
-        :param created_after:
-        :param created_before:
-        :param created_by_user_ids:
-        :param created_by_station_ids:
-        :param operated_by_ids:
-        :param limit: Maximum number of runs to return per page.
-        :param cursor:
-        :param sort_by: Field to sort results by.
-        :param sort_order: Sort order direction.
+        :param outcome: Overall test result. Use PASS when test succeeds, FAIL when test fails but script execution completed successfully, ERROR when script execution fails, TIMEOUT when test exceeds time limit, ABORTED for manual script interruption.
+        :param procedure_id: Procedure ID. Create the procedure in the app first, then find the auto-generated ID on the procedure page.
+        :param started_at: ISO 8601 timestamp when the test run began execution. This timestamp will be used to track when the test execution started and for historical analysis of test runs. A separate created_at timestamp is stored internally server side to track upload date.
+        :param ended_at: ISO 8601 timestamp when the test run finished execution.
+        :param serial_number: Unique serial number of the unit under test. Matched case-insensitively. If no unit with this serial number exists, one will be created.
+        :param procedure_version: Specific version of the test procedure used for the run. Matched case-insensitively. If none exist, a procedure with this procedure version will be created. If no procedure version is specified, the run will not be linked to any specific version.
+        :param operated_by: Email address of the operator who executed the test run. The operator must exist as a user in the system. The run will be linked to this user to track who performed the test.
+        :param part_number: Component part number for the unit. Matched case-insensitively. This field is required if the part number cannot be extracted from the serial number (as set in the settings). This field takes precedence over extraction from serial number. A component with the provided or extracted part number will be created if one does not exist.
+        :param revision_number: Hardware revision identifier for the unit. Matched case-insensitively. If none exist, a revision with this number will be created. If no revision is specified, the unit will be linked to the default revision of the part number.
+        :param batch_number: Production batch identifier for grouping units manufactured together. Matched case-insensitively. If none exist, a batch with this batch number will be created. If no batch number is specified, the unit will not be linked to any batch.
+        :param sub_units: Array of sub-unit serial numbers that are part of this main unit. Matched case-insensitively. Each sub-unit must already exist and will be linked as a sub-component of the main unit under test. If no sub-units are specified, the unit will be created without sub-unit relationships.
+        :param docstring: Additional notes or documentation about this test run.
+        :param phases: Array of test phases with measurements and results. Each phase represents a distinct stage of the test execution with timing information, outcome status, and optional measurements. If no phases are specified, the run will be created without phase-level organization of test data.
+        :param logs: Array of log messages generated during the test execution. Each log entry captures events, errors, and diagnostic information with severity levels and source code references. If no logs are specified, the run will be created without log entries.
         :param retries: Override the default retry configuration for this method
         :param server_url: Override the default server URL for this method
         :param timeout_ms: Override the default request timeout configuration for this method in milliseconds
@@ -254,46 +228,41 @@ class Runs(BaseSDK):
         else:
             base_url = self._get_url(base_url, url_variables)
 
-        request = models.RunListRequest(
-            search_query=search_query,
-            ids=ids,
-            outcomes=outcomes,
-            procedure_ids=procedure_ids,
-            procedure_versions=procedure_versions,
-            serial_numbers=serial_numbers,
-            part_numbers=part_numbers,
-            revision_numbers=revision_numbers,
-            batch_numbers=batch_numbers,
-            duration_min=duration_min,
-            duration_max=duration_max,
-            started_after=started_after,
-            started_before=started_before,
-            ended_after=ended_after,
-            ended_before=ended_before,
-            created_after=created_after,
-            created_before=created_before,
-            created_by_user_ids=created_by_user_ids,
-            created_by_station_ids=created_by_station_ids,
-            operated_by_ids=operated_by_ids,
-            limit=limit,
-            cursor=cursor,
-            sort_by=sort_by,
-            sort_order=sort_order,
+        request = models.RunCreateRequest(
+            outcome=outcome,
+            procedure_id=procedure_id,
+            procedure_version=procedure_version,
+            operated_by=operated_by,
+            started_at=started_at,
+            ended_at=ended_at,
+            serial_number=serial_number,
+            part_number=part_number,
+            revision_number=revision_number,
+            batch_number=batch_number,
+            sub_units=sub_units,
+            docstring=docstring,
+            phases=utils.get_pydantic_model(
+                phases, Optional[List[models.RunCreatePhase]]
+            ),
+            logs=utils.get_pydantic_model(logs, Optional[List[models.RunCreateLog]]),
         )
 
         req = self._build_request_async(
-            method="GET",
+            method="POST",
             path="/v2/runs",
             base_url=base_url,
             url_variables=url_variables,
             request=request,
-            request_body_required=False,
+            request_body_required=True,
             request_has_path_params=False,
             request_has_query_params=True,
             user_agent_header="user-agent",
             accept_header_value="application/json",
             http_headers=http_headers,
             security=self.sdk_configuration.security,
+            get_serialized_body=lambda: utils.serialize_request_body(
+                request, False, False, "json", models.RunCreateRequest
+            ),
             timeout_ms=timeout_ms,
         )
 
@@ -309,20 +278,20 @@ class Runs(BaseSDK):
             hook_ctx=HookContext(
                 config=self.sdk_configuration,
                 base_url=base_url or "",
-                operation_id="run-list",
+                operation_id="run-create",
                 oauth2_scopes=[],
                 security_source=get_security_from_env(
                     self.sdk_configuration.security, models.Security
                 ),
             ),
             request=req,
-            error_status_codes=["400", "401", "4XX", "500", "5XX"],
+            error_status_codes=["400", "401", "403", "404", "422", "4XX", "500", "5XX"],
             retry_config=retry_config,
         )
 
         response_data: Any = None
         if utils.match_response(http_res, "200", "application/json"):
-            return unmarshal_json_response(models.RunListResponse, http_res)
+            return unmarshal_json_response(models.RunCreateResponse, http_res)
         if utils.match_response(http_res, "400", "application/json"):
             response_data = unmarshal_json_response(
                 errors.ErrorBADREQUESTData, http_res
@@ -333,6 +302,17 @@ class Runs(BaseSDK):
                 errors.ErrorUNAUTHORIZEDData, http_res
             )
             raise errors.ErrorUNAUTHORIZED(response_data, http_res)
+        if utils.match_response(http_res, "403", "application/json"):
+            response_data = unmarshal_json_response(errors.ErrorFORBIDDENData, http_res)
+            raise errors.ErrorFORBIDDEN(response_data, http_res)
+        if utils.match_response(http_res, "404", "application/json"):
+            response_data = unmarshal_json_response(errors.ErrorNOTFOUNDData, http_res)
+            raise errors.ErrorNOTFOUND(response_data, http_res)
+        if utils.match_response(http_res, "422", "application/json"):
+            response_data = unmarshal_json_response(
+                errors.ErrorUNPROCESSABLECONTENTData, http_res
+            )
+            raise errors.ErrorUNPROCESSABLECONTENT(response_data, http_res)
         if utils.match_response(http_res, "500", "application/json"):
             response_data = unmarshal_json_response(
                 errors.ErrorINTERNALSERVERERRORData, http_res
@@ -347,50 +327,66 @@ class Runs(BaseSDK):
 
         raise errors.APIError("Unexpected response received", http_res)
 
-    def create(
+    def list(
         self,
         *,
-        outcome: models.RunCreateOutcome,
-        procedure_id: str,
-        started_at: datetime,
-        ended_at: datetime,
-        serial_number: str,
-        procedure_version: OptionalNullable[str] = UNSET,
-        operated_by: Optional[str] = None,
-        part_number: Optional[str] = None,
-        revision_number: Optional[str] = None,
-        batch_number: Optional[str] = None,
-        sub_units: Optional[List[str]] = None,
-        docstring: Optional[str] = None,
-        phases: Optional[
-            Union[List[models.RunCreatePhase], List[models.RunCreatePhaseTypedDict]]
-        ] = None,
-        logs: Optional[
-            Union[List[models.RunCreateLog], List[models.RunCreateLogTypedDict]]
-        ] = None,
+        search_query: Optional[str] = None,
+        ids: Optional[List[str]] = None,
+        outcomes: Optional[List[models.RunListQueryParamOutcome]] = None,
+        procedure_ids: Optional[List[str]] = None,
+        procedure_versions: Optional[List[str]] = None,
+        serial_numbers: Optional[List[str]] = None,
+        part_numbers: Optional[List[str]] = None,
+        revision_numbers: Optional[List[str]] = None,
+        batch_numbers: Optional[List[str]] = None,
+        duration_min: Optional[str] = None,
+        duration_max: Optional[str] = None,
+        started_after: Optional[datetime] = None,
+        started_before: Optional[datetime] = None,
+        ended_after: Optional[datetime] = None,
+        ended_before: Optional[datetime] = None,
+        created_after: Optional[datetime] = None,
+        created_before: Optional[datetime] = None,
+        created_by_user_ids: Optional[List[str]] = None,
+        created_by_station_ids: Optional[List[str]] = None,
+        operated_by_ids: Optional[List[str]] = None,
+        limit: Optional[int] = 50,
+        cursor: Optional[float] = None,
+        sort_by: Optional[models.RunListSortBy] = "started_at",
+        sort_order: Optional[models.RunListSortOrder] = "desc",
         retries: OptionalNullable[utils.RetryConfig] = UNSET,
         server_url: Optional[str] = None,
         timeout_ms: Optional[int] = None,
         http_headers: Optional[Mapping[str, str]] = None,
-    ) -> models.RunCreateResponse:
-        r"""Create run
+    ) -> models.RunListResponse:
+        r"""List and filter runs
 
-        Create a new test run, linking it to a procedure and unit. Existing entities are reused automatically.
+        Retrieve a paginated list of test runs with filtering by unit, procedure, date range, outcome, and station.
 
-        :param outcome: Overall test result. Use PASS when test succeeds, FAIL when test fails but script execution completed successfully, ERROR when script execution fails, TIMEOUT when test exceeds time limit, ABORTED for manual script interruption.
-        :param procedure_id: Procedure ID. Create the procedure in the app first, then find the auto-generated ID on the procedure page.
-        :param started_at: ISO 8601 timestamp when the test run began execution. This timestamp will be used to track when the test execution started and for historical analysis of test runs. A separate created_at timestamp is stored internally server side to track upload date.
-        :param ended_at: ISO 8601 timestamp when the test run finished execution.
-        :param serial_number: Unique serial number of the unit under test. Matched case-insensitively. If no unit with this serial number exists, one will be created.
-        :param procedure_version:
-        :param operated_by: Email address of the operator who executed the test run. The operator must exist as a user in the system. The run will be linked to this user to track who performed the test.
-        :param part_number: Component part number for the unit. Matched case-insensitively. This field is required if the part number cannot be extracted from the serial number (as set in the settings). This field takes precedence over extraction from serial number. A component with the provided or extracted part number will be created if one does not exist.
-        :param revision_number: Hardware revision identifier for the unit. Matched case-insensitively. If none exist, a revision with this number will be created. If no revision is specified, the unit will be linked to the default revision of the part number.
-        :param batch_number: Production batch identifier for grouping units manufactured together. Matched case-insensitively. If none exist, a batch with this batch number will be created. If no batch number is specified, the unit will not be linked to any batch.
-        :param sub_units: Array of sub-unit serial numbers that are part of this main unit. Matched case-insensitively. Each sub-unit must already exist and will be linked as a sub-component of the main unit under test. If no sub-units are specified, the unit will be created without sub-unit relationships.
-        :param docstring: Additional notes or documentation about this test run.
-        :param phases: Array of test phases with measurements and results. Each phase represents a distinct stage of the test execution with timing information, outcome status, and optional measurements. If no phases are specified, the run will be created without phase-level organization of test data.
-        :param logs: Array of log messages generated during the test execution. Each log entry captures events, errors, and diagnostic information with severity levels and source code references. If no logs are specified, the run will be created without log entries.
+        :param search_query:
+        :param ids:
+        :param outcomes:
+        :param procedure_ids:
+        :param procedure_versions:
+        :param serial_numbers:
+        :param part_numbers:
+        :param revision_numbers:
+        :param batch_numbers:
+        :param duration_min:
+        :param duration_max:
+        :param started_after:
+        :param started_before:
+        :param ended_after:
+        :param ended_before:
+        :param created_after:
+        :param created_before:
+        :param created_by_user_ids:
+        :param created_by_station_ids:
+        :param operated_by_ids:
+        :param limit: Maximum number of runs to return per page.
+        :param cursor:
+        :param sort_by: Field to sort results by.
+        :param sort_order: Sort order direction.
         :param retries: Override the default retry configuration for this method
         :param server_url: Override the default server URL for this method
         :param timeout_ms: Override the default request timeout configuration for this method in milliseconds
@@ -406,41 +402,46 @@ class Runs(BaseSDK):
         else:
             base_url = self._get_url(base_url, url_variables)
 
-        request = models.RunCreateRequest(
-            outcome=outcome,
-            procedure_id=procedure_id,
-            procedure_version=procedure_version,
-            operated_by=operated_by,
-            started_at=started_at,
-            ended_at=ended_at,
-            serial_number=serial_number,
-            part_number=part_number,
-            revision_number=revision_number,
-            batch_number=batch_number,
-            sub_units=sub_units,
-            docstring=docstring,
-            phases=utils.get_pydantic_model(
-                phases, Optional[List[models.RunCreatePhase]]
-            ),
-            logs=utils.get_pydantic_model(logs, Optional[List[models.RunCreateLog]]),
+        request = models.RunListRequest(
+            search_query=search_query,
+            ids=ids,
+            outcomes=outcomes,
+            procedure_ids=procedure_ids,
+            procedure_versions=procedure_versions,
+            serial_numbers=serial_numbers,
+            part_numbers=part_numbers,
+            revision_numbers=revision_numbers,
+            batch_numbers=batch_numbers,
+            duration_min=duration_min,
+            duration_max=duration_max,
+            started_after=started_after,
+            started_before=started_before,
+            ended_after=ended_after,
+            ended_before=ended_before,
+            created_after=created_after,
+            created_before=created_before,
+            created_by_user_ids=created_by_user_ids,
+            created_by_station_ids=created_by_station_ids,
+            operated_by_ids=operated_by_ids,
+            limit=limit,
+            cursor=cursor,
+            sort_by=sort_by,
+            sort_order=sort_order,
         )
 
         req = self._build_request(
-            method="POST",
+            method="GET",
             path="/v2/runs",
             base_url=base_url,
             url_variables=url_variables,
             request=request,
-            request_body_required=True,
+            request_body_required=False,
             request_has_path_params=False,
             request_has_query_params=True,
             user_agent_header="user-agent",
             accept_header_value="application/json",
             http_headers=http_headers,
             security=self.sdk_configuration.security,
-            get_serialized_body=lambda: utils.serialize_request_body(
-                request, False, False, "json", models.RunCreateRequest
-            ),
             timeout_ms=timeout_ms,
         )
 
@@ -456,20 +457,20 @@ class Runs(BaseSDK):
             hook_ctx=HookContext(
                 config=self.sdk_configuration,
                 base_url=base_url or "",
-                operation_id="run-create",
+                operation_id="run-list",
                 oauth2_scopes=[],
                 security_source=get_security_from_env(
                     self.sdk_configuration.security, models.Security
                 ),
             ),
             request=req,
-            error_status_codes=["400", "401", "403", "404", "422", "4XX", "500", "5XX"],
+            error_status_codes=["400", "401", "4XX", "500", "5XX"],
             retry_config=retry_config,
         )
 
         response_data: Any = None
         if utils.match_response(http_res, "200", "application/json"):
-            return unmarshal_json_response(models.RunCreateResponse, http_res)
+            return unmarshal_json_response(models.RunListResponse, http_res)
         if utils.match_response(http_res, "400", "application/json"):
             response_data = unmarshal_json_response(
                 errors.ErrorBADREQUESTData, http_res
@@ -480,17 +481,6 @@ class Runs(BaseSDK):
                 errors.ErrorUNAUTHORIZEDData, http_res
             )
             raise errors.ErrorUNAUTHORIZED(response_data, http_res)
-        if utils.match_response(http_res, "403", "application/json"):
-            response_data = unmarshal_json_response(errors.ErrorFORBIDDENData, http_res)
-            raise errors.ErrorFORBIDDEN(response_data, http_res)
-        if utils.match_response(http_res, "404", "application/json"):
-            response_data = unmarshal_json_response(errors.ErrorNOTFOUNDData, http_res)
-            raise errors.ErrorNOTFOUND(response_data, http_res)
-        if utils.match_response(http_res, "422", "application/json"):
-            response_data = unmarshal_json_response(
-                errors.ErrorUNPROCESSABLECONTENTData, http_res
-            )
-            raise errors.ErrorUNPROCESSABLECONTENT(response_data, http_res)
         if utils.match_response(http_res, "500", "application/json"):
             response_data = unmarshal_json_response(
                 errors.ErrorINTERNALSERVERERRORData, http_res
@@ -505,50 +495,66 @@ class Runs(BaseSDK):
 
         raise errors.APIError("Unexpected response received", http_res)
 
-    async def create_async(
+    async def list_async(
         self,
         *,
-        outcome: models.RunCreateOutcome,
-        procedure_id: str,
-        started_at: datetime,
-        ended_at: datetime,
-        serial_number: str,
-        procedure_version: OptionalNullable[str] = UNSET,
-        operated_by: Optional[str] = None,
-        part_number: Optional[str] = None,
-        revision_number: Optional[str] = None,
-        batch_number: Optional[str] = None,
-        sub_units: Optional[List[str]] = None,
-        docstring: Optional[str] = None,
-        phases: Optional[
-            Union[List[models.RunCreatePhase], List[models.RunCreatePhaseTypedDict]]
-        ] = None,
-        logs: Optional[
-            Union[List[models.RunCreateLog], List[models.RunCreateLogTypedDict]]
-        ] = None,
+        search_query: Optional[str] = None,
+        ids: Optional[List[str]] = None,
+        outcomes: Optional[List[models.RunListQueryParamOutcome]] = None,
+        procedure_ids: Optional[List[str]] = None,
+        procedure_versions: Optional[List[str]] = None,
+        serial_numbers: Optional[List[str]] = None,
+        part_numbers: Optional[List[str]] = None,
+        revision_numbers: Optional[List[str]] = None,
+        batch_numbers: Optional[List[str]] = None,
+        duration_min: Optional[str] = None,
+        duration_max: Optional[str] = None,
+        started_after: Optional[datetime] = None,
+        started_before: Optional[datetime] = None,
+        ended_after: Optional[datetime] = None,
+        ended_before: Optional[datetime] = None,
+        created_after: Optional[datetime] = None,
+        created_before: Optional[datetime] = None,
+        created_by_user_ids: Optional[List[str]] = None,
+        created_by_station_ids: Optional[List[str]] = None,
+        operated_by_ids: Optional[List[str]] = None,
+        limit: Optional[int] = 50,
+        cursor: Optional[float] = None,
+        sort_by: Optional[models.RunListSortBy] = "started_at",
+        sort_order: Optional[models.RunListSortOrder] = "desc",
         retries: OptionalNullable[utils.RetryConfig] = UNSET,
         server_url: Optional[str] = None,
         timeout_ms: Optional[int] = None,
         http_headers: Optional[Mapping[str, str]] = None,
-    ) -> models.RunCreateResponse:
-        r"""Create run
+    ) -> models.RunListResponse:
+        r"""List and filter runs
 
-        Create a new test run, linking it to a procedure and unit. Existing entities are reused automatically.
+        Retrieve a paginated list of test runs with filtering by unit, procedure, date range, outcome, and station.
 
-        :param outcome: Overall test result. Use PASS when test succeeds, FAIL when test fails but script execution completed successfully, ERROR when script execution fails, TIMEOUT when test exceeds time limit, ABORTED for manual script interruption.
-        :param procedure_id: Procedure ID. Create the procedure in the app first, then find the auto-generated ID on the procedure page.
-        :param started_at: ISO 8601 timestamp when the test run began execution. This timestamp will be used to track when the test execution started and for historical analysis of test runs. A separate created_at timestamp is stored internally server side to track upload date.
-        :param ended_at: ISO 8601 timestamp when the test run finished execution.
-        :param serial_number: Unique serial number of the unit under test. Matched case-insensitively. If no unit with this serial number exists, one will be created.
-        :param procedure_version:
-        :param operated_by: Email address of the operator who executed the test run. The operator must exist as a user in the system. The run will be linked to this user to track who performed the test.
-        :param part_number: Component part number for the unit. Matched case-insensitively. This field is required if the part number cannot be extracted from the serial number (as set in the settings). This field takes precedence over extraction from serial number. A component with the provided or extracted part number will be created if one does not exist.
-        :param revision_number: Hardware revision identifier for the unit. Matched case-insensitively. If none exist, a revision with this number will be created. If no revision is specified, the unit will be linked to the default revision of the part number.
-        :param batch_number: Production batch identifier for grouping units manufactured together. Matched case-insensitively. If none exist, a batch with this batch number will be created. If no batch number is specified, the unit will not be linked to any batch.
-        :param sub_units: Array of sub-unit serial numbers that are part of this main unit. Matched case-insensitively. Each sub-unit must already exist and will be linked as a sub-component of the main unit under test. If no sub-units are specified, the unit will be created without sub-unit relationships.
-        :param docstring: Additional notes or documentation about this test run.
-        :param phases: Array of test phases with measurements and results. Each phase represents a distinct stage of the test execution with timing information, outcome status, and optional measurements. If no phases are specified, the run will be created without phase-level organization of test data.
-        :param logs: Array of log messages generated during the test execution. Each log entry captures events, errors, and diagnostic information with severity levels and source code references. If no logs are specified, the run will be created without log entries.
+        :param search_query:
+        :param ids:
+        :param outcomes:
+        :param procedure_ids:
+        :param procedure_versions:
+        :param serial_numbers:
+        :param part_numbers:
+        :param revision_numbers:
+        :param batch_numbers:
+        :param duration_min:
+        :param duration_max:
+        :param started_after:
+        :param started_before:
+        :param ended_after:
+        :param ended_before:
+        :param created_after:
+        :param created_before:
+        :param created_by_user_ids:
+        :param created_by_station_ids:
+        :param operated_by_ids:
+        :param limit: Maximum number of runs to return per page.
+        :param cursor:
+        :param sort_by: Field to sort results by.
+        :param sort_order: Sort order direction.
         :param retries: Override the default retry configuration for this method
         :param server_url: Override the default server URL for this method
         :param timeout_ms: Override the default request timeout configuration for this method in milliseconds
@@ -564,41 +570,46 @@ class Runs(BaseSDK):
         else:
             base_url = self._get_url(base_url, url_variables)
 
-        request = models.RunCreateRequest(
-            outcome=outcome,
-            procedure_id=procedure_id,
-            procedure_version=procedure_version,
-            operated_by=operated_by,
-            started_at=started_at,
-            ended_at=ended_at,
-            serial_number=serial_number,
-            part_number=part_number,
-            revision_number=revision_number,
-            batch_number=batch_number,
-            sub_units=sub_units,
-            docstring=docstring,
-            phases=utils.get_pydantic_model(
-                phases, Optional[List[models.RunCreatePhase]]
-            ),
-            logs=utils.get_pydantic_model(logs, Optional[List[models.RunCreateLog]]),
+        request = models.RunListRequest(
+            search_query=search_query,
+            ids=ids,
+            outcomes=outcomes,
+            procedure_ids=procedure_ids,
+            procedure_versions=procedure_versions,
+            serial_numbers=serial_numbers,
+            part_numbers=part_numbers,
+            revision_numbers=revision_numbers,
+            batch_numbers=batch_numbers,
+            duration_min=duration_min,
+            duration_max=duration_max,
+            started_after=started_after,
+            started_before=started_before,
+            ended_after=ended_after,
+            ended_before=ended_before,
+            created_after=created_after,
+            created_before=created_before,
+            created_by_user_ids=created_by_user_ids,
+            created_by_station_ids=created_by_station_ids,
+            operated_by_ids=operated_by_ids,
+            limit=limit,
+            cursor=cursor,
+            sort_by=sort_by,
+            sort_order=sort_order,
         )
 
         req = self._build_request_async(
-            method="POST",
+            method="GET",
             path="/v2/runs",
             base_url=base_url,
             url_variables=url_variables,
             request=request,
-            request_body_required=True,
+            request_body_required=False,
             request_has_path_params=False,
             request_has_query_params=True,
             user_agent_header="user-agent",
             accept_header_value="application/json",
             http_headers=http_headers,
             security=self.sdk_configuration.security,
-            get_serialized_body=lambda: utils.serialize_request_body(
-                request, False, False, "json", models.RunCreateRequest
-            ),
             timeout_ms=timeout_ms,
         )
 
@@ -614,20 +625,20 @@ class Runs(BaseSDK):
             hook_ctx=HookContext(
                 config=self.sdk_configuration,
                 base_url=base_url or "",
-                operation_id="run-create",
+                operation_id="run-list",
                 oauth2_scopes=[],
                 security_source=get_security_from_env(
                     self.sdk_configuration.security, models.Security
                 ),
             ),
             request=req,
-            error_status_codes=["400", "401", "403", "404", "422", "4XX", "500", "5XX"],
+            error_status_codes=["400", "401", "4XX", "500", "5XX"],
             retry_config=retry_config,
         )
 
         response_data: Any = None
         if utils.match_response(http_res, "200", "application/json"):
-            return unmarshal_json_response(models.RunCreateResponse, http_res)
+            return unmarshal_json_response(models.RunListResponse, http_res)
         if utils.match_response(http_res, "400", "application/json"):
             response_data = unmarshal_json_response(
                 errors.ErrorBADREQUESTData, http_res
@@ -638,17 +649,6 @@ class Runs(BaseSDK):
                 errors.ErrorUNAUTHORIZEDData, http_res
             )
             raise errors.ErrorUNAUTHORIZED(response_data, http_res)
-        if utils.match_response(http_res, "403", "application/json"):
-            response_data = unmarshal_json_response(errors.ErrorFORBIDDENData, http_res)
-            raise errors.ErrorFORBIDDEN(response_data, http_res)
-        if utils.match_response(http_res, "404", "application/json"):
-            response_data = unmarshal_json_response(errors.ErrorNOTFOUNDData, http_res)
-            raise errors.ErrorNOTFOUND(response_data, http_res)
-        if utils.match_response(http_res, "422", "application/json"):
-            response_data = unmarshal_json_response(
-                errors.ErrorUNPROCESSABLECONTENTData, http_res
-            )
-            raise errors.ErrorUNPROCESSABLECONTENT(response_data, http_res)
         if utils.match_response(http_res, "500", "application/json"):
             response_data = unmarshal_json_response(
                 errors.ErrorINTERNALSERVERERRORData, http_res
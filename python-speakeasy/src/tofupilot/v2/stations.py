@@ -10,26 +10,22 @@ from typing import Any, List, Mapping, Optional
 
 
 class Stations(BaseSDK):
-    def list(
+    def create(
         self,
         *,
-        limit: Optional[int] = 50,
-        cursor: Optional[int] = None,
-        search_query: Optional[str] = None,
-        procedure_ids: Optional[List[str]] = None,
+        name: str,
+        procedure_id: Optional[str] = None,
         retries: OptionalNullable[utils.RetryConfig] = UNSET,
         server_url: Optional[str] = None,
         timeout_ms: Optional[int] = None,
         http_headers: Optional[Mapping[str, str]] = None,
-    ) -> models.StationListResponse:
-        r"""List and filter stations
+    ) -> models.StationCreateResponse:
+        r"""Create station
 
-        Retrieve a paginated list of test stations in your organization. Search by station name and filter by status for station fleet management.
+        Create a new test station in TofuPilot to register production equipment and link it to test procedures.
 
-        :param limit: Number of stations to return per page
-        :param cursor:
-        :param search_query:
-        :param procedure_ids:
+        :param name: Name of the station
+        :param procedure_id: Optional procedure ID to link the station to
         :param retries: Override the default retry configuration for this method
         :param server_url: Override the default server URL for this method
         :param timeout_ms: Override the default request timeout configuration for this method in milliseconds
@@ -45,26 +41,27 @@ class Stations(BaseSDK):
         else:
             base_url = self._get_url(base_url, url_variables)
 
-        request = models.StationListRequest(
-            limit=limit,
-            cursor=cursor,
-            search_query=search_query,
-            procedure_ids=procedure_ids,
+        request = models.StationCreateRequest(
+            name=name,
+            procedure_id=procedure_id,
         )
 
         req = self._build_request(
-            method="GET",
+            method="POST",
             path="/v2/stations",
             base_url=base_url,
             url_variables=url_variables,
             request=request,
-            request_body_required=False,
+            request_body_required=True,
             request_has_path_params=False,
             request_has_query_params=True,
             user_agent_header="user-agent",
             accept_header_value="application/json",
             http_headers=http_headers,
             security=self.sdk_configuration.security,
+            get_serialized_body=lambda: utils.serialize_request_body(
+                request, False, False, "json", models.StationCreateRequest
+            ),
             timeout_ms=timeout_ms,
         )
 
@@ -80,25 +77,31 @@ class Stations(BaseSDK):
             hook_ctx=HookContext(
                 config=self.sdk_configuration,
                 base_url=base_url or "",
-                operation_id="station-list",
+                operation_id="station-create",
                 oauth2_scopes=[],
                 security_source=get_security_from_env(
                     self.sdk_configuration.security, models.Security
                 ),
             ),
             request=req,
-            error_status_codes=["401", "4XX", "500", "5XX"],
+            error_status_codes=["401", "403", "409", "4XX", "500", "5XX"],
             retry_config=retry_config,
         )
 
         response_data: Any = None
         if utils.match_response(http_res, "200", "application/json"):
-            return unmarshal_json_response(models.StationListResponse, http_res)
+            return unmarshal_json_response(models.StationCreateResponse, http_res)
         if utils.match_response(http_res, "401", "application/json"):
             response_data = unmarshal_json_response(
                 errors.ErrorUNAUTHORIZEDData, http_res
             )
             raise errors.ErrorUNAUTHORIZED(response_data, http_res)
+        if utils.match_response(http_res, "403", "application/json"):
+            response_data = unmarshal_json_response(errors.ErrorFORBIDDENData, http_res)
+            raise errors.ErrorFORBIDDEN(response_data, http_res)
+        if utils.match_response(http_res, "409", "application/json"):
+            response_data = unmarshal_json_response(errors.ErrorCONFLICTData, http_res)
+            raise errors.ErrorCONFLICT(response_data, http_res)
         if utils.match_response(http_res, "500", "application/json"):
             response_data = unmarshal_json_response(
                 errors.ErrorINTERNALSERVERERRORData, http_res
@@ -113,26 +116,22 @@ class Stations(BaseSDK):
 
         raise errors.APIError("Unexpected response received", http_res)
 
-    async def list_async(
+    async def create_async(
         self,
         *,
-        limit: Optional[int] = 50,
-        cursor: Optional[int] = None,
-        search_query: Optional[str] = None,
-        procedure_ids: Optional[List[str]] = None,
+        name: str,
+        procedure_id: Optional[str] = None,
         retries: OptionalNullable[utils.RetryConfig] = UNSET,
         server_url: Optional[str] = None,
         timeout_ms: Optional[int] = None,
         http_headers: Optional[Mapping[str, str]] = None,
-    ) -> models.StationListResponse:
-        r"""List and filter stations
+    ) -> models.StationCreateResponse:
+        r"""Create station
 
-        Retrieve a paginated list of test stations in your organization. Search by station name and filter by status for station fleet management.
+        Create a new test station in TofuPilot to register production equipment and link it to test procedures.
 
-        :param limit: Number of stations to return per page
-        :param cursor:
-        :param search_query:
-        :param procedure_ids:
+        :param name: Name of the station
+        :param procedure_id: Optional procedure ID to link the station to
         :param retries: Override the default retry configuration for this method
         :param server_url: Override the default server URL for this method
         :param timeout_ms: Override the default request timeout configuration for this method in milliseconds
@@ -148,26 +147,27 @@ class Stations(BaseSDK):
         else:
             base_url = self._get_url(base_url, url_variables)
 
-        request = models.StationListRequest(
-            limit=limit,
-            cursor=cursor,
-            search_query=search_query,
-            procedure_ids=procedure_ids,
+        request = models.StationCreateRequest(
+            name=name,
+            procedure_id=procedure_id,
         )
 
         req = self._build_request_async(
-            method="GET",
+            method="POST",
             path="/v2/stations",
             base_url=base_url,
             url_variables=url_variables,
             request=request,
-            request_body_required=False,
+            request_body_required=True,
             request_has_path_params=False,
             request_has_query_params=True,
             user_agent_header="user-agent",
             accept_header_value="application/json",
             http_headers=http_headers,
             security=self.sdk_configuration.security,
+            get_serialized_body=lambda: utils.serialize_request_body(
+                request, False, False, "json", models.StationCreateRequest
+            ),
             timeout_ms=timeout_ms,
         )
 
@@ -183,25 +183,31 @@ class Stations(BaseSDK):
             hook_ctx=HookContext(
                 config=self.sdk_configuration,
                 base_url=base_url or "",
-                operation_id="station-list",
+                operation_id="station-create",
                 oauth2_scopes=[],
                 security_source=get_security_from_env(
                     self.sdk_configuration.security, models.Security
                 ),
             ),
             request=req,
-            error_status_codes=["401", "4XX", "500", "5XX"],
+            error_status_codes=["401", "403", "409", "4XX", "500", "5XX"],
             retry_config=retry_config,
         )
 
         response_data: Any = None
         if utils.match_response(http_res, "200", "application/json"):
-            return unmarshal_json_response(models.StationListResponse, http_res)
+            return unmarshal_json_response(models.StationCreateResponse, http_res)
         if utils.match_response(http_res, "401", "application/json"):
             response_data = unmarshal_json_response(
                 errors.ErrorUNAUTHORIZEDData, http_res
             )
             raise errors.ErrorUNAUTHORIZED(response_data, http_res)
+        if utils.match_response(http_res, "403", "application/json"):
+            response_data = unmarshal_json_response(errors.ErrorFORBIDDENData, http_res)
+            raise errors.ErrorFORBIDDEN(response_data, http_res)
+        if utils.match_response(http_res, "409", "application/json"):
+            response_data = unmarshal_json_response(errors.ErrorCONFLICTData, http_res)
+            raise errors.ErrorCONFLICT(response_data, http_res)
         if utils.match_response(http_res, "500", "application/json"):
             response_data = unmarshal_json_response(
                 errors.ErrorINTERNALSERVERERRORData, http_res
@@ -216,22 +222,26 @@ class Stations(BaseSDK):
 
         raise errors.APIError("Unexpected response received", http_res)
 
-    def create(
+    def list(
         self,
         *,
-        name: str,
-        procedure_id: Optional[str] = None,
+        limit: Optional[int] = 50,
+        cursor: Optional[int] = None,
+        search_query: Optional[str] = None,
+        procedure_ids: Optional[List[str]] = None,
         retries: OptionalNullable[utils.RetryConfig] = UNSET,
         server_url: Optional[str] = None,
         timeout_ms: Optional[int] = None,
         http_headers: Optional[Mapping[str, str]] = None,
-    ) -> models.StationCreateResponse:
-        r"""Create station
+    ) -> models.StationListResponse:
+        r"""List and filter stations
 
-        Create a new test station in TofuPilot to register production equipment and link it to test procedures.
+        Retrieve a paginated list of test stations in your organization. Search by station name and filter by status for station fleet management.
 
-        :param name: Name of the station
-        :param procedure_id: Optional procedure ID to link the station to
+        :param limit: Number of stations to return per page
+        :param cursor:
+        :param search_query:
+        :param procedure_ids:
         :param retries: Override the default retry configuration for this method
         :param server_url: Override the default server URL for this method
         :param timeout_ms: Override the default request timeout configuration for this method in milliseconds
@@ -247,27 +257,26 @@ class Stations(BaseSDK):
         else:
             base_url = self._get_url(base_url, url_variables)
 
-        request = models.StationCreateRequest(
-            name=name,
-            procedure_id=procedure_id,
+        request = models.StationListRequest(
+            limit=limit,
+            cursor=cursor,
+            search_query=search_query,
+            procedure_ids=procedure_ids,
         )
 
         req = self._build_request(
-            method="POST",
+            method="GET",
             path="/v2/stations",
             base_url=base_url,
             url_variables=url_variables,
             request=request,
-            request_body_required=True,
+            request_body_required=False,
             request_has_path_params=False,
             request_has_query_params=True,
             user_agent_header="user-agent",
             accept_header_value="application/json",
             http_headers=http_headers,
             security=self.sdk_configuration.security,
-            get_serialized_body=lambda: utils.serialize_request_body(
-                request, False, False, "json", models.StationCreateRequest
-            ),
             timeout_ms=timeout_ms,
         )
 
@@ -283,31 +292,25 @@ class Stations(BaseSDK):
             hook_ctx=HookContext(
                 config=self.sdk_configuration,
                 base_url=base_url or "",
-                operation_id="station-create",
+                operation_id="station-list",
                 oauth2_scopes=[],
                 security_source=get_security_from_env(
                     self.sdk_configuration.security, models.Security
                 ),
             ),
             request=req,
-            error_status_codes=["401", "403", "409", "4XX", "500", "5XX"],
+            error_status_codes=["401", "4XX", "500", "5XX"],
             retry_config=retry_config,
         )
 
         response_data: Any = None
         if utils.match_response(http_res, "200", "application/json"):
-            return unmarshal_json_response(models.StationCreateResponse, http_res)
+            return unmarshal_json_response(models.StationListResponse, http_res)
         if utils.match_response(http_res, "401", "application/json"):
             response_data = unmarshal_json_response(
                 errors.ErrorUNAUTHORIZEDData, http_res
             )
             raise errors.ErrorUNAUTHORIZED(response_data, http_res)
-        if utils.match_response(http_res, "403", "application/json"):
-            response_data = unmarshal_json_response(errors.ErrorFORBIDDENData, http_res)
-            raise errors.ErrorFORBIDDEN(response_data, http_res)
-        if utils.match_response(http_res, "409", "application/json"):
-            response_data = unmarshal_json_response(errors.ErrorCONFLICTData, http_res)
-            raise errors.ErrorCONFLICT(response_data, http_res)
         if utils.match_response(http_res, "500", "application/json"):
             response_data = unmarshal_json_response(
                 errors.ErrorINTERNALSERVERERRORData, http_res
@@ -322,22 +325,26 @@ class Stations(BaseSDK):
 
         raise errors.APIError("Unexpected response received", http_res)
 
-    async def create_async(
+    async def list_async(
         self,
         *,
-        name: str,
-        procedure_id: Optional[str] = None,
+        limit: Optional[int] = 50,
+        cursor: Optional[int] = None,
+        search_query: Optional[str] = None,
+        procedure_ids: Optional[List[str]] = None,
         retries: OptionalNullable[utils.RetryConfig] = UNSET,
         server_url: Optional[str] = None,
         timeout_ms: Optional[int] = None,
         http_headers: Optional[Mapping[str, str]] = None,
-    ) -> models.StationCreateResponse:
-        r"""Create station
+    ) -> models.StationListResponse:
+        r"""List and filter stations
 
-        Create a new test station in TofuPilot to register production equipment and link it to test procedures.
+        Retrieve a paginated list of test stations in your organization. Search by station name and filter by status for station fleet management.
 
-        :param name: Name of the station
-        :param procedure_id: Optional procedure ID to link the station to
+        :param limit: Number of stations to return per page
+        :param cursor:
+        :param search_query:
+        :param procedure_ids:
         :param retries: Override the default retry configuration for this method
         :param server_url: Override the default server URL for this method
         :param timeout_ms: Override the default request timeout configuration for this method in milliseconds
@@ -353,27 +360,26 @@ class Stations(BaseSDK):
         else:
             base_url = self._get_url(base_url, url_variables)
 
-        request = models.StationCreateRequest(
-            name=name,
-            procedure_id=procedure_id,
+        request = models.StationListRequest(
+            limit=limit,
+            cursor=cursor,
+            search_query=search_query,
+            procedure_ids=procedure_ids,
         )
 
         req = self._build_request_async(
-            method="POST",
+            method="GET",
             path="/v2/stations",
             base_url=base_url,
             url_variables=url_variables,
             request=request,
-            request_body_required=True,
+            request_body_required=False,
             request_has_path_params=False,
             request_has_query_params=True,
             user_agent_header="user-agent",
             accept_header_value="application/json",
             http_headers=http_headers,
             security=self.sdk_configuration.security,
-            get_serialized_body=lambda: utils.serialize_request_body(
-                request, False, False, "json", models.StationCreateRequest
-            ),
             timeout_ms=timeout_ms,
         )
 
@@ -389,31 +395,25 @@ class Stations(BaseSDK):
             hook_ctx=HookContext(
                 config=self.sdk_configuration,
                 base_url=base_url or "",
-                operation_id="station-create",
+                operation_id="station-list",
                 oauth2_scopes=[],
                 security_source=get_security_from_env(
                     self.sdk_configuration.security, models.Security
                 ),
             ),
             request=req,
-            error_status_codes=["401", "403", "409", "4XX", "500", "5XX"],
+            error_status_codes=["401", "4XX", "500", "5XX"],
             retry_config=retry_config,
         )
 
         response_data: Any = None
         if utils.match_response(http_res, "200", "application/json"):
-            return unmarshal_json_response(models.StationCreateResponse, http_res)
+            return unmarshal_json_response(models.StationListResponse, http_res)
         if utils.match_response(http_res, "401", "application/json"):
             response_data = unmarshal_json_response(
                 errors.ErrorUNAUTHORIZEDData, http_res
             )
             raise errors.ErrorUNAUTHORIZED(response_data, http_res)
-        if utils.match_response(http_res, "403", "application/json"):
-            response_data = unmarshal_json_response(errors.ErrorFORBIDDENData, http_res)
-            raise errors.ErrorFORBIDDEN(response_data, http_res)
-        if utils.match_response(http_res, "409", "application/json"):
-            response_data = unmarshal_json_response(errors.ErrorCONFLICTData, http_res)
-            raise errors.ErrorCONFLICT(response_data, http_res)
         if utils.match_response(http_res, "500", "application/json"):
             response_data = unmarshal_json_response(
                 errors.ErrorINTERNALSERVERERRORData, http_res
@@ -802,20 +802,26 @@ class Stations(BaseSDK):
 
         raise errors.APIError("Unexpected response received", http_res)
 
-    def remove(
+    def update(
         self,
         *,
         id: str,
+        name: Optional[str] = None,
+        image_id: Optional[str] = None,
+        team_id: OptionalNullable[str] = UNSET,
         retries: OptionalNullable[utils.RetryConfig] = UNSET,
         server_url: Optional[str] = None,
         timeout_ms: Optional[int] = None,
         http_headers: Optional[Mapping[str, str]] = None,
-    ) -> models.StationRemoveResponse:
-        r"""Remove station
+    ) -> models.StationUpdateResponse:
+        r"""Update station
 
-        Remove a test station. Deletes permanently if unused, or archives with preserved historical data if runs exist.
+        Update station name and/or image. The station ID is specified in the URL path. To remove an image, pass an empty string for image_id.
 
-        :param id: Unique identifier of the station to remove
+        :param id: Unique identifier of the station to update
+        :param name: New name for the station
+        :param image_id: Upload ID for the station image, or empty string to remove image
+        :param team_id: Team ID to assign this station to, or null to unassign
         :param retries: Override the default retry configuration for this method
         :param server_url: Override the default server URL for this method
         :param timeout_ms: Override the default request timeout configuration for this method in milliseconds
@@ -831,23 +837,35 @@ class Stations(BaseSDK):
         else:
             base_url = self._get_url(base_url, url_variables)
 
-        request = models.StationRemoveRequest(
+        request = models.StationUpdateRequest(
             id=id,
+            request_body=models.StationUpdateRequestBody(
+                name=name,
+                image_id=image_id,
+                team_id=team_id,
+            ),
         )
 
         req = self._build_request(
-            method="DELETE",
+            method="PATCH",
             path="/v2/stations/{id}",
             base_url=base_url,
             url_variables=url_variables,
             request=request,
-            request_body_required=False,
+            request_body_required=True,
             request_has_path_params=True,
             request_has_query_params=True,
             user_agent_header="user-agent",
             accept_header_value="application/json",
             http_headers=http_headers,
             security=self.sdk_configuration.security,
+            get_serialized_body=lambda: utils.serialize_request_body(
+                request.request_body,
+                False,
+                False,
+                "json",
+                models.StationUpdateRequestBody,
+            ),
             timeout_ms=timeout_ms,
         )
 
@@ -863,25 +881,20 @@ class Stations(BaseSDK):
             hook_ctx=HookContext(
                 config=self.sdk_configuration,
                 base_url=base_url or "",
-                operation_id="station-remove",
+                operation_id="station-update",
                 oauth2_scopes=[],
                 security_source=get_security_from_env(
                     self.sdk_configuration.security, models.Security
                 ),
             ),
             request=req,
-            error_status_codes=["400", "401", "404", "4XX", "500", "5XX"],
+            error_status_codes=["401", "404", "409", "4XX", "500", "5XX"],
             retry_config=retry_config,
         )
 
         response_data: Any = None
         if utils.match_response(http_res, "200", "application/json"):
-            return unmarshal_json_response(models.StationRemoveResponse, http_res)
-        if utils.match_response(http_res, "400", "application/json"):
-            response_data = unmarshal_json_response(
-                errors.ErrorBADREQUESTData, http_res
-            )
-            raise errors.ErrorBADREQUEST(response_data, http_res)
+            return unmarshal_json_response(models.StationUpdateResponse, http_res)
         if utils.match_response(http_res, "401", "application/json"):
             response_data = unmarshal_json_response(
                 errors.ErrorUNAUTHORIZEDData, http_res
@@ -890,6 +903,9 @@ class Stations(BaseSDK):
         if utils.match_response(http_res, "404", "application/json"):
             response_data = unmarshal_json_response(errors.ErrorNOTFOUNDData, http_res)
             raise errors.ErrorNOTFOUND(response_data, http_res)
+        if utils.match_response(http_res, "409", "application/json"):
+            response_data = unmarshal_json_response(errors.ErrorCONFLICTData, http_res)
+            raise errors.ErrorCONFLICT(response_data, http_res)
         if utils.match_response(http_res, "500", "application/json"):
             response_data = unmarshal_json_response(
                 errors.ErrorINTERNALSERVERERRORData, http_res
@@ -904,20 +920,26 @@ class Stations(BaseSDK):
 
         raise errors.APIError("Unexpected response received", http_res)
 
-    async def remove_async(
+    async def update_async(
         self,
         *,
         id: str,
+        name: Optional[str] = None,
+        image_id: Optional[str] = None,
+        team_id: OptionalNullable[str] = UNSET,
         retries: OptionalNullable[utils.RetryConfig] = UNSET,
         server_url: Optional[str] = None,
         timeout_ms: Optional[int] = None,
         http_headers: Optional[Mapping[str, str]] = None,
-    ) -> models.StationRemoveResponse:
-        r"""Remove station
+    ) -> models.StationUpdateResponse:
+        r"""Update station
 
-        Remove a test station. Deletes permanently if unused, or archives with preserved historical data if runs exist.
+        Update station name and/or image. The station ID is specified in the URL path. To remove an image, pass an empty string for image_id.
 
-        :param id: Unique identifier of the station to remove
+        :param id: Unique identifier of the station to update
+        :param name: New name for the station
+        :param image_id: Upload ID for the station image, or empty string to remove image
+        :param team_id: Team ID to assign this station to, or null to unassign
         :param retries: Override the default retry configuration for this method
         :param server_url: Override the default server URL for this method
         :param timeout_ms: Override the default request timeout configuration for this method in milliseconds
@@ -933,23 +955,35 @@ class Stations(BaseSDK):
         else:
             base_url = self._get_url(base_url, url_variables)
 
-        request = models.StationRemoveRequest(
+        request = models.StationUpdateRequest(
             id=id,
+            request_body=models.StationUpdateRequestBody(
+                name=name,
+                image_id=image_id,
+                team_id=team_id,
+            ),
         )
 
         req = self._build_request_async(
-            method="DELETE",
+            method="PATCH",
             path="/v2/stations/{id}",
             base_url=base_url,
             url_variables=url_variables,
             request=request,
-            request_body_required=False,
+            request_body_required=True,
             request_has_path_params=True,
             request_has_query_params=True,
             user_agent_header="user-agent",
             accept_header_value="application/json",
             http_headers=http_headers,
             security=self.sdk_configuration.security,
+            get_serialized_body=lambda: utils.serialize_request_body(
+                request.request_body,
+                False,
+                False,
+                "json",
+                models.StationUpdateRequestBody,
+            ),
             timeout_ms=timeout_ms,
         )
 
@@ -965,25 +999,20 @@ class Stations(BaseSDK):
             hook_ctx=HookContext(
                 config=self.sdk_configuration,
                 base_url=base_url or "",
-                operation_id="station-remove",
+                operation_id="station-update",
                 oauth2_scopes=[],
                 security_source=get_security_from_env(
                     self.sdk_configuration.security, models.Security
                 ),
             ),
             request=req,
-            error_status_codes=["400", "401", "404", "4XX", "500", "5XX"],
+            error_status_codes=["401", "404", "409", "4XX", "500", "5XX"],
             retry_config=retry_config,
         )
 
         response_data: Any = None
         if utils.match_response(http_res, "200", "application/json"):
-            return unmarshal_json_response(models.StationRemoveResponse, http_res)
-        if utils.match_response(http_res, "400", "application/json"):
-            response_data = unmarshal_json_response(
-                errors.ErrorBADREQUESTData, http_res
-            )
-            raise errors.ErrorBADREQUEST(response_data, http_res)
+            return unmarshal_json_response(models.StationUpdateResponse, http_res)
         if utils.match_response(http_res, "401", "application/json"):
             response_data = unmarshal_json_response(
                 errors.ErrorUNAUTHORIZEDData, http_res
@@ -992,6 +1021,9 @@ class Stations(BaseSDK):
         if utils.match_response(http_res, "404", "application/json"):
             response_data = unmarshal_json_response(errors.ErrorNOTFOUNDData, http_res)
             raise errors.ErrorNOTFOUND(response_data, http_res)
+        if utils.match_response(http_res, "409", "application/json"):
+            response_data = unmarshal_json_response(errors.ErrorCONFLICTData, http_res)
+            raise errors.ErrorCONFLICT(response_data, http_res)
         if utils.match_response(http_res, "500", "application/json"):
             response_data = unmarshal_json_response(
                 errors.ErrorINTERNALSERVERERRORData, http_res
@@ -1006,26 +1038,20 @@ class Stations(BaseSDK):
 
         raise errors.APIError("Unexpected response received", http_res)
 
-    def update(
+    def remove(
         self,
         *,
         id: str,
-        name: Optional[str] = None,
-        image_id: Optional[str] = None,
-        team_id: OptionalNullable[str] = UNSET,
         retries: OptionalNullable[utils.RetryConfig] = UNSET,
         server_url: Optional[str] = None,
         timeout_ms: Optional[int] = None,
         http_headers: Optional[Mapping[str, str]] = None,
-    ) -> models.StationUpdateResponse:
-        r"""Update station
+    ) -> models.StationRemoveResponse:
+        r"""Remove station
 
-        Update station name and/or image. The station ID is specified in the URL path. To remove an image, pass an empty string for image_id.
+        Remove a test station. Deletes permanently if unused, or archives with preserved historical data if runs exist.
 
-        :param id: Unique identifier of the station to update
-        :param name: New name for the station
-        :param image_id: Upload ID for the station image, or empty string to remove image
-        :param team_id: Team ID to assign this station to, or null to unassign
+        :param id: Unique identifier of the station to remove
         :param retries: Override the default retry configuration for this method
         :param server_url: Override the default server URL for this method
         :param timeout_ms: Override the default request timeout configuration for this method in milliseconds
@@ -1041,35 +1067,23 @@ class Stations(BaseSDK):
         else:
             base_url = self._get_url(base_url, url_variables)
 
-        request = models.StationUpdateRequest(
+        request = models.StationRemoveRequest(
             id=id,
-            request_body=models.StationUpdateRequestBody(
-                name=name,
-                image_id=image_id,
-                team_id=team_id,
-            ),
         )
 
         req = self._build_request(
-            method="PATCH",
+            method="DELETE",
             path="/v2/stations/{id}",
             base_url=base_url,
             url_variables=url_variables,
             request=request,
-            request_body_required=True,
+            request_body_required=False,
             request_has_path_params=True,
             request_has_query_params=True,
             user_agent_header="user-agent",
             accept_header_value="application/json",
             http_headers=http_headers,
             security=self.sdk_configuration.security,
-            get_serialized_body=lambda: utils.serialize_request_body(
-                request.request_body,
-                False,
-                False,
-                "json",
-                models.StationUpdateRequestBody,
-            ),
             timeout_ms=timeout_ms,
         )
 
@@ -1085,20 +1099,25 @@ class Stations(BaseSDK):
             hook_ctx=HookContext(
                 config=self.sdk_configuration,
                 base_url=base_url or "",
-                operation_id="station-update",
+                operation_id="station-remove",
                 oauth2_scopes=[],
                 security_source=get_security_from_env(
                     self.sdk_configuration.security, models.Security
                 ),
             ),
             request=req,
-            error_status_codes=["401", "404", "409", "4XX", "500", "5XX"],
+            error_status_codes=["400", "401", "404", "4XX", "500", "5XX"],
             retry_config=retry_config,
         )
 
         response_data: Any = None
         if utils.match_response(http_res, "200", "application/json"):
-            return unmarshal_json_response(models.StationUpdateResponse, http_res)
+            return unmarshal_json_response(models.StationRemoveResponse, http_res)
+        if utils.match_response(http_res, "400", "application/json"):
+            response_data = unmarshal_json_response(
+                errors.ErrorBADREQUESTData, http_res
+            )
+            raise errors.ErrorBADREQUEST(response_data, http_res)
         if utils.match_response(http_res, "401", "application/json"):
             response_data = unmarshal_json_response(
                 errors.ErrorUNAUTHORIZEDData, http_res
@@ -1107,9 +1126,6 @@ class Stations(BaseSDK):
         if utils.match_response(http_res, "404", "application/json"):
             response_data = unmarshal_json_response(errors.ErrorNOTFOUNDData, http_res)
             raise errors.ErrorNOTFOUND(response_data, http_res)
-        if utils.match_response(http_res, "409", "application/json"):
-            response_data = unmarshal_json_response(errors.ErrorCONFLICTData, http_res)
-            raise errors.ErrorCONFLICT(response_data, http_res)
         if utils.match_response(http_res, "500", "application/json"):
             response_data = unmarshal_json_response(
                 errors.ErrorINTERNALSERVERERRORData, http_res
@@ -1124,26 +1140,20 @@ class Stations(BaseSDK):
 
         raise errors.APIError("Unexpected response received", http_res)
 
-    async def update_async(
+    async def remove_async(
         self,
         *,
         id: str,
-        name: Optional[str] = None,
-        image_id: Optional[str] = None,
-        team_id: OptionalNullable[str] = UNSET,
         retries: OptionalNullable[utils.RetryConfig] = UNSET,
         server_url: Optional[str] = None,
         timeout_ms: Optional[int] = None,
         http_headers: Optional[Mapping[str, str]] = None,
-    ) -> models.StationUpdateResponse:
-        r"""Update station
+    ) -> models.StationRemoveResponse:
+        r"""Remove station
 
-        Update station name and/or image. The station ID is specified in the URL path. To remove an image, pass an empty string for image_id.
+        Remove a test station. Deletes permanently if unused, or archives with preserved historical data if runs exist.
 
-        :param id: Unique identifier of the station to update
-        :param name: New name for the station
-        :param image_id: Upload ID for the station image, or empty string to remove image
-        :param team_id: Team ID to assign this station to, or null to unassign
+        :param id: Unique identifier of the station to remove
         :param retries: Override the default retry configuration for this method
         :param server_url: Override the default server URL for this method
         :param timeout_ms: Override the default request timeout configuration for this method in milliseconds
@@ -1159,35 +1169,23 @@ class Stations(BaseSDK):
         else:
             base_url = self._get_url(base_url, url_variables)
 
-        request = models.StationUpdateRequest(
+        request = models.StationRemoveRequest(
             id=id,
-            request_body=models.StationUpdateRequestBody(
-                name=name,
-                image_id=image_id,
-                team_id=team_id,
-            ),
         )
 
         req = self._build_request_async(
-            method="PATCH",
+            method="DELETE",
             path="/v2/stations/{id}",
             base_url=base_url,
             url_variables=url_variables,
             request=request,
-            request_body_required=True,
+            request_body_required=False,
             request_has_path_params=True,
             request_has_query_params=True,
             user_agent_header="user-agent",
             accept_header_value="application/json",
             http_headers=http_headers,
             security=self.sdk_configuration.security,
-            get_serialized_body=lambda: utils.serialize_request_body(
-                request.request_body,
-                False,
-                False,
-                "json",
-                models.StationUpdateRequestBody,
-            ),
             timeout_ms=timeout_ms,
         )
 
@@ -1203,20 +1201,25 @@ class Stations(BaseSDK):
             hook_ctx=HookContext(
                 config=self.sdk_configuration,
                 base_url=base_url or "",
-                operation_id="station-update",
+                operation_id="station-remove",
                 oauth2_scopes=[],
                 security_source=get_security_from_env(
                     self.sdk_configuration.security, models.Security
                 ),
             ),
             request=req,
-            error_status_codes=["401", "404", "409", "4XX", "500", "5XX"],
+            error_status_codes=["400", "401", "404", "4XX", "500", "5XX"],
             retry_config=retry_config,
         )
 
         response_data: Any = None
         if utils.match_response(http_res, "200", "application/json"):
-            return unmarshal_json_response(models.StationUpdateResponse, http_res)
+            return unmarshal_json_response(models.StationRemoveResponse, http_res)
+        if utils.match_response(http_res, "400", "application/json"):
+            response_data = unmarshal_json_response(
+                errors.ErrorBADREQUESTData, http_res
+            )
+            raise errors.ErrorBADREQUEST(response_data, http_res)
         if utils.match_response(http_res, "401", "application/json"):
             response_data = unmarshal_json_response(
                 errors.ErrorUNAUTHORIZEDData, http_res
@@ -1225,9 +1228,6 @@ class Stations(BaseSDK):
         if utils.match_response(http_res, "404", "application/json"):
             response_data = unmarshal_json_response(errors.ErrorNOTFOUNDData, http_res)
             raise errors.ErrorNOTFOUND(response_data, http_res)
-        if utils.match_response(http_res, "409", "application/json"):
-            response_data = unmarshal_json_response(errors.ErrorCONFLICTData, http_res)
-            raise errors.ErrorCONFLICT(response_data, http_res)
         if utils.match_response(http_res, "500", "application/json"):
             response_data = unmarshal_json_response(
                 errors.ErrorINTERNALSERVERERRORData, http_res
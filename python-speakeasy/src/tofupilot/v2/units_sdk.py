@@ -1,6 +1,7 @@
 """Code generated by Speakeasy (https://speakeasy.com). DO NOT EDIT."""
 
 from .basesdk import BaseSDK
+from datetime import datetime
 from tofupilot.v2 import errors, models, utils
 from tofupilot.v2._hooks import HookContext
 from tofupilot.v2.types import OptionalNullable, UNSET
@@ -10,62 +11,24 @@ from typing import Any, List, Mapping, Optional
 
 
 class UnitsSDK(BaseSDK):
-    def list(
+    def create(
         self,
         *,
-        search_query: Optional[str] = None,
-        ids: Optional[List[str]] = None,
-        serial_numbers: Optional[List[str]] = None,
-        part_numbers: Optional[List[str]] = None,
-        revision_numbers: Optional[List[str]] = None,
-        batch_numbers: Optional[List[str]] = None,
-        procedure_ids: Optional[List[str]] = None,
-        outcomes: Optional[List[models.UnitListQueryParamOutcome]] = None,
-        started_after: Optional[str] = None,
-        started_before: Optional[str] = None,
-        latest_only: Optional[bool] = False,
-        run_count_min: Optional[int] = None,
-        run_count_max: Optional[int] = None,
-        created_after: Optional[str] = None,
-        created_before: Optional[str] = None,
-        created_by_user_ids: Optional[List[str]] = None,
-        created_by_station_ids: Optional[List[str]] = None,
-        exclude_units_with_parent: Optional[bool] = False,
-        limit: Optional[int] = 50,
-        cursor: Optional[int] = None,
-        sort_by: Optional[models.UnitListSortBy] = "created_at",
-        sort_order: Optional[models.UnitListSortOrder] = "desc",
+        serial_number: str,
+        part_number: str,
+        revision_number: str,
         retries: OptionalNullable[utils.RetryConfig] = UNSET,
         server_url: Optional[str] = None,
         timeout_ms: Optional[int] = None,
         http_headers: Optional[Mapping[str, str]] = None,
-    ) -> models.UnitListResponse:
-        r"""List and filter units
+    ) -> models.UnitCreateResponse:
+        r"""Create unit
 
-        Retrieve a paginated list of units with filtering by serial number, part number, and batch. Uses cursor-based pagination for efficient large dataset traversal.
+        Create a new unit with a serial number and link it to a part revision. Units represent individual hardware items tracked for manufacturing traceability.
 
-        :param search_query:
-        :param ids:
-        :param serial_numbers:
-        :param part_numbers:
-        :param revision_numbers:
-        :param batch_numbers:
-        :param procedure_ids:
-        :param outcomes:
-        :param started_after:
-        :param started_before:
-        :param latest_only:
-        :param run_count_min:
-        :param run_count_max:
-        :param created_after:
-        :param created_before:
-        :param created_by_user_ids:
-        :param created_by_station_ids:
-        :param exclude_units_with_parent:
-        :param limit: Maximum number of units to return.
-        :param cursor:
-        :param sort_by: Field to sort results by. last_run_at sorts by most recent test run date. last_run_procedure sorts by procedure name of the last run.
-        :param sort_order: Sort order direction.
+        :param serial_number: Unique serial number identifier for the unit. Must be unique within the organization.
+        :param part_number: Component part number that defines what type of unit this is. If the part does not exist, it will be created.
+        :param revision_number: Hardware revision identifier for the specific version of the part. If the revision does not exist, it will be created.
         :param retries: Override the default retry configuration for this method
         :param server_url: Override the default server URL for this method
         :param timeout_ms: Override the default request timeout configuration for this method in milliseconds
@@ -81,44 +44,28 @@ class UnitsSDK(BaseSDK):
         else:
             base_url = self._get_url(base_url, url_variables)
 
-        request = models.UnitListRequest(
-            search_query=search_query,
-            ids=ids,
-            serial_numbers=serial_numbers,
-            part_numbers=part_numbers,
-            revision_numbers=revision_numbers,
-            batch_numbers=batch_numbers,
-            procedure_ids=procedure_ids,
-            outcomes=outcomes,
-            started_after=started_after,
-            started_before=started_before,
-            latest_only=latest_only,
-            run_count_min=run_count_min,
-            run_count_max=run_count_max,
-            created_after=created_after,
-            created_before=created_before,
-            created_by_user_ids=created_by_user_ids,
-            created_by_station_ids=created_by_station_ids,
-            exclude_units_with_parent=exclude_units_with_parent,
-            limit=limit,
-            cursor=cursor,
-            sort_by=sort_by,
-            sort_order=sort_order,
+        request = models.UnitCreateRequest(
+            serial_number=serial_number,
+            part_number=part_number,
+            revision_number=revision_number,
         )
 
         req = self._build_request(
-            method="GET",
+            method="POST",
             path="/v2/units",
             base_url=base_url,
             url_variables=url_variables,
             request=request,
-            request_body_required=False,
+            request_body_required=True,
             request_has_path_params=False,
             request_has_query_params=True,
             user_agent_header="user-agent",
             accept_header_value="application/json",
             http_headers=http_headers,
             security=self.sdk_configuration.security,
+            get_serialized_body=lambda: utils.serialize_request_body(
+                request, False, False, "json", models.UnitCreateRequest
+            ),
             timeout_ms=timeout_ms,
         )
 
@@ -134,25 +81,31 @@ class UnitsSDK(BaseSDK):
             hook_ctx=HookContext(
                 config=self.sdk_configuration,
                 base_url=base_url or "",
-                operation_id="unit-list",
+                operation_id="unit-create",
                 oauth2_scopes=[],
                 security_source=get_security_from_env(
                     self.sdk_configuration.security, models.Security
                 ),
             ),
             request=req,
-            error_status_codes=["401", "4XX", "500", "5XX"],
+            error_status_codes=["401", "404", "409", "4XX", "500", "5XX"],
             retry_config=retry_config,
         )
 
         response_data: Any = None
         if utils.match_response(http_res, "200", "application/json"):
-            return unmarshal_json_response(models.UnitListResponse, http_res)
+            return unmarshal_json_response(models.UnitCreateResponse, http_res)
         if utils.match_response(http_res, "401", "application/json"):
             response_data = unmarshal_json_response(
                 errors.ErrorUNAUTHORIZEDData, http_res
             )
             raise errors.ErrorUNAUTHORIZED(response_data, http_res)
+        if utils.match_response(http_res, "404", "application/json"):
+            response_data = unmarshal_json_response(errors.ErrorNOTFOUNDData, http_res)
+            raise errors.ErrorNOTFOUND(response_data, http_res)
+        if utils.match_response(http_res, "409", "application/json"):
+            response_data = unmarshal_json_response(errors.ErrorCONFLICTData, http_res)
+            raise errors.ErrorCONFLICT(response_data, http_res)
         if utils.match_response(http_res, "500", "application/json"):
             response_data = unmarshal_json_response(
                 errors.ErrorINTERNALSERVERERRORData, http_res
@@ -167,62 +120,24 @@ class UnitsSDK(BaseSDK):
 
         raise errors.APIError("Unexpected response received", http_res)
 
-    async def list_async(
+    async def create_async(
         self,
         *,
-        search_query: Optional[str] = None,
-        ids: Optional[List[str]] = None,
-        serial_numbers: Optional[List[str]] = None,
-        part_numbers: Optional[List[str]] = None,
-        revision_numbers: Optional[List[str]] = None,
-        batch_numbers: Optional[List[str]] = None,
-        procedure_ids: Optional[List[str]] = None,
-        outcomes: Optional[List[models.UnitListQueryParamOutcome]] = None,
-        started_after: Optional[str] = None,
-        started_before: Optional[str] = None,
-        latest_only: Optional[bool] = False,
-        run_count_min: Optional[int] = None,
-        run_count_max: Optional[int] = None,
-        created_after: Optional[str] = None,
-        created_before: Optional[str] = None,
-        created_by_user_ids: Optional[List[str]] = None,
-        created_by_station_ids: Optional[List[str]] = None,
-        exclude_units_with_parent: Optional[bool] = False,
-        limit: Optional[int] = 50,
-        cursor: Optional[int] = None,
-        sort_by: Optional[models.UnitListSortBy] = "created_at",
-        sort_order: Optional[models.UnitListSortOrder] = "desc",
+        serial_number: str,
+        part_number: str,
+        revision_number: str,
         retries: OptionalNullable[utils.RetryConfig] = UNSET,
         server_url: Optional[str] = None,
         timeout_ms: Optional[int] = None,
         http_headers: Optional[Mapping[str, str]] = None,
-    ) -> models.UnitListResponse:
-        r"""List and filter units
+    ) -> models.UnitCreateResponse:
+        r"""Create unit
 
-        Retrieve a paginated list of units with filtering by serial number, part number, and batch. Uses cursor-based pagination for efficient large dataset traversal.
+        Create a new unit with a serial number and link it to a part revision. Units represent individual hardware items tracked for manufacturing traceability.
 
-        :param search_query:
-        :param ids:
-        :param serial_numbers:
-        :param part_numbers:
-        :param revision_numbers:
-        :param batch_numbers:
-        :param procedure_ids:
-        :param outcomes:
-        :param started_after:
-        :param started_before:
-        :param latest_only:
-        :param run_count_min:
-        :param run_count_max:
-        :param created_after:
-        :param created_before:
-        :param created_by_user_ids:
-        :param created_by_station_ids:
-        :param exclude_units_with_parent:
-        :param limit: Maximum number of units to return.
-        :param cursor:
-        :param sort_by: Field to sort results by. last_run_at sorts by most recent test run date. last_run_procedure sorts by procedure name of the last run.
-        :param sort_order: Sort order direction.
+        :param serial_number: Unique serial number identifier for the unit. Must be unique within the organization.
+        :param part_number: Component part number that defines what type of unit this is. If the part does not exist, it will be created.
+        :param revision_number: Hardware revision identifier for the specific version of the part. If the revision does not exist, it will be created.
         :param retries: Override the default retry configuration for this method
         :param server_url: Override the default server URL for this method
         :param timeout_ms: Override the default request timeout configuration for this method in milliseconds
@@ -238,44 +153,28 @@ class UnitsSDK(BaseSDK):
         else:
             base_url = self._get_url(base_url, url_variables)
 
-        request = models.UnitListRequest(
-            search_query=search_query,
-            ids=ids,
-            serial_numbers=serial_numbers,
-            part_numbers=part_numbers,
-            revision_numbers=revision_numbers,
-            batch_numbers=batch_numbers,
-            procedure_ids=procedure_ids,
-            outcomes=outcomes,
-            started_after=started_after,
-            started_before=started_before,
-            latest_only=latest_only,
-            run_count_min=run_count_min,
-            run_count_max=run_count_max,
-            created_after=created_after,
-            created_before=created_before,
-            created_by_user_ids=created_by_user_ids,
-            created_by_station_ids=created_by_station_ids,
-            exclude_units_with_parent=exclude_units_with_parent,
-            limit=limit,
-            cursor=cursor,
-            sort_by=sort_by,
-            sort_order=sort_order,
+        request = models.UnitCreateRequest(
+            serial_number=serial_number,
+            part_number=part_number,
+            revision_number=revision_number,
         )
 
         req = self._build_request_async(
-            method="GET",
+            method="POST",
             path="/v2/units",
             base_url=base_url,
             url_variables=url_variables,
             request=request,
-            request_body_required=False,
+            request_body_required=True,
             request_has_path_params=False,
             request_has_query_params=True,
             user_agent_header="user-agent",
             accept_header_value="application/json",
             http_headers=http_headers,
             security=self.sdk_configuration.security,
+            get_serialized_body=lambda: utils.serialize_request_body(
+                request, False, False, "json", models.UnitCreateRequest
+            ),
             timeout_ms=timeout_ms,
         )
 
@@ -291,25 +190,31 @@ class UnitsSDK(BaseSDK):
             hook_ctx=HookContext(
                 config=self.sdk_configuration,
                 base_url=base_url or "",
-                operation_id="unit-list",
+                operation_id="unit-create",
                 oauth2_scopes=[],
                 security_source=get_security_from_env(
                     self.sdk_configuration.security, models.Security
                 ),
             ),
             request=req,
-            error_status_codes=["401", "4XX", "500", "5XX"],
+            error_status_codes=["401", "404", "409", "4XX", "500", "5XX"],
             retry_config=retry_config,
         )
 
         response_data: Any = None
         if utils.match_response(http_res, "200", "application/json"):
-            return unmarshal_json_response(models.UnitListResponse, http_res)
+            return unmarshal_json_response(models.UnitCreateResponse, http_res)
         if utils.match_response(http_res, "401", "application/json"):
             response_data = unmarshal_json_response(
                 errors.ErrorUNAUTHORIZEDData, http_res
             )
             raise errors.ErrorUNAUTHORIZED(response_data, http_res)
+        if utils.match_response(http_res, "404", "application/json"):
+            response_data = unmarshal_json_response(errors.ErrorNOTFOUNDData, http_res)
+            raise errors.ErrorNOTFOUND(response_data, http_res)
+        if utils.match_response(http_res, "409", "application/json"):
+            response_data = unmarshal_json_response(errors.ErrorCONFLICTData, http_res)
+            raise errors.ErrorCONFLICT(response_data, http_res)
         if utils.match_response(http_res, "500", "application/json"):
             response_data = unmarshal_json_response(
                 errors.ErrorINTERNALSERVERERRORData, http_res
@@ -324,24 +229,62 @@ class UnitsSDK(BaseSDK):
 
         raise errors.APIError("Unexpected response received", http_res)
 
-    def create(
+    def list(
         self,
         *,
-        serial_number: str,
-        part_number: str,
-        revision_number: str,
+        search_query: Optional[str] = None,
+        ids: Optional[List[str]] = None,
+        serial_numbers: Optional[List[str]] = None,
+        part_numbers: Optional[List[str]] = None,
+        revision_numbers: Optional[List[str]] = None,
+        batch_numbers: Optional[List[str]] = None,
+        procedure_ids: Optional[List[str]] = None,
+        outcomes: Optional[List[models.UnitListQueryParamOutcome]] = None,
+        started_after: Optional[datetime] = None,
+        started_before: Optional[datetime] = None,
+        latest_only: Optional[bool] = False,
+        run_count_min: Optional[int] = None,
+        run_count_max: Optional[int] = None,
+        created_after: Optional[datetime] = None,
+        created_before: Optional[datetime] = None,
+        created_by_user_ids: Optional[List[str]] = None,
+        created_by_station_ids: Optional[List[str]] = None,
+        exclude_units_with_parent: Optional[bool] = False,
+        limit: Optional[int] = 50,
+        cursor: Optional[int] = None,
+        sort_by: Optional[models.UnitListSortBy] = "created_at",
+        sort_order: Optional[models.UnitListSortOrder] = "desc",
         retries: OptionalNullable[utils.RetryConfig] = UNSET,
         server_url: Optional[str] = None,
         timeout_ms: Optional[int] = None,
         http_headers: Optional[Mapping[str, str]] = None,
-    ) -> models.UnitCreateResponse:
-        r"""Create unit
+    ) -> models.UnitListResponse:
+        r"""List and filter units
 
-        Create a new unit with a serial number and link it to a part revision. Units represent individual hardware items tracked for manufacturing traceability.
+        Retrieve a paginated list of units with filtering by serial number, part number, and batch. Uses cursor-based pagination for efficient large dataset traversal.
 
-        :param serial_number: Unique serial number identifier for the unit. Must be unique within the organization.
-        :param part_number: Component part number that defines what type of unit this is. If the part does not exist, it will be created.
-        :param revision_number: Hardware revision identifier for the specific version of the part. If the revision does not exist, it will be created.
+        :param search_query:
+        :param ids:
+        :param serial_numbers:
+        :param part_numbers:
+        :param revision_numbers:
+        :param batch_numbers:
+        :param procedure_ids:
+        :param outcomes:
+        :param started_after:
+        :param started_before:
+        :param latest_only:
+        :param run_count_min:
+        :param run_count_max:
+        :param created_after:
+        :param created_before:
+        :param created_by_user_ids:
+        :param created_by_station_ids:
+        :param exclude_units_with_parent:
+        :param limit: Maximum number of units to return.
+        :param cursor:
+        :param sort_by: Field to sort results by. last_run_at sorts by most recent test run date. last_run_procedure sorts by procedure name of the last run.
+        :param sort_order: Sort order direction.
         :param retries: Override the default retry configuration for this method
         :param server_url: Override the default server URL for this method
         :param timeout_ms: Override the default request timeout configuration for this method in milliseconds
@@ -357,28 +300,44 @@ class UnitsSDK(BaseSDK):
         else:
             base_url = self._get_url(base_url, url_variables)
 
-        request = models.UnitCreateRequest(
-            serial_number=serial_number,
-            part_number=part_number,
-            revision_number=revision_number,
+        request = models.UnitListRequest(
+            search_query=search_query,
+            ids=ids,
+            serial_numbers=serial_numbers,
+            part_numbers=part_numbers,
+            revision_numbers=revision_numbers,
+            batch_numbers=batch_numbers,
+            procedure_ids=procedure_ids,
+            outcomes=outcomes,
+            started_after=started_after,
+            started_before=started_before,
+            latest_only=latest_only,
+            run_count_min=run_count_min,
+            run_count_max=run_count_max,
+            created_after=created_after,
+            created_before=created_before,
+            created_by_user_ids=created_by_user_ids,
+            created_by_station_ids=created_by_station_ids,
+            exclude_units_with_parent=exclude_units_with_parent,
+            limit=limit,
+            cursor=cursor,
+            sort_by=sort_by,
+            sort_order=sort_order,
         )
 
         req = self._build_request(
-            method="POST",
+            method="GET",
             path="/v2/units",
             base_url=base_url,
             url_variables=url_variables,
             request=request,
-            request_body_required=True,
+            request_body_required=False,
             request_has_path_params=False,
             request_has_query_params=True,
             user_agent_header="user-agent",
             accept_header_value="application/json",
             http_headers=http_headers,
             security=self.sdk_configuration.security,
-            get_serialized_body=lambda: utils.serialize_request_body(
-                request, False, False, "json", models.UnitCreateRequest
-            ),
             timeout_ms=timeout_ms,
         )
 
@@ -394,31 +353,25 @@ class UnitsSDK(BaseSDK):
             hook_ctx=HookContext(
                 config=self.sdk_configuration,
                 base_url=base_url or "",
-                operation_id="unit-create",
+                operation_id="unit-list",
                 oauth2_scopes=[],
                 security_source=get_security_from_env(
                     self.sdk_configuration.security, models.Security
                 ),
             ),
             request=req,
-            error_status_codes=["401", "404", "409", "4XX", "500", "5XX"],
+            error_status_codes=["401", "4XX", "500", "5XX"],
             retry_config=retry_config,
         )
 
         response_data: Any = None
         if utils.match_response(http_res, "200", "application/json"):
-            return unmarshal_json_response(models.UnitCreateResponse, http_res)
+            return unmarshal_json_response(models.UnitListResponse, http_res)
         if utils.match_response(http_res, "401", "application/json"):
             response_data = unmarshal_json_response(
                 errors.ErrorUNAUTHORIZEDData, http_res
             )
             raise errors.ErrorUNAUTHORIZED(response_data, http_res)
-        if utils.match_response(http_res, "404", "application/json"):
-            response_data = unmarshal_json_response(errors.ErrorNOTFOUNDData, http_res)
-            raise errors.ErrorNOTFOUND(response_data, http_res)
-        if utils.match_response(http_res, "409", "application/json"):
-            response_data = unmarshal_json_response(errors.ErrorCONFLICTData, http_res)
-            raise errors.ErrorCONFLICT(response_data, http_res)
         if utils.match_response(http_res, "500", "application/json"):
             response_data = unmarshal_json_response(
                 errors.ErrorINTERNALSERVERERRORData, http_res
@@ -433,24 +386,62 @@ class UnitsSDK(BaseSDK):
 
         raise errors.APIError("Unexpected response received", http_res)
 
-    async def create_async(
+    async def list_async(
         self,
         *,
-        serial_number: str,
-        part_number: str,
-        revision_number: str,
+        search_query: Optional[str] = None,
+        ids: Optional[List[str]] = None,
+        serial_numbers: Optional[List[str]] = None,
+        part_numbers: Optional[List[str]] = None,
+        revision_numbers: Optional[List[str]] = None,
+        batch_numbers: Optional[List[str]] = None,
+        procedure_ids: Optional[List[str]] = None,
+        outcomes: Optional[List[models.UnitListQueryParamOutcome]] = None,
+        started_after: Optional[datetime] = None,
+        started_before: Optional[datetime] = None,
+        latest_only: Optional[bool] = False,
+        run_count_min: Optional[int] = None,
+        run_count_max: Optional[int] = None,
+        created_after: Optional[datetime] = None,
+        created_before: Optional[datetime] = None,
+        created_by_user_ids: Optional[List[str]] = None,
+        created_by_station_ids: Optional[List[str]] = None,
+        exclude_units_with_parent: Optional[bool] = False,
+        limit: Optional[int] = 50,
+        cursor: Optional[int] = None,
+        sort_by: Optional[models.UnitListSortBy] = "created_at",
+        sort_order: Optional[models.UnitListSortOrder] = "desc",
         retries: OptionalNullable[utils.RetryConfig] = UNSET,
         server_url: Optional[str] = None,
         timeout_ms: Optional[int] = None,
         http_headers: Optional[Mapping[str, str]] = None,
-    ) -> models.UnitCreateResponse:
-        r"""Create unit
+    ) -> models.UnitListResponse:
+        r"""List and filter units
 
-        Create a new unit with a serial number and link it to a part revision. Units represent individual hardware items tracked for manufacturing traceability.
+        Retrieve a paginated list of units with filtering by serial number, part number, and batch. Uses cursor-based pagination for efficient large dataset traversal.
 
-        :param serial_number: Unique serial number identifier for the unit. Must be unique within the organization.
-        :param part_number: Component part number that defines what type of unit this is. If the part does not exist, it will be created.
-        :param revision_number: Hardware revision identifier for the specific version of the part. If the revision does not exist, it will be created.
+        :param search_query:
+        :param ids:
+        :param serial_numbers:
+        :param part_numbers:
+        :param revision_numbers:
+        :param batch_numbers:
+        :param procedure_ids:
+        :param outcomes:
+        :param started_after:
+        :param started_before:
+        :param latest_only:
+        :param run_count_min:
+        :param run_count_max:
+        :param created_after:
+        :param created_before:
+        :param created_by_user_ids:
+        :param created_by_station_ids:
+        :param exclude_units_with_parent:
+        :param limit: Maximum number of units to return.
+        :param cursor:
+        :param sort_by: Field to sort results by. last_run_at sorts by most recent test run date. last_run_procedure sorts by procedure name of the last run.
+        :param sort_order: Sort order direction.
         :param retries: Override the default retry configuration for this method
         :param server_url: Override the default server URL for this method
         :param timeout_ms: Override the default request timeout configuration for this method in milliseconds
@@ -466,28 +457,44 @@ class UnitsSDK(BaseSDK):
         else:
             base_url = self._get_url(base_url, url_variables)
 
-        request = models.UnitCreateRequest(
-            serial_number=serial_number,
-            part_number=part_number,
-            revision_number=revision_number,
+        request = models.UnitListRequest(
+            search_query=search_query,
+            ids=ids,
+            serial_numbers=serial_numbers,
+            part_numbers=part_numbers,
+            revision_numbers=revision_numbers,
+            batch_numbers=batch_numbers,
+            procedure_ids=procedure_ids,
+            outcomes=outcomes,
+            started_after=started_after,
+            started_before=started_before,
+            latest_only=latest_only,
+            run_count_min=run_count_min,
+            run_count_max=run_count_max,
+            created_after=created_after,
+            created_before=created_before,
+            created_by_user_ids=created_by_user_ids,
+            created_by_station_ids=created_by_station_ids,
+            exclude_units_with_parent=exclude_units_with_parent,
+            limit=limit,
+            cursor=cursor,
+            sort_by=sort_by,
+            sort_order=sort_order,
         )
 
         req = self._build_request_async(
-            method="POST",
+            method="GET",
             path="/v2/units",
             base_url=base_url,
             url_variables=url_variables,
             request=request,
-            request_body_required=True,
+            request_body_required=False,
             request_has_path_params=False,
             request_has_query_params=True,
             user_agent_header="user-agent",
             accept_header_value="application/json",
             http_headers=http_headers,
             security=self.sdk_configuration.security,
-            get_serialized_body=lambda: utils.serialize_request_body(
-                request, False, False, "json", models.UnitCreateRequest
-            ),
             timeout_ms=timeout_ms,
         )
 
@@ -503,31 +510,25 @@ class UnitsSDK(BaseSDK):
             hook_ctx=HookContext(
                 config=self.sdk_configuration,
                 base_url=base_url or "",
-                operation_id="unit-create",
+                operation_id="unit-list",
                 oauth2_scopes=[],
                 security_source=get_security_from_env(
                     self.sdk_configuration.security, models.Security
                 ),
             ),
             request=req,
-            error_status_codes=["401", "404", "409", "4XX", "500", "5XX"],
+            error_status_codes=["401", "4XX", "500", "5XX"],
             retry_config=retry_config,
         )
 
         response_data: Any = None
         if utils.match_response(http_res, "200", "application/json"):
-            return unmarshal_json_response(models.UnitCreateResponse, http_res)
+            return unmarshal_json_response(models.UnitListResponse, http_res)
         if utils.match_response(http_res, "401", "application/json"):
             response_data = unmarshal_json_response(
                 errors.ErrorUNAUTHORIZEDData, http_res
             )
             raise errors.ErrorUNAUTHORIZED(response_data, http_res)
-        if utils.match_response(http_res, "404", "application/json"):
-            response_data = unmarshal_json_response(errors.ErrorNOTFOUNDData, http_res)
-            raise errors.ErrorNOTFOUND(response_data, http_res)
-        if utils.match_response(http_res, "409", "application/json"):
-            response_data = unmarshal_json_response(errors.ErrorCONFLICTData, http_res)
-            raise errors.ErrorCONFLICT(response_data, http_res)
         if utils.match_response(http_res, "500", "application/json"):
             response_data = unmarshal_json_response(
                 errors.ErrorINTERNALSERVERERRORData, http_res
@@ -0,0 +1,49 @@
+"""Regression test for the cost of `import tofupilot`."""
+
+import subprocess
+import sys
+
+# Cumulative import time budget for the top-level package, in microseconds
+IMPORT_TIME_BUDGET_US = 50_000
+
+# Dependencies that must only be loaded when the client needing them is used
+HEAVY_MODULES = ("requests", "httpx", "pydantic", "posthog", "openhtf", "paho")
+
+
+def _import_times(statement: str) -> dict:
+    """Run `statement` in a fresh interpreter, returning cumulative import times per module."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        if cumulative.strip().isdigit():
+            times[name.strip()] = int(cumulative)
+    return times
+
+
+class TestImportTime:
+    def test_import_is_lazy(self):
+        times = _import_times("import tofupilot")
+
+        loaded = [module for module in HEAVY_MODULES if module in times]
+        assert loaded == [], f"`import tofupilot` loaded {loaded}"
+
+    def test_import_time_budget(self):
+        times = _import_times("import tofupilot")
+
+        assert times["tofupilot"] < IMPORT_TIME_BUDGET_US
+
+    def test_legacy_aliases(self):
+        times = _import_times(
+            "import tofupilot.responses.responses, tofupilot.v1.responses.responses as r;"
+            "import sys; assert sys.modules['tofupilot.responses.responses'] is r"
+        )
+
+        assert "tofupilot.v1.responses.responses" in times
@@ -0,0 +1,115 @@
+"""Offline checks of the idempotency keys of TofuPilotClient.create_run() requests."""
+
+import json
+
+import requests
+from requests.adapters import BaseAdapter
+
+from tofupilot import TofuPilotClient
+from tofupilot.v2.utils import BackoffStrategy, RetryConfig
+
+URL = "http://tofupilot.test"
+RUN = {
+    "unit_under_test": {"serial_number": "IDEMP-1", "part_number": "test_cr_idemp"},
+    "run_passed": True,
+    "procedure_id": "FVT1",
+}
+
+
+class _Server(BaseAdapter):
+    """Adapter recording idempotency keys, failing the first `failures` requests with a 503."""
+
+    def __init__(self, failures: int = 0):
+        super().__init__()
+        self.failures = failures
+        self.keys = []
+
+    def send(self, request, **kwargs):
+        self.keys.append(request.headers.get("Idempotency-Key"))
+        response = requests.Response()
+        response.request = request
+        response.url = request.url
+        response.headers["Content-Type"] = "application/json"
+        if len(self.keys) <= self.failures:
+            response.status_code = 503
+            response._content = json.dumps({"error": {"message": "Unavailable"}}).encode()
+        else:
+            response.status_code = 200
+            response._content = json.dumps({"id": f"run-{len(self.keys)}"}).encode()
+        return response
+
+    def close(self):
+        pass
+
+
+def _client(server: _Server, **kwargs) -> TofuPilotClient:
+    client = TofuPilotClient(api_key="offline-api-key", url=URL, **kwargs)
+    client._session.mount(URL, server)
+    return client
+
+
+def test_retries_reuse_the_key_of_their_call():
+    server = _Server(failures=1)
+    client = _client(server, retry_config=RetryConfig("backoff", BackoffStrategy(1, 10, 1.5, 5000), True))
+
+    client.create_run(**RUN)
+    client.create_run(**RUN)
+
+    first, retried, second = server.keys
+    assert first and retried == first
+    assert second and second != first
+
+
+def test_spool_replays_reuse_the_key_of_their_call(tmp_path):
+    server = _Server(failures=1)
+
+    with _client(server, spool_dir=str(tmp_path)) as client:
+        client.create_run(**RUN)
+        client.flush_spool(timeout=10)
+        assert client.flush_spool(timeout=10)
+
+    first, replayed = server.keys
+    assert first and replayed == first
+
+
+class _ImportServer(BaseAdapter):
+    """Adapter serving OpenHTF imports, failing the first `/import` with a 503."""
+
+    def __init__(self):
+        super().__init__()
+        self.import_keys = []
+
+    def send(self, request, **kwargs):
+        response = requests.Response()
+        response.request = request
+        response.url = request.url
+        response.headers["Content-Type"] = "application/json"
+        response.status_code = 200
+        if request.url.endswith("/uploads/initialize"):
+            body = {"id": "upload-1", "uploadUrl": f"{URL}/storage/upload-1"}
+        elif request.url.endswith("/import"):
+            self.import_keys.append(request.headers.get("Idempotency-Key"))
+            if len(self.import_keys) == 1:
+                response.status_code = 503
+                body = {"error": {"message": "Unavailable"}}
+            else:
+                body = {"id": "run-1"}
+        else:
+            body = {}
+        response._content = json.dumps(body).encode()
+        return response
+
+    def close(self):
+        pass
+
+
+def test_spooled_openhtf_imports_reuse_the_key_of_their_call(tmp_path):
+    server = _ImportServer()
+
+    with _client(server, spool_dir=str(tmp_path)) as client:
+        client._spool.put_openhtf_report("report.json", b"{}", [])
+        client.flush_spool(timeout=10)
+        assert client.flush_spool(timeout=10)
+
+    first, replayed = server.import_keys
+    assert first and replayed == first
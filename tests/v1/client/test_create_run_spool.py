@@ -0,0 +1,200 @@
+"""Tests for TofuPilotClient.create_run() with a local spool (spool_dir)."""
+
+import json
+import uuid
+
+import requests
+from requests.adapters import BaseAdapter
+
+from tofupilot import TofuPilotClient
+
+# Nothing listens on the discard port, so requests fail with a network error
+UNREACHABLE_URL = "http://127.0.0.1:9"
+OFFLINE_URL = "http://tofupilot.test"
+
+
+def _runs_of(client: TofuPilotClient, serial: str) -> list:
+    result = client.get_runs(serial_number=serial)
+    assert result.get("success"), f"Expected runs in response, got: {result}"
+    return result["result"]
+
+
+def test_queued_run_is_uploaded(tofupilot_server_url, api_key, procedure_identifier, tmp_path):
+    """create_run returns a spool entry, the run and its attachment are uploaded in the background."""
+    serial = f"SPOOL-{uuid.uuid4().hex[:8]}"
+
+    with TofuPilotClient(
+        api_key=api_key, url=tofupilot_server_url, spool_dir=str(tmp_path)
+    ) as client:
+        result = client.create_run(
+            unit_under_test={"serial_number": serial, "part_number": "test_cr_spool"},
+            run_passed=True,
+            procedure_id=procedure_identifier,
+            attachments=["tests/v1/attachments/sample_file.txt"],
+        )
+
+        assert result.get("spool_id"), f"Expected spool entry in response, got: {result}"
+        assert "id" not in result
+        assert client.flush_spool(timeout=60)
+        assert len(_runs_of(client, serial)) == 1
+
+
+def test_offline_run_is_uploaded_after_restart(
+    tofupilot_server_url, api_key, procedure_identifier, tmp_path
+):
+    """A run queued while the server is unreachable is uploaded by the next client on the spool."""
+    serial = f"SPOOLR-{uuid.uuid4().hex[:8]}"
+
+    with TofuPilotClient(api_key=api_key, url=UNREACHABLE_URL, spool_dir=str(tmp_path)) as client:
+        result = client.create_run(
+            unit_under_test={"serial_number": serial, "part_number": "test_cr_spool"},
+            run_passed=True,
+            procedure_id=procedure_identifier,
+        )
+        assert result.get("spool_id")
+        assert not client.flush_spool(timeout=60)
+
+    with TofuPilotClient(
+        api_key=api_key, url=tofupilot_server_url, spool_dir=str(tmp_path)
+    ) as client:
+        assert client.flush_spool(timeout=60)
+        assert len(_runs_of(client, serial)) == 1
+
+
+def test_identical_runs_are_all_uploaded(
+    tofupilot_server_url, api_key, procedure_identifier, tmp_path
+):
+    """Queuing the same run twice, e.g. re-testing a unit, creates two runs."""
+    serial = f"SPOOLD-{uuid.uuid4().hex[:8]}"
+    run = {
+        "unit_under_test": {"serial_number": serial, "part_number": "test_cr_spool"},
+        "run_passed": True,
+        "procedure_id": procedure_identifier,
+    }
+
+    with TofuPilotClient(
+        api_key=api_key, url=tofupilot_server_url, spool_dir=str(tmp_path)
+    ) as client:
+        first = client.create_run(**run)
+        assert client.flush_spool(timeout=60)
+        second = client.create_run(**run)
+        assert client.flush_spool(timeout=60)
+
+        assert first["spool_id"] != second["spool_id"]
+        assert len(_runs_of(client, serial)) == 2
+
+
+def test_identical_runs_are_queued_separately(tmp_path):
+    """Each create_run call gets its own spool entry, whatever its content."""
+    run = {
+        "unit_under_test": {"serial_number": "SPOOLD-1", "part_number": "test_cr_spool"},
+        "run_passed": True,
+        "procedure_id": "FVT1",
+    }
+
+    with TofuPilotClient(api_key="offline", url=UNREACHABLE_URL, spool_dir=str(tmp_path)) as client:
+        first = client.create_run(**run)
+        second = client.create_run(**run)
+
+        assert first["spool_id"] != second["spool_id"]
+        assert client._spool.pending_count() == 2
+
+
+def test_queued_attachment_is_a_copy(tmp_path):
+    """Rewriting an attachment after queuing its run doesn't change the queued file."""
+    source = tmp_path / "measurements.csv"
+    source.write_text("first")
+    spool_dir = tmp_path / "spool"
+
+    with TofuPilotClient(api_key="offline", url=UNREACHABLE_URL, spool_dir=str(spool_dir)) as client:
+        client.create_run(
+            unit_under_test={"serial_number": "SPOOLC-1", "part_number": "test_cr_spool"},
+            run_passed=True,
+            procedure_id="FVT1",
+            attachments=[str(source)],
+        )
+        source.write_text("second")
+
+    (stored,) = (spool_dir / "files").glob("*/0")
+    assert stored.read_text() == "first"
+    assert stored.stat().st_ino != source.stat().st_ino
+
+
+class _Server(BaseAdapter):
+    """Adapter serving OpenHTF imports with the given `/import`, storage and sync statuses."""
+
+    def __init__(self, import_status: int = 200, storage_statuses=(), sync_statuses=()):
+        super().__init__()
+        self.import_status = import_status
+        self.storage_statuses = list(storage_statuses)
+        self.sync_statuses = list(sync_statuses)
+        self.imports = 0
+        self.syncs = 0
+
+    def send(self, request, **kwargs):
+        response = requests.Response()
+        response.request = request
+        response.url = request.url
+        response.headers["Content-Type"] = "application/json"
+        response.status_code = 200
+        body = {}
+        if request.url.endswith("/uploads/initialize"):
+            body = {"id": "upload-1", "uploadUrl": f"{OFFLINE_URL}/storage/upload-1"}
+        elif "/storage/" in request.url and self.storage_statuses:
+            response.status_code = self.storage_statuses.pop(0)
+        elif request.url.endswith("/uploads/sync"):
+            self.syncs += 1
+            if self.sync_statuses:
+                response.status_code = self.sync_statuses.pop(0)
+        elif request.url.endswith("/import"):
+            self.imports += 1
+            response.status_code = self.import_status
+            body = {"id": "run-1"} if self.import_status == 200 else {"error": {"message": "Rejected"}}
+        response._content = json.dumps(body).encode()
+        return response
+
+    def close(self):
+        pass
+
+
+def _offline_client(server: _Server, spool_dir) -> TofuPilotClient:
+    client = TofuPilotClient(api_key="offline-api-key", url=OFFLINE_URL, spool_dir=str(spool_dir))
+    client._session.mount(OFFLINE_URL, server)
+    return client
+
+
+def test_failed_report_storage_is_retried(tmp_path):
+    """A report the storage didn't accept is uploaded again instead of being imported."""
+    server = _Server(storage_statuses=[503])
+
+    with _offline_client(server, tmp_path) as client:
+        client._spool.put_openhtf_report("report.json", b"{}", [])
+        client.flush_spool(timeout=10)
+        assert server.imports == 0
+        assert client.flush_spool(timeout=10)
+        assert server.imports == 1
+
+
+def test_failed_entry_files_are_kept(tmp_path):
+    """The files of an entry rejected by the server stay in the spool, also after a restart."""
+    server = _Server(import_status=400)
+
+    with _offline_client(server, tmp_path) as client:
+        client._spool.put_openhtf_report("report.json", b"{}", [])
+        assert client.flush_spool(timeout=10)
+
+    with _offline_client(server, tmp_path):
+        (stored,) = (tmp_path / "files").glob("*/0")
+        assert stored.read_bytes() == b"{}"
+
+
+def test_failed_attachment_sync_is_retried(tmp_path):
+    """An attachment stored but not linked to its run because of a 5xx is uploaded again."""
+    server = _Server(sync_statuses=[503])
+
+    with _offline_client(server, tmp_path) as client:
+        client._spool.put_openhtf_report("report.json", b"{}", [("log.txt", b"log", None)])
+        client.flush_spool(timeout=10)
+        assert client.flush_spool(timeout=10)
+        assert server.imports == 1
+        assert server.syncs == 2
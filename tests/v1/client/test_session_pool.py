@@ -0,0 +1,93 @@
+"""Offline checks of the pooled session shared by the requests of a TofuPilotClient."""
+
+import json
+
+import pytest
+import requests
+from requests.adapters import BaseAdapter, HTTPAdapter
+
+from tofupilot import TofuPilotClient
+
+URL = "http://tofupilot.test"
+
+
+class _Server(BaseAdapter):
+    """Adapter creating runs and uploads, recording requests and whether it was closed."""
+
+    def __init__(self):
+        super().__init__()
+        self.requests = []
+        self.closed = False
+
+    def send(self, request, **kwargs):
+        self.requests.append(request)
+        response = requests.Response()
+        response.request = request
+        response.url = request.url
+        response.headers["Content-Type"] = "application/json"
+        response.status_code = 200
+        body = {}
+        if request.url.endswith("/runs"):
+            body = {"id": "run-1"}
+        elif request.url.endswith("/uploads/initialize"):
+            body = {"id": "upload-1", "uploadUrl": f"{URL}/storage/upload-1"}
+        response._content = json.dumps(body).encode()
+        return response
+
+    def close(self):
+        self.closed = True
+
+
+@pytest.fixture
+def no_sessionless_requests(monkeypatch):
+    """Fails requests sent without the client's session."""
+
+    def request(*args, **kwargs):
+        raise AssertionError("Request sent without the pooled session")
+
+    monkeypatch.setattr(requests.api, "request", request)
+
+
+def test_adapter_is_mounted_with_the_pool_sizes():
+    client = TofuPilotClient(
+        api_key="offline", url=URL, pool_connections=3, pool_maxsize=7, upload_concurrency=2
+    )
+
+    adapter = client._session.get_adapter("https://tofupilot.test")
+    assert isinstance(adapter, HTTPAdapter)
+    assert client._session.get_adapter(URL) is adapter
+    # pylint: disable=protected-access
+    assert (adapter._pool_connections, adapter._pool_maxsize) == (3, 7)
+
+    # Every upload worker gets a connection
+    client = TofuPilotClient(api_key="offline", url=URL, pool_maxsize=2, upload_concurrency=8)
+    assert client._session.get_adapter(URL)._pool_maxsize == 8
+
+
+def test_api_requests_and_uploads_reuse_the_session(no_sessionless_requests):
+    server = _Server()
+    client = TofuPilotClient(api_key="offline", url=URL)
+    client._session.mount(URL, server)
+
+    result = client.create_run(
+        unit_under_test={"serial_number": "POOL-1", "part_number": "test_pool"},
+        run_passed=True,
+        procedure_id="FVT1",
+        attachments=["tests/v1/attachments/sample_file.txt"],
+    )
+
+    assert result["id"] == "run-1"
+    assert [(r.method, r.path_url) for r in server.requests] == [
+        ("POST", "/api/v1/runs"),
+        ("POST", "/api/v1/uploads/initialize"),
+        ("PUT", "/storage/upload-1"),
+        ("POST", "/api/v1/uploads/sync"),
+    ]
+
+
+def test_close_releases_the_session():
+    server = _Server()
+    with TofuPilotClient(api_key="offline", url=URL) as client:
+        client._session.mount(URL, server)
+
+    assert server.closed
@@ -0,0 +1,35 @@
+"""Upload test records in the background with TofuPilot(..., background_upload=True)"""
+
+import random
+
+import openhtf as htf
+from openhtf.util import units
+from tofupilot.openhtf import TofuPilot
+
+
+@htf.measures(htf.Measurement("input_voltage").in_range(4.5, 5).with_units(units.VOLT))
+def check_voltage_input(test):
+    test.measurements.input_voltage = 4.7
+
+
+def attach_scope_capture(test):
+    test.attach_from_file("tests/v1/attachments/oscilloscope.jpeg")
+
+
+def test_background_upload(tofupilot_server_url, api_key, procedure_identifier, procedure_id, extract_id_and_check_run_exists):
+    test = htf.Test(
+        check_voltage_input,
+        attach_scope_capture,
+        procedure_id=procedure_identifier,
+        part_number="00221",
+    )
+
+    random_digits = "".join([str(random.randint(0, 9)) for _ in range(5)])
+    serial_number = f"00221BG{random_digits}"
+
+    # The upload still running when the test returns is finished on exit
+    with TofuPilot(test, url=tofupilot_server_url, api_key=api_key, background_upload=True):
+        test.execute(lambda: serial_number)
+
+    run = extract_id_and_check_run_exists(serial_number=serial_number, procedure_id=procedure_id, outcome="PASS", part_number="00221")
+    assert "oscilloscope.jpeg" in [attachment.name for attachment in run.attachments]
@@ -0,0 +1,69 @@
+"""Test that the station watcher streams test state changes as they happen."""
+
+import threading
+import time
+
+from tofupilot.openhtf import tofupilot as streaming
+
+
+class _PlugManager:
+    def get_frontend_aware_plug_names(self):
+        return []
+
+
+class _TestState:
+    """Stands in for an OpenHTF TestState, setting its update event on changes."""
+
+    execution_uid = "execution-uid"
+    plug_manager = _PlugManager()
+
+    def __init__(self):
+        self.status = "WAITING_FOR_TEST_START"
+        self.event = threading.Event()
+
+    def asdict_with_event(self):
+        self.event = threading.Event()
+        return {"status": self.status}, self.event
+
+    def update(self, status: str):
+        self.status = status
+        self.event.set()
+
+
+class _Updates:
+    def __init__(self):
+        self.states = []
+        self.received = threading.Condition()
+
+    def __call__(self, state):
+        with self.received:
+            self.states.append((time.monotonic(), state["status"]))
+            self.received.notify_all()
+
+    def wait_for(self, count: int, timeout: float):
+        with self.received:
+            assert self.received.wait_for(lambda: len(self.states) >= count, timeout)
+
+
+def test_state_change_is_sent_without_waiting_for_the_poll(monkeypatch):
+    test_state = _TestState()
+    monkeypatch.setattr(streaming, "_get_executing_test", lambda: (None, test_state))
+    # Far longer than the test waits, so only the update event can wake the watcher
+    monkeypatch.setattr(streaming, "_WAIT_FOR_UPDATE_POLL_S", 30.0)
+    updates = _Updates()
+    watcher = streaming.SimpleStationWatcher(updates)
+    watcher.start()
+    try:
+        updates.wait_for(1, timeout=5)
+        # Past the throttle, the watcher is waiting for a change
+        time.sleep(2 * streaming._MIN_UPDATE_INTERVAL_S)
+
+        changed_at = time.monotonic()
+        test_state.update("RUNNING")
+        updates.wait_for(2, timeout=5)
+    finally:
+        watcher.stop()
+
+    sent_at, status = updates.states[1]
+    assert status == "RUNNING"
+    assert sent_at - changed_at < 1.0
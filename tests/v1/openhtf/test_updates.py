@@ -0,0 +1,143 @@
+"""Test Operator UI update encoding: JSON patches, compression, coalescing and resyncs."""
+
+import base64
+import json
+import time
+import zlib
+
+import openhtf as htf
+
+from tofupilot.openhtf import TofuPilot
+from tofupilot.openhtf.updates import UpdatePublisher, json_patch
+
+
+class TestJsonPatch:
+    def test_no_change(self):
+        state = {"status": "RUNNING", "phases": [{"name": "a"}]}
+        assert json_patch(state, json.loads(json.dumps(state))) == []
+
+    def test_changed_subtrees_only(self):
+        old = {"status": "RUNNING", "phases": [{"name": "a"}], "plugs": {"x": 1}}
+        new = {"status": "RUNNING", "phases": [{"name": "a"}, {"name": "b"}], "plugs": {}}
+
+        assert json_patch(old, new) == [
+            {"op": "add", "path": "/phases/-", "value": {"name": "b"}},
+            {"op": "remove", "path": "/plugs/x"},
+        ]
+
+    def test_type_change_is_replaced(self):
+        assert json_patch({"v": 1}, {"v": True}) == [
+            {"op": "replace", "path": "/v", "value": True}
+        ]
+
+    def test_keys_are_escaped(self):
+        assert json_patch({}, {"a/b~c": 1}) == [
+            {"op": "add", "path": "/a~1b~0c", "value": 1}
+        ]
+
+    def test_list_shrink_removes_from_the_end(self):
+        assert json_patch([1, 2, 3], [1]) == [
+            {"op": "remove", "path": "/2"},
+            {"op": "remove", "path": "/1"},
+        ]
+
+
+class TestUpdatePublisher:
+    def test_default_payload_is_full_state(self):
+        published = []
+        publisher = UpdatePublisher(published.append)
+
+        publisher.submit({"status": "RUNNING"})
+
+        assert json.loads(published[0]) == {
+            "action": "send",
+            "source": "python",
+            "message": {"status": "RUNNING"},
+        }
+
+    def test_delta_mode(self):
+        published = []
+        publisher = UpdatePublisher(published.append, delta=True)
+
+        publisher.submit({"status": "RUNNING", "logs": []})
+        publisher.submit({"status": "RUNNING", "logs": ["started"]})
+        publisher.submit({"status": "RUNNING", "logs": ["started"]})
+        publisher.resync()
+        publisher.submit({"status": "COMPLETED", "logs": ["started"]})
+
+        payloads = [json.loads(payload) for payload in published]
+        assert [payload["action"] for payload in payloads] == ["send", "patch", "send"]
+        assert [payload["seq"] for payload in payloads] == [1, 2, 3]
+        assert payloads[1]["message"] == [
+            {"op": "add", "path": "/logs/-", "value": "started"}
+        ]
+
+    def test_compression(self):
+        published = []
+        publisher = UpdatePublisher(published.append, compress=True)
+
+        publisher.submit({"status": "RUNNING"})
+
+        payload = json.loads(published[0])
+        assert payload["encoding"] == "zlib"
+        message = zlib.decompress(base64.b64decode(payload["message"]))
+        assert json.loads(message) == {"status": "RUNNING"}
+
+    def test_coalescing(self):
+        published = []
+        publisher = UpdatePublisher(published.append, max_update_rate=10)
+
+        for index in range(5):
+            publisher.submit({"index": index})
+        time.sleep(0.3)
+
+        messages = [json.loads(payload)["message"] for payload in published]
+        assert messages == [{"index": 0}, {"index": 4}]
+
+    def test_force_bypasses_rate_limit(self):
+        published = []
+        publisher = UpdatePublisher(published.append, max_update_rate=0.1)
+
+        publisher.submit({"index": 0})
+        publisher.submit({"index": 1}, force=True)
+        publisher.close()
+
+        assert len(published) == 2
+
+    def test_resync_sends_a_full_snapshot(self):
+        published = []
+        publisher = UpdatePublisher(published.append, delta=True)
+
+        publisher.submit({"status": "RUNNING", "logs": []})
+        publisher.resync()
+        publisher.submit({"status": "RUNNING", "logs": ["started"]})
+
+        assert [json.loads(payload)["action"] for payload in published] == ["send", "send"]
+
+
+class _MqttClient:
+    def __init__(self):
+        self.payloads = []
+
+    def publish(self, payload, **kwargs):
+        self.payloads.append(json.loads(payload))
+
+
+def _phase():
+    pass
+
+
+class TestReconnection:
+    def test_update_after_reconnecting_is_a_full_snapshot(self):
+        tofupilot = TofuPilot(htf.Test(_phase), stream=False, api_key="offline", delta_updates=True)
+        mqtt_client = _MqttClient()
+        tofupilot.stream, tofupilot.mqttClient, tofupilot.publishOptions = True, mqtt_client, {}
+
+        tofupilot._send_update({"status": "RUNNING", "logs": []})
+        tofupilot._send_update({"status": "RUNNING", "logs": ["a"]})
+        tofupilot._reconnecting = True
+        tofupilot._on_connect(None, None, None, 0, None)
+        tofupilot._send_update({"status": "RUNNING", "logs": ["a", "b"]})
+
+        assert [payload["action"] for payload in mqtt_client.payloads] == ["send", "patch", "send"]
+        assert mqtt_client.payloads[-1]["message"]["logs"] == ["a", "b"]
@@ -0,0 +1,142 @@
+"""Offline checks of the v1 upload helpers against a mocked TofuPilot server."""
+
+import io
+import json
+import logging
+import tempfile
+import threading
+import time
+
+import requests
+from requests.adapters import BaseAdapter
+
+from tofupilot.v1.utils import setup_logger
+from tofupilot.v1.utils.files import _iter_in_pool, upload_attachments, upload_data
+
+URL = "http://tofupilot.test/api"
+
+
+class _Server(BaseAdapter):
+    """Adapter serving uploads, failing the initialization of the names in `failing`."""
+
+    def __init__(self, failing=()):
+        super().__init__()
+        self.failing = set(failing)
+        self.requests = []
+        self._lock = threading.Lock()
+
+    def send(self, request, **kwargs):
+        with self._lock:
+            self.requests.append(request)
+        response = requests.Response()
+        response.request = request
+        response.url = request.url
+        response.headers["Content-Type"] = "application/json"
+        response.status_code = 200
+        body = {}
+        if request.url.endswith("/uploads/initialize"):
+            name = json.loads(request.body)["name"]
+            if name in self.failing:
+                response.status_code = 500
+                body = {"error": {"message": "Unavailable"}}
+            else:
+                body = {"id": f"upload-{name}", "uploadUrl": f"{URL}/storage/{name}"}
+        response._content = json.dumps(body).encode()
+        return response
+
+    def close(self):
+        pass
+
+    def stored(self):
+        """Returns the PUT requests sent to the storage, by file name."""
+        return {
+            request.url.rsplit("/", 1)[-1]: request
+            for request in self.requests
+            if request.method == "PUT"
+        }
+
+
+def _session(server: _Server) -> requests.Session:
+    session = requests.Session()
+    session.mount(URL, server)
+    return session
+
+
+def _files(tmp_path, *names):
+    paths = []
+    for name in names:
+        path = tmp_path / name
+        path.write_text(f"content of {name}")
+        paths.append(str(path))
+    return paths
+
+
+def test_pool_yields_results_in_task_order():
+    def task(index):
+        # Later tasks finish first
+        time.sleep(0.05 * (3 - index))
+        return index
+
+    tasks = [lambda index=index: task(index) for index in range(4)]
+
+    assert list(_iter_in_pool(tasks, concurrency=4)) == [(i, None) for i in range(4)]
+
+
+def test_pool_failure_only_fails_its_task():
+    error = ValueError("broken")
+
+    def fail():
+        raise error
+
+    results = list(_iter_in_pool([lambda: 1, fail, lambda: 3], concurrency=2))
+
+    assert results == [(1, None), (None, error), (3, None)]
+
+
+def test_upload_attachments_returns_one_result_per_path(tmp_path):
+    server = _Server(failing={"broken.txt"})
+    paths = _files(tmp_path, "first.txt", "broken.txt", "last.txt")
+    paths.insert(1, str(tmp_path / "missing.txt"))
+
+    results = upload_attachments(
+        setup_logger(logging.INFO), {}, URL, paths, "run-1",
+        session=_session(server), concurrency=3,
+    )
+
+    assert results == [True, False, False, True]
+    assert set(server.stored()) == {"first.txt", "last.txt"}
+
+
+def test_file_attachments_are_streamed_with_their_length(tmp_path):
+    server = _Server()
+    paths = _files(tmp_path, "first.txt")
+
+    upload_attachments(
+        setup_logger(logging.INFO), {}, URL, paths, "run-1", session=_session(server)
+    )
+
+    stored = server.stored()["first.txt"]
+    # The open file is the request body, sent in blocks instead of read in memory
+    assert hasattr(stored.body, "read")
+    assert stored.headers["Content-Length"] == str(len("content of first.txt"))
+    assert "Transfer-Encoding" not in stored.headers
+
+
+def test_in_memory_report_is_uploaded_without_a_temp_file(monkeypatch):
+    def no_temp_file(*args, **kwargs):
+        raise AssertionError("A temporary file was created")
+
+    for name in ("NamedTemporaryFile", "TemporaryFile", "mkstemp"):
+        monkeypatch.setattr(tempfile, name, no_temp_file)
+    server = _Server()
+    report = io.BytesIO(b'{"dut_id": "SN-1"}')
+
+    upload_id = upload_data(
+        {}, URL, "report.json", report, "application/json", session=_session(server)
+    )
+
+    assert upload_id == "upload-report.json"
+    stored = server.stored()["report.json"]
+    assert stored.headers["Content-Type"] == "application/json"
+    assert stored.headers["Content-Length"] == str(len(report.getvalue()))
+    assert stored.body.getvalue() == b'{"dut_id": "SN-1"}'
@@ -1,5 +1,6 @@
 """Test attachment operations."""
 
+import asyncio
 import os
 import tempfile
 from types import SimpleNamespace
@@ -61,6 +62,19 @@ class TestAttachmentUpload:
         with pytest.raises(FileNotFoundError):
             client.attachments.upload("/tmp/nonexistent_file_abc123.txt")
 
+    def test_upload_file_async(self, client: TofuPilot) -> None:
+        with tempfile.NamedTemporaryFile(suffix=".txt", delete=False) as f:
+            f.write(b"async convenience method test")
+            f.flush()
+            path = f.name
+
+        try:
+            upload_id = asyncio.run(client.attachments.upload_async(path))
+            assert upload_id
+            assert len(upload_id) == 36
+        finally:
+            os.unlink(path)
+
 
 class TestAttachmentDownload:
     """Test the download() convenience method."""
@@ -84,6 +98,23 @@ class TestAttachmentDownload:
             if os.path.exists(dest):
                 os.unlink(dest)
 
+    def test_download_uploaded_file_async(self, client: TofuPilot) -> None:
+        content = b"async round-trip download test"
+
+        init = client.attachments.initialize(name="download_async_test.txt")
+        http_requests.put(init.upload_url, data=content, headers={"Content-Type": "text/plain"})
+        result = client.attachments.finalize(id=init.id)
+
+        attachment = SimpleNamespace(name="download_async_test.txt", download_url=result.url)
+
+        dest = tempfile.mktemp(suffix=".txt")
+        try:
+            path = asyncio.run(client.attachments.download_async(attachment, dest=dest))
+            assert path.read_bytes() == content
+        finally:
+            if os.path.exists(dest):
+                os.unlink(dest)
+
     def test_download_no_url(self, client: TofuPilot) -> None:
         attachment = SimpleNamespace(name="missing.txt", download_url=None)
         with pytest.raises(ValueError, match="no download URL"):
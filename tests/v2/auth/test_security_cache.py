@@ -0,0 +1,121 @@
+"""Offline checks of the auth headers cached by the client."""
+
+import asyncio
+
+import httpx
+import pytest
+
+from tofupilot.v2 import TofuPilot, errors
+from tofupilot.v2.utils import security
+
+LIST_RESPONSE = {"data": [], "meta": {"has_more": False, "next_cursor": None}}
+
+
+class _Server:
+    """Mock transport recording the Authorization header, rejecting `rejected` keys."""
+
+    def __init__(self, rejected: str = ""):
+        self.rejected = rejected
+        self.keys = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        key = request.headers.get("authorization")
+        self.keys.append(key)
+        if key == f"Bearer {self.rejected}":
+            return httpx.Response(
+                401, json={"message": "Invalid API key", "code": "UNAUTHORIZED"}
+            )
+        return httpx.Response(200, json=LIST_RESPONSE)
+
+
+class _KeyProvider:
+    def __init__(self, *keys: str):
+        self.keys = list(keys)
+        self.calls = 0
+
+    def __call__(self) -> str:
+        self.calls += 1
+        return self.keys[min(self.calls, len(self.keys)) - 1]
+
+
+def _client(server: _Server, api_key, **kwargs) -> TofuPilot:
+    return TofuPilot(
+        api_key=api_key,
+        server_url="http://tofupilot.test/api",
+        client=httpx.Client(transport=httpx.MockTransport(server)),
+        async_client=httpx.AsyncClient(transport=httpx.MockTransport(server)),
+        **kwargs,
+    )
+
+
+@pytest.fixture
+def resolutions(monkeypatch):
+    calls = []
+    get_security = security.get_security
+
+    def counted(sec):
+        calls.append(sec)
+        return get_security(sec)
+
+    monkeypatch.setattr(security, "get_security", counted)
+    return calls
+
+
+class TestSecurityCache:
+    def test_static_key_is_resolved_once(self, resolutions) -> None:
+        server = _Server()
+        client = _client(server, "key-1")
+
+        for _ in range(3):
+            client.runs.list()
+        asyncio.run(client.units.list_async())
+
+        assert server.keys == ["Bearer key-1"] * 4
+        assert len(resolutions) == 1
+
+    def test_rotated_key_is_picked_up(self, resolutions) -> None:
+        server = _Server()
+        provider = _KeyProvider("key-1", "key-1", "key-2")
+        client = _client(server, provider)
+
+        for _ in range(4):
+            client.runs.list()
+
+        assert server.keys == ["Bearer key-1"] * 2 + ["Bearer key-2"] * 2
+        assert provider.calls == 4
+        assert len(resolutions) == 2
+
+    def test_provider_is_called_once_per_ttl(self) -> None:
+        server = _Server()
+        provider = _KeyProvider("key-1", "key-2")
+        client = _client(server, provider, api_key_ttl_ms=60_000)
+
+        client.runs.list()
+        client.runs.list()
+        assert provider.calls == 1
+
+        client.refresh_api_key()
+        client.runs.list()
+        assert provider.calls == 2
+        assert server.keys == ["Bearer key-1"] * 2 + ["Bearer key-2"]
+
+    def test_expired_ttl_calls_the_provider_again(self) -> None:
+        server = _Server()
+        provider = _KeyProvider("key-1", "key-2")
+        client = _client(server, provider, api_key_ttl_ms=0)
+
+        client.runs.list()
+        client.runs.list()
+
+        assert server.keys == ["Bearer key-1", "Bearer key-2"]
+
+    def test_unauthorized_response_invalidates_the_key(self) -> None:
+        server = _Server(rejected="expired")
+        provider = _KeyProvider("expired", "key-2")
+        client = _client(server, provider, api_key_ttl_ms=60_000)
+
+        with pytest.raises(errors.ErrorUNAUTHORIZED):
+            client.runs.list()
+        client.runs.list()
+
+        assert server.keys == ["Bearer expired", "Bearer key-2"]
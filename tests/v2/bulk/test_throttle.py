@@ -0,0 +1,113 @@
+"""Offline checks of the adaptive concurrency of runs.create_many."""
+
+import asyncio
+import json
+import threading
+import time
+
+import httpx
+import pytest
+
+from tofupilot.v2 import TofuPilot, bulk, errors
+
+RETRY_AFTER_S = 0.2
+
+
+class _Server:
+    """Mock transport answering 429 with Retry-After to the first attempt of SN-0."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.arrivals = {}
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        serial_number = json.loads(request.read())["serial_number"]
+        with self.lock:
+            arrivals = self.arrivals.setdefault(serial_number, [])
+            arrivals.append(time.monotonic())
+        if serial_number == "SN-0" and len(arrivals) == 1:
+            return httpx.Response(
+                429,
+                headers={"Retry-After": str(RETRY_AFTER_S)},
+                json={"message": "Too many requests", "code": "TOO_MANY_REQUESTS"},
+            )
+        time.sleep(0.01)
+        return httpx.Response(200, json={"id": "run-id"})
+
+
+def _client(server: _Server) -> TofuPilot:
+    return TofuPilot(
+        api_key="k" * 20,
+        server_url="http://tofupilot.test/api",
+        client=httpx.Client(transport=httpx.MockTransport(server)),
+        async_client=httpx.AsyncClient(transport=httpx.MockTransport(server)),
+    )
+
+
+def _runs(count: int):
+    return [
+        {
+            "serial_number": f"SN-{i}",
+            "procedure_id": "00000000-0000-0000-0000-000000000000",
+            "started_at": "2025-01-01T00:00:00Z",
+            "ended_at": "2025-01-01T00:01:00Z",
+            "outcome": "PASS",
+        }
+        for i in range(count)
+    ]
+
+
+@pytest.fixture
+def releases(monkeypatch):
+    """Records (time, limit) after every rate-limited release of a throttle."""
+    recorded = []
+
+    class Throttle(bulk._Throttle):  # pylint: disable=protected-access
+        def release(self, retry_after=None):
+            super().release(retry_after)
+            if retry_after is not None:
+                recorded.append((time.monotonic(), self.limit))
+
+    class AsyncThrottle(bulk._AsyncThrottle):  # pylint: disable=protected-access
+        async def release(self, retry_after=None):
+            await super().release(retry_after)
+            if retry_after is not None:
+                recorded.append((time.monotonic(), self.limit))
+
+    monkeypatch.setattr(bulk, "_Throttle", Throttle)
+    monkeypatch.setattr(bulk, "_AsyncThrottle", AsyncThrottle)
+    return recorded
+
+
+class TestThrottle:
+    def test_rate_limit_halves_concurrency_and_waits(self, releases) -> None:
+        server = _Server()
+        client = _client(server)
+
+        results = client.runs.create_many(_runs(8), concurrency=4)
+
+        assert all(result.success for result in results)
+        ((released_at, limit),) = releases
+        assert limit == 2
+        _, retried = server.arrivals["SN-0"]
+        assert retried - released_at >= RETRY_AFTER_S * 0.95
+
+    def test_async_rate_limit_halves_concurrency_and_waits(self, releases) -> None:
+        server = _Server()
+        client = _client(server)
+
+        results = asyncio.run(client.runs.create_many_async(_runs(8), concurrency=4))
+
+        assert all(result.success for result in results)
+        ((released_at, limit),) = releases
+        assert limit == 2
+        _, retried = server.arrivals["SN-0"]
+        assert retried - released_at >= RETRY_AFTER_S * 0.95
+
+    def test_retry_after_uses_the_shared_parser(self) -> None:
+        client = _client(_Server())
+        with pytest.raises(errors.TofuPilotError) as e:
+            client.runs.create(**_runs(1)[0])
+
+        assert bulk._retry_after(e.value, 1) == RETRY_AFTER_S  # pylint: disable=protected-access
+        assert bulk._retry_after(ValueError(), 1) is None  # pylint: disable=protected-access
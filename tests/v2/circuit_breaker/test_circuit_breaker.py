@@ -0,0 +1,111 @@
+"""Offline checks of the per-host circuit breaker."""
+
+import time
+
+import httpx
+import pytest
+
+from tofupilot.v2 import TofuPilot, errors
+from tofupilot.v2.utils import CircuitBreaker
+from tofupilot.v2.utils.circuit_breaker import CLOSED, HALF_OPEN, OPEN
+
+
+class _Server:
+    """Mock transport failing with a connection error while `down`."""
+
+    def __init__(self):
+        self.down = True
+        self.calls = 0
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.calls += 1
+        if self.down:
+            raise httpx.ConnectError("Connection refused", request=request)
+        return httpx.Response(
+            200, json={"data": [], "meta": {"has_more": False, "next_cursor": None}}
+        )
+
+
+def _client(server: _Server, breaker: CircuitBreaker) -> TofuPilot:
+    return TofuPilot(
+        api_key="k" * 20,
+        server_url="http://tofupilot.test/api",
+        client=httpx.Client(transport=httpx.MockTransport(server)),
+        circuit_breaker=breaker,
+    )
+
+
+class TestCircuitBreaker:
+    def test_opens_after_consecutive_failures(self):
+        server = _Server()
+        client = _client(server, CircuitBreaker(failure_threshold=3, reset_timeout=60))
+
+        for _ in range(3):
+            with pytest.raises(httpx.ConnectError):
+                client.runs.list()
+        assert client.circuit_state == OPEN
+
+        with pytest.raises(errors.CircuitOpenError):
+            client.runs.list()
+        assert server.calls == 3
+
+    def test_half_open_probe_closes_the_circuit(self):
+        server = _Server()
+        changes = []
+        breaker = CircuitBreaker(
+            failure_threshold=1,
+            reset_timeout=0.1,
+            on_state_change=lambda host, old, new: changes.append(new),
+        )
+        client = _client(server, breaker)
+
+        with pytest.raises(httpx.ConnectError):
+            client.runs.list()
+        time.sleep(0.15)
+        assert client.circuit_state == HALF_OPEN
+
+        server.down = False
+        client.runs.list()
+
+        assert client.circuit_state == CLOSED
+        assert changes == [OPEN, HALF_OPEN, CLOSED]
+
+    def test_failed_probe_reopens_the_circuit(self):
+        server = _Server()
+        client = _client(server, CircuitBreaker(failure_threshold=1, reset_timeout=0.1))
+
+        with pytest.raises(httpx.ConnectError):
+            client.runs.list()
+        time.sleep(0.15)
+        with pytest.raises(httpx.ConnectError):
+            client.runs.list()
+
+        assert client.circuit_state == OPEN
+
+    def test_one_probe_at_a_time(self):
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0)
+        breaker.record_failure("tofupilot.test")
+
+        breaker.before_request("tofupilot.test")
+        with pytest.raises(errors.CircuitOpenError):
+            breaker.before_request("tofupilot.test")
+
+    def test_hosts_are_independent(self):
+        breaker = CircuitBreaker(failure_threshold=1)
+        breaker.record_failure("storage.tofupilot.test")
+
+        assert breaker.state("storage.tofupilot.test") == OPEN
+        assert breaker.state("tofupilot.test") == CLOSED
+
+    def test_disabled_by_default(self):
+        server = _Server()
+        client = TofuPilot(
+            api_key="k" * 20,
+            server_url="http://tofupilot.test/api",
+            client=httpx.Client(transport=httpx.MockTransport(server)),
+        )
+
+        for _ in range(10):
+            with pytest.raises(httpx.ConnectError):
+                client.runs.list()
+        assert client.circuit_state == CLOSED
@@ -0,0 +1,91 @@
+"""Offline checks of request body compression."""
+
+import gzip
+import json
+
+import httpx
+import pytest
+
+from tofupilot.v2 import TofuPilot
+from tofupilot.v2.utils import CompressionConfig, compress_body
+from tofupilot.v2.utils.compression import GZIP, ZSTD
+
+LOGS = [
+    {
+        "level": "INFO",
+        "timestamp": "2025-01-01T00:00:00Z",
+        "message": f"Measured rail voltage {i}",
+        "source_file": "test.py",
+        "line_number": i,
+    }
+    for i in range(500)
+]
+
+
+def _create_run(compression, requests: list):
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(200, json={"id": "run-id"})
+
+    client = TofuPilot(
+        api_key="k" * 20,
+        server_url="http://tofupilot.test/api",
+        client=httpx.Client(transport=httpx.MockTransport(handler)),
+        compression=compression,
+    )
+    return client.runs.create(
+        serial_number="SN-GZIP",
+        procedure_id="00000000-0000-0000-0000-000000000000",
+        started_at="2025-01-01T00:00:00Z",
+        ended_at="2025-01-01T00:01:00Z",
+        outcome="PASS",
+        logs=LOGS,
+    )
+
+
+class TestCompression:
+    def test_large_body_is_gzipped(self):
+        requests = []
+        _create_run(CompressionConfig(GZIP, min_size=1024), requests)
+
+        request = requests[0]
+        assert request.headers["content-encoding"] == "gzip"
+        assert request.headers["content-type"] == "application/json"
+        body = json.loads(gzip.decompress(request.content))
+        assert len(body["logs"]) == len(LOGS)
+
+    def test_small_body_is_sent_as_is(self):
+        requests = []
+        _create_run(CompressionConfig(GZIP, min_size=10 * 1024 * 1024), requests)
+
+        assert "content-encoding" not in requests[0].headers
+        assert len(json.loads(requests[0].content)["logs"]) == len(LOGS)
+
+    def test_disabled_by_default(self):
+        requests = []
+        _create_run(None, requests)
+
+        assert "content-encoding" not in requests[0].headers
+
+    def test_same_body_compresses_to_the_same_bytes(self):
+        requests = []
+        config = CompressionConfig(GZIP, min_size=1024)
+        _create_run(config, requests)
+        _create_run(config, requests)
+
+        assert requests[0].content == requests[1].content
+
+    def test_zstd_falls_back_to_gzip(self):
+        data = json.dumps(LOGS)
+        body, encoding = compress_body(data, CompressionConfig(ZSTD, min_size=0))
+
+        assert encoding in (GZIP, ZSTD)
+        if encoding == GZIP:
+            assert json.loads(gzip.decompress(body)) == LOGS
+
+    def test_incompressible_body_is_sent_as_is(self):
+        assert compress_body(bytes(range(256)), CompressionConfig(min_size=0)) is None
+
+    def test_unsupported_encoding(self):
+        with pytest.raises(ValueError):
+            CompressionConfig("br")
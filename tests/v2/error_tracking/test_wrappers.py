@@ -0,0 +1,83 @@
+"""Offline checks of the resource wrappers of the error tracking client."""
+
+import asyncio
+import inspect
+
+import httpx
+import pytest
+
+from tofupilot.v2 import TofuPilot, errors
+from tofupilot.v2.client_with_error_tracking import TofuPilotValidationError
+
+BAD_REQUEST = {
+    "message": "Invalid run",
+    "code": "BAD_REQUEST",
+    "issues": [{"message": "serial_number is empty"}],
+}
+
+
+def _client() -> TofuPilot:
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(400, json=BAD_REQUEST)
+
+    return TofuPilot(
+        api_key="k" * 20,
+        server_url="http://tofupilot.test/api",
+        client=httpx.Client(transport=httpx.MockTransport(handler)),
+        async_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+    )
+
+
+class TestResourceWrappers:
+    def test_wrapper_is_built_once(self) -> None:
+        client = _client()
+
+        assert client.runs.get is client.runs.get
+        assert client.units.list_async is client.units.list_async
+
+    def test_wrappers_keep_method_metadata(self) -> None:
+        client = _client()
+
+        assert client.runs.get.__doc__ == type(client.runs._resource).get.__doc__
+        assert inspect.iscoroutinefunction(client.units.list_async)
+        assert not inspect.iscoroutinefunction(client.units.list)
+
+    def test_sync_error_is_enhanced(self) -> None:
+        client = _client()
+
+        with pytest.raises(errors.ErrorBADREQUEST, match="serial_number is empty"):
+            client.units.get(serial_number="SN-1")
+
+    def test_async_error_is_enhanced(self) -> None:
+        client = _client()
+
+        with pytest.raises(errors.ErrorBADREQUEST, match="serial_number is empty"):
+            asyncio.run(client.units.get_async(serial_number="SN-1"))
+
+    def test_create_async_formats_validation_errors(self) -> None:
+        client = _client()
+
+        with pytest.raises(TofuPilotValidationError, match="outcome"):
+            asyncio.run(
+                client.runs.create_async(
+                    serial_number="SN-1",
+                    procedure_id="proc-id",
+                    started_at="2025-01-01T00:00:00Z",
+                    ended_at="2025-01-01T00:01:00Z",
+                    outcome="MAYBE",
+                )
+            )
+
+    def test_create_async_error_is_enhanced(self) -> None:
+        client = _client()
+
+        with pytest.raises(errors.ErrorBADREQUEST, match="serial_number is empty"):
+            asyncio.run(
+                client.runs.create_async(
+                    serial_number="SN-1",
+                    procedure_id="proc-id",
+                    started_at="2025-01-01T00:00:00Z",
+                    ended_at="2025-01-01T00:01:00Z",
+                    outcome="PASS",
+                )
+            )
@@ -0,0 +1,154 @@
+"""Offline checks of the cursor pagination helpers."""
+
+import asyncio
+import threading
+import time
+
+import httpx
+
+from tofupilot.v2 import TofuPilot
+
+PAGES = 3
+PAGE_SIZE = 2
+
+
+def _page(cursor: int) -> dict:
+    data = [
+        {
+            "id": f"batch-{cursor}-{i}",
+            "number": f"B-{cursor}-{i}",
+            "created_at": "2025-01-01T00:00:00Z",
+            "unit_count": 0,
+        }
+        for i in range(PAGE_SIZE)
+    ]
+    last = cursor == PAGES - 1
+    return {"data": data, "meta": {"has_more": not last, "next_cursor": None if last else cursor + 1}}
+
+
+class _Server:
+    """Mock transport serving `PAGES` pages, holding page 1 until `release` is set."""
+
+    def __init__(self, hold: bool = False):
+        self.cursors = []
+        self.release = threading.Event()
+        if not hold:
+            self.release.set()
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        cursor = int(request.url.params.get("cursor", 0))
+        self.cursors.append(cursor)
+        if cursor == 1:
+            self.release.wait(5)
+        return httpx.Response(200, json=_page(cursor))
+
+
+class _AsyncServer:
+    """Async mock transport holding page 1 until cancelled."""
+
+    def __init__(self, hold: bool = False):
+        self.hold = hold
+        self.cursors = []
+        self.cancelled = False
+
+    async def __call__(self, request: httpx.Request) -> httpx.Response:
+        cursor = int(request.url.params.get("cursor", 0))
+        self.cursors.append(cursor)
+        if cursor == 1 and self.hold:
+            try:
+                await asyncio.sleep(5)
+            except asyncio.CancelledError:
+                self.cancelled = True
+                raise
+        return httpx.Response(200, json=_page(cursor))
+
+
+def _client(server=None, async_server=None) -> TofuPilot:
+    return TofuPilot(
+        api_key="k" * 20,
+        server_url="http://tofupilot.test/api",
+        client=httpx.Client(transport=httpx.MockTransport(server or _Server())),
+        async_client=httpx.AsyncClient(
+            transport=httpx.MockTransport(async_server or _AsyncServer())
+        ),
+    )
+
+
+def _ids(items) -> list:
+    return [item.id for item in items]
+
+
+EXPECTED_IDS = [f"batch-{cursor}-{i}" for cursor in range(PAGES) for i in range(PAGE_SIZE)]
+
+
+class TestPagination:
+    def test_cursor_is_followed_until_exhausted(self) -> None:
+        for prefetch in (False, True):
+            server = _Server()
+            client = _client(server)
+
+            pages = list(client.batches.iter_pages(prefetch=prefetch))
+            items = list(client.batches.list_all(prefetch=prefetch))
+
+            assert len(pages) == PAGES
+            assert _ids(items) == EXPECTED_IDS
+            assert server.cursors == [0, 1, 2] * 2
+
+    def test_async_cursor_is_followed_until_exhausted(self) -> None:
+        async def collect(client, prefetch):
+            pages = [page async for page in client.batches.iter_pages_async(prefetch=prefetch)]
+            items = [item async for item in client.batches.list_all_async(prefetch=prefetch)]
+            return pages, items
+
+        for prefetch in (False, True):
+            server = _AsyncServer()
+            client = _client(async_server=server)
+
+            pages, items = asyncio.run(collect(client, prefetch))
+
+            assert len(pages) == PAGES
+            assert _ids(items) == EXPECTED_IDS
+            assert server.cursors == [0, 1, 2] * 2
+
+    def test_stopping_early_does_not_wait_for_the_prefetch(self) -> None:
+        server = _Server(hold=True)
+        client = _client(server)
+
+        pages = client.batches.iter_pages(prefetch=True)
+        next(pages)
+        # Wait for the prefetch thread to send its request
+        deadline = time.monotonic() + 1
+        while len(server.cursors) < 2 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        start = time.monotonic()
+        pages.close()
+        elapsed = time.monotonic() - start
+        server.release.set()
+
+        assert elapsed < 1
+        assert server.cursors == [0, 1]
+
+    def test_stopping_early_cancels_the_prefetch_task(self) -> None:
+        server = _AsyncServer(hold=True)
+        client = _client(async_server=server)
+
+        async def first_page():
+            pages = client.batches.iter_pages_async(prefetch=True)
+            await pages.__anext__()
+            # Let the prefetch task send its request
+            await asyncio.sleep(0.05)
+            await pages.aclose()
+            await asyncio.sleep(0)
+
+        asyncio.run(first_page())
+
+        assert server.cursors == [0, 1]
+        assert server.cancelled
+
+    def test_helpers_are_only_on_paginated_resources(self) -> None:
+        client = _client()
+
+        for name in ("runs", "units", "parts", "batches", "procedures", "stations"):
+            assert callable(getattr(client, name).list_all)
+        for name in ("attachments", "user"):
+            assert not hasattr(getattr(client, name), "list_all")
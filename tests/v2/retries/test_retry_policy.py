@@ -0,0 +1,157 @@
+"""Offline checks of the retry policy: Retry-After, jitter, budget and idempotency."""
+
+import time
+from typing import List, Tuple
+
+import httpx
+
+from tofupilot.v2 import TofuPilot
+from tofupilot.v2.utils import BackoffStrategy, RetryBudget, RetryConfig
+from tofupilot.v2.utils.retries import (
+    DECORRELATED_JITTER,
+    Retries,
+    parse_retry_after,
+)
+
+STATUS_CODES = ["429", "500", "502", "503", "504"]
+
+
+def _config(**kwargs) -> RetryConfig:
+    return RetryConfig("backoff", BackoffStrategy(10, 100, 1.5, 5000), True, **kwargs)
+
+
+def _client(responses: List[Tuple[int, dict]], calls: list) -> TofuPilot:
+    """A client answering with `responses` in order, repeating the last one."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append((request.method, request.headers.get("Idempotency-Key")))
+        status_code, headers = responses.pop(0) if len(responses) > 1 else responses[0]
+        if status_code != 200:
+            return httpx.Response(status_code, headers=headers, json={"message": "error"})
+        if request.method == "POST":
+            return httpx.Response(200, json={"id": "run-id"})
+        return httpx.Response(200, json={"data": [], "meta": {"has_more": False, "next_cursor": None}})
+
+    return TofuPilot(
+        api_key="k" * 20,
+        server_url="http://tofupilot.test/api",
+        client=httpx.Client(transport=httpx.MockTransport(handler)),
+        retry_config=_config(),
+    )
+
+
+def _create_run(client: TofuPilot):
+    return client.runs.create(
+        serial_number="SN-RETRY",
+        procedure_id="00000000-0000-0000-0000-000000000000",
+        started_at="2025-01-01T00:00:00Z",
+        ended_at="2025-01-01T00:01:00Z",
+        outcome="PASS",
+    )
+
+
+class TestRetryPolicy:
+    def test_parse_retry_after(self):
+        assert parse_retry_after("2.5") == 2.5
+        assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+        assert parse_retry_after("soon") is None
+        assert parse_retry_after(None) is None
+
+    def test_full_jitter_is_bounded(self):
+        retries = Retries(_config(), STATUS_CODES)
+        for attempt in range(10):
+            assert 0 <= retries.next_sleep(attempt, 0) <= 0.1
+
+    def test_decorrelated_jitter_is_bounded(self):
+        retries = Retries(_config(jitter=DECORRELATED_JITTER), STATUS_CODES)
+        for attempt in range(10):
+            assert 0.01 <= retries.next_sleep(attempt, 0) <= 0.1
+
+    def test_retry_after_is_honored(self):
+        retries = Retries(_config(), STATUS_CODES)
+        assert retries.next_sleep(0, 0, {"retry-after": "3"}) == 3
+
+    def test_gives_up_past_max_elapsed_time(self):
+        retries = Retries(_config(), STATUS_CODES)
+        assert retries.next_sleep(0, 0, {"retry-after": "10"}) is None
+
+    def test_budget_bounds_retries(self):
+        calls = []
+        client = _client([(503, {})], calls)
+        client.sdk_configuration.retry_budget = RetryBudget(capacity=2)
+
+        try:
+            client.runs.list()
+        except Exception:  # pylint: disable=broad-except
+            pass
+
+        # The first attempt, then one retry per token
+        assert len(calls) == 3
+
+    def test_idempotent_request_is_retried(self):
+        calls = []
+        client = _client([(503, {}), (200, {})], calls)
+
+        client.runs.list()
+
+        assert calls == [("GET", None), ("GET", None)]
+
+    def test_unkeyed_post_is_only_retried_when_rate_limited(self):
+        retries = Retries(_config(), STATUS_CODES, idempotent=False)
+
+        assert retries.retries_status(429)
+        assert not retries.retries_status(503)
+
+    def test_create_is_retried_with_the_same_key(self):
+        calls = []
+        client = _client([(503, {}), (200, {})], calls)
+
+        run = _create_run(client)
+
+        assert run.id == "run-id"
+        assert len(calls) == 2
+        assert calls[0][1] is not None
+        assert calls[0] == calls[1]
+
+    def test_each_call_has_its_own_key(self):
+        calls = []
+        client = _client([(200, {})], calls)
+
+        _create_run(client)
+        _create_run(client)
+        client.runs.create(
+            serial_number="SN-OTHER",
+            procedure_id="00000000-0000-0000-0000-000000000000",
+            started_at="2025-01-01T00:00:00Z",
+            ended_at="2025-01-01T00:01:00Z",
+            outcome="PASS",
+        )
+
+        keys = {key for _, key in calls}
+        assert len(keys) == 3 and None not in keys
+
+    def test_caller_key_is_kept(self):
+        calls = []
+        client = _client([(200, {})], calls)
+
+        client.runs.create(
+            serial_number="SN-RETRY",
+            procedure_id="00000000-0000-0000-0000-000000000000",
+            started_at="2025-01-01T00:00:00Z",
+            ended_at="2025-01-01T00:01:00Z",
+            outcome="PASS",
+            http_headers={"Idempotency-Key": "station-1-run-42"},
+        )
+
+        assert calls == [("POST", "station-1-run-42")]
+
+    def test_create_is_retried_when_rate_limited(self):
+        calls = []
+        client = _client([(429, {"Retry-After": "0.1"}), (200, {})], calls)
+
+        start = time.monotonic()
+        run = _create_run(client)
+
+        assert run.id == "run-id"
+        assert [method for method, _ in calls] == ["POST", "POST"]
+        assert time.monotonic() - start >= 0.1
@@ -0,0 +1,73 @@
+"""Test bulk run creation with runs.create_many."""
+
+import asyncio
+import uuid
+
+from tofupilot.v2 import TofuPilot, models
+from ...utils import assert_create_run_success, get_random_test_dates
+
+
+def _runs(procedure_id: str, uid: str, count: int):
+    for i in range(count):
+        started_at, ended_at = get_random_test_dates()
+        yield models.RunCreateRequest(
+            serial_number=f"SN-BULK-{i}-{uid}",
+            procedure_id=procedure_id,
+            part_number=f"PART-BULK-{uid}",
+            started_at=started_at,
+            ended_at=ended_at,
+            outcome="PASS",
+        )
+
+
+class TestCreateMany:
+    def test_create_many(self, client: TofuPilot, procedure_id: str):
+        """All runs are created and reported in input order, with progress."""
+        uid = str(uuid.uuid4())[:8]
+        progress = []
+
+        results = client.runs.create_many(
+            _runs(procedure_id, uid, 10),
+            concurrency=4,
+            on_progress=lambda result, completed: progress.append(completed),
+        )
+
+        assert [result.index for result in results] == list(range(10))
+        assert all(result.success for result in results)
+        for result in results:
+            assert_create_run_success(result.response)
+        assert sorted(progress) == list(range(1, 11))
+
+        listed = client.runs.list(part_numbers=[f"PART-BULK-{uid}"], limit=20)
+        assert len(listed.data) == 10
+
+    def test_create_many_reports_failures(self, client: TofuPilot, procedure_id: str):
+        """A failing run does not prevent the others from being created."""
+        uid = str(uuid.uuid4())[:8]
+        started_at, ended_at = get_random_test_dates()
+        runs = list(_runs(procedure_id, uid, 2))
+        runs.insert(
+            1,
+            {
+                "serial_number": f"SN-BULK-BAD-{uid}",
+                "procedure_id": "00000000-0000-0000-0000-000000000000",
+                "started_at": started_at,
+                "ended_at": ended_at,
+                "outcome": "PASS",
+            },
+        )
+
+        results = client.runs.create_many(runs, concurrency=2)
+
+        assert [result.success for result in results] == [True, False, True]
+        assert results[1].error is not None
+
+    def test_create_many_async(self, client: TofuPilot, procedure_id: str):
+        """The async variant creates all runs."""
+        uid = str(uuid.uuid4())[:8]
+
+        results = asyncio.run(
+            client.runs.create_many_async(_runs(procedure_id, uid, 5), concurrency=3)
+        )
+
+        assert all(result.success for result in results)
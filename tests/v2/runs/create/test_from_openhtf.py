@@ -0,0 +1,90 @@
+"""Test creating runs from OpenHTF test records with the v2 converter."""
+
+import uuid
+
+import openhtf as htf
+from openhtf.util import units
+from tofupilot.openhtf import create_run, to_run_create_request
+from tofupilot.v2 import TofuPilot
+
+# The conversion is offline and never looks the procedure up
+PROCEDURE_ID = "FVT1"
+
+
+@htf.measures(
+    htf.Measurement("voltage").with_units(units.VOLT).in_range(3.1, 3.5),
+    htf.Measurement("firmware_version").equals("1.4.3"),
+    htf.Measurement("current_over_time")
+    .with_dimensions(units.SECOND, units.VOLT)
+    .with_units(units.AMPERE),
+)
+def measure_phase(test):
+    """Measure the power supply."""
+    test.logger.info("Measuring power supply")
+    test.measurements.voltage = 3.3
+    test.measurements.firmware_version = "1.4.3"
+    for t in range(10):
+        test.measurements.current_over_time[t / 10, 3.3] = 0.5 + t / 100
+
+
+def _execute(serial_number: str, procedure_id: str, *callbacks, **metadata):
+    records = []
+    test = htf.Test(measure_phase, procedure_id=procedure_id, **metadata)
+    test.add_output_callbacks(records.append, *callbacks)
+    test.execute(lambda: serial_number)
+    return records[0]
+
+
+def test_to_run_create_request():
+    """Phases, measurements and logs are mapped onto the v2 request."""
+    uid = str(uuid.uuid4())[:8]
+    record = _execute(f"SN-HTF-{uid}", PROCEDURE_ID)
+
+    request = to_run_create_request(record, part_number=f"PART-HTF-{uid}")
+
+    assert request.outcome == "PASS"
+    assert request.procedure_id == PROCEDURE_ID
+    assert request.serial_number == f"SN-HTF-{uid}"
+    assert request.part_number == f"PART-HTF-{uid}"
+    assert request.logs
+
+    phase = request.phases[-1]
+    assert phase.name == "measure_phase"
+
+    voltage, firmware_version, current_over_time = phase.measurements
+    assert voltage.measured_value == 3.3
+    assert voltage.units == "V"
+    assert voltage.validators[0].operator == "range"
+    assert voltage.validators[0].expected_value == [3.1, 3.5]
+    assert firmware_version.measured_value == "1.4.3"
+    assert current_over_time.x_axis.units == "s"
+    assert len(current_over_time.x_axis.data) == 10
+    assert [axis.units for axis in current_over_time.y_axis] == ["V", "A"]
+
+
+def test_sub_units_are_mapped_to_serial_numbers():
+    """Sub-units given as v1 style dicts are sent as their serial numbers."""
+    record = _execute(
+        "SN-HTF-MAIN",
+        PROCEDURE_ID,
+        sub_units=[{"serial_number": "SN-HTF-SUB-1"}, "SN-HTF-SUB-2"],
+    )
+
+    request = to_run_create_request(record)
+
+    assert request.sub_units == ["SN-HTF-SUB-1", "SN-HTF-SUB-2"]
+
+
+def test_create_run_callback(client: TofuPilot, procedure_id: str):
+    """The output callback creates the run with a single runs.create call."""
+    uid = str(uuid.uuid4())[:8]
+    callback = create_run(client=client, part_number=f"PART-HTF-{uid}")
+    run_ids = []
+
+    _execute(f"SN-HTF-{uid}", procedure_id, lambda record: run_ids.append(callback(record)))
+
+    assert run_ids[0]
+    run = client.runs.get(id=run_ids[0])
+    assert run.phases is not None
+    assert "measure_phase" in [phase.name for phase in run.phases]
+
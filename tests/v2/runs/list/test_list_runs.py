@@ -1,5 +1,6 @@
 """Test runs list filtering, pagination, and sorting."""
 
+import asyncio
 import uuid
 from datetime import datetime, timedelta, timezone
 
@@ -512,3 +513,40 @@ class TestListRuns:
         assert_get_runs_success(result)
         result_ids = [r.id for r in result.data]
         assert create_result.id in result_ids
+
+    @pytest.mark.parametrize("prefetch", [False, True])
+    def test_list_all(self, client: TofuPilot, procedure_id: str, prefetch: bool) -> None:
+        """Test list_all follows the cursor across pages."""
+        unique_id = str(uuid.uuid4())[:8]
+        part_number = f"PART-ALL-{unique_id}"
+
+        run_ids = []
+        for i in range(3):
+            started_at, ended_at = get_random_test_dates()
+            result = client.runs.create(
+                serial_number=f"SN-ALL-{i}-{unique_id}",
+                procedure_id=procedure_id,
+                part_number=part_number,
+                started_at=started_at,
+                outcome="PASS",
+                ended_at=ended_at,
+            )
+            assert_create_run_success(result)
+            run_ids.append(result.id)
+
+        pages = list(client.runs.iter_pages(part_numbers=[part_number], limit=1, prefetch=prefetch))
+        assert len(pages) == 3
+        assert pages[-1].meta.has_more is False
+
+        runs = list(client.runs.list_all(part_numbers=[part_number], limit=1, prefetch=prefetch))
+        assert sorted(run.id for run in runs) == sorted(run_ids)
+
+        async def list_all_async():
+            return [
+                run.id
+                async for run in client.runs.list_all_async(
+                    part_numbers=[part_number], limit=1, prefetch=prefetch
+                )
+            ]
+
+        assert sorted(asyncio.run(list_all_async())) == sorted(run_ids)
@@ -0,0 +1,100 @@
+"""Micro-benchmark and correctness checks for the cached (un)marshaller models."""
+
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Callable
+
+from tofupilot.v2 import models
+from tofupilot.v2.utils import serializers
+from tofupilot.v2.utils.serializers import (
+    clear_body_model_cache,
+    marshal_json,
+    unmarshal_json,
+)
+
+ITERATIONS = 200
+
+
+def _make_request() -> models.RunCreateRequest:
+    started_at = datetime(2025, 1, 1, tzinfo=timezone.utc)
+    return models.RunCreateRequest(
+        outcome="PASS",
+        procedure_id="proc-id",
+        started_at=started_at,
+        ended_at=started_at + timedelta(minutes=1),
+        serial_number="SN-BENCH",
+        phases=[
+            models.RunCreatePhase(
+                name=f"phase_{i}",
+                outcome="PASS",
+                started_at=started_at,
+                ended_at=started_at + timedelta(seconds=1),
+                measurements=[
+                    models.RunCreateMeasurement(
+                        name="voltage", outcome="PASS", measured_value=3.3
+                    )
+                ],
+            )
+            for i in range(5)
+        ],
+    )
+
+
+def _per_call_us(func: Callable[[], object]) -> float:
+    start = time.perf_counter()
+    for _ in range(ITERATIONS):
+        func()
+    return (time.perf_counter() - start) / ITERATIONS * 1e6
+
+
+class TestBodyModelCache:
+    """The wrapper model for a given type is compiled once and reused."""
+
+    def test_marshaller_is_reused(self) -> None:
+        clear_body_model_cache()
+        first = serializers._get_body_model("Marshaller", models.RunCreateRequest)
+        second = serializers._get_body_model("Marshaller", models.RunCreateRequest)
+        assert first is second
+
+    def test_cached_output_matches_uncached(self) -> None:
+        request = _make_request()
+        clear_body_model_cache()
+        cold = marshal_json(request, models.RunCreateRequest)
+        warm = marshal_json(request, models.RunCreateRequest)
+        assert cold == warm
+
+        response = unmarshal_json('{"id": "run-id"}', models.RunCreateResponse)
+        assert response.id == "run-id"
+
+    def test_benchmark_marshal_json(self) -> None:
+        """Compares per-call cost with a cold cache (previous behaviour) and a warm cache."""
+        request = _make_request()
+
+        def cold() -> object:
+            clear_body_model_cache()
+            return marshal_json(request, models.RunCreateRequest)
+
+        def warm() -> object:
+            return marshal_json(request, models.RunCreateRequest)
+
+        before = _per_call_us(cold)
+        warm()
+        after = _per_call_us(warm)
+        print(f"\nmarshal_json: {before:.1f}us/call uncached, {after:.1f}us/call cached")
+        assert after < before
+
+    def test_benchmark_unmarshal_json(self) -> None:
+        raw = '{"id": "run-id"}'
+
+        def cold() -> object:
+            clear_body_model_cache()
+            return unmarshal_json(raw, models.RunCreateResponse)
+
+        def warm() -> object:
+            return unmarshal_json(raw, models.RunCreateResponse)
+
+        before = _per_call_us(cold)
+        warm()
+        after = _per_call_us(warm)
+        print(f"\nunmarshal_json: {before:.1f}us/call uncached, {after:.1f}us/call cached")
+        assert after < before
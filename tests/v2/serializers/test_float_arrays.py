@@ -0,0 +1,77 @@
+"""Checks of measurement axes given as buffers instead of lists of floats."""
+
+import array
+import json
+import math
+
+import pytest
+from pydantic import ValidationError
+
+from tofupilot.v2 import models
+from tofupilot.v2.utils.serializers import marshal_json
+
+
+def _dumped_data(axis) -> list:
+    return json.loads(marshal_json(axis, models.XAxis))["data"]
+
+
+class TestFloatArrays:
+    def test_list_is_kept(self) -> None:
+        axis = models.XAxis(data=[1, 2.5])
+
+        assert axis.data == [1.0, 2.5]
+        assert _dumped_data(axis) == [1.0, 2.5]
+
+    def test_float_buffer_is_not_copied_element_wise(self) -> None:
+        data = array.array("d", [0.5, 1.5, 2.5])
+        axis = models.YAxi(data=data)
+
+        assert axis.data is data
+        assert json.loads(marshal_json(axis, models.YAxi))["data"] == [0.5, 1.5, 2.5]
+
+    @pytest.mark.parametrize("typecode", ["f", "i", "q", "B"])
+    def test_numeric_buffers_are_converted(self, typecode: str) -> None:
+        axis = models.XAxis(data=memoryview(array.array(typecode, [1, 2, 3])))
+
+        assert axis.data == array.array("d", [1.0, 2.0, 3.0])
+        assert _dumped_data(axis) == [1.0, 2.0, 3.0]
+
+    def test_non_contiguous_buffer(self) -> None:
+        data = memoryview(array.array("d", range(10)))[::2]
+
+        assert _dumped_data(models.XAxis(data=data)) == [0.0, 2.0, 4.0, 6.0, 8.0]
+
+    def test_non_finite_values_are_null(self) -> None:
+        data = array.array("d", [1.0, math.nan, math.inf])
+
+        assert _dumped_data(models.XAxis(data=data)) == [1.0, None, None]
+
+    def test_multidimensional_buffer_is_rejected(self) -> None:
+        data = memoryview(array.array("d", range(6))).cast("B").cast("d", (2, 3))
+
+        with pytest.raises(ValidationError):
+            models.XAxis(data=data)
+
+    def test_non_numeric_input_is_rejected(self) -> None:
+        with pytest.raises(ValidationError):
+            models.XAxis(data=b"abc")
+        with pytest.raises(ValidationError):
+            models.XAxis(data="1,2,3")
+
+    def test_request_from_dict(self) -> None:
+        measurement = models.RunCreateMeasurement(
+            name="waveform",
+            outcome="PASS",
+            x_axis={"data": array.array("d", [0.0, 0.1]), "units": "s"},
+            y_axis=[{"data": array.array("f", [1.0, 2.0]), "units": "V"}],
+        )
+
+        dumped = json.loads(marshal_json(measurement, models.RunCreateMeasurement))
+        assert dumped["x_axis"] == {"data": [0.0, 0.1], "units": "s"}
+        assert dumped["y_axis"] == [{"data": [1.0, 2.0], "units": "V"}]
+
+    def test_python_mode_dump_returns_lists(self) -> None:
+        axis = models.XAxis(data=array.array("d", [0.5, 1.5]), units="s")
+
+        assert axis.model_dump()["data"] == [0.5, 1.5]
+        assert type(axis.model_dump()["data"]) is list
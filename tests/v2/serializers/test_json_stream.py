@@ -0,0 +1,155 @@
+"""Checks of run bodies streamed phase by phase."""
+
+import asyncio
+import gzip
+import json
+import tracemalloc
+from datetime import datetime, timedelta, timezone
+
+import httpx
+
+from tofupilot.v2 import TofuPilot, models
+from tofupilot.v2.utils import BackoffStrategy, CompressionConfig, RetryConfig
+from tofupilot.v2.utils.serializers import marshal_json
+from tofupilot.v2.utils.streaming import JsonStream
+
+STARTED_AT = datetime(2025, 1, 1, tzinfo=timezone.utc)
+STREAMED_FIELDS = {"phases": models.RunCreatePhase, "logs": models.RunCreateLog}
+
+
+def _phase(index: int) -> models.RunCreatePhase:
+    return models.RunCreatePhase(
+        name=f"phase_{index}",
+        outcome="PASS",
+        started_at=STARTED_AT,
+        ended_at=STARTED_AT + timedelta(seconds=1),
+        measurements=[
+            models.RunCreateMeasurement(
+                name=f"waveform_{i}",
+                outcome="PASS",
+                x_axis=models.XAxis(data=[float(x) for x in range(1000)], units="s"),
+            )
+            for i in range(5)
+        ],
+    )
+
+
+def _run_fields(phases: int = 20, logs: int = 500) -> dict:
+    return {
+        "outcome": "PASS",
+        "procedure_id": "proc-id",
+        "started_at": STARTED_AT,
+        "ended_at": STARTED_AT + timedelta(minutes=1),
+        "serial_number": "SN-STREAM",
+        "phases": [_phase(i) for i in range(phases)],
+        "logs": [
+            models.RunCreateLog(
+                level="INFO",
+                timestamp=STARTED_AT,
+                message=f"Step {i}",
+                source_file="test.py",
+                line_number=i,
+            )
+            for i in range(logs)
+        ],
+    }
+
+
+def _stream(request: models.RunCreateRequest) -> JsonStream:
+    return JsonStream(request, models.RunCreateRequest, STREAMED_FIELDS)
+
+
+def _client(handler, **kwargs) -> TofuPilot:
+    return TofuPilot(
+        api_key="k" * 20,
+        server_url="http://tofupilot.test/api",
+        client=httpx.Client(transport=httpx.MockTransport(handler)),
+        async_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+        stream_request_bodies=True,
+        **kwargs,
+    )
+
+
+class TestJsonStream:
+    def test_matches_marshal_json(self) -> None:
+        request = models.RunCreateRequest(**_run_fields())
+
+        streamed = b"".join(_stream(request))
+
+        assert json.loads(streamed) == json.loads(
+            marshal_json(request, models.RunCreateRequest)
+        )
+
+    def test_unset_lists_are_left_out(self) -> None:
+        fields = _run_fields()
+        del fields["phases"], fields["logs"]
+        request = models.RunCreateRequest(**fields)
+
+        streamed = json.loads(b"".join(_stream(request)))
+
+        assert "phases" not in streamed and "logs" not in streamed
+        assert streamed["serial_number"] == "SN-STREAM"
+
+    def test_empty_lists_are_kept(self) -> None:
+        request = models.RunCreateRequest(**_run_fields(phases=0, logs=0))
+
+        streamed = json.loads(b"".join(_stream(request)))
+
+        assert streamed["phases"] == [] and streamed["logs"] == []
+
+    def test_peak_memory_is_bounded_by_a_phase(self) -> None:
+        request = models.RunCreateRequest(**_run_fields(phases=50))
+
+        tracemalloc.start()
+        marshal_json(request, models.RunCreateRequest)
+        whole = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+
+        tracemalloc.start()
+        for _ in _stream(request):
+            pass
+        streamed = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+
+        assert streamed * 10 < whole
+
+    def test_create_sends_a_chunked_body(self) -> None:
+        bodies = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            bodies.append((request.headers, request.read()))
+            return httpx.Response(200, json={"id": "run-id"})
+
+        client = _client(handler, compression=CompressionConfig())
+        client.runs.create(**_run_fields())
+        asyncio.run(client.runs.create_async(**_run_fields()))
+
+        expected = json.loads(
+            marshal_json(
+                models.RunCreateRequest(**_run_fields()), models.RunCreateRequest
+            )
+        )
+        for headers, body in bodies:
+            assert headers["transfer-encoding"] == "chunked"
+            assert headers["content-encoding"] == "gzip"
+            assert json.loads(gzip.decompress(body)) == expected
+
+    def test_streamed_body_is_retried(self) -> None:
+        bodies = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            bodies.append(request.read())
+            if len(bodies) == 1:
+                return httpx.Response(503, json={"message": "unavailable"})
+            return httpx.Response(200, json={"id": "run-id"})
+
+        client = _client(
+            handler,
+            retry_config=RetryConfig(
+                "backoff", BackoffStrategy(10, 100, 1.5, 5000), True
+            ),
+        )
+        run = client.runs.create(**_run_fields(phases=2))
+
+        assert run.id == "run-id"
+        assert len(bodies) == 2 and bodies[0] == bodies[1]
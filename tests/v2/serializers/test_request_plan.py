@@ -0,0 +1,44 @@
+"""Checks of the per-class plans used to build request URLs and headers."""
+
+from datetime import datetime, timezone
+
+from tofupilot.v2 import models, utils
+from tofupilot.v2.utils.requestplan import request_plan
+
+
+class TestRequestPlan:
+    def test_plan_is_built_once_per_class(self) -> None:
+        assert request_plan(models.RunListRequest) is request_plan(
+            models.RunListRequest
+        )
+
+    def test_plan_sorts_fields_by_location(self) -> None:
+        plan = request_plan(models.RunGetRequest)
+
+        assert [name for name, *_ in plan.path_params] == ["id"]
+        assert plan.query_params == () and plan.headers == ()
+
+    def test_query_params_keep_their_style(self) -> None:
+        request = models.RunListRequest(
+            search_query="x y",
+            ids=["a", "b"],
+            started_after=datetime(2025, 1, 1, tzinfo=timezone.utc),
+            limit=5,
+        )
+
+        params = utils.get_query_params(request)
+
+        assert params["ids"] == ["a", "b"]
+        assert params["search_query"] == ["x y"]
+        assert params["started_after"] == ["2025-01-01T00:00:00Z"]
+        assert params["limit"] == ["5"]
+        assert "outcomes" not in params
+
+    def test_path_params_are_filled_in(self) -> None:
+        url = utils.generate_url(
+            "http://tofupilot.test/api/",
+            "/v2/runs/{id}",
+            models.RunGetRequest(id="run-id"),
+        )
+
+        assert url == "http://tofupilot.test/api/v2/runs/run-id"
@@ -0,0 +1,68 @@
+"""Checks that generated models keep their UNSET/null semantics when serialized."""
+
+import json
+from datetime import datetime, timezone
+
+from tofupilot.v2 import models
+from tofupilot.v2.utils.serializers import marshal_json
+
+STARTED_AT = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+
+def _phase(**kwargs) -> models.RunCreatePhase:
+    return models.RunCreatePhase(
+        name="phase",
+        outcome="PASS",
+        started_at=STARTED_AT,
+        ended_at=STARTED_AT,
+        **kwargs,
+    )
+
+
+class TestSerializeFields:
+    def test_unset_optional_fields_are_left_out(self) -> None:
+        axis = models.XAxis(data=[1.0])
+
+        assert axis.model_dump() == {"data": [1.0]}
+
+    def test_optional_nullable_field_set_to_null_is_kept(self) -> None:
+        axis = models.XAxis(data=[1.0], units=None)
+
+        assert axis.model_dump() == {"data": [1.0], "units": None}
+
+    def test_required_nullable_field_is_kept(self) -> None:
+        user = models.UserListResponse.model_validate(
+            {
+                "id": "user-id",
+                "email": "a@b.c",
+                "name": None,
+                "image": None,
+                "banned": False,
+            }
+        )
+
+        assert user.model_dump()["name"] is None
+
+    def test_scalar_default_is_kept(self) -> None:
+        phase = _phase()
+
+        assert phase.model_dump(mode="json")["retry_count"] == 0
+        assert phase.model_dump(mode="json", exclude_unset=True)["retry_count"] == 0
+        assert json.loads(marshal_json(phase, models.RunCreatePhase))["retry_count"] == 0
+
+    def test_scalar_field_set_to_null_is_left_out(self) -> None:
+        assert "retry_count" not in _phase(retry_count=None).model_dump()
+
+    def test_marshal_json_matches_full_dump(self) -> None:
+        measurement = models.RunCreateMeasurement(
+            name="voltage",
+            outcome="PASS",
+            measured_value=3.3,
+            units=None,
+            validators=[models.RunCreateValidator(operator=">=", expected_value=3.0)],
+        )
+
+        dumped = measurement.model_dump(by_alias=True, mode="json", exclude_none=True)
+        assert json.loads(
+            marshal_json(measurement, models.RunCreateMeasurement)
+        ) == dumped
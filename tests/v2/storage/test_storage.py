@@ -0,0 +1,196 @@
+"""Offline checks of attachment transfers through the SDK's storage client."""
+
+import asyncio
+import hashlib
+from types import SimpleNamespace
+
+import httpx
+import pytest
+
+from tofupilot.v2 import TofuPilot, errors
+from tofupilot.v2.utils import BackoffStrategy, RetryConfig, StorageClient
+
+CONTENT = b"0123456789" * 300_000
+UPLOAD_URL = "https://storage.test/bucket/file.bin?X-Amz-Signature=abc"
+RETRY_CONFIG = RetryConfig("backoff", BackoffStrategy(1, 10, 1.5, 5000), True)
+
+
+def _etag(content: bytes) -> str:
+    return f'"{hashlib.md5(content).hexdigest()}"'
+
+
+class _Storage:
+    """Mock storage host, failing the first `failures` requests with a 503."""
+
+    def __init__(
+        self, failures: int = 0, etag: str = _etag(CONTENT), ranges: bool = True
+    ):
+        self.failures = failures
+        self.etag = etag
+        self.ranges = ranges
+        self.requests = []
+        self.bodies = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        self.bodies.append(request.read())
+        if len(self.requests) <= self.failures:
+            return httpx.Response(503, text="Slow Down")
+        if request.method == "PUT":
+            return httpx.Response(200, headers={"ETag": self.etag})
+
+        if self.ranges and "range" in request.headers:
+            start = int(request.headers["range"][len("bytes="):-1])
+            return httpx.Response(
+                206, headers={"ETag": self.etag}, content=CONTENT[start:]
+            )
+        return httpx.Response(200, headers={"ETag": self.etag}, content=CONTENT)
+
+
+def _storage_client(storage: _Storage, **kwargs) -> StorageClient:
+    return StorageClient(
+        retry_config=RETRY_CONFIG,
+        client=httpx.Client(transport=httpx.MockTransport(storage)),
+        async_client=httpx.AsyncClient(transport=httpx.MockTransport(storage)),
+        **kwargs,
+    )
+
+
+@pytest.fixture
+def file(tmp_path):
+    path = tmp_path / "file.bin"
+    path.write_bytes(CONTENT)
+    return path
+
+
+class TestStorageClient:
+    def test_upload_is_retried_with_the_whole_file(self, file) -> None:
+        storage = _Storage(failures=2)
+
+        _storage_client(storage).upload(UPLOAD_URL, file, "application/octet-stream")
+
+        assert [r.method for r in storage.requests] == ["PUT"] * 3
+        assert storage.bodies == [CONTENT] * 3
+        assert storage.requests[-1].headers["content-length"] == str(len(CONTENT))
+
+    def test_upload_checksum_mismatch_raises(self, file) -> None:
+        storage = _Storage(etag=_etag(b"something else"))
+
+        with pytest.raises(errors.ChecksumMismatchError) as e:
+            _storage_client(storage).upload(UPLOAD_URL, file, "text/plain")
+        assert "X-Amz-Signature" not in str(e.value)
+
+        _storage_client(storage, verify_checksums=False).upload(
+            UPLOAD_URL, file, "text/plain"
+        )
+
+    def test_multipart_etag_is_not_checked(self, file) -> None:
+        storage = _Storage(etag='"9b2cf535f27731c974343645a3985328-2"')
+
+        _storage_client(storage).upload(UPLOAD_URL, file, "text/plain")
+
+    def test_download_is_retried_and_verified(self, tmp_path) -> None:
+        storage = _Storage(failures=1)
+        dest = tmp_path / "download.bin"
+
+        _storage_client(storage).download(UPLOAD_URL, dest)
+
+        assert dest.read_bytes() == CONTENT
+        assert len(storage.requests) == 2
+
+    def test_resumed_download_is_verified_with_the_kept_bytes(self, tmp_path) -> None:
+        dest = tmp_path / "download.bin"
+        dest.write_bytes(CONTENT[:1000])
+
+        _storage_client(_Storage()).download(UPLOAD_URL, dest, offset=1000)
+        assert dest.read_bytes() == CONTENT
+
+        dest.write_bytes(b"x" * 1000)
+        with pytest.raises(errors.ChecksumMismatchError):
+            _storage_client(_Storage()).download(UPLOAD_URL, dest, offset=1000)
+
+    def test_download_resumes_with_a_range_request(self, tmp_path) -> None:
+        storage = _Storage()
+        dest = tmp_path / "download.bin"
+        dest.write_bytes(CONTENT[:1000])
+
+        _storage_client(storage).download(UPLOAD_URL, dest, offset=1000)
+
+        assert storage.requests[0].headers["range"] == "bytes=1000-"
+        assert dest.read_bytes() == CONTENT
+
+    def test_ignored_range_falls_back_to_a_full_download(self, tmp_path) -> None:
+        dest = tmp_path / "download.bin"
+        dest.write_bytes(b"x" * 1000)
+
+        _storage_client(_Storage(ranges=False)).download(UPLOAD_URL, dest, offset=1000)
+
+        assert dest.read_bytes() == CONTENT
+
+    def test_async_transfers_share_the_client(self, file, tmp_path) -> None:
+        storage = _Storage(failures=1)
+        client = _storage_client(storage)
+        async_client = client.async_client
+
+        async def transfer():
+            await asyncio.gather(
+                *(client.upload_async(UPLOAD_URL, file, "text/plain") for _ in range(3))
+            )
+            await client.download_async(UPLOAD_URL, tmp_path / "download.bin")
+
+        asyncio.run(transfer())
+
+        assert storage.bodies[1:4] == [CONTENT] * 3
+        assert (tmp_path / "download.bin").read_bytes() == CONTENT
+        assert client.async_client is async_client
+
+    def test_created_clients_are_reused_until_closed(self) -> None:
+        client = StorageClient()
+
+        # pylint: disable=protected-access
+        created = client._client()
+        assert client._client() is created
+
+        client.close()
+        assert created.is_closed and client.client is None
+
+    def test_close_in_a_running_loop_closes_the_async_client(self) -> None:
+        client = StorageClient()
+
+        async def use_and_close():
+            # pylint: disable=protected-access
+            created = client._async_client()
+            client.close()
+            assert client.async_client is None
+            await asyncio.gather(*client._closing)
+            return created
+
+        created = asyncio.run(use_and_close())
+
+        assert created.is_closed
+        assert not client._closing  # pylint: disable=protected-access
+
+
+class TestAttachmentTransfers:
+    def test_upload_and_download_use_the_storage_client(self, file, tmp_path) -> None:
+        storage = _Storage(failures=1)
+
+        def api(request: httpx.Request) -> httpx.Response:
+            if request.url.path.endswith("/finalize"):
+                return httpx.Response(200, json={"url": UPLOAD_URL})
+            return httpx.Response(200, json={"id": "upload-id", "upload_url": UPLOAD_URL})
+
+        client = TofuPilot(
+            api_key="k" * 20,
+            server_url="http://tofupilot.test/api",
+            client=httpx.Client(transport=httpx.MockTransport(api)),
+            storage=_storage_client(storage),
+        )
+        attachment = SimpleNamespace(name="file.bin", download_url=UPLOAD_URL)
+
+        assert client.attachments.upload(file) == "upload-id"
+        client.attachments.download(attachment, tmp_path / "download.bin")
+
+        assert [r.method for r in storage.requests] == ["PUT", "PUT", "GET"]
+        assert "authorization" not in storage.requests[0].headers
+        assert (tmp_path / "download.bin").read_bytes() == CONTENT
@@ -0,0 +1,112 @@
+"""Offline checks of the transport configuration of the clients."""
+
+import asyncio
+from datetime import datetime, timezone
+
+import httpx
+import pytest
+
+from tofupilot.v2 import TofuPilot, errors
+from tofupilot.v2.utils import Timeouts, TransportConfig
+
+STARTED_AT = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+TRANSPORT = TransportConfig(
+    max_connections=50,
+    max_keepalive_connections=10,
+    keepalive_expiry_ms=30_000,
+    timeouts=Timeouts(connect_ms=5_000, read_ms=30_000, write_ms=30_000),
+    operation_timeouts={
+        "run-create": Timeouts(write_ms=300_000),
+        "station-getCurrent": Timeouts(read_ms=2_000),
+    },
+)
+
+
+class _Server:
+    """Mock transport recording the timeouts of the requests it receives."""
+
+    def __init__(self):
+        self.timeouts = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.timeouts.append(request.extensions["timeout"])
+        if request.method == "POST":
+            return httpx.Response(200, json={"id": "run-id"})
+        if request.url.path.endswith("/runs"):
+            return httpx.Response(
+                200, json={"data": [], "meta": {"has_more": False, "next_cursor": None}}
+            )
+        return httpx.Response(403, json={"message": "Forbidden", "code": "FORBIDDEN"})
+
+
+def _client(server: _Server, **kwargs) -> TofuPilot:
+    return TofuPilot(
+        api_key="k" * 20,
+        server_url="http://tofupilot.test/api",
+        client=httpx.Client(transport=httpx.MockTransport(server)),
+        async_client=httpx.AsyncClient(transport=httpx.MockTransport(server)),
+        transport=TRANSPORT,
+        **kwargs,
+    )
+
+
+def _create_run(client: TofuPilot, **kwargs) -> None:
+    client.runs.create(
+        serial_number="SN-1",
+        procedure_id="proc-id",
+        started_at=STARTED_AT,
+        ended_at=STARTED_AT,
+        outcome="PASS",
+        **kwargs,
+    )
+
+
+class TestTransportConfig:
+    def test_created_clients_use_the_pool_limits(self) -> None:
+        client = TofuPilot(api_key="k" * 20, transport=TRANSPORT)
+
+        # pylint: disable=protected-access
+        pool = client.sdk_configuration.client._transport._pool
+        assert pool._max_connections == 50
+        assert pool._max_keepalive_connections == 10
+        assert pool._keepalive_expiry == 30.0
+        assert client.sdk_configuration.async_client.timeout.connect == 5.0
+
+    def test_operation_timeouts_fall_back_on_the_default_ones(self) -> None:
+        server = _Server()
+        client = _client(server)
+
+        _create_run(client)
+        with pytest.raises(errors.ErrorFORBIDDEN):
+            client.stations.get_current()
+        with pytest.raises(errors.ErrorFORBIDDEN):
+            asyncio.run(client.stations.get_current_async())
+
+        assert server.timeouts == [
+            {"connect": 5.0, "read": 30.0, "write": 300.0, "pool": None},
+            {"connect": 5.0, "read": 2.0, "write": 30.0, "pool": None},
+            {"connect": 5.0, "read": 2.0, "write": 30.0, "pool": None},
+        ]
+
+    def test_other_operations_use_the_default_timeouts(self) -> None:
+        server = _Server()
+        client = _client(server)
+
+        client.runs.list()
+
+        assert server.timeouts == [
+            {"connect": 5.0, "read": 30.0, "write": 30.0, "pool": None}
+        ]
+
+    def test_timeout_ms_takes_precedence(self) -> None:
+        server = _Server()
+        client = _client(server, timeout_ms=10_000)
+
+        _create_run(client)
+        _create_run(client, timeout_ms=1_000)
+
+        assert server.timeouts == [
+            dict.fromkeys(("connect", "read", "write", "pool"), 10.0),
+            dict.fromkeys(("connect", "read", "write", "pool"), 1.0),
+        ]
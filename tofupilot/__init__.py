@@ -19,22 +19,95 @@ Or configure programmatically using configure_error_tracking().
 
 __version__ = "2.0.0"
 
-# Import v1 client for backward compatibility
-from .v1.client import TofuPilotClient
-from .v1.models import MeasurementOutcome, PhaseOutcome
-from .v1 import responses, models, client, constants
+# Everything below is loaded on first access, so that `import tofupilot` stays
+# cheap for scripts that only need one of the clients.
 
+from typing import TYPE_CHECKING
+from importlib import import_module
+import importlib.abc as _importlib_abc
+import importlib.util as _importlib_util
 import sys as _sys
-_sys.modules['tofupilot.responses'] = responses
-_sys.modules['tofupilot.models'] = models
-_sys.modules['tofupilot.client'] = client
-_sys.modules['tofupilot.constants'] = constants
-_sys.modules['tofupilot.responses.responses'] = responses.responses
-_sys.modules['tofupilot.models.models'] = models.models
-_sys.modules['tofupilot.constants.attachments'] = constants.attachments
-_sys.modules['tofupilot.constants.requests'] = constants.requests
-
-# Import pytest plugin
-from .pytest import TofuPilotPlugIn
-
-from . import v2
+
+if TYPE_CHECKING:
+    from .v1.client import TofuPilotClient
+    from .v1.models import MeasurementOutcome, PhaseOutcome
+    from .v1 import responses, models, client, constants
+    from .pytest import TofuPilotPlugIn
+    from . import v1, v2, openhtf, pytest
+
+_dynamic_imports: dict = {
+    "TofuPilotClient": ".v1.client",
+    "MeasurementOutcome": ".v1.models",
+    "PhaseOutcome": ".v1.models",
+    "TofuPilotPlugIn": ".pytest",
+}
+
+_submodules: dict = {
+    "responses": ".v1.responses",
+    "models": ".v1.models",
+    "client": ".v1.client",
+    "constants": ".v1.constants",
+    "v1": ".v1",
+    "v2": ".v2",
+    "openhtf": ".openhtf",
+    "pytest": ".pytest",
+}
+
+# Legacy import paths, kept for backward compatibility with the v1 layout
+_module_aliases: dict = {
+    "tofupilot.responses": "tofupilot.v1.responses",
+    "tofupilot.models": "tofupilot.v1.models",
+    "tofupilot.client": "tofupilot.v1.client",
+    "tofupilot.constants": "tofupilot.v1.constants",
+    "tofupilot.responses.responses": "tofupilot.v1.responses.responses",
+    "tofupilot.models.models": "tofupilot.v1.models.models",
+    "tofupilot.constants.attachments": "tofupilot.v1.constants.attachments",
+    "tofupilot.constants.requests": "tofupilot.v1.constants.requests",
+}
+
+
+class _ModuleAliasFinder(_importlib_abc.MetaPathFinder, _importlib_abc.Loader):
+    """Resolves the legacy import paths in `_module_aliases` on first import."""
+
+    def find_spec(self, fullname, path=None, target=None):
+        if fullname not in _module_aliases:
+            return None
+        return _importlib_util.spec_from_loader(fullname, self)
+
+    def create_module(self, spec):
+        module = import_module(_module_aliases[spec.name])
+        spec.loader_state = module.__spec__
+        return module
+
+    def exec_module(self, module):
+        # The import system sets the alias spec on the module, restore its own
+        module.__spec__ = module.__spec__.loader_state
+
+
+if not any(isinstance(finder, _ModuleAliasFinder) for finder in _sys.meta_path):
+    _sys.meta_path.insert(0, _ModuleAliasFinder())
+
+
+def __getattr__(attr_name: str) -> object:
+    if attr_name in _submodules:
+        result = import_module(_submodules[attr_name], __package__)
+        globals()[attr_name] = result
+        return result
+
+    module_name = _dynamic_imports.get(attr_name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {attr_name!r}")
+
+    try:
+        module = import_module(module_name, __package__)
+        result = getattr(module, attr_name)
+    except ImportError as e:
+        raise ImportError(
+            f"Failed to import {attr_name} from {module_name}: {e}"
+        ) from e
+    globals()[attr_name] = result
+    return result
+
+
+def __dir__():
+    return sorted(list(globals()) + list(_dynamic_imports) + list(_submodules))
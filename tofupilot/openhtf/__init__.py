@@ -1,9 +1,11 @@
 """TofuPilot integration with OpenHTF.
 
-It provides two main classes:
+It provides three main classes:
 1. upload(): Upload OpenHTF test results to TofuPilot
-2. TofuPilot(): Stream real-time test execution data for monitoring
+2. create_run(): Create the run from OpenHTF test results with the v2 API
+3. TofuPilot(): Stream real-time test execution data for monitoring
 """
 
 from .upload import upload
+from .create_run import create_run, to_run_create_request
 from .tofupilot import TofuPilot
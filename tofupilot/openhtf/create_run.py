@@ -0,0 +1,345 @@
+"""Conversion of OpenHTF test records into v2 `runs.create` requests."""
+
+import array
+import json
+import logging
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional
+
+from openhtf.core import measurements as htf_measurements
+from openhtf.core.test_record import PhaseRecord, TestRecord
+from openhtf.util import data, logs, validators
+
+from ..v1.utils import setup_logger
+from ..v2 import TofuPilot as TofuPilotV2
+from ..v2 import models
+
+import posthog
+
+
+# Test metadata keys (as passed to `openhtf.Test(**metadata)`) copied onto the run
+_METADATA_FIELDS = (
+    "procedure_id",
+    "procedure_version",
+    "operated_by",
+    "part_number",
+    "revision_number",
+    "batch_number",
+    "sub_units",
+)
+
+# OpenHTF measurement outcomes with a v2 equivalent, others are sent as UNSET
+_MEASUREMENT_OUTCOMES = {
+    "PASS": "PASS",
+    "FAIL": "FAIL",
+}
+
+_SCALAR_TYPES = (bool, int, float, str)
+
+
+def _sub_unit_serials(sub_units: List[Any]) -> List[str]:
+    """Returns the serial numbers of sub-units given as strings or as
+    `{"serial_number": ...}` dicts, the form used by the v1 client."""
+    return [
+        sub_unit["serial_number"] if isinstance(sub_unit, dict) else sub_unit
+        for sub_unit in sub_units
+    ]
+
+
+def _millis_to_datetime(millis: Optional[int]) -> Optional[datetime]:
+    if millis is None:
+        return None
+    return datetime.fromtimestamp(millis / 1000.0, tz=timezone.utc)
+
+
+def _unit_name(unit) -> Optional[str]:
+    """Returns the display name of an OpenHTF UnitDescriptor, if any."""
+    if unit is None:
+        return None
+    return unit.suffix or unit.name or None
+
+
+def _as_floats(values: List[Any]) -> Optional["array.array[float]"]:
+    """Returns `values` as packed floats, or None if any of them is not numeric."""
+    try:
+        return array.array("d", (float(value) for value in values))
+    except (TypeError, ValueError):
+        return None
+
+
+def _convert_validator(validator) -> models.RunCreateValidator:
+    """Maps an OpenHTF validator onto a structured v2 validator.
+
+    Validators without a structured equivalent are sent as an expression only.
+    """
+    expression = str(validator)
+
+    if isinstance(validator, validators.RangeValidatorBase):
+        minimum, maximum = validator.minimum, validator.maximum
+        if minimum is not None and maximum is not None:
+            return models.RunCreateValidator(
+                operator="range",
+                expected_value=[float(minimum), float(maximum)],
+                expression=expression,
+            )
+        if minimum is not None:
+            return models.RunCreateValidator(
+                operator=">=", expected_value=float(minimum), expression=expression
+            )
+        if maximum is not None:
+            return models.RunCreateValidator(
+                operator="<=", expected_value=float(maximum), expression=expression
+            )
+    elif isinstance(validator, validators.Equals) and isinstance(
+        validator.expected, _SCALAR_TYPES
+    ):
+        return models.RunCreateValidator(
+            operator="==", expected_value=validator.expected, expression=expression
+        )
+    elif isinstance(validator, validators.RegexMatcher):
+        return models.RunCreateValidator(
+            operator="matches", expected_value=validator.regex, expression=expression
+        )
+
+    return models.RunCreateValidator(expression=expression)
+
+
+def _convert_dimensioned_value(
+    measurement: htf_measurements.Measurement, fields: Dict[str, Any]
+) -> None:
+    """Stores a multidimensional measurement as x/y axes.
+
+    The first dimension becomes the x axis; the other dimensions and the
+    measured value each become a y axis.
+    """
+    rows = measurement.measured_value.value
+    columns = list(zip(*rows))
+    dimensions = measurement.dimensions
+
+    series = [_as_floats(list(column)) for column in columns]
+    if any(values is None for values in series):
+        # Non-numeric coordinates or values: keep them as-is in the legacy field
+        fields["measured_value"] = json.dumps(
+            data.convert_to_base_types(rows), default=str
+        )
+        return
+
+    units = [_unit_name(dimension.unit) for dimension in dimensions]
+    units.append(_unit_name(measurement.units))
+    descriptions = [dimension.description for dimension in dimensions]
+    descriptions.append(None)
+
+    axes = []
+    for values, unit, description in zip(series, units, descriptions):
+        axis: Dict[str, Any] = {"data": values}
+        if unit:
+            axis["units"] = unit
+        if description:
+            axis["description"] = description
+        axes.append(axis)
+
+    fields["x_axis"] = models.XAxis(**axes[0])
+    fields["y_axis"] = [models.YAxi(**axis) for axis in axes[1:]]
+
+
+def _convert_measurement(
+    measurement: htf_measurements.Measurement,
+) -> models.RunCreateMeasurement:
+    fields: Dict[str, Any] = {
+        "name": measurement.name,
+        "outcome": _MEASUREMENT_OUTCOMES.get(measurement.outcome.name, "UNSET"),
+    }
+
+    if measurement.docstring:
+        fields["docstring"] = measurement.docstring
+
+    if measurement.validators:
+        fields["validators"] = [
+            _convert_validator(validator) for validator in measurement.validators
+        ]
+
+    if measurement.dimensions:
+        if measurement.measured_value.is_value_set:
+            _convert_dimensioned_value(measurement, fields)
+        return models.RunCreateMeasurement(**fields)
+
+    units = _unit_name(measurement.units)
+    if units:
+        fields["units"] = units
+
+    if measurement.measured_value.is_value_set:
+        value = measurement.measured_value.value
+        if isinstance(value, _SCALAR_TYPES):
+            fields["measured_value"] = value
+        else:
+            fields["measured_value"] = json.dumps(
+                data.convert_to_base_types(value), default=str
+            )
+
+    return models.RunCreateMeasurement(**fields)
+
+
+def _convert_phase(phase: PhaseRecord, retry_count: int) -> models.RunCreatePhase:
+    started_at = _millis_to_datetime(phase.start_time_millis)
+    ended_at = _millis_to_datetime(phase.end_time_millis) or started_at
+
+    fields: Dict[str, Any] = {
+        "name": phase.name,
+        "outcome": phase.outcome.name if phase.outcome is not None else "ERROR",
+        "started_at": started_at,
+        "ended_at": ended_at,
+        "retry_count": retry_count,
+    }
+
+    if phase.codeinfo is not None and phase.codeinfo.docstring:
+        fields["docstring"] = phase.codeinfo.docstring
+
+    if phase.measurements:
+        fields["measurements"] = [
+            _convert_measurement(measurement)
+            for measurement in phase.measurements.values()
+        ]
+
+    return models.RunCreatePhase(**fields)
+
+
+def _convert_log(record: logs.LogRecord) -> models.RunCreateLog:
+    if record.level >= logging.CRITICAL:
+        level = "CRITICAL"
+    elif record.level >= logging.ERROR:
+        level = "ERROR"
+    elif record.level >= logging.WARNING:
+        level = "WARNING"
+    elif record.level >= logging.INFO:
+        level = "INFO"
+    else:
+        level = "DEBUG"
+
+    return models.RunCreateLog(
+        level=level,
+        timestamp=_millis_to_datetime(record.timestamp_millis),
+        message=record.message,
+        source_file=record.source,
+        line_number=record.lineno,
+    )
+
+
+def to_run_create_request(
+    test_record: TestRecord, **overrides: Any
+) -> models.RunCreateRequest:
+    """
+    Converts an OpenHTF test record into a v2 run creation request.
+
+    Phases, measurements (including multidimensional ones) and logs are mapped
+    directly, so the run can be created with a single `runs.create` call
+    instead of going through the OpenHTF report importer.
+
+    Run fields such as `procedure_id`, `part_number` or `sub_units` are read
+    from the test metadata (`openhtf.Test(*phases, procedure_id="FVT1")`) and
+    can be overridden with keyword arguments.
+
+    Args:
+        test_record (TestRecord): The completed OpenHTF test record.
+        **overrides: Fields of `models.RunCreateRequest` to set or replace.
+
+    Returns:
+        models.RunCreateRequest: The request to pass to `runs.create`.
+    """
+    started_at = _millis_to_datetime(test_record.start_time_millis)
+    ended_at = _millis_to_datetime(test_record.end_time_millis) or started_at
+
+    # Repeated phases share their name, with an increasing retry count
+    attempts: Dict[str, int] = {}
+    phases = []
+    for phase in test_record.phases:
+        retry_count = attempts.get(phase.name, 0)
+        attempts[phase.name] = retry_count + 1
+        phases.append(_convert_phase(phase, retry_count))
+
+    fields: Dict[str, Any] = {
+        "outcome": (
+            test_record.outcome.name if test_record.outcome is not None else "ERROR"
+        ),
+        "serial_number": test_record.dut_id,
+        "started_at": started_at,
+        "ended_at": ended_at,
+        "phases": phases,
+        "logs": [_convert_log(record) for record in test_record.log_records],
+    }
+
+    for field in _METADATA_FIELDS:
+        if test_record.metadata.get(field) is not None:
+            fields[field] = test_record.metadata[field]
+    if "sub_units" in fields:
+        fields["sub_units"] = _sub_unit_serials(fields["sub_units"])
+
+    docstring = test_record.metadata.get("test_description")
+    if docstring:
+        fields["docstring"] = docstring
+
+    fields.update(overrides)
+    return models.RunCreateRequest(**fields)
+
+
+class create_run:  # pylint: disable=invalid-name
+    """
+    OpenHTF output callback to create the run in TofuPilot upon test completion, using the v2 API.
+
+    Unlike `upload()`, the test record is converted client-side and sent with a single
+    `runs.create` call, without uploading and importing an OpenHTF JSON report.
+    Attachments are not uploaded by this callback.
+
+    Args:
+        api_key (Optional[str]): API key for authentication with TofuPilot's API.
+        url (Optional[str]): Base URL for TofuPilot's API.
+        client (Optional[TofuPilotV2]): An existing v2 TofuPilot client instance to use.
+        **overrides: Run fields to set or replace, see `to_run_create_request()`.
+
+    ### Usage Example:
+
+    ```python
+    from openhtf import Test
+    from tofupilot.openhtf import create_run
+
+    # ...
+
+    def main():
+        test = Test(*your_phases, procedure_id="FVT1")
+
+        # Create the run in TofuPilot upon completion
+        test.add_output_callback(create_run())
+
+        test.execute(lambda: "SN15")
+    ```
+    """
+
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        url: Optional[str] = None,
+        client: Optional[TofuPilotV2] = None,
+        **overrides: Any,
+    ):
+        self.client = client or TofuPilotV2(api_key=api_key, server_url=url)
+        self._overrides = overrides
+        self._logger = setup_logger(logging.INFO)
+
+    def __call__(self, test_record: TestRecord) -> str:
+        """
+        Returns:
+            str:
+                Id of the created run, or an empty string if creation failed
+        """
+        try:
+            request = to_run_create_request(test_record, **self._overrides)
+
+            self._logger.info("Creating run...")
+            response = self.client.runs.create(
+                **{name: getattr(request, name) for name in request.model_fields_set}
+            )
+            self._logger.success(f"Run created successfully with ID: {response.id}")
+            return response.id
+        except Exception as e:
+            posthog.capture_exception(e)
+            self._logger.error(f"Error creating run: {str(e)}")
+            return ""
@@ -15,6 +15,7 @@ from openhtf.core.test_record import TestRecord
 from openhtf.core.test_state import TestState
 
 from .upload import upload
+from .updates import UpdatePublisher
 from ..v1.client import TofuPilotClient
 
 import posthog
@@ -49,27 +50,73 @@ def _to_dict_with_event(test_state: TestState):
     return test_state_dict, event
 
 
+# Minimum delay between two updates, bounds the cost of converting the test state
+_MIN_UPDATE_INTERVAL_S = 0.1
+
+# How often to check for a state change, a new test or a stop request while idle
+_WAIT_FOR_UPDATE_POLL_S = 0.05
+
+
+def _get_plug_update_events(test_state: TestState):
+    """Get update events for the plugs displayed in the frontend (e.g. user prompts)."""
+    plug_manager = test_state.plug_manager
+    return [
+        plug_manager.get_plug_by_class_path(plug_name).asdict_with_event()[1]
+        for plug_name in plug_manager.get_frontend_aware_plug_names()
+    ]
+
+
 class SimpleStationWatcher(threading.Thread):
     """
     Simplified watcher that detects phase changes and sends test state updates.
+
+    Changes are detected with the update events OpenHTF sets whenever the test
+    state or a frontend-aware plug is updated, so the test state is only
+    converted when something changed.
     """
 
     def __init__(self, send_update_callback):
         super().__init__(daemon=True)
         self.send_update = send_update_callback
-        self.previous_state = None
         self.stop_event = threading.Event()
 
     def run(self):
         while not self.stop_event.is_set():
             _, test_state = _get_executing_test()
-            if test_state is not None:
-                # TODO: Add a hash to result of _to_dict_with_event to speed up comparaison
-                test_state_dict, _ = _to_dict_with_event(test_state)
-                if test_state_dict != self.previous_state:
-                    self.send_update(test_state_dict)
-                    self.previous_state = test_state_dict
-            sleep(0.1)  # Wait for 100 milliseconds
+            if test_state is None:
+                self.stop_event.wait(_MIN_UPDATE_INTERVAL_S)
+                continue
+
+            # Register for updates before converting, so none are missed
+            events = _get_plug_update_events(test_state)
+            try:
+                test_state_dict, event = _to_dict_with_event(test_state)
+            except RuntimeError:
+                # 'dictionary changed size during iteration' while the test
+                # state is being updated, retry shortly
+                self.stop_event.wait(_MIN_UPDATE_INTERVAL_S)
+                continue
+
+            self.send_update(test_state_dict)
+
+            # Throttle updates, then sleep until the next change
+            self.stop_event.wait(_MIN_UPDATE_INTERVAL_S)
+            self._wait_for_update(test_state, event, events)
+
+    def _wait_for_update(self, test_state: TestState, event, plug_events):
+        """
+        Wait until the test state or a plug is updated, another test starts or the watcher is stopped.
+
+        The watcher wakes up as soon as the test state `event` is set. Plug events,
+        stop requests and new tests are checked every `_WAIT_FOR_UPDATE_POLL_S`.
+        """
+        while not (event.is_set() or any(e.is_set() for e in plug_events)):
+            event.wait(_WAIT_FOR_UPDATE_POLL_S)
+            if self.stop_event.is_set():
+                return
+            _, executing_test_state = _get_executing_test()
+            if executing_test_state is not test_state:
+                return
 
     def stop(self):
         self.stop_event.set()
@@ -80,6 +127,20 @@ class TofuPilot:
     Context manager to automatically add an output callback to the running OpenHTF test
     and live stream it's execution to the Operator UI.
 
+    Args:
+        test (Test): The OpenHTF test to upload and stream.
+        stream (Optional[bool]): Whether to live stream the test to the Operator UI.
+        api_key (Optional[str]): API key for authentication with TofuPilot's API.
+        url (Optional[str]): Base URL for TofuPilot's API.
+        delta_updates (bool): Stream JSON patches of the test state instead of the full state,
+            with periodic full snapshots.
+        compress_updates (bool): Compress streamed updates with zlib.
+        max_update_rate (Optional[float]): Maximum number of updates streamed per second,
+            intermediate states are skipped.
+        background_upload (bool): Upload test records in a background thread so the next
+            test can start during the upload. Pending uploads are finished on exit.
+            The final update of a test is streamed before its upload is done, so the
+            Operator UI gets no upload id and can't link the test to its run.
 
     ### Usage Example:
 
@@ -108,6 +169,10 @@ class TofuPilot:
         stream: Optional[bool] = True,  # Controls connection to Operator UI
         api_key: Optional[str] = None,
         url: Optional[str] = None,
+        delta_updates: bool = False,
+        compress_updates: bool = False,
+        max_update_rate: Optional[float] = None,
+        background_upload: bool = False,
     ):
         self.test = test
         self.stream = stream
@@ -122,11 +187,22 @@ class TofuPilot:
         self._logger = self.client._logger
         self._reconnecting = False
         self._streaming_setup_thread = None
+        self._publisher = UpdatePublisher(
+            self._publish,
+            delta=delta_updates,
+            compress=compress_updates,
+            max_update_rate=max_update_rate,
+        )
+        self._uploader = upload(
+            api_key=api_key, url=url, client=self.client, background=background_upload
+        )
 
     def _upload(self, testRecord: TestRecord):
 
-        # Side effecting !
-        upload_id = upload(api_key=self.api_key, url=self.url, client=self.client)(testRecord)
+        # Side effecting ! In background mode, the upload id isn't known yet and is
+        # sent empty: a final update sent once the upload is done could overwrite
+        # the state of the next test in the Operator UI
+        upload_id = self._uploader(testRecord)
 
         if (self.stream):
             self._final_update(upload_id, testRecord)
@@ -180,6 +256,9 @@ class TofuPilot:
                 posthog.capture_exception(e)
                 self._logger.warning(f"Error stopping watcher: {e}")
 
+        # Drop updates still waiting for the rate limit
+        self._publisher.close()
+
         # Clean up MQTT connection
         if self.mqttClient:
             try:
@@ -192,6 +271,12 @@ class TofuPilot:
             finally:
                 self.mqttClient = None
 
+        # Finish the uploads still running in the background
+        self._uploader.close()
+
+        # Release the pooled HTTP connections used for uploads
+        self.client.close()
+
         # Return False to allow any exception to propagate, unless it's a KeyboardInterrupt
         # In case of KeyboardInterrupt, return True to suppress the exception
         return exc_type is KeyboardInterrupt
@@ -347,16 +432,22 @@ class TofuPilot:
             self._display_help_disable_streaming()
             self.stream = False  # Disable streaming on any setup error
 
-    def _send_update(self, message):
+    def _send_update(self, message, force: bool = False):
+        """Stream a test state to the Operator UI, `force` sends it immediately and in full."""
         # Skip publishing if streaming is disabled or client is None
         if not self.stream or self.mqttClient is None:
             return
 
+        self._publisher.submit(message, force=force)
+
+    def _publish(self, payload: str):
+        # Streaming may have been disabled while the update was waiting
+        if not self.stream or self.mqttClient is None:
+            return
+
         try:
             self.mqttClient.publish(
-                payload=json.dumps(
-                    {"action": "send", "source": "python", "message": message}
-                ),
+                payload=payload,
                 **self.publishOptions,
             )
         except Exception as e:
@@ -422,7 +513,7 @@ class TofuPilot:
             "upload_id": upload_id
         }
 
-        self._send_update(test_state_dict)
+        self._send_update(test_state_dict, force=True)
 
     # Operator UI-related callbacks
 
@@ -441,6 +532,9 @@ class TofuPilot:
                 f"Operator UI: Reconnected"
             )
             self._reconnecting = False
+            # Updates published while disconnected may be lost, start over from
+            # a full snapshot so the Operator UI can resync
+            self._publisher.resync()
 
     def _on_disconnect(
         self, client, userdata, disconnect_flags: mqtt.DisconnectFlags, reason_code: ReasonCode, properties
@@ -451,10 +545,12 @@ class TofuPilot:
                 f"Operator UI: Unexpected disconnect (code {reason_code})"
             )
             self._reconnecting = True
+            self._publisher.resync()
             self._connect_streaming()
             self.mqttClient.loop_start()
+            # Send a full snapshot so the Operator UI can resync
             test_state_dict, _ = _to_dict_with_event(self.test.state)
-            self._send_update(test_state_dict)
+            self._send_update(test_state_dict, force=True)
 
     def _on_unsubscribe(self, client, userdata, mid, reason_code_list, properties):
         if any(
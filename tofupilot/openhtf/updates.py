@@ -0,0 +1,177 @@
+"""Publishing of test state updates to the Operator UI.
+
+Updates are sent either as full snapshots or, in delta mode, as JSON patches
+(RFC 6902) against the previously published state, with a full snapshot sent
+periodically and after reconnections so the Operator UI can resynchronize.
+"""
+
+import base64
+import json
+import threading
+import time
+import zlib
+from typing import Any, Callable, Dict, List, Optional
+
+# Interval between full snapshots in delta mode, for late joiners and lost messages
+FULL_UPDATE_INTERVAL_S = 30.0
+
+
+def _escape(key: Any) -> str:
+    """Escape a key for use in a JSON pointer."""
+    return str(key).replace("~", "~0").replace("/", "~1")
+
+
+def json_patch(old: Any, new: Any, path: str = "") -> List[Dict[str, Any]]:
+    """
+    Compute the JSON patch operations turning `old` into `new`.
+
+    Dicts are compared key by key and lists item by item, so items appended to
+    a list (phases, logs, measurements) result in `add` operations only.
+    """
+    if old is new:
+        return []
+
+    if isinstance(old, dict) and isinstance(new, dict):
+        ops = []
+        for key in old:
+            if key not in new:
+                ops.append({"op": "remove", "path": f"{path}/{_escape(key)}"})
+        for key, value in new.items():
+            key_path = f"{path}/{_escape(key)}"
+            if key in old:
+                ops.extend(json_patch(old[key], value, key_path))
+            else:
+                ops.append({"op": "add", "path": key_path, "value": value})
+        return ops
+
+    if isinstance(old, list) and isinstance(new, list):
+        ops = []
+        common = min(len(old), len(new))
+        for index in range(common):
+            ops.extend(json_patch(old[index], new[index], f"{path}/{index}"))
+        for index in range(common, len(new)):
+            ops.append({"op": "add", "path": f"{path}/-", "value": new[index]})
+        # Remove from the end so indexes stay valid
+        for index in reversed(range(common, len(old))):
+            ops.append({"op": "remove", "path": f"{path}/{index}"})
+        return ops
+
+    if type(old) is type(new) and old == new:
+        return []
+
+    return [{"op": "replace", "path": path, "value": new}]
+
+
+class UpdatePublisher:
+    """
+    Encodes test state updates and hands them to `publish`, at most `max_update_rate` times per second.
+
+    Updates submitted faster than that are coalesced: only the latest state is published
+    once the interval has elapsed.
+
+    Args:
+        publish (Callable[[str], None]): Sends an encoded payload, e.g. over MQTT.
+        delta (bool): Publish JSON patches against the previous state instead of full states.
+        compress (bool): Compress messages with zlib (base64-encoded in the payload).
+        max_update_rate (Optional[float]): Maximum number of updates per second, unlimited if None.
+        full_update_interval_s (float): Interval between full snapshots in delta mode.
+    """
+
+    def __init__(
+        self,
+        publish: Callable[[str], None],
+        delta: bool = False,
+        compress: bool = False,
+        max_update_rate: Optional[float] = None,
+        full_update_interval_s: float = FULL_UPDATE_INTERVAL_S,
+    ):
+        self._publish = publish
+        self._delta = delta
+        self._compress = compress
+        self._min_interval_s = 1.0 / max_update_rate if max_update_rate else 0.0
+        self._full_update_interval_s = full_update_interval_s
+
+        self._lock = threading.Lock()
+        self._pending: Optional[Dict[str, Any]] = None
+        self._timer: Optional[threading.Timer] = None
+        self._previous: Optional[Dict[str, Any]] = None
+        self._last_publish = float("-inf")
+        self._last_full_update = float("-inf")
+        self._seq = 0
+
+    def submit(self, state: Dict[str, Any], force: bool = False):
+        """
+        Publish `state`, or schedule it if the maximum update rate was reached.
+
+        With `force`, the state is published immediately as a full snapshot.
+        """
+        with self._lock:
+            self._pending = state
+            if force:
+                self._previous = None
+
+            wait_s = self._last_publish + self._min_interval_s - time.monotonic()
+            if force or wait_s <= 0:
+                self._flush_locked()
+            elif self._timer is None:
+                self._timer = threading.Timer(wait_s, self._flush)
+                self._timer.daemon = True
+                self._timer.start()
+
+    def resync(self):
+        """Make the next update a full snapshot, e.g. after a reconnection."""
+        with self._lock:
+            self._previous = None
+
+    def close(self):
+        """Cancel any scheduled update."""
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            self._pending = None
+
+    def _flush(self):
+        with self._lock:
+            self._timer = None
+            if self._pending is not None:
+                self._flush_locked()
+
+    def _flush_locked(self):
+        state, self._pending = self._pending, None
+        now = time.monotonic()
+
+        if (
+            self._delta
+            and self._previous is not None
+            and now - self._last_full_update < self._full_update_interval_s
+        ):
+            ops = json_patch(self._previous, state)
+            if not ops:
+                return
+            action, message = "patch", ops
+        else:
+            action, message = "send", state
+            self._last_full_update = now
+
+        self._previous = state
+        self._last_publish = now
+        self._publish(self._encode(action, message))
+
+    def _encode(self, action: str, message: Any) -> str:
+        payload: Dict[str, Any] = {"action": action, "source": "python"}
+
+        if self._delta:
+            # Lets the Operator UI detect a missed patch and wait for the next snapshot
+            self._seq += 1
+            payload["seq"] = self._seq
+
+        if self._compress:
+            payload["encoding"] = "zlib"
+            payload["message"] = base64.b64encode(
+                zlib.compress(json.dumps(message).encode("utf-8"))
+            ).decode("ascii")
+        else:
+            payload["message"] = message
+
+        return json.dumps(payload)
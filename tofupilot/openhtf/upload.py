@@ -1,24 +1,39 @@
+import copy
+import io
 import os
-import json
 import datetime
-import tempfile
-from typing import Optional
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from typing import List, Optional, Set
 
 from openhtf.core.test_record import TestRecord
 from openhtf.output.callbacks import json_factory
-import requests
 
 from ..v1.client import TofuPilotClient
-from ..v1.constants import (
-    SECONDS_BEFORE_TIMEOUT,
-)
+from ..v1.spool import AttachmentSource
 from ..v1.utils import (
-    notify_server,
+    process_openhtf_attachments,
 )
-from ..v1.utils.logger import LoggerStateManager
 
 import posthog
 
+MAX_PENDING_UPLOADS = 8
+"""Default number of test records waiting for a background upload before the callback blocks."""
+
+
+def _snapshot(test_record: TestRecord) -> TestRecord:
+    """Deep copies a test record, sharing its attachments.
+
+    Attachments are immutable and their content lives in a temporary file, which the
+    snapshot keeps alive by referencing them instead of copying it.
+    """
+    memo = {
+        id(attachment): attachment
+        for phase in test_record.phases
+        for attachment in phase.attachments.values()
+    }
+    return copy.deepcopy(test_record, memo)
+
 
 class upload:  # pylint: disable=invalid-name
     """
@@ -34,6 +49,15 @@ class upload:  # pylint: disable=invalid-name
         client (Optional[TofuPilotClient]): An existing TofuPilot client instance to use.
         verify (Optional[str]): Path to a CA bundle file to verify TofuPilot's server certificate.
             Useful for connecting to instances with custom/self-signed certificates.
+        upload_concurrency (Optional[int]): Maximum number of attachments uploaded at the same time.
+            Defaults to the client's setting.
+        spool_dir (Optional[str]): Directory of a local spool used when no client is given.
+            Reports are stored there and uploaded in the background, so the test loop
+            does not wait for the network. See `TofuPilotClient`.
+        background (bool): Upload in a background thread. The callback returns as soon as
+            the test record is copied, so the next test can start during the upload.
+        max_pending_uploads (int): In background mode, number of records waiting for
+            their upload before the callback blocks until one is done.
 
     ### Usage Example:
 
@@ -60,23 +84,90 @@ class upload:  # pylint: disable=invalid-name
         url: Optional[str] = None,
         client: Optional[TofuPilotClient] = None,
         verify: Optional[str] = None,
+        upload_concurrency: Optional[int] = None,
+        spool_dir: Optional[str] = None,
+        background: bool = False,
+        max_pending_uploads: int = MAX_PENDING_UPLOADS,
     ):
         self.allow_nan = allow_nan
-        self.client = client or TofuPilotClient(api_key=api_key, url=url, verify=verify)
+        self.client = client or TofuPilotClient(
+            api_key=api_key, url=url, verify=verify, spool_dir=spool_dir
+        )
         self._logger = self.client._logger
         self._url = self.client._url
         self._headers = self.client._headers
+        self._session = self.client._session
         self._verify = verify  # Kept for backward compatibility
         self._max_attachments = self.client._max_attachments
         self._max_file_size = self.client._max_file_size
+        self._upload_concurrency = (
+            upload_concurrency
+            if upload_concurrency is not None
+            else self.client._upload_concurrency
+        )
+        self._executor: Optional[ThreadPoolExecutor] = None
+        if background:
+            # One worker keeps uploads in test order and reuses the client's connections
+            self._executor = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="tofupilot-upload-bg"
+            )
+            self._slots = threading.BoundedSemaphore(max(1, max_pending_uploads))
+            self._pending: Set[Future] = set()
+            self._pending_lock = threading.Lock()
 
     def __call__(self, test_record: TestRecord) -> str:
         """
         Returns:
             str:
                 Id of the initial upload
-                (This id is present in the ApiCall table of the database)
+                (This id is present in the ApiCall table of the database),
+                or an empty string if the report was queued in the client's spool
+                or is uploaded in the background
         """
+        if self._executor is None:
+            return self._upload(test_record)
+
+        snapshot = _snapshot(test_record)
+        if not self._slots.acquire(blocking=False):
+            self._logger.info("Waiting for a pending upload to finish")
+            self._slots.acquire()
+
+        future = self._executor.submit(self._upload, snapshot)
+        with self._pending_lock:
+            self._pending.add(future)
+        future.add_done_callback(self._on_background_upload_done)
+        return ""
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Waits for the background uploads submitted so far.
+
+        Returns:
+            bool:
+                False if uploads are still running after `timeout` seconds.
+        """
+        if self._executor is None:
+            return True
+        with self._pending_lock:
+            pending = set(self._pending)
+        if pending:
+            self._logger.info(f"Waiting for {len(pending)} pending upload(s)")
+        _, not_done = wait(pending, timeout)
+        return not not_done
+
+    def close(self):
+        """Waits for the background uploads and stops the upload thread."""
+        if self._executor is not None:
+            self.flush()
+            self._executor.shutdown()
+
+    def _on_background_upload_done(self, future: Future):
+        with self._pending_lock:
+            self._pending.discard(future)
+        self._slots.release()
+
+    def _upload(self, test_record: TestRecord) -> str:
+        """Uploads the test record and its attachments, see `__call__`."""
         # Resume logger to ensure it's active during attachment processing
         was_logger_resumed = False
         if hasattr(self._logger, "resume"):
@@ -96,146 +187,64 @@ class upload:  # pylint: disable=invalid-name
             # Format the timestamp as YYYY-MM-DD_HH_MM_SS_SSS
             start_time_formatted = start_time.strftime("%Y-%m-%d_%H-%M-%S-%f")[:-3]
 
-            temp_dir = tempfile.gettempdir()
+            # Name the report as OpenHTF's JSON output would name it on disk
+            filename = f"{dut_id}.{test_name}.{start_time_formatted}.json"
 
-            # Craft system-agnostic temporary filename
-            filename = os.path.join(
-                temp_dir, f"{dut_id}.{test_name}.{start_time_formatted}.json"
-            )
-
-            # Use the existing OutputToJSON callback to write to the custom file
+            # Use the existing OutputToJSON callback to serialize the test record
             output_callback = json_factory.OutputToJSON(
                 filename,
                 inline_attachments=False,  # Exclude raw attachments
                 allow_nan=self.allow_nan,
             )
 
-            # Open the custom file and write serialized test record to it
-            with open(filename, "w", encoding="utf-8") as file:
+            # Serialize into memory and upload from there, without a temporary file
+            with io.BytesIO() as report:
                 for json_line in output_callback.serialize_test_record(test_record):
-                    file.write(json_line)
+                    report.write(json_line.encode("utf-8"))
+                report.seek(0)
+
+                if self.client._spool is not None:
+                    self.client._validate_report_size(filename, report.getbuffer().nbytes)
+                    spool_id = self.client._spool.put_openhtf_report(
+                        filename, report.getvalue(), self._spooled_attachments(test_record)
+                    )
+                    self._logger.success(f"Run queued for upload: {spool_id}")
+                    return ""
 
-            try:
-                # Call create_run_from_report with the generated file path
-                result = self.client._upload_and_create_from_openhtf_report(filename)
+                try:
+                    result = self.client._upload_and_create_from_openhtf_data(
+                        filename, report
+                    )
 
-                # Extract run_id from response - it could be a string (id) or a dict (result with id field)
-                run_id = None
+                    # Extract run_id from response - it could be a string (id) or a dict (result with id field)
+                    run_id = None
 
-                if not result.get("success", False):
-                    self._logger.error("Run creation failed, skipping attachments")
-                    return result.get("upload_id", "")
+                    if not result.get("success", False):
+                        self._logger.error("Run creation failed, skipping attachments")
+                        return result.get("upload_id", "")
 
-                run_id = result.get("run_id")
-                original_upload_id: str = result.get("upload_id")
+                    run_id = result.get("run_id")
+                    original_upload_id: str = result.get("upload_id")
 
-            except Exception as e:
-                posthog.capture_exception(e)
-                self._logger.error(f"Error creating run: {str(e)}")
-                return ""
-            finally:
-                # Ensure the file is deleted after processing
-                if os.path.exists(filename):
-                    os.remove(filename)
+                except Exception as e:
+                    posthog.capture_exception(e)
+                    self._logger.error(f"Error creating run: {str(e)}")
+                    return ""
 
             # Process attachments
-            number_of_attachments = 0
-            for phase_idx, phase in enumerate(test_record.phases):
-
-                # Process each attachment in the phase
-                for attachment_name, attachment in phase.attachments.items():
-                    # Remove attachments that exceed the max file size
-                    if attachment.size > self._max_file_size:
-                        self._logger.warning(f"File too large: {attachment_name}")
-                        continue
-                    if number_of_attachments == self._max_attachments:
-                        self._logger.warning(
-                            f"Attachment limit ({self._max_attachments}) reached"
-                        )
-                    if number_of_attachments >= self._max_attachments:
-                        break
-
-                    number_of_attachments += 1
-
-                    # Use LoggerStateManager to temporarily activate the logger
-                    with LoggerStateManager(self._logger):
-                        self._logger.info(f"Uploading attachment...")
-
-                    # Upload initialization
-                    initialize_url = f"{self._url}/uploads/initialize"
-                    payload = {"name": attachment_name}
-
-                    try:
-                        response = requests.post(
-                            initialize_url,
-                            data=json.dumps(payload),
-                            headers=self._headers,
-                            verify=self._verify,
-                            timeout=SECONDS_BEFORE_TIMEOUT,
-                        )
-
-                        response.raise_for_status()
-                        response_json = response.json()
-                        upload_url = response_json.get("uploadUrl")
-                        upload_id = response_json.get("id")
-
-                        # Handle file attachments created with test.attach_from_file
-                        try:
-                            attachment_data = attachment.data
-
-                            # Some OpenHTF implementations have file path in the attachment object
-                            if hasattr(attachment, "file_path") and getattr(
-                                attachment, "file_path"
-                            ):
-                                try:
-                                    with open(
-                                        getattr(attachment, "file_path"), "rb"
-                                    ) as f:
-                                        attachment_data = f.read()
-                                        self._logger.info(
-                                            f"Read file data from {attachment.file_path}"
-                                        )
-                                except Exception as e:
-                                    posthog.capture_exception(e)
-                                    self._logger.warning(
-                                        f"Could not read from file_path: {str(e)}"
-                                    )
-                                    # Continue with attachment.data
-
-                            requests.put(
-                                upload_url,
-                                data=attachment_data,
-                                headers={"Content-Type": attachment.mimetype},
-                                timeout=SECONDS_BEFORE_TIMEOUT,
-                                verify=self._verify,
-                            )
-                        except Exception as e:
-                            posthog.capture_exception(e)
-                            self._logger.error(f"Error uploading data: {str(e)}")
-                            continue
-
-                        notify_server(
-                            self._headers,
-                            self._url,
-                            upload_id,
-                            run_id,
-                            logger=self._logger,
-                            verify=self._verify,
-                        )
-
-                        # Use LoggerStateManager to temporarily activate the logger
-                        with LoggerStateManager(self._logger):
-                            self._logger.success(
-                                f"Uploaded attachment: {attachment_name}"
-                            )
-                    except Exception as e:
-                        posthog.capture_exception(e)
-                        # Use LoggerStateManager to temporarily activate the logger
-                        with LoggerStateManager(self._logger):
-                            self._logger.error(
-                                f"Failed to process attachment: {str(e)}"
-                            )
-                        continue
+            process_openhtf_attachments(
+                self._logger,
+                self._headers,
+                self._url,
+                test_record,
+                run_id,
+                self._max_attachments,
+                self._max_file_size,
+                needs_base64_decode=False,
+                verify=self._verify,
+                session=self._session,
+                concurrency=self._upload_concurrency,
+            )
             return original_upload_id
         except Exception as e:
             posthog.capture_exception(e)
@@ -243,3 +252,26 @@ class upload:  # pylint: disable=invalid-name
                 f"Otherwise uncaught exception: {str(e)}"
             )
             return ""
+
+    def _spooled_attachments(self, test_record: TestRecord) -> List[AttachmentSource]:
+        """Lists the attachments of the record to store in the spool with its report."""
+        attachments: List[AttachmentSource] = []
+        for phase in test_record.phases:
+            for name, attachment in phase.attachments.items():
+                if len(attachments) >= self._max_attachments:
+                    self._logger.warning(
+                        f"Attachment limit ({self._max_attachments}) reached"
+                    )
+                    return attachments
+
+                # OpenHTF keeps attachment content in a temporary file
+                source = getattr(attachment, "_filename", None)
+                if not (isinstance(source, str) and os.path.isfile(source)):
+                    source = attachment.data
+                size = os.path.getsize(source) if isinstance(source, str) else len(source)
+                if size > self._max_file_size:
+                    self._logger.warning(f"File too large: {name}")
+                    continue
+
+                attachments.append((name, source, attachment.mimetype))
+        return attachments
@@ -1,8 +1,10 @@
 """Module for TofuPilot's Python API wrapper."""
 
-from typing import Dict, List, Optional, Union, cast
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional, Union, cast
+import io
 import os
 import sys
+import uuid
 import logging
 from datetime import datetime, timedelta
 from importlib.metadata import version
@@ -17,10 +19,14 @@ from .constants import (
     ENDPOINT,
     FILE_MAX_SIZE,
     CLIENT_MAX_ATTACHMENTS,
+    POOL_CONNECTIONS,
+    POOL_MAXSIZE,
+    UPLOAD_CONCURRENCY,
 )
 from .models import SubUnit, UnitUnderTest, Step, Phase, Log, RunOutcome
 from .responses import (
     CreateRunResponse,
+    QueuedRunResponse,
     GetRunsResponse,
     _OpenHTFImportResult,
     _StreamingResult,
@@ -31,7 +37,9 @@ from .responses import (
 from .utils import (
     validate_files,
     upload_file,
+    upload_data,
     upload_attachments,
+    log_and_raise,
     setup_logger,
     timedelta_to_iso,
     datetime_to_iso,
@@ -41,7 +49,14 @@ from .utils import (
     handle_network_error,
     api_request,
     process_openhtf_attachments,
+    create_session,
+    with_idempotency_key,
 )
+from .spool import Spool
+
+if TYPE_CHECKING:
+    from ..v2.utils.compression import CompressionConfig
+    from ..v2.utils.retries import RetryConfig
 
 from .utils import api_request
 
@@ -56,6 +71,20 @@ class TofuPilotClient:
             If not provided, the TOFUPILOT_URL environment variable or the default endpoint will be used.
         verify (Optional[str]): Path to a CA bundle file to verify TofuPilot's server certificate.
             Useful for connecting to instances with custom/self-signed certificates.
+        pool_connections (int): Number of per-host connection pools kept by the client's session.
+        pool_maxsize (int): Maximum number of connections kept open per host.
+        keep_alive (bool): Reuse connections across API calls and attachment uploads.
+            Disable to close every connection once its response has been received.
+        upload_concurrency (int): Maximum number of attachments uploaded at the same time.
+            Use 1 to upload attachments one after the other.
+        spool_dir (Optional[str]): Directory of a local spool. When set, runs are stored
+            there and uploaded by a background thread, retrying until TofuPilot is
+            reachable, so `create_run` returns without waiting for the network.
+        retry_config (Optional[RetryConfig]): Retry failed API requests with the v2 client's
+            retry policy, e.g. `RetryConfig("backoff", BackoffStrategy(500, 60000, 1.5, 3600000), True)`.
+            Requests creating runs carry an idempotency key, so retrying them can't duplicate runs.
+        compression (Optional[CompressionConfig]): Compress request bodies above a size threshold,
+            e.g. `CompressionConfig("gzip")` for runs with large measurements or many logs.
     """
 
     def __init__(
@@ -63,6 +92,13 @@ class TofuPilotClient:
         api_key: Optional[str] = None,
         url: Optional[str] = None,
         verify: Optional[str] = None,
+        pool_connections: int = POOL_CONNECTIONS,
+        pool_maxsize: int = POOL_MAXSIZE,
+        keep_alive: bool = True,
+        upload_concurrency: int = UPLOAD_CONCURRENCY,
+        spool_dir: Optional[str] = None,
+        retry_config: Optional["RetryConfig"] = None,
+        compression: Optional["CompressionConfig"] = None,
     ):
         self._logger = setup_logger(logging.INFO)
         self._current_version = version("tofupilot")
@@ -89,6 +125,50 @@ class TofuPilotClient:
         self._verify = verify
         self._max_attachments = CLIENT_MAX_ATTACHMENTS
         self._max_file_size = FILE_MAX_SIZE
+        self._upload_concurrency = upload_concurrency
+        self._session = create_session(
+            pool_connections, max(pool_maxsize, upload_concurrency), keep_alive
+        )
+        self._retry_config = retry_config
+        self._retry_budget = None
+        if retry_config is not None:
+            from ..v2.utils.retries import RetryBudget
+
+            self._retry_budget = RetryBudget()
+        self._compression = compression
+        self._spool = Spool(self, spool_dir) if spool_dir else None
+
+    def close(self):
+        """Closes the pooled connections held by the client.
+
+        With a spool, the run being uploaded is finished first. Other queued runs
+        stay in the spool and are uploaded by the next client using it.
+        """
+        if self._spool is not None:
+            self._spool.close()
+        self._session.close()
+
+    def flush_spool(self, timeout: Optional[float] = None) -> bool:
+        """
+        Attempts to upload every run waiting in the spool and waits for the result.
+
+        Args:
+            timeout (float, optional):
+                Maximum number of seconds to wait. Default is None, to wait until done.
+
+        Returns:
+            bool:
+                Whether the spool is empty, False if runs are still waiting.
+        """
+        if self._spool is None:
+            return True
+        return self._spool.flush(timeout)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
 
     def _setup_ssl_certificates(self):
         """Configure SSL certificate validation using certifi if needed."""
@@ -121,7 +201,7 @@ class TofuPilotClient:
         sub_units: Optional[List[SubUnit]] = None,
         attachments: Optional[List[str]] = None,
         logs: Optional[List[Log]] = None,
-    ) -> Union[CreateRunResponse, ErrorResponse]:
+    ) -> Union[CreateRunResponse, QueuedRunResponse, ErrorResponse]:
         """
         Creates a test run with the specified parameters and uploads it to the TofuPilot platform.
 
@@ -154,6 +234,8 @@ class TofuPilotClient:
         Returns:
             CreateRunResponse:
                 Dict containing run id if successful.
+            QueuedRunResponse:
+                Dict containing the spool entry id if the client has a spool.
 
         References:
             https://tofupilot.com/docs
@@ -199,6 +281,44 @@ class TofuPilotClient:
         if sub_units is not None:
             payload["sub_units"] = sub_units
 
+        # Keys the request and the spool entry: retries and replays of this call
+        # create the run once, while identical runs from separate calls stay distinct
+        call_id = uuid.uuid4().hex
+
+        if self._spool is not None:
+            spool_id = self._spool.put_run(payload, attachments, call_id)
+            self._logger.success(f"Run queued for upload: {spool_id}")
+            return {"success": True, "message": "Run queued for upload", "spool_id": spool_id}
+
+        result = self._post_run(payload, call_id)
+
+        # Upload attachments if run was created successfully
+        run_id = result.get("id")
+        if run_id and attachments:
+            # Ensure logger is active for attachment uploads
+            if hasattr(self._logger, 'resume'):
+                self._logger.resume()
+                
+            upload_attachments(
+                self._logger,
+                self._headers,
+                self._url,
+                attachments,
+                run_id,
+                self._verify,
+                session=self._session,
+                concurrency=self._upload_concurrency,
+            )
+        return result
+
+    def _post_run(
+        self, payload: dict, idempotency_key: str
+    ) -> Union[CreateRunResponse, ErrorResponse]:
+        """Sends a run payload built by `create_run`, without its attachments.
+
+        `idempotency_key` identifies the `create_run` call, so retrying or replaying
+        it can't create the run twice.
+        """
         self._log_request("POST", "/runs", payload)
         result = cast(
             Union[CreateRunResponse, ErrorResponse],
@@ -206,23 +326,16 @@ class TofuPilotClient:
                 self._logger,
                 "POST",
                 f"{self._url}/runs",
-                self._headers,
+                with_idempotency_key(self._headers, idempotency_key),
                 data=payload,
                 verify=self._verify,
+                session=self._session,
+                retry_config=self._retry_config,
+                retry_budget=self._retry_budget,
+                compression=self._compression,
             )
         )
         result["success"] = result.get("success", True) # pyright: ignore[reportGeneralTypeIssues]
-
-        # Upload attachments if run was created successfully
-        run_id = result.get("id")
-        if run_id and attachments:
-            # Ensure logger is active for attachment uploads
-            if hasattr(self._logger, 'resume'):
-                self._logger.resume()
-                
-            upload_attachments(
-                self._logger, self._headers, self._url, attachments, run_id, self._verify,
-            )
         return result
 
     def create_run_from_openhtf_report(self, file_path: str) -> str:
@@ -290,6 +403,8 @@ class TofuPilotClient:
                 self._max_file_size,
                 needs_base64_decode=True,  # JSON attachments need base64 decoding
                 verify=self._verify,
+                session=self._session,
+                concurrency=self._upload_concurrency,
             )
         else:
             if not test_record:
@@ -338,6 +453,10 @@ class TofuPilotClient:
                 self._headers,
                 params=params,
                 verify=self._verify,
+                session=self._session,
+                retry_config=self._retry_config,
+                retry_budget=self._retry_budget,
+                compression=self._compression,
             )
         )
         if isinstance(result, list):
@@ -366,6 +485,68 @@ class TofuPilotClient:
             self._logger, [file_path], self._max_attachments, self._max_file_size
         )
 
+        return self._import_openhtf_report(
+            lambda: upload_file(
+                self._headers, self._url, file_path, self._verify, session=self._session
+            )
+        )
+
+    def _upload_and_create_from_openhtf_data(
+        self,
+        name: str,
+        data: io.BytesIO,
+        idempotency_key: Optional[str] = None,
+    ) -> Union[_OpenHTFImportResult, ErrorResponse]:
+        """
+        Takes an in-memory OpenHTF JSON report, uploads it and creates a run from it.
+
+        `idempotency_key` identifies the import, see `_import_openhtf_report`.
+
+        Returns:
+            Dict
+        """
+
+        print("")
+        self._logger.info("Importing run...")
+
+        self._validate_report_size(name, data.getbuffer().nbytes)
+
+        return self._import_openhtf_report(
+            lambda: upload_data(
+                self._headers,
+                self._url,
+                name,
+                data,
+                "application/json",
+                self._verify,
+                session=self._session,
+            ),
+            idempotency_key,
+        )
+
+    def _validate_report_size(self, name: str, file_size: int):
+        """Exits like `validate_files` if an in-memory report is too large."""
+        if file_size > self._max_file_size:
+            log_and_raise(
+                self._logger,
+                f"File size ({file_size / 1024 / 1024:.2f} MB) exceeds the maximum allowed size of {self._max_file_size / 1024 / 1024:.2f} MB: {name}",
+            )
+
+    def _import_openhtf_report(
+        self,
+        upload: Callable[[], str],
+        idempotency_key: Optional[str] = None,
+    ) -> Union[_OpenHTFImportResult, ErrorResponse]:
+        """
+        Uploads an OpenHTF JSON report with `upload` and creates a run from it.
+
+        `idempotency_key` identifies the import, so replaying it can't create the
+        run twice. A new one is generated when None.
+
+        Returns:
+            Dict
+        """
+
         # Upload report
         try:
             # First, check if we have a valid API key directly (avoids cryptic errors)
@@ -373,7 +554,7 @@ class TofuPilotClient:
                 self._logger.error("API key error: Invalid API key format.")
                 return {"success": False, "error": {"message": "Invalid API key format."}}
             
-            upload_id = upload_file(self._headers, self._url, file_path, self._verify)
+            upload_id = upload()
         except requests.exceptions.HTTPError as http_err:
             error_info = handle_http_error(self._logger, http_err)
             # Error already logged by handle_http_error
@@ -397,9 +578,13 @@ class TofuPilotClient:
             self._logger,
             "POST",
             f"{self._url}/import",
-            self._headers,
+            with_idempotency_key(self._headers, idempotency_key or uuid.uuid4().hex),
             data=payload,
             verify=self._verify,
+            session=self._session,
+            retry_config=self._retry_config,
+            retry_budget=self._retry_budget,
+            compression=self._compression,
         )
 
          # Return only the ID if successful, otherwise return the full result
@@ -448,6 +633,10 @@ class TofuPilotClient:
             f"{self._url}/streaming",
             self._headers,
             verify=self._verify,
+            session=self._session,
+            retry_config=self._retry_config,
+            retry_budget=self._retry_budget,
+            compression=self._compression,
         )
         if result.get("success", True):
             return {"success": True, "values": cast(_StreamingCredentials, result)}
@@ -1,9 +1,31 @@
-from .attachments import FILE_MAX_SIZE, CLIENT_MAX_ATTACHMENTS
-from .requests import ENDPOINT, SECONDS_BEFORE_TIMEOUT
+from .attachments import FILE_MAX_SIZE, CLIENT_MAX_ATTACHMENTS, UPLOAD_CONCURRENCY
+from .requests import (
+    ENDPOINT,
+    SECONDS_BEFORE_TIMEOUT,
+    POOL_CONNECTIONS,
+    POOL_MAXSIZE,
+    RETRY_STATUS_CODES,
+    IDEMPOTENCY_KEY_HEADER,
+)
+from .spool import (
+    SPOOL_RETRY_BASE_DELAY,
+    SPOOL_RETRY_MAX_DELAY,
+    SPOOL_DONE_RETENTION,
+    SPOOL_FAILED_RETENTION,
+)
 
 __all__ = [
     "FILE_MAX_SIZE",
     "CLIENT_MAX_ATTACHMENTS",
+    "UPLOAD_CONCURRENCY",
     "SECONDS_BEFORE_TIMEOUT",
     "ENDPOINT",
+    "POOL_CONNECTIONS",
+    "POOL_MAXSIZE",
+    "RETRY_STATUS_CODES",
+    "IDEMPOTENCY_KEY_HEADER",
+    "SPOOL_RETRY_BASE_DELAY",
+    "SPOOL_RETRY_MAX_DELAY",
+    "SPOOL_DONE_RETENTION",
+    "SPOOL_FAILED_RETENTION",
 ]
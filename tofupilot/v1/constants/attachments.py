@@ -1,3 +1,5 @@
 FILE_MAX_SIZE = 10 * 1024 * 1024  # 10 MB
 
 CLIENT_MAX_ATTACHMENTS = 100
+
+UPLOAD_CONCURRENCY = 4  # Attachments transferred at the same time
@@ -1,3 +1,13 @@
 ENDPOINT = "https://www.tofupilot.app"
 
 SECONDS_BEFORE_TIMEOUT = 60
+
+# Connection pooling defaults for the shared requests.Session
+POOL_CONNECTIONS = 4  # Number of distinct hosts to keep a pool for (API + storage)
+POOL_MAXSIZE = 10  # Maximum number of connections kept alive per host
+
+# Responses retried when the client has a retry configuration, as in the v2 client
+RETRY_STATUS_CODES = ["429", "500", "502", "503", "504"]
+
+# Header making a POST safe to retry, the server applies a key at most once
+IDEMPOTENCY_KEY_HEADER = "Idempotency-Key"
@@ -0,0 +1,7 @@
+SPOOL_RETRY_BASE_DELAY = 1  # Seconds before the first retry of a queued entry
+
+SPOOL_RETRY_MAX_DELAY = 5 * 60  # Upper bound of the exponential retry backoff
+
+SPOOL_DONE_RETENTION = 7 * 24 * 60 * 60  # Uploaded entries are remembered for deduplication
+
+SPOOL_FAILED_RETENTION = 30 * 24 * 60 * 60  # Failed entries and their files are kept for inspection
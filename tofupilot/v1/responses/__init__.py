@@ -1,6 +1,7 @@
 from .responses import (
     # Response types
     CreateRunResponse,
+    QueuedRunResponse,
     GetRunsResponse,
 
     # Private types (used only by private methods)
@@ -20,6 +21,7 @@ from .responses import (
 __all__ = [
     # Response types
     "CreateRunResponse",
+    "QueuedRunResponse",
     "GetRunsResponse",
     
     # Private types (used only by private methods)
@@ -118,6 +118,9 @@ class SuccessResponse(_SuccessResponseOptional):
 class CreateRunResponse(SuccessResponse):
     id: str  # UUID format
 
+class QueuedRunResponse(SuccessResponse):
+    spool_id: int  # Entry of the run in the client's spool
+
 class GetRunsResponse(SuccessResponse):
     result: List[Run]
 
@@ -0,0 +1,418 @@
+"""Durable local queue of runs uploaded in the background.
+
+When a `TofuPilotClient` is created with a `spool_dir`, `create_run` and the
+OpenHTF `upload` callback store the run and its attachments in that directory
+and return right away. A background thread then sends them to TofuPilot:
+
+- Entries are kept in a SQLite database and their files next to it, so nothing
+  is lost while the network is down or if the process exits or crashes. Pending
+  entries are resumed by the next client using the same directory.
+- Network errors, 408, 429 and 5xx responses are retried with an exponential
+  backoff. Other errors mark the entry as failed, with the error kept in the database.
+  Failed entries and their files are kept for `SPOOL_FAILED_RETENTION`, so the
+  run can be inspected or uploaded by hand, then removed by the next client.
+- The id of the created run is saved before attachments are uploaded, so an
+  interrupted entry resumes with its attachments instead of creating the run twice.
+- Entries are keyed by the id of the call that queued them: queuing the same call
+  again is ignored, while identical runs queued by separate calls are all uploaded.
+
+A spool directory must only be used by one process at a time.
+"""
+
+import io
+import json
+import os
+import random
+import shutil
+import sqlite3
+import threading
+import time
+import uuid
+from functools import partial
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Union
+
+import posthog
+import requests
+
+from .constants import (
+    SPOOL_RETRY_BASE_DELAY,
+    SPOOL_RETRY_MAX_DELAY,
+    SPOOL_DONE_RETENTION,
+    SPOOL_FAILED_RETENTION,
+)
+from .utils.files import _iter_in_pool, _report_attachment_upload, _store_file_attachment
+from .utils.logger import LoggerStateManager
+
+if TYPE_CHECKING:
+    from .client import TofuPilotClient
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    key TEXT NOT NULL UNIQUE,
+    kind TEXT NOT NULL,
+    payload TEXT NOT NULL,
+    attachments TEXT NOT NULL,
+    run_id TEXT,
+    state TEXT NOT NULL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    next_attempt_at REAL NOT NULL,
+    created_at REAL NOT NULL,
+    error TEXT
+)
+"""
+
+_PENDING = "pending"
+_DONE = "done"
+_FAILED = "failed"
+
+_RUN = "run"  # A `POST /runs` payload
+_OPENHTF = "openhtf"  # An OpenHTF JSON report to import
+
+# Content of an attachment to queue: (name, file path or data, mimetype)
+AttachmentSource = Tuple[str, Union[str, bytes], Optional[str]]
+
+
+def _store(source: Union[str, bytes], path: str):
+    """Writes `source` data, or a copy of the `source` file, to `path`.
+
+    Files of the caller are copied rather than linked: a hard link shares their
+    content, so a file rewritten in place after queuing would change the queued run.
+    """
+    with open(path, "wb") as file:
+        if isinstance(source, str):
+            with open(source, "rb") as original:
+                shutil.copyfileobj(original, file)
+        else:
+            file.write(source)
+        file.flush()
+        os.fsync(file.fileno())
+
+
+def _is_transient(result: Dict[str, Any]) -> bool:
+    """Whether a failed request result is worth retrying."""
+    if "status_code" not in result:
+        # Rejected by the client itself, e.g. an invalid API key
+        return False
+    status_code = result["status_code"]
+    return status_code is None or status_code in (408, 429) or status_code >= 500
+
+
+def _is_transient_upload_error(error: Exception) -> bool:
+    if isinstance(error, requests.HTTPError) and error.response is not None:
+        return _is_transient({"status_code": error.response.status_code})
+    return isinstance(error, requests.RequestException)
+
+
+class Spool:
+    """Stores runs in `directory` and uploads them with `client` from a background thread.
+
+    Args:
+        client (TofuPilotClient): Client used to upload the queued runs.
+        directory (str): Directory holding the spool database and files. Created if needed.
+        retry_base_delay (float): Seconds before the first retry of a failed upload.
+        retry_max_delay (float): Upper bound of the delay between two retries.
+    """
+
+    def __init__(
+        self,
+        client: "TofuPilotClient",
+        directory: str,
+        retry_base_delay: float = SPOOL_RETRY_BASE_DELAY,
+        retry_max_delay: float = SPOOL_RETRY_MAX_DELAY,
+    ):
+        self._client = client
+        self._logger = client._logger
+        self._retry_base_delay = retry_base_delay
+        self._retry_max_delay = retry_max_delay
+        self._files_dir = os.path.join(directory, "files")
+        os.makedirs(self._files_dir, exist_ok=True)
+
+        self._db = sqlite3.connect(
+            os.path.join(directory, "spool.sqlite3"), check_same_thread=False
+        )
+        self._db.row_factory = sqlite3.Row
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=FULL")
+
+        # Guards the database and is notified whenever entries change
+        self._cond = threading.Condition()
+        self._closed = False
+
+        with self._db:
+            self._db.execute(_SCHEMA)
+            for state, retention in ((_DONE, SPOOL_DONE_RETENTION), (_FAILED, SPOOL_FAILED_RETENTION)):
+                self._db.execute(
+                    "DELETE FROM entries WHERE state = ? AND created_at < ?",
+                    (state, time.time() - retention),
+                )
+        self._remove_orphan_files()
+
+        self._worker = threading.Thread(
+            target=self._run, name="tofupilot-spool", daemon=True
+        )
+        self._worker.start()
+
+    def put_run(
+        self,
+        payload: Dict[str, Any],
+        attachments: Optional[List[str]] = None,
+        key: Optional[str] = None,
+    ) -> int:
+        """Queues a `POST /runs` payload and the paths of files to attach to the run.
+
+        `key` identifies the call queuing the run, a new one is generated when None.
+
+        Returns:
+            int: Id of the spool entry.
+        """
+        sources: List[AttachmentSource] = [
+            (os.path.basename(path), path, None) for path in attachments or []
+        ]
+        key = key or uuid.uuid4().hex
+        return self._put(key, _RUN, payload, sources)
+
+    def put_openhtf_report(
+        self,
+        name: str,
+        report: bytes,
+        attachments: List[AttachmentSource],
+        key: Optional[str] = None,
+    ) -> int:
+        """Queues an OpenHTF JSON report to import and the attachments of its record.
+
+        `key` identifies the call queuing the report, a new one is generated when None.
+
+        Returns:
+            int: Id of the spool entry.
+        """
+        key = key or uuid.uuid4().hex
+        return self._put(key, _OPENHTF, {"name": name}, [(name, report, None)] + attachments)
+
+    def pending_count(self) -> int:
+        """Returns the number of entries waiting to be uploaded."""
+        with self._cond:
+            return self._db.execute(
+                "SELECT COUNT(*) FROM entries WHERE state = ?", (_PENDING,)
+            ).fetchone()[0]
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Retries every pending entry now and waits until each one was attempted.
+
+        Returns:
+            bool: Whether no entry is waiting anymore, False if entries failed
+                again or are still in progress after `timeout` seconds.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._cond:
+            now = time.time()
+            with self._db:
+                self._db.execute(
+                    "UPDATE entries SET next_attempt_at = ? WHERE state = ?",
+                    (now, _PENDING),
+                )
+            self._cond.notify_all()
+            # Entries that failed again are rescheduled after `now`
+            while self._db.execute(
+                "SELECT 1 FROM entries WHERE state = ? AND next_attempt_at <= ? LIMIT 1",
+                (_PENDING, now),
+            ).fetchone():
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if self._closed or (remaining is not None and remaining <= 0):
+                    return False
+                self._cond.wait(remaining)
+        return self.pending_count() == 0
+
+    def close(self, timeout: Optional[float] = None):
+        """Stops the background upload once the entry in progress is done.
+
+        Pending entries stay in the spool and are uploaded by the next client using it.
+        """
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+        self._worker.join(timeout)
+        if not self._worker.is_alive():
+            self._db.close()
+
+    def _put(
+        self,
+        key: str,
+        kind: str,
+        payload: Dict[str, Any],
+        sources: List[AttachmentSource],
+    ) -> int:
+        with self._cond:
+            row = self._db.execute("SELECT id FROM entries WHERE key = ?", (key,)).fetchone()
+        if row is not None:
+            with LoggerStateManager(self._logger):
+                self._logger.warning(f"Run already queued, skipping: {row['id']}")
+            return row["id"]
+
+        # Files are written before the entry, so a committed entry always has them
+        entry_dir = os.path.join(self._files_dir, key)
+        os.makedirs(entry_dir, exist_ok=True)
+        stored = []
+        for index, (name, source, mimetype) in enumerate(sources):
+            path = os.path.join(entry_dir, str(index))
+            if not os.path.exists(path):
+                _store(source, path)
+            stored.append((name, path, mimetype))
+
+        if kind == _OPENHTF:
+            name, report_path, _ = stored.pop(0)
+            payload = {"name": name, "report": report_path}
+
+        now = time.time()
+        with self._cond:
+            with self._db:
+                self._db.execute(
+                    "INSERT OR IGNORE INTO entries"
+                    " (key, kind, payload, attachments, state, next_attempt_at, created_at)"
+                    " VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    (key, kind, json.dumps(payload), json.dumps(stored), _PENDING, now, now),
+                )
+            entry_id = self._db.execute(
+                "SELECT id FROM entries WHERE key = ?", (key,)
+            ).fetchone()["id"]
+            self._cond.notify_all()
+        return entry_id
+
+    def _remove_orphan_files(self):
+        """Removes files left by an interrupted `_put`, an uploaded or an expired entry."""
+        kept = {
+            row["key"]
+            for row in self._db.execute(
+                "SELECT key FROM entries WHERE state IN (?, ?)", (_PENDING, _FAILED)
+            )
+        }
+        for key in os.listdir(self._files_dir):
+            if key not in kept:
+                shutil.rmtree(os.path.join(self._files_dir, key), ignore_errors=True)
+
+    def _next_entry(self) -> Tuple[Optional[sqlite3.Row], Optional[float]]:
+        """Returns the next entry to upload, or None and how long to wait for it."""
+        row = self._db.execute(
+            "SELECT * FROM entries WHERE state = ? ORDER BY next_attempt_at, id LIMIT 1",
+            (_PENDING,),
+        ).fetchone()
+        if row is None:
+            return None, None
+        delay = row["next_attempt_at"] - time.time()
+        if delay > 0:
+            return None, delay
+        return row, None
+
+    def _run(self):
+        while True:
+            with self._cond:
+                entry = None
+                while not self._closed:
+                    entry, delay = self._next_entry()
+                    if entry is not None:
+                        break
+                    self._cond.wait(delay)
+                if self._closed:
+                    return
+
+            try:
+                self._process(entry)
+            except Exception as e:
+                posthog.capture_exception(e)
+                self._retry(entry, str(e))
+
+    def _process(self, entry: sqlite3.Row):
+        run_id = entry["run_id"]
+        if run_id is None:
+            result, run_id = self._create(entry)
+            if not run_id:
+                message = result.get("error", {}).get("message", "Run creation failed")
+                if _is_transient(result):
+                    self._retry(entry, message)
+                else:
+                    self._finish(entry, _FAILED, error=message)
+                return
+            self._update(entry, run_id=run_id)
+
+        attachments = json.loads(entry["attachments"])
+        remaining = self._upload_attachments(run_id, attachments)
+        if remaining:
+            self._retry(
+                entry, f"{len(remaining)} attachment(s) not uploaded", attachments=json.dumps(remaining)
+            )
+        else:
+            self._finish(entry, _DONE)
+
+    def _create(self, entry: sqlite3.Row) -> Tuple[Dict[str, Any], Optional[str]]:
+        """Creates the run of `entry`, returning the request result and the run id."""
+        payload = json.loads(entry["payload"])
+        if entry["kind"] == _RUN:
+            result = self._client._post_run(payload, entry["key"])
+            return result, result.get("id")
+
+        with open(payload["report"], "rb") as file:
+            report = io.BytesIO(file.read())
+        result = self._client._upload_and_create_from_openhtf_data(
+            payload["name"], report, entry["key"]
+        )
+        return result, result.get("run_id")
+
+    def _upload_attachments(
+        self, run_id: str, attachments: List[Tuple[str, str, Optional[str]]]
+    ) -> List[Tuple[str, str, Optional[str]]]:
+        """Uploads attachments to the run, returning the ones to retry."""
+        client = self._client
+        tasks = [
+            partial(
+                _store_file_attachment,
+                client._headers, client._url, name, path, mimetype, run_id, client._verify, client._session,
+            )
+            for name, path, mimetype in attachments
+        ]
+        remaining = []
+        for attachment, (sync_error, error) in zip(
+            attachments, _iter_in_pool(tasks, client._upload_concurrency)
+        ):
+            _report_attachment_upload(self._logger, attachment[0], sync_error, error)
+            # A stored attachment that could not be linked to the run is uploaded again
+            failure = error if error is not None else sync_error
+            if failure is not None and _is_transient_upload_error(failure):
+                remaining.append(attachment)
+        return remaining
+
+    def _update(self, entry: sqlite3.Row, **values: Any):
+        columns = ", ".join(f"{column} = ?" for column in values)
+        with self._cond:
+            with self._db:
+                self._db.execute(
+                    f"UPDATE entries SET {columns} WHERE id = ?",
+                    (*values.values(), entry["id"]),
+                )
+            self._cond.notify_all()
+
+    def _retry(self, entry: sqlite3.Row, message: str, **values: Any):
+        attempts = entry["attempts"] + 1
+        # Exponential backoff, jittered so that stations don't retry in sync
+        delay = min(self._retry_max_delay, self._retry_base_delay * 2 ** (attempts - 1))
+        delay *= random.uniform(0.5, 1.0)
+        with LoggerStateManager(self._logger):
+            self._logger.warning(f"Upload of queued run failed, retrying in {delay:.0f}s: {message}")
+        self._update(
+            entry,
+            attempts=attempts,
+            next_attempt_at=time.time() + delay,
+            error=message,
+            **values,
+        )
+
+    def _finish(self, entry: sqlite3.Row, state: str, error: Optional[str] = None):
+        if state == _FAILED:
+            with LoggerStateManager(self._logger):
+                self._logger.error(
+                    f"Queued run could not be uploaded, its files are kept in"
+                    f" {os.path.join(self._files_dir, entry['key'])}: {error}"
+                )
+        with self._cond:
+            self._update(entry, state=state, error=error)
+            if state == _DONE:
+                shutil.rmtree(os.path.join(self._files_dir, entry["key"]), ignore_errors=True)
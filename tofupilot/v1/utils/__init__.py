@@ -2,6 +2,7 @@ from .logger import setup_logger, LoggerStateManager
 from .files import (
     validate_files,
     upload_file,
+    upload_data,
     notify_server,
     upload_attachments,
     upload_attachment_data,
@@ -22,6 +23,8 @@ from .network import (
     handle_http_error,
     handle_network_error,
     api_request,
+    create_session,
+    with_idempotency_key,
 )
 
 __all__ = [
@@ -29,6 +32,7 @@ __all__ = [
     "LoggerStateManager",
     "validate_files",
     "upload_file",
+    "upload_data",
     "notify_server",
     "upload_attachments",
     "upload_attachment_data",
@@ -45,4 +49,6 @@ __all__ = [
     "handle_http_error",
     "handle_network_error",
     "api_request",
+    "create_session",
+    "with_idempotency_key",
 ]
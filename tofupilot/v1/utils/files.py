@@ -1,12 +1,15 @@
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 import json
 import mimetypes
 from logging import Logger
 import os
 import sys
-from typing import List, Dict, Optional, Union
+from typing import IO, Any, Callable, Iterator, List, Dict, Optional, Tuple, Union
 import requests
 import posthog
 
+from ..constants.attachments import UPLOAD_CONCURRENCY
 from ..constants.requests import SECONDS_BEFORE_TIMEOUT
 from .logger import LoggerStateManager
 from ...error_tracking import ApiV1Error
@@ -54,6 +57,7 @@ def upload_file(
     url: str,
     file_path: str,
     verify: Optional[str] = None,
+    session: Optional[requests.Session] = None,
 ) -> str:
     """Initializes an upload and stores file in it
     
@@ -62,19 +66,58 @@ def upload_file(
         url (str): Base API URL
         file_path (str): Path to the file to upload
         verify (Optional[str]): Path to a CA bundle file to verify the server certificate
+        session (Optional[requests.Session]): Pooled session to send requests with
     
+    Returns:
+        str: The ID of the created upload
+    """
+    with open(file_path, "rb") as file:
+        content_type, _ = mimetypes.guess_type(file_path) or "application/octet-stream"
+        return upload_data(
+            headers,
+            url,
+            os.path.basename(file_path),
+            file,
+            content_type,
+            verify,
+            session=session,
+        )
+
+
+def upload_data(
+    headers: dict,
+    url: str,
+    name: str,
+    data: Union[bytes, IO[bytes]],
+    content_type: Optional[str] = None,
+    verify: Optional[str] = None,
+    session: Optional[requests.Session] = None,
+) -> str:
+    """Initializes an upload and stores in-memory data in it
+
+    Same as `upload_file`, without requiring the content to be written to disk first.
+
+    Args:
+        headers (dict): Request headers including authorization
+        url (str): Base API URL
+        name (str): Name of the upload
+        data (Union[bytes, IO[bytes]]): Content to upload, as bytes or a binary file-like object
+        content_type (Optional[str]): MIME type of the content
+        verify (Optional[str]): Path to a CA bundle file to verify the server certificate
+        session (Optional[requests.Session]): Pooled session to send requests with
+
     Returns:
         str: The ID of the created upload
     """
     verify_setting = prepare_verify_setting(verify)
+    http = session or requests
     
     try:
         # Upload initialization
         initialize_url = f"{url}/uploads/initialize"
-        file_name = os.path.basename(file_path)
-        payload = {"name": file_name}
+        payload = {"name": name}
 
-        response = requests.post(
+        response = http.post(
             initialize_url,
             data=json.dumps(payload),
             headers=headers,
@@ -99,22 +142,43 @@ def upload_file(
         if not upload_id or not upload_url:
             raise ValueError(f"Upload initialization failed: missing 'id' or 'uploadUrl' in response: {response_json}")
 
-        # File storing
-        with open(file_path, "rb") as file:
-            content_type, _ = mimetypes.guess_type(file_path) or "application/octet-stream"
-            requests.put(
-                upload_url,
-                data=file,
-                headers={"Content-Type": content_type},
-                timeout=SECONDS_BEFORE_TIMEOUT,
-                verify=verify_setting,
-            )
+        # Data storing
+        upload_response = http.put(
+            upload_url,
+            data=data,
+            headers={"Content-Type": content_type},
+            timeout=SECONDS_BEFORE_TIMEOUT,
+            verify=verify_setting,
+        )
+        upload_response.raise_for_status()
 
         return upload_id
     finally:
         cleanup_temp_cert_bundle(verify_setting, verify)
 
 
+def _sync_upload(
+    http,
+    headers: dict,
+    url: str,
+    upload_id: str,
+    run_id: str,
+    verify_setting: Optional[str],
+) -> None:
+    """Links an upload to a run, raising on failure."""
+    sync_url = f"{url}/uploads/sync"
+    sync_payload = {"upload_id": upload_id, "run_id": run_id}
+
+    response = http.post(
+        sync_url,
+        data=json.dumps(sync_payload),
+        headers=headers,
+        timeout=SECONDS_BEFORE_TIMEOUT,
+        verify=verify_setting,
+    )
+    response.raise_for_status()
+
+
 def notify_server(
     headers: dict,
     url: str,
@@ -122,6 +186,7 @@ def notify_server(
     run_id: str,
     logger = None,
     verify: Optional[str] = None,
+    session: Optional[requests.Session] = None,
 ) -> bool:
     """Tells TP server to sync upload with newly created run
     
@@ -132,24 +197,16 @@ def notify_server(
         run_id (str): ID of the run to link to
         logger (Optional[Logger]): The logger to use
         verify (Optional[str]): Path to a CA bundle file to verify the server certificate
+        session (Optional[requests.Session]): Pooled session to send requests with
         
     Returns:
         bool: True if successful
     """
     verify_setting = prepare_verify_setting(verify)
+    http = session or requests
     
     try:
-        sync_url = f"{url}/uploads/sync"
-        sync_payload = {"upload_id": upload_id, "run_id": run_id}
-
-        response = requests.post(
-            sync_url,
-            data=json.dumps(sync_payload),
-            headers=headers,
-            timeout=SECONDS_BEFORE_TIMEOUT,
-            verify=verify_setting,
-        )
-        response.raise_for_status()
+        _sync_upload(http, headers, url, upload_id, run_id, verify_setting)
 
         return True
     except Exception as e:
@@ -163,8 +220,7 @@ def notify_server(
         cleanup_temp_cert_bundle(verify_setting, verify)
 
 
-def upload_attachment_data(
-    logger: Logger,
+def _store_attachment(
     headers: dict,
     url: str,
     name: str,
@@ -172,19 +228,22 @@ def upload_attachment_data(
     mimetype: str,
     run_id: str,
     verify: Optional[str],
-) -> bool:
-    """
-    Uploads binary data as an attachment and links it to a run
+    session: Optional[requests.Session] = None,
+) -> Optional[Exception]:
+    """Initializes an upload, stores the data in it and links it to a run.
 
-    Uses LoggerStateManager to ensure proper logging, similar to OpenHTF implementation.
+    Does no logging so it can run on worker threads. Raises if the upload could not
+    be initialized or stored. A failure to link the stored upload to the run is
+    returned instead, as the attachment itself was transferred.
     """
     verify_setting = prepare_verify_setting(verify)
-    
+    http = session or requests
+
     try:
         initialize_url = f"{url}/uploads/initialize"
         payload = {"name": name}
 
-        response = requests.post(
+        response = http.post(
             initialize_url,
             data=json.dumps(payload),
             headers=headers,
@@ -200,7 +259,7 @@ def upload_attachment_data(
 
         # Upload the actual data
         content_type = mimetype or "application/octet-stream"
-        upload_response = requests.put(
+        upload_response = http.put(
             upload_url,
             data=data,
             headers={"Content-Type": content_type},
@@ -209,26 +268,138 @@ def upload_attachment_data(
         )
         upload_response.raise_for_status()
 
-        # Link attachment to run (uses its own verify handling)
-        notify_server(headers, url, upload_id, run_id, verify=verify, logger=logger)
+        # Link attachment to run
+        try:
+            _sync_upload(http, headers, url, upload_id, run_id, verify_setting)
+        except Exception as e:
+            posthog.capture_exception(e)
+            return e
+        return None
+    finally:
+        cleanup_temp_cert_bundle(verify_setting, verify)
+
 
-        # Log success with LoggerStateManager for visibility
-        with LoggerStateManager(logger):
-            logger.success(f"Uploaded attachment: {name}")
-        return True
-    except Exception as e:
-        posthog.capture_exception(e)
+def _store_file_attachment(
+    headers: dict,
+    url: str,
+    name: str,
+    file_path: str,
+    mimetype: str,
+    run_id: str,
+    verify: Optional[str],
+    session: Optional[requests.Session] = None,
+) -> Optional[Exception]:
+    """Same as `_store_attachment`, streaming the content from `file_path`.
+
+    The open file is passed as the request body, so it is sent in blocks with a
+    Content-Length taken from its size and never fully loaded in memory.
+    """
+    with open(file_path, "rb") as file:
+        return _store_attachment(
+            headers, url, name, file, mimetype, run_id, verify, session
+        )
+
+
+def _report_attachment_upload(
+    logger: Logger,
+    name: str,
+    sync_error: Optional[Exception],
+    error: Optional[Exception],
+) -> bool:
+    """Logs the outcome of `_store_attachment` and returns whether the file was stored."""
+    if error is not None:
+        posthog.capture_exception(error)
         # Log error with LoggerStateManager for visibility
         with LoggerStateManager(logger):
-            logger.error(f"Upload failed: {name} - {str(e)}")
-            
+            logger.error(f"Upload failed: {name} - {str(error)}")
+
             # Provide specific guidance for SSL errors with storage service
-            if "storage." in str(e) and "certificate is not valid for" in str(e):
+            if "storage." in str(error) and "certificate is not valid for" in str(error):
                 logger.warning("Certificate must include storage subdomain")
                 logger.warning("Generate wildcard certificate or add storage hostname to SAN")
         return False
-    finally:
-        cleanup_temp_cert_bundle(verify_setting, verify)
+
+    # Log success with LoggerStateManager for visibility
+    with LoggerStateManager(logger):
+        if sync_error is not None:
+            logger.error(f"Failed to sync attachment: {str(sync_error)}")
+        logger.success(f"Uploaded attachment: {name}")
+    return True
+
+
+def _call_isolated(task: Callable[[], Any]) -> Tuple[Any, Optional[Exception]]:
+    try:
+        return task(), None
+    except Exception as e:
+        return None, e
+
+
+def _iter_in_pool(
+    tasks: List[Callable[[], Any]],
+    concurrency: int,
+) -> Iterator[Tuple[Any, Optional[Exception]]]:
+    """Runs tasks on at most `concurrency` worker threads.
+
+    Yields one `(result, error)` pair per task, in task order, as soon as that task
+    and every task before it are done. An exception only fails its own task.
+    """
+    if concurrency <= 1 or len(tasks) <= 1:
+        for task in tasks:
+            yield _call_isolated(task)
+        return
+
+    with ThreadPoolExecutor(
+        max_workers=min(concurrency, len(tasks)),
+        thread_name_prefix="tofupilot-upload",
+    ) as executor:
+        futures = [executor.submit(_call_isolated, task) for task in tasks]
+        for future in futures:
+            yield future.result()
+
+
+def upload_attachment_data(
+    logger: Logger,
+    headers: dict,
+    url: str,
+    name: str,
+    data,
+    mimetype: str,
+    run_id: str,
+    verify: Optional[str],
+    session: Optional[requests.Session] = None,
+) -> bool:
+    """
+    Uploads binary data as an attachment and links it to a run
+
+    Uses LoggerStateManager to ensure proper logging, similar to OpenHTF implementation.
+    """
+    sync_error, error = _call_isolated(
+        lambda: _store_attachment(
+            headers, url, name, data, mimetype, run_id, verify, session
+        )
+    )
+    return _report_attachment_upload(logger, name, sync_error, error)
+
+
+def _file_upload_task(
+    headers: dict,
+    url: str,
+    file_path: str,
+    run_id: str,
+    verify: Optional[str],
+    session: Optional[requests.Session],
+) -> Callable[[], Optional[Exception]]:
+    """Returns a task reading and uploading one file, run on an upload worker."""
+
+    def task() -> Optional[Exception]:
+        name = os.path.basename(file_path)
+        mimetype, _ = mimetypes.guess_type(file_path) or "application/octet-stream"
+        return _store_file_attachment(
+            headers, url, name, file_path, mimetype, run_id, verify, session
+        )
+
+    return task
+
 
 def upload_attachments(
     logger: Logger,
@@ -237,11 +408,16 @@ def upload_attachments(
     paths: List[str],
     run_id: str,
     verify: Optional[str] = None,
-):
+    session: Optional[requests.Session] = None,
+    concurrency: int = UPLOAD_CONCURRENCY,
+) -> List[bool]:
     """Creates one upload per file and stores them into TofuPilot
 
     Uses LoggerStateManager to ensure logging is properly handled during the upload process,
-    similar to the OpenHTF implementation.s
+    similar to the OpenHTF implementation.
+
+    Files are transferred by up to `concurrency` workers. Results are logged and
+    returned in the order of `paths`, and a failing file never stops the others.
     
     Args:
         logger (Logger): Logger instance
@@ -250,43 +426,42 @@ def upload_attachments(
         paths (List[Dict[str, Optional[str]]]): List of file paths to upload
         run_id (str): ID of the run to link files to
         verify (Optional[str]): Path to a CA bundle file to verify the server certificate
+        session (Optional[requests.Session]): Pooled session to send requests with
+        concurrency (int): Maximum number of files uploaded at the same time
+
+    Returns:
+        List[bool]: Whether each file of `paths` was uploaded
     """
     # Print a visual separator before attachment uploads
     print("")
 
-    for file_path in paths:
+    results = [False] * len(paths)
+    pending: List[int] = []
+    tasks: List[Callable[[], Any]] = []
+
+    for index, file_path in enumerate(paths):
         # Use LoggerStateManager to ensure logger is active for each file
         with LoggerStateManager(logger):
             logger.info(f"Uploading attachment: {file_path}")
 
-        try:
-            # Verify file exists
-            if not os.path.exists(file_path):
-                error_message = f"File not found: {file_path}"
-                posthog.capture_exception(ApiV1Error(error_message))
-                with LoggerStateManager(logger):
-                    logger.error(error_message)
-                continue
-
-            # Open file and prepare for upload
-            with open(file_path, "rb") as file:
-                name = os.path.basename(file_path)
-                data = file.read()
-                mimetype, _ = (
-                    mimetypes.guess_type(file_path) or "application/octet-stream"
-                )
-
-                # Use shared upload function
-                upload_attachment_data(
-                    logger, headers, url, name, data, mimetype, run_id, verify
-                )
-        except Exception as e:
-            posthog.capture_exception(e)
-            # Use LoggerStateManager to ensure error is visible
+        # Verify file exists
+        if not os.path.exists(file_path):
+            error_message = f"File not found: {file_path}"
+            posthog.capture_exception(ApiV1Error(error_message))
             with LoggerStateManager(logger):
-                logger.error(f"Upload failed: {file_path} - {str(e)}")
+                logger.error(error_message)
             continue
 
+        pending.append(index)
+        tasks.append(_file_upload_task(headers, url, file_path, run_id, verify, session))
+
+    for index, (sync_error, error) in zip(pending, _iter_in_pool(tasks, concurrency)):
+        results[index] = _report_attachment_upload(
+            logger, os.path.basename(paths[index]), sync_error, error
+        )
+
+    return results
+
 
 def process_openhtf_attachments(
     logger: Logger,
@@ -298,6 +473,8 @@ def process_openhtf_attachments(
     max_file_size: int,
     needs_base64_decode: bool = True,
     verify: Optional[str] = None,
+    session: Optional[requests.Session] = None,
+    concurrency: int = UPLOAD_CONCURRENCY,
 ) -> None:
     """
     Process attachments from an OpenHTF test record and upload them.
@@ -317,6 +494,9 @@ def process_openhtf_attachments(
         max_attachments: Maximum number of attachments to process
         max_file_size: Maximum size per attachment
         needs_base64_decode: Whether attachment data is base64 encoded (true for dict format)
+        verify: Path to a CA bundle file to verify the server certificate
+        session: Pooled session to send requests with
+        concurrency: Maximum number of attachments uploaded at the same time
     """
     # Print a visual separator
     print("")
@@ -327,6 +507,7 @@ def process_openhtf_attachments(
 
     try:
         attachment_count = 0
+        pending: List[Tuple[str, Callable[[], Optional[Exception]]]] = []
 
         # Extract phases from test record based on type
         if isinstance(test_record, dict):
@@ -371,6 +552,9 @@ def process_openhtf_attachments(
                 if attachment_count >= max_attachments:
                     break
 
+                # Set when the attachment content lives in a file on disk
+                source_path: Optional[str] = None
+
                 # Debug attachment details (using debug level to avoid cluttering the console)
                 if isinstance(test_record, dict):
                     with LoggerStateManager(logger):
@@ -414,57 +598,61 @@ def process_openhtf_attachments(
                         continue
                 else:
                     # Object format (from callback)
-                    attachment_data = getattr(attachment, "data", None)
-
-                    # Handle different attachment types in OpenHTF
-                    if attachment_data is None:
-                        warning_message = f"No data in: {name}"
-                        posthog.capture_exception(ApiV1Error(warning_message))
-                        with LoggerStateManager(logger):
-                            logger.warning(warning_message)
-                        continue
-
-                    # Handle file-based attachments in different formats
+                    # File-based attachments are streamed from disk by the upload
+                    # worker instead of being loaded into memory here.
                     data = None
 
                     # Option 1: Check for direct file_path attribute
                     if hasattr(attachment, "file_path") and getattr(
                         attachment, "file_path"
                     ):
-                        try:
-                            file_path = getattr(attachment, "file_path")
-                            with LoggerStateManager(logger):
-                                logger.info(f"Found file_path attribute: {file_path}")
-                            with open(file_path, "rb") as f:
-                                data = f.read()
-                        except Exception as e:
-                            posthog.capture_exception(e)
+                        file_path = getattr(attachment, "file_path")
+                        with LoggerStateManager(logger):
+                            logger.info(f"Found file_path attribute: {file_path}")
+                        if os.path.isfile(file_path):
+                            source_path = file_path
+                        else:
+                            posthog.capture_exception(ApiV1Error(f"File not found: {file_path}"))
                             with LoggerStateManager(logger):
-                                logger.error(f"Failed to read from file_path: {str(e)}")
+                                logger.error(f"Failed to read from file_path: {file_path}")
 
                     # Option 2: Check for filename attribute (used in some OpenHTF versions)
                     elif hasattr(attachment, "filename") and getattr(
                         attachment, "filename"
                     ):
-                        try:
-                            file_path = getattr(attachment, "filename")
-                            with LoggerStateManager(logger):
-                                logger.info(f"Found filename attribute: {file_path}")
-                            with open(file_path, "rb") as f:
-                                data = f.read()
-                        except Exception as e:
-                            posthog.capture_exception(e)
+                        file_path = getattr(attachment, "filename")
+                        with LoggerStateManager(logger):
+                            logger.info(f"Found filename attribute: {file_path}")
+                        if os.path.isfile(file_path):
+                            source_path = file_path
+                        else:
+                            posthog.capture_exception(ApiV1Error(f"File not found: {file_path}"))
                             with LoggerStateManager(logger):
-                                logger.error(f"Failed to read from filename: {str(e)}")
+                                logger.error(f"Failed to read from filename: {file_path}")
 
-                    # Option 3: Use the data attribute directly
+                    # Option 3: OpenHTF keeps attachment content in a temporary file
+                    elif isinstance(
+                        getattr(attachment, "_filename", None), str
+                    ) and os.path.isfile(getattr(attachment, "_filename")):
+                        source_path = getattr(attachment, "_filename")
+
+                    # Option 4: Use the data attribute directly
                     else:
+                        data = getattr(attachment, "data", None)
+
+                        # Handle different attachment types in OpenHTF
+                        if data is None:
+                            warning_message = f"No data in: {name}"
+                            posthog.capture_exception(ApiV1Error(warning_message))
+                            with LoggerStateManager(logger):
+                                logger.warning(warning_message)
+                            continue
+
                         with LoggerStateManager(logger):
                             logger.info("Using data attribute directly")
-                        data = attachment_data
 
                     # Verify we have valid data
-                    if data is None:
+                    if data is None and source_path is None:
                         error_message = f"No valid data found for attachment: {name}"
                         posthog.capture_exception(ApiV1Error(error_message))
                         with LoggerStateManager(logger):
@@ -472,7 +660,11 @@ def process_openhtf_attachments(
                         continue
 
                     # Get size from attribute or calculate it
-                    attachment_size = getattr(attachment, "size", len(data))
+                    attachment_size = getattr(
+                        attachment,
+                        "size",
+                        os.path.getsize(source_path) if source_path else len(data),
+                    )
                     mimetype = getattr(
                         attachment, "mimetype", "application/octet-stream"
                     )
@@ -485,30 +677,26 @@ def process_openhtf_attachments(
                         logger.warning(warning_message)
                     continue
 
-                # Increment counter and process the attachment
+                # Increment counter and queue the attachment for upload
                 attachment_count += 1
-
-                # Use unified attachment upload function - logging is handled inside this function
-                try:
-                    success = upload_attachment_data(
-                        logger,
-                        headers,
-                        url,
-                        name,
-                        data,
-                        mimetype,
-                        run_id,
-                        verify
+                if source_path is not None:
+                    task = partial(
+                        _store_file_attachment,
+                        headers, url, name, source_path, mimetype, run_id, verify, session,
                     )
-
-                    # Don't log success/failure here as it's already logged in upload_attachment_data
-                except Exception as e:
-                    posthog.capture_exception(e)
-                    with LoggerStateManager(logger):
-                        logger.error(
-                            f"Exception during attachment upload: {name} - {str(e)}"
-                        )
-                # Continue with other attachments regardless of success/failure
+                else:
+                    task = partial(
+                        _store_attachment,
+                        headers, url, name, data, mimetype, run_id, verify, session,
+                    )
+                pending.append((name, task))
+
+        # Upload queued attachments concurrently, reporting them in record order
+        tasks = [task for _, task in pending]
+        for (name, _), (sync_error, error) in zip(
+            pending, _iter_in_pool(tasks, concurrency)
+        ):
+            _report_attachment_upload(logger, name, sync_error, error)
     except Exception as e:
         posthog.capture_exception(e)
         raise e
@@ -1,13 +1,27 @@
-from typing import Dict, List, Optional, Any, Union
+from typing import TYPE_CHECKING, Dict, List, Optional, Any, Union
+import json
 import tempfile
 import os
+import time
 
 import requests
+import urllib3
+from requests.adapters import HTTPAdapter
 import certifi
 import posthog
-from ..constants.requests import SECONDS_BEFORE_TIMEOUT
+from ..constants.requests import (
+    SECONDS_BEFORE_TIMEOUT,
+    POOL_CONNECTIONS,
+    POOL_MAXSIZE,
+    RETRY_STATUS_CODES,
+    IDEMPOTENCY_KEY_HEADER,
+)
 from ..responses import HttpErrorResponse, NetworkErrorResponse, ErrorResponse
 
+if TYPE_CHECKING:
+    from ...v2.utils.compression import CompressionConfig
+    from ...v2.utils.retries import Retries, RetryBudget, RetryConfig
+
 # Cache for certificate bundles to avoid recreating them
 _cert_bundle_cache = {}
 
@@ -48,6 +62,36 @@ def cleanup_temp_cert_bundle(verify_setting: str, original_verify: Optional[str]
     pass
 
 
+def create_session(
+    pool_connections: int = POOL_CONNECTIONS,
+    pool_maxsize: int = POOL_MAXSIZE,
+    keep_alive: bool = True,
+) -> requests.Session:
+    """Create a pooled session shared by every request of a client.
+
+    Args:
+        pool_connections (int): Number of per-host connection pools to cache.
+        pool_maxsize (int): Maximum number of connections kept open per host.
+        keep_alive (bool): Reuse connections between requests. When False, every
+            request asks the server to close the connection once answered.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    if not keep_alive:
+        session.headers["Connection"] = "close"
+    return session
+
+
+def with_idempotency_key(headers: Dict, key: str) -> Dict:
+    """Returns the headers with the idempotency `key` of a request, so sending it
+    again is applied once by the server. A key already set in the headers is kept."""
+    if IDEMPOTENCY_KEY_HEADER in requests.structures.CaseInsensitiveDict(headers):
+        return headers
+    return {**headers, IDEMPOTENCY_KEY_HEADER: key}
+
+
 def parse_error_message(response: requests.Response) -> str:
     """Extract error message from response"""
     try:
@@ -59,33 +103,121 @@ def parse_error_message(response: requests.Response) -> str:
         return f"HTTP error occurred: {response.text}"
 
 
+def _retry_policy(
+    method: str,
+    headers: Dict,
+    retry_config: Optional["RetryConfig"],
+    retry_budget: Optional["RetryBudget"],
+) -> Optional["Retries"]:
+    """Builds the retry policy of a request, the same as the v2 client applies."""
+    if retry_config is None or retry_config.strategy != "backoff":
+        return None
+
+    # Only loaded by clients configured with a v2 RetryConfig
+    from ...v2.utils.retries import Retries, is_idempotent
+
+    return Retries(
+        retry_config,
+        RETRY_STATUS_CODES,
+        idempotent=is_idempotent(method, requests.structures.CaseInsensitiveDict(headers)),
+        budget=retry_budget,
+    )
+
+
+def _was_sent(e: requests.RequestException) -> bool:
+    """Whether the request may have reached the server before `e` was raised."""
+    if isinstance(e, requests.exceptions.ConnectTimeout):
+        return False
+    reason = getattr(e.args[0], "reason", None) if e.args else None
+    return not isinstance(reason, urllib3.exceptions.NewConnectionError)
+
+
+def _compressed_body(data: Optional[Dict], compression: Optional["CompressionConfig"]):
+    """Returns the JSON body compressed and its content encoding, or None to send `data` as is."""
+    if data is None or compression is None:
+        return None
+
+    # Only loaded by clients configured with a v2 CompressionConfig
+    from ...v2.utils.compression import compress_body
+
+    return compress_body(json.dumps(data, allow_nan=False), compression)
+
+
 def api_request(
     logger, method: str, url: str, headers: Dict, 
     data: Optional[Dict] = None, 
     params: Optional[Dict] = None,
     timeout: int = SECONDS_BEFORE_TIMEOUT,
     verify: Optional[str] = None,
+    session: Optional[requests.Session] = None,
+    retry_config: Optional["RetryConfig"] = None,
+    retry_budget: Optional["RetryBudget"] = None,
+    compression: Optional["CompressionConfig"] = None,
 ) -> Union[Dict[str, Any], ErrorResponse]:
-    """Unified API request handler with consistent error handling"""
+    """Unified API request handler with consistent error handling
+
+    With a `retry_config`, failed requests are retried following the v2 client's
+    retry policy: `Retry-After`, jittered backoff, the client's `retry_budget`, and
+    non-idempotent requests only retried when the server can't have processed them.
+
+    With a `compression` configuration, large JSON bodies are sent compressed.
+    """
     verify_setting = prepare_verify_setting(verify)
-    
+    http = session or requests
+    policy = _retry_policy(method, headers, retry_config, retry_budget)
+    body: Dict[str, Any] = {"json": data}
+    compressed = _compressed_body(data, compression)
+    if compressed is not None:
+        content, encoding = compressed
+        body = {"data": content}
+        headers = {
+            **headers,
+            "Content-Type": "application/json",
+            "Content-Encoding": encoding,
+        }
+    if policy is not None and policy.budget is not None:
+        policy.budget.deposit()
+    start = time.monotonic()
+    attempt = 0
+
     try:
-        response = requests.request(
-            method, url, 
-            json=data,
-            headers=headers,
-            params=params,
-            timeout=timeout,
-            verify=verify_setting,
-        )
-        response.raise_for_status()
-        result = handle_response(logger, response)
-        
-        return result
-    except requests.exceptions.HTTPError as http_err:
-        return handle_http_error(logger, http_err)
-    except requests.RequestException as e:
-        return handle_network_error(logger, e)
+        while True:
+            try:
+                response = http.request(
+                    method, url, 
+                    headers=headers,
+                    params=params,
+                    timeout=timeout,
+                    verify=verify_setting,
+                    **body,
+                )
+                if policy is not None and policy.retries_status(response.status_code):
+                    sleep = policy.next_sleep(
+                        attempt, time.monotonic() - start, response.headers
+                    )
+                    if sleep is not None:
+                        logger.debug(
+                            "Retrying %s %s in %.1fs after HTTP %s",
+                            method, url, sleep, response.status_code,
+                        )
+                        time.sleep(sleep)
+                        attempt += 1
+                        continue
+                response.raise_for_status()
+                result = handle_response(logger, response)
+
+                return result
+            except requests.exceptions.HTTPError as http_err:
+                return handle_http_error(logger, http_err)
+            except requests.RequestException as e:
+                if policy is not None and policy.retries_error(sent=_was_sent(e)):
+                    sleep = policy.next_sleep(attempt, time.monotonic() - start)
+                    if sleep is not None:
+                        logger.debug("Retrying %s %s in %.1fs after %s", method, url, sleep, e)
+                        time.sleep(sleep)
+                        attempt += 1
+                        continue
+                return handle_network_error(logger, e)
     finally:
         cleanup_temp_cert_bundle(verify_setting, verify)
 
@@ -9,7 +9,7 @@ from tofupilot.v2._hooks import (
     BeforeRequestContext,
 )
 from tofupilot.v2.utils import RetryConfig, SerializedRequestBody, get_body_content
-from typing import Callable, List, Mapping, Optional, Tuple
+from typing import Callable, List, Mapping, Optional, Tuple, Union
 from urllib.parse import parse_qs, urlparse
 
 
@@ -162,14 +162,21 @@ class BaseSDK:
         headers["Accept"] = accept_header_value
         headers[user_agent_header] = self.sdk_configuration.user_agent
 
-        if security is not None:
-            if callable(security):
-                security = security()
-        security = utils.get_security_from_env(security, models.Security)
-        if security is not None:
-            security_headers, security_query_params = utils.get_security(security)
+        if security is self.sdk_configuration.security:
+            security_headers, security_query_params = (
+                self.sdk_configuration.security_cache.get(security, models.Security)
+            )
             headers = {**headers, **security_headers}
             query_params = {**query_params, **security_query_params}
+        else:
+            if security is not None:
+                if callable(security):
+                    security = security()
+            security = utils.get_security_from_env(security, models.Security)
+            if security is not None:
+                security_headers, security_query_params = utils.get_security(security)
+                headers = {**headers, **security_headers}
+                query_params = {**query_params, **security_query_params}
 
         serialized_request_body = SerializedRequestBody()
         if get_serialized_body is not None:
@@ -190,11 +197,31 @@ class BaseSDK:
         ):
             headers["content-type"] = serialized_request_body.media_type
 
+        content = serialized_request_body.content
+        if isinstance(content, utils.JsonStream):
+            encoding = content.compress(self.sdk_configuration.compression)
+            if encoding is not None:
+                headers["content-encoding"] = encoding
+            if client is self.sdk_configuration.async_client:
+                serialized_request_body.content = content.async_iterable()
+        else:
+            compressed = utils.compress_body(
+                content, self.sdk_configuration.compression
+            )
+            if compressed is not None:
+                serialized_request_body.content, headers["content-encoding"] = (
+                    compressed
+                )
+
         if http_headers is not None:
             for header, value in http_headers.items():
                 headers[header] = value
 
-        timeout = timeout_ms / 1000 if timeout_ms is not None else None
+        timeout: Optional[Union[httpx.Timeout, float]] = None
+        if timeout_ms is not None:
+            timeout = timeout_ms / 1000
+        elif self.sdk_configuration.transport is not None:
+            timeout = self.sdk_configuration.transport.timeout()
 
         return client.build_request(
             method,
@@ -207,6 +234,16 @@ class BaseSDK:
             timeout=timeout,
         )
 
+    def _retries(
+        self, request: httpx.Request, retry_config: Tuple[RetryConfig, List[str]]
+    ) -> utils.Retries:
+        return utils.Retries(
+            retry_config[0],
+            retry_config[1],
+            idempotent=utils.is_idempotent(request.method, request.headers),
+            budget=self.sdk_configuration.retry_budget,
+        )
+
     def do_request(
         self,
         hook_ctx,
@@ -219,6 +256,11 @@ class BaseSDK:
         logger = self.sdk_configuration.debug_logger
 
         hooks = self.sdk_configuration.__dict__["_hooks"]
+        breaker = self.sdk_configuration.circuit_breaker
+
+        transport = self.sdk_configuration.transport
+        if transport is not None:
+            transport.set_operation_timeout(request, hook_ctx.operation_id)
 
         def do():
             http_res = None
@@ -235,7 +277,19 @@ class BaseSDK:
                 if client is None:
                     raise ValueError("client is required")
 
-                http_res = client.send(req, stream=stream)
+                if breaker is None:
+                    http_res = client.send(req, stream=stream)
+                else:
+                    breaker.before_request(req.url.host)
+                    try:
+                        http_res = client.send(req, stream=stream)
+                    except Exception:
+                        breaker.record_failure(req.url.host)
+                        raise
+                    if http_res.status_code >= 500:
+                        breaker.record_failure(req.url.host)
+                    else:
+                        breaker.record_success(req.url.host)
             except Exception as e:
                 _, e = hooks.after_error(AfterErrorContext(hook_ctx), None, e)
                 if e is not None:
@@ -246,6 +300,10 @@ class BaseSDK:
                 logger.debug("Raising no response SDK error")
                 raise errors.NoResponseError("No response received")
 
+            if http_res.status_code == 401:
+                # The key may have been rotated, get it again for the next request
+                self.sdk_configuration.security_cache.invalidate()
+
             logger.debug(
                 "Response:\nStatus Code: %s\nURL: %s\nHeaders: %s\nBody: %s",
                 http_res.status_code,
@@ -270,7 +328,7 @@ class BaseSDK:
             return http_res
 
         if retry_config is not None:
-            http_res = utils.retry(do, utils.Retries(retry_config[0], retry_config[1]))
+            http_res = utils.retry(do, self._retries(request, retry_config))
         else:
             http_res = do()
 
@@ -291,6 +349,11 @@ class BaseSDK:
         logger = self.sdk_configuration.debug_logger
 
         hooks = self.sdk_configuration.__dict__["_hooks"]
+        breaker = self.sdk_configuration.circuit_breaker
+
+        transport = self.sdk_configuration.transport
+        if transport is not None:
+            transport.set_operation_timeout(request, hook_ctx.operation_id)
 
         async def do():
             http_res = None
@@ -307,7 +370,19 @@ class BaseSDK:
                 if client is None:
                     raise ValueError("client is required")
 
-                http_res = await client.send(req, stream=stream)
+                if breaker is None:
+                    http_res = await client.send(req, stream=stream)
+                else:
+                    breaker.before_request(req.url.host)
+                    try:
+                        http_res = await client.send(req, stream=stream)
+                    except Exception:
+                        breaker.record_failure(req.url.host)
+                        raise
+                    if http_res.status_code >= 500:
+                        breaker.record_failure(req.url.host)
+                    else:
+                        breaker.record_success(req.url.host)
             except Exception as e:
                 _, e = hooks.after_error(AfterErrorContext(hook_ctx), None, e)
                 if e is not None:
@@ -318,6 +393,10 @@ class BaseSDK:
                 logger.debug("Raising no response SDK error")
                 raise errors.NoResponseError("No response received")
 
+            if http_res.status_code == 401:
+                # The key may have been rotated, get it again for the next request
+                self.sdk_configuration.security_cache.invalidate()
+
             logger.debug(
                 "Response:\nStatus Code: %s\nURL: %s\nHeaders: %s\nBody: %s",
                 http_res.status_code,
@@ -343,7 +422,7 @@ class BaseSDK:
 
         if retry_config is not None:
             http_res = await utils.retry_async(
-                do, utils.Retries(retry_config[0], retry_config[1])
+                do, self._retries(request, retry_config)
             )
         else:
             http_res = await do()
@@ -0,0 +1,262 @@
+"""Concurrent bulk submission on top of the v2 `create` endpoints.
+
+Items are submitted with bounded concurrency. When the server answers 429,
+the item is retried after `Retry-After` and the concurrency is halved, then
+grows back by one for every `limit` successful requests (AIMD), so throughput
+settles at what the server accepts.
+"""
+
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+    Union,
+)
+
+from pydantic import BaseModel
+
+from .errors.tofupiloterror import TofuPilotError
+from .utils.retries import parse_retry_after
+
+DEFAULT_CONCURRENCY = 8
+"""Default number of requests in flight."""
+
+MAX_RATE_LIMITED_ATTEMPTS = 8
+"""Attempts per item before a 429 response is reported as its failure."""
+
+_DEFAULT_RETRY_AFTER_S = 1.0
+_MAX_RETRY_AFTER_S = 60.0
+
+
+@dataclass
+class BulkResult:
+    """Outcome of one submitted item, in input order."""
+
+    index: int
+    """Position of the item in the submitted iterable."""
+    response: Optional[Any] = None
+    """The endpoint response, if the item was created."""
+    error: Optional[Exception] = None
+    """The error raised for the item, if it failed."""
+
+    @property
+    def success(self) -> bool:
+        return self.error is None
+
+
+ProgressCallback = Callable[[BulkResult, int], None]
+"""Called with each result and the number of items completed so far."""
+
+
+def _as_kwargs(item: Union[BaseModel, Mapping[str, Any]]) -> Dict[str, Any]:
+    """Turns a request model or a mapping into keyword arguments for `create`."""
+    if isinstance(item, BaseModel):
+        return {name: getattr(item, name) for name in item.model_fields_set}
+    return dict(item)
+
+
+def _retry_after(error: Exception, attempt: int) -> Optional[float]:
+    """Returns how long to wait before retrying, or None if `error` is not a rate limit."""
+    if not isinstance(error, TofuPilotError) or error.status_code != 429:
+        return None
+
+    delay = parse_retry_after(error.headers.get("retry-after"))
+    if delay is None:
+        delay = _DEFAULT_RETRY_AFTER_S * 2 ** (attempt - 1)
+    return min(delay, _MAX_RETRY_AFTER_S)
+
+
+class _AdaptiveLimit:
+    """AIMD bookkeeping of how many requests may be in flight."""
+
+    def __init__(self, max_concurrency: int):
+        self.max_concurrency = max_concurrency
+        self.limit = max_concurrency
+        self.active = 0
+        self.resume_at = 0.0
+        self._successes = 0
+
+    def _wait_time(self) -> Optional[float]:
+        """Seconds until a request may start, 0 to wait for a release, None if it may start now."""
+        delay = self.resume_at - time.monotonic()
+        if delay > 0:
+            return delay
+        if self.active >= self.limit:
+            return 0.0
+        return None
+
+    def _record(self, retry_after: Optional[float]):
+        self.active -= 1
+        if retry_after is None:
+            self._successes += 1
+            if self._successes >= self.limit and self.limit < self.max_concurrency:
+                self.limit += 1
+                self._successes = 0
+        else:
+            self.limit = max(1, self.limit // 2)
+            self._successes = 0
+            self.resume_at = max(self.resume_at, time.monotonic() + retry_after)
+
+
+class _Throttle(_AdaptiveLimit):
+    def __init__(self, max_concurrency: int):
+        super().__init__(max_concurrency)
+        self._cond = threading.Condition()
+
+    def acquire(self):
+        with self._cond:
+            while True:
+                wait_s = self._wait_time()
+                if wait_s is None:
+                    self.active += 1
+                    return
+                self._cond.wait(wait_s or None)
+
+    def release(self, retry_after: Optional[float] = None):
+        with self._cond:
+            self._record(retry_after)
+            self._cond.notify_all()
+
+
+class _AsyncThrottle(_AdaptiveLimit):
+    def __init__(self, max_concurrency: int):
+        super().__init__(max_concurrency)
+        self._cond = asyncio.Condition()
+
+    async def acquire(self):
+        async with self._cond:
+            while True:
+                wait_s = self._wait_time()
+                if wait_s is None:
+                    self.active += 1
+                    return
+                try:
+                    await asyncio.wait_for(self._cond.wait(), wait_s or None)
+                except asyncio.TimeoutError:
+                    pass
+
+    async def release(self, retry_after: Optional[float] = None):
+        async with self._cond:
+            self._record(retry_after)
+            self._cond.notify_all()
+
+
+def create_many(
+    create: Callable[..., Any],
+    items: Iterable[Union[BaseModel, Mapping[str, Any]]],
+    *,
+    concurrency: int = DEFAULT_CONCURRENCY,
+    on_progress: Optional[ProgressCallback] = None,
+) -> List[BulkResult]:
+    """
+    Calls `create` for every item using up to `concurrency` threads.
+
+    Items are consumed lazily, so `items` can be a generator over a large data set.
+    A failing item does not stop the others: its error is reported in its result.
+
+    Args:
+        create: The endpoint method, e.g. `client.runs.create`.
+        items: Request models or mappings of keyword arguments for `create`.
+        concurrency: Maximum number of requests in flight.
+        on_progress: Called with each result and the number of completed items.
+
+    Returns:
+        List[BulkResult]: One result per item, in input order.
+    """
+    throttle = _Throttle(max(1, concurrency))
+    lock = threading.Lock()
+    pending: Iterator[Tuple[int, Any]] = enumerate(items)
+    results: Dict[int, BulkResult] = {}
+
+    def next_item() -> Optional[Tuple[int, Any]]:
+        with lock:
+            return next(pending, None)
+
+    def submit(index: int, item: Any) -> BulkResult:
+        kwargs = _as_kwargs(item)
+        attempt = 1
+        while True:
+            throttle.acquire()
+            try:
+                response = create(**kwargs)
+            except Exception as e:  # pylint: disable=broad-except
+                retry_after = _retry_after(e, attempt)
+                throttle.release(retry_after)
+                if retry_after is None or attempt >= MAX_RATE_LIMITED_ATTEMPTS:
+                    return BulkResult(index, error=e)
+                attempt += 1
+            else:
+                throttle.release()
+                return BulkResult(index, response=response)
+
+    def worker():
+        while True:
+            entry = next_item()
+            if entry is None:
+                return
+            result = submit(*entry)
+            with lock:
+                results[result.index] = result
+                if on_progress is not None:
+                    on_progress(result, len(results))
+
+    with ThreadPoolExecutor(
+        max_workers=max(1, concurrency), thread_name_prefix="tofupilot-bulk"
+    ) as pool:
+        for future in [pool.submit(worker) for _ in range(max(1, concurrency))]:
+            future.result()
+
+    return [results[index] for index in sorted(results)]
+
+
+async def create_many_async(
+    create_async: Callable[..., Awaitable[Any]],
+    items: Iterable[Union[BaseModel, Mapping[str, Any]]],
+    *,
+    concurrency: int = DEFAULT_CONCURRENCY,
+    on_progress: Optional[ProgressCallback] = None,
+) -> List[BulkResult]:
+    """Async version of `create_many`, running up to `concurrency` requests as tasks."""
+    throttle = _AsyncThrottle(max(1, concurrency))
+    pending: Iterator[Tuple[int, Any]] = enumerate(items)
+    results: Dict[int, BulkResult] = {}
+
+    async def submit(index: int, item: Any) -> BulkResult:
+        kwargs = _as_kwargs(item)
+        attempt = 1
+        while True:
+            await throttle.acquire()
+            try:
+                response = await create_async(**kwargs)
+            except Exception as e:  # pylint: disable=broad-except
+                retry_after = _retry_after(e, attempt)
+                await throttle.release(retry_after)
+                if retry_after is None or attempt >= MAX_RATE_LIMITED_ATTEMPTS:
+                    return BulkResult(index, error=e)
+                attempt += 1
+            else:
+                await throttle.release()
+                return BulkResult(index, response=response)
+
+    async def worker():
+        for index, item in pending:
+            result = await submit(index, item)
+            results[index] = result
+            if on_progress is not None:
+                on_progress(result, len(results))
+
+    await asyncio.gather(*(worker() for _ in range(max(1, concurrency))))
+
+    return [results[index] for index in sorted(results)]
@@ -1,14 +1,28 @@
 """TofuPilot SDK with enhanced error tracking and logging capabilities."""
 
+import functools
+import inspect
 import mimetypes
 import os
 from pathlib import Path
-from typing import Optional, Union
+from typing import (
+    Any,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+    Union,
+)
+from urllib.parse import urlparse
 
 from pydantic_core import ValidationError
 
+from . import bulk, models, pagination
 from .sdk import TofuPilot
 from .errors.tofupiloterror import TofuPilotError
+from .utils.circuit_breaker import CLOSED
+from .utils.storage import StorageClient
 
 
 def _enhance_error_message(e: TofuPilotError) -> None:
@@ -37,6 +51,31 @@ def _format_validation_error(e: ValidationError) -> str:
     return "Invalid input:\n" + "\n".join(lines)
 
 
+def _with_better_errors(method):
+    """Wrap a resource method to enhance the TofuPilotError it raises, awaiting `*_async` methods."""
+    if inspect.iscoroutinefunction(method):
+
+        @functools.wraps(method)
+        async def async_wrapper(*args, **kwargs):
+            try:
+                return await method(*args, **kwargs)
+            except TofuPilotError as e:
+                _enhance_error_message(e)
+                raise
+
+        return async_wrapper
+
+    @functools.wraps(method)
+    def wrapper(*args, **kwargs):
+        try:
+            return method(*args, **kwargs)
+        except TofuPilotError as e:
+            _enhance_error_message(e)
+            raise
+
+    return wrapper
+
+
 class _ResourceWithBetterErrors:
     """Wraps any SDK resource to enhance TofuPilotError messages with validation details."""
 
@@ -48,17 +87,37 @@ class _ResourceWithBetterErrors:
         if not callable(attr):
             return attr
 
-        def wrapper(*args, **kwargs):
-            try:
-                return attr(*args, **kwargs)
-            except TofuPilotError as e:
-                _enhance_error_message(e)
-                raise
-
+        # Stored on the instance, so later calls skip __getattr__ and reuse the wrapper
+        wrapper = _with_better_errors(attr)
+        setattr(self, name, wrapper)
         return wrapper
 
 
-class _RunsWithBetterErrors(_ResourceWithBetterErrors):
+# Resources whose `list` returns cursor-paginated pages
+_PAGINATED_RESOURCES = frozenset(("runs", "units", "parts", "batches", "procedures", "stations"))
+
+
+class _PaginatedResourceWithBetterErrors(_ResourceWithBetterErrors):
+    """Extends resource wrapper with helpers following the cursor of `list`."""
+
+    def iter_pages(self, *, prefetch: bool = False, **kwargs):
+        """Yield every page of `list`, following the cursor. Set `prefetch` to fetch the next page in the background."""
+        return pagination.iter_pages(self.list, prefetch=prefetch, **kwargs)
+
+    def list_all(self, *, prefetch: bool = False, **kwargs):
+        """Yield the items of every page of `list`, following the cursor. Set `prefetch` to fetch the next page in the background."""
+        return pagination.iter_items(self.list, prefetch=prefetch, **kwargs)
+
+    def iter_pages_async(self, *, prefetch: bool = False, **kwargs):
+        """Async version of `iter_pages`, based on `list_async`."""
+        return pagination.iter_pages_async(self.list_async, prefetch=prefetch, **kwargs)
+
+    def list_all_async(self, *, prefetch: bool = False, **kwargs):
+        """Async version of `list_all`, based on `list_async`."""
+        return pagination.iter_items_async(self.list_async, prefetch=prefetch, **kwargs)
+
+
+class _RunsWithBetterErrors(_PaginatedResourceWithBetterErrors):
     """Extends resource wrapper with ValidationError handling for runs.create."""
 
     def create(self, **kwargs):
@@ -70,14 +129,89 @@ class _RunsWithBetterErrors(_ResourceWithBetterErrors):
         except ValidationError as e:
             raise TofuPilotValidationError(_format_validation_error(e)) from None
 
+    async def create_async(self, **kwargs):
+        try:
+            return await self._resource.create_async(**kwargs)
+        except TofuPilotError as e:
+            _enhance_error_message(e)
+            raise
+        except ValidationError as e:
+            raise TofuPilotValidationError(_format_validation_error(e)) from None
+
+    def create_many(
+        self,
+        runs: Iterable[Union[models.RunCreateRequest, Mapping[str, Any]]],
+        *,
+        concurrency: int = bulk.DEFAULT_CONCURRENCY,
+        on_progress: Optional[bulk.ProgressCallback] = None,
+    ) -> List[bulk.BulkResult]:
+        """
+        Create many runs concurrently, backing off when the server rate limits.
+
+        Args:
+            runs: `models.RunCreateRequest` objects or dicts of `create` arguments.
+                Consumed lazily, so a generator can be used for large backfills.
+            concurrency: Maximum number of requests in flight.
+            on_progress: Called with each `BulkResult` and the number of runs completed so far.
+
+        Returns:
+            One `BulkResult` per run, in input order, with the response or the error.
+        """
+        return bulk.create_many(
+            self.create, runs, concurrency=concurrency, on_progress=on_progress
+        )
+
+    async def create_many_async(
+        self,
+        runs: Iterable[Union[models.RunCreateRequest, Mapping[str, Any]]],
+        *,
+        concurrency: int = bulk.DEFAULT_CONCURRENCY,
+        on_progress: Optional[bulk.ProgressCallback] = None,
+    ) -> List[bulk.BulkResult]:
+        """Async version of `create_many`."""
+        return await bulk.create_many_async(
+            self.create_async, runs, concurrency=concurrency, on_progress=on_progress
+        )
+
+
+def _upload_source(file: Union[str, Path]) -> Tuple[Path, str]:
+    """Check the file to upload exists and return it with its content type."""
+    file = Path(file)
+    if not file.exists():
+        raise FileNotFoundError(f"File not found: {file}")
+    return file, mimetypes.guess_type(str(file))[0] or "application/octet-stream"
+
+
+def _download_target(
+    attachment, dest: Union[str, Path, None], offset: int
+) -> Tuple[str, Path]:
+    """Check a download request and return its URL and destination."""
+    url = attachment.download_url
+    if not url:
+        raise ValueError(f"Attachment '{attachment.name}' has no download URL")
+    if offset < 0:
+        raise ValueError("offset must be a positive number of bytes")
+
+    dest = Path(dest) if dest else Path(attachment.name)
+    if offset and not dest.exists():
+        raise FileNotFoundError(f"Cannot resume download, file not found: {dest}")
+    return url, dest
+
 
 class _AttachmentsWithUpload(_ResourceWithBetterErrors):
     """Extends attachments resource with convenience upload and download methods."""
 
+    @property
+    def _storage(self) -> StorageClient:
+        return self._resource.sdk_configuration.storage
+
     def upload(self, file: Union[str, Path]) -> str:
         """Upload a file and return its attachment ID.
 
         Handles the full upload workflow: initialize → upload to storage → finalize.
+        The file is streamed to storage in chunks, so memory use does not grow with its size,
+        through the SDK's `StorageClient`, which retries failed uploads and checks the
+        checksum storage reports.
 
         Args:
             file: Path to the file to upload.
@@ -85,44 +219,55 @@ class _AttachmentsWithUpload(_ResourceWithBetterErrors):
         Returns:
             The attachment ID (use with units.update or runs.update).
         """
-        import httpx
+        file, content_type = _upload_source(file)
 
-        file = Path(file)
-        if not file.exists():
-            raise FileNotFoundError(f"File not found: {file}")
+        init = self.initialize(name=file.name)
+        self._storage.upload(init.upload_url, file, content_type)
+        self.finalize(id=init.id)
+        return init.id
 
-        content_type = mimetypes.guess_type(str(file))[0] or "application/octet-stream"
+    async def upload_async(self, file: Union[str, Path]) -> str:
+        """Async version of `upload`. The file is read in a worker thread."""
+        file, content_type = _upload_source(file)
 
-        init = self._resource.initialize(name=file.name)
-        with open(file, "rb") as f:
-            resp = httpx.put(init.upload_url, content=f.read(), headers={"Content-Type": content_type})
-        if resp.status_code != 200:
-            raise RuntimeError(f"File upload failed with status {resp.status_code}")
-        self._resource.finalize(id=init.id)
+        init = await self.initialize_async(name=file.name)
+        await self._storage.upload_async(init.upload_url, file, content_type)
+        await self.finalize_async(id=init.id)
         return init.id
 
-    def download(self, attachment, dest: Union[str, Path, None] = None) -> Path:
+    def download(
+        self,
+        attachment,
+        dest: Union[str, Path, None] = None,
+        offset: int = 0,
+    ) -> Path:
         """Download an attachment to a local file.
 
+        The response is streamed to disk in chunks, so memory use does not grow
+        with the attachment size, through the SDK's `StorageClient`.
+
         Args:
             attachment: An attachment object from unit.attachments or run.attachments.
             dest: Destination path. Defaults to the attachment name in the current directory.
+            offset: Byte offset to resume an interrupted download from. The first `offset`
+                bytes already in `dest` are kept and only the rest is requested. Falls back
+                to a full download if the server does not honor the range.
 
         Returns:
             The path to the downloaded file.
         """
-        import httpx
-
-        url = attachment.download_url
-        if not url:
-            raise ValueError(f"Attachment '{attachment.name}' has no download URL")
+        url, dest = _download_target(attachment, dest, offset)
+        return self._storage.download(url, dest, offset)
 
-        dest = Path(dest) if dest else Path(attachment.name)
-        resp = httpx.get(url)
-        if resp.status_code != 200:
-            raise RuntimeError(f"Download failed with status {resp.status_code}")
-        dest.write_bytes(resp.content)
-        return dest
+    async def download_async(
+        self,
+        attachment,
+        dest: Union[str, Path, None] = None,
+        offset: int = 0,
+    ) -> Path:
+        """Async version of `download`. The file is written in a worker thread."""
+        url, dest = _download_target(attachment, dest, offset)
+        return await self._storage.download_async(url, dest, offset)
 
 
 class TofuPilotWithErrorTracking(TofuPilot):
@@ -169,12 +314,28 @@ class TofuPilotWithErrorTracking(TofuPilot):
             **kwargs
         )
 
+    @property
+    def circuit_state(self) -> str:
+        """
+        State of the circuit breaker for the TofuPilot server: "closed", "open" or "half_open".
+
+        Always "closed" without a `circuit_breaker`. While "open", requests fail
+        right away with `errors.CircuitOpenError`, e.g. to spool runs locally instead.
+        """
+        breaker = self.sdk_configuration.circuit_breaker
+        if breaker is None:
+            return CLOSED
+        server_url, _ = self.sdk_configuration.get_server_details()
+        return breaker.state(urlparse(server_url).hostname or "")
+
     def __getattr__(self, name: str):
         attr = super().__getattr__(name)
         if name == 'runs':
             attr = _RunsWithBetterErrors(attr)
         elif name == 'attachments':
             attr = _AttachmentsWithUpload(attr)
+        elif name in _PAGINATED_RESOURCES:
+            attr = _PaginatedResourceWithBetterErrors(attr)
         else:
             attr = _ResourceWithBetterErrors(attr)
         setattr(self, name, attr)
@@ -5,6 +5,8 @@ from importlib import import_module
 
 if TYPE_CHECKING:
     from .apierror import APIError
+    from .checksum_mismatch_error import ChecksumMismatchError
+    from .circuit_open_error import CircuitOpenError
     from .errorbadgateway import ErrorBADGATEWAY, ErrorBADGATEWAYData
     from .errorbadrequest import ErrorBADREQUEST, ErrorBADREQUESTData
     from .errorconflict import ErrorCONFLICT, ErrorCONFLICTData
@@ -25,6 +27,8 @@ if TYPE_CHECKING:
 
 __all__ = [
     "APIError",
+    "ChecksumMismatchError",
+    "CircuitOpenError",
     "ErrorBADGATEWAY",
     "ErrorBADGATEWAYData",
     "ErrorBADREQUEST",
@@ -48,6 +52,8 @@ __all__ = [
 
 _dynamic_imports: dict[str, str] = {
     "APIError": ".apierror",
+    "ChecksumMismatchError": ".checksum_mismatch_error",
+    "CircuitOpenError": ".circuit_open_error",
     "ErrorBADGATEWAY": ".errorbadgateway",
     "ErrorBADGATEWAYData": ".errorbadgateway",
     "ErrorBADREQUEST": ".errorbadrequest",
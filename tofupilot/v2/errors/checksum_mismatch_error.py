@@ -0,0 +1,20 @@
+class ChecksumMismatchError(Exception):
+    """Error raised when a file transferred to or from storage doesn't match the checksum storage reports."""
+
+    url: str
+    expected: str
+    actual: str
+    message: str
+
+    def __init__(self, url: str, expected: str, actual: str):
+        self.url = url
+        self.expected = expected
+        self.actual = actual
+        self.message = (
+            f"Checksum mismatch for {url.split('?', 1)[0]}: "
+            f"storage reports MD5 {expected}, transferred {actual}"
+        )
+        super().__init__(self.message)
+
+    def __str__(self):
+        return self.message
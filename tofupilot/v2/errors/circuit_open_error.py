@@ -0,0 +1,17 @@
+class CircuitOpenError(Exception):
+    """Error raised without sending the request, while the circuit of its host is open."""
+
+    host: str
+    retry_after: float
+    message: str
+
+    def __init__(self, host: str, retry_after: float):
+        self.host = host
+        self.retry_after = retry_after
+        self.message = (
+            f"Circuit open for {host}, requests fail fast for {retry_after:.1f}s"
+        )
+        super().__init__(self.message)
+
+    def __str__(self):
+        return self.message
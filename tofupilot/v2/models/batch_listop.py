@@ -8,7 +8,7 @@ from tofupilot.v2.types import (
     Nullable,
     OptionalNullable,
     UNSET,
-    UNSET_SENTINEL,
+    serialize_fields,
 )
 from tofupilot.v2.utils import FieldMetadata, QueryParamMetadata
 from typing import List, Literal, Optional
@@ -119,33 +119,15 @@ class BatchListCreatedByUser(BaseModel):
 
     @model_serializer(mode="wrap")
     def serialize_model(self, handler):
-        optional_fields = []
-        nullable_fields = ["name"]
-        null_default_fields = []
+        optional_fields = ()
+        nullable_fields = ("name",)
+        null_default_fields = ()
 
         serialized = handler(self)
 
-        m = {}
-
-        for n, f in type(self).model_fields.items():
-            k = f.alias or n
-            val = serialized.get(k)
-            serialized.pop(k, None)
-
-            optional_nullable = k in optional_fields and k in nullable_fields
-            is_set = (
-                self.__pydantic_fields_set__.intersection({n})
-                or k in null_default_fields
-            )  # pylint: disable=no-member
-
-            if val is not None and val != UNSET_SENTINEL:
-                m[k] = val
-            elif val != UNSET_SENTINEL and (
-                not k in optional_fields or (optional_nullable and is_set)
-            ):
-                m[k] = val
-
-        return m
+        return serialize_fields(
+            self, serialized, optional_fields, nullable_fields, null_default_fields
+        )
 
 
 class BatchListCreatedByStationTypedDict(TypedDict):
@@ -203,33 +185,15 @@ class BatchListData(BaseModel):
 
     @model_serializer(mode="wrap")
     def serialize_model(self, handler):
-        optional_fields = ["created_by_user", "created_by_station"]
-        nullable_fields = ["created_by_user", "created_by_station"]
-        null_default_fields = []
+        optional_fields = ("created_by_user", "created_by_station")
+        nullable_fields = ("created_by_user", "created_by_station")
+        null_default_fields = ()
 
         serialized = handler(self)
 
-        m = {}
-
-        for n, f in type(self).model_fields.items():
-            k = f.alias or n
-            val = serialized.get(k)
-            serialized.pop(k, None)
-
-            optional_nullable = k in optional_fields and k in nullable_fields
-            is_set = (
-                self.__pydantic_fields_set__.intersection({n})
-                or k in null_default_fields
-            )  # pylint: disable=no-member
-
-            if val is not None and val != UNSET_SENTINEL:
-                m[k] = val
-            elif val != UNSET_SENTINEL and (
-                not k in optional_fields or (optional_nullable and is_set)
-            ):
-                m[k] = val
-
-        return m
+        return serialize_fields(
+            self, serialized, optional_fields, nullable_fields, null_default_fields
+        )
 
 
 class BatchListMetaTypedDict(TypedDict):
@@ -252,33 +216,15 @@ class BatchListMeta(BaseModel):
 
     @model_serializer(mode="wrap")
     def serialize_model(self, handler):
-        optional_fields = []
-        nullable_fields = ["next_cursor"]
-        null_default_fields = []
+        optional_fields = ()
+        nullable_fields = ("next_cursor",)
+        null_default_fields = ()
 
         serialized = handler(self)
 
-        m = {}
-
-        for n, f in type(self).model_fields.items():
-            k = f.alias or n
-            val = serialized.get(k)
-            serialized.pop(k, None)
-
-            optional_nullable = k in optional_fields and k in nullable_fields
-            is_set = (
-                self.__pydantic_fields_set__.intersection({n})
-                or k in null_default_fields
-            )  # pylint: disable=no-member
-
-            if val is not None and val != UNSET_SENTINEL:
-                m[k] = val
-            elif val != UNSET_SENTINEL and (
-                not k in optional_fields or (optional_nullable and is_set)
-            ):
-                m[k] = val
-
-        return m
+        return serialize_fields(
+            self, serialized, optional_fields, nullable_fields, null_default_fields
+        )
 
 
 class BatchListResponseTypedDict(TypedDict):
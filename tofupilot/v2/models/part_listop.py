@@ -3,7 +3,7 @@
 from __future__ import annotations
 from datetime import datetime
 from pydantic import model_serializer
-from tofupilot.v2.types import BaseModel, Nullable, UNSET_SENTINEL
+from tofupilot.v2.types import BaseModel, Nullable, serialize_fields
 from tofupilot.v2.utils import FieldMetadata, QueryParamMetadata
 from typing import List, Literal, Optional
 from typing_extensions import Annotated, NotRequired, TypedDict
@@ -128,33 +128,15 @@ class PartListMeta(BaseModel):
 
     @model_serializer(mode="wrap")
     def serialize_model(self, handler):
-        optional_fields = []
-        nullable_fields = ["next_cursor"]
-        null_default_fields = []
+        optional_fields = ()
+        nullable_fields = ("next_cursor",)
+        null_default_fields = ()
 
         serialized = handler(self)
 
-        m = {}
-
-        for n, f in type(self).model_fields.items():
-            k = f.alias or n
-            val = serialized.get(k)
-            serialized.pop(k, None)
-
-            optional_nullable = k in optional_fields and k in nullable_fields
-            is_set = (
-                self.__pydantic_fields_set__.intersection({n})
-                or k in null_default_fields
-            )  # pylint: disable=no-member
-
-            if val is not None and val != UNSET_SENTINEL:
-                m[k] = val
-            elif val != UNSET_SENTINEL and (
-                not k in optional_fields or (optional_nullable and is_set)
-            ):
-                m[k] = val
-
-        return m
+        return serialize_fields(
+            self, serialized, optional_fields, nullable_fields, null_default_fields
+        )
 
 
 class PartListResponseTypedDict(TypedDict):
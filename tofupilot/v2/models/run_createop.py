@@ -6,10 +6,12 @@ import pydantic
 from pydantic import model_serializer
 from tofupilot.v2.types import (
     BaseModel,
+    FloatArray,
+    FloatArrayTypedDict,
     Nullable,
     OptionalNullable,
     UNSET,
-    UNSET_SENTINEL,
+    serialize_fields,
 )
 from typing import Any, Dict, List, Literal, Optional, Union
 from typing_extensions import Annotated, NotRequired, TypeAliasType, TypedDict
@@ -74,45 +76,27 @@ class XAxisValidator(BaseModel):
 
     @model_serializer(mode="wrap")
     def serialize_model(self, handler):
-        optional_fields = [
+        optional_fields = (
             "outcome",
             "operator",
             "expected_value",
             "expression",
             "is_decisive",
-        ]
-        nullable_fields = [
+        )
+        nullable_fields = (
             "outcome",
             "operator",
             "expected_value",
             "expression",
             "is_decisive",
-        ]
-        null_default_fields = []
+        )
+        null_default_fields = ()
 
         serialized = handler(self)
 
-        m = {}
-
-        for n, f in type(self).model_fields.items():
-            k = f.alias or n
-            val = serialized.get(k)
-            serialized.pop(k, None)
-
-            optional_nullable = k in optional_fields and k in nullable_fields
-            is_set = (
-                self.__pydantic_fields_set__.intersection({n})
-                or k in null_default_fields
-            )  # pylint: disable=no-member
-
-            if val is not None and val != UNSET_SENTINEL:
-                m[k] = val
-            elif val != UNSET_SENTINEL and (
-                not k in optional_fields or (optional_nullable and is_set)
-            ):
-                m[k] = val
-
-        return m
+        return serialize_fields(
+            self, serialized, optional_fields, nullable_fields, null_default_fields
+        )
 
 
 XAxisAggregationOutcome = Literal["PASS", "FAIL", "UNSET"]
@@ -177,45 +161,27 @@ class XAxisAggregationValidator(BaseModel):
 
     @model_serializer(mode="wrap")
     def serialize_model(self, handler):
-        optional_fields = [
+        optional_fields = (
             "outcome",
             "operator",
             "expected_value",
             "expression",
             "is_decisive",
-        ]
-        nullable_fields = [
+        )
+        nullable_fields = (
             "outcome",
             "operator",
             "expected_value",
             "expression",
             "is_decisive",
-        ]
-        null_default_fields = []
+        )
+        null_default_fields = ()
 
         serialized = handler(self)
 
-        m = {}
-
-        for n, f in type(self).model_fields.items():
-            k = f.alias or n
-            val = serialized.get(k)
-            serialized.pop(k, None)
-
-            optional_nullable = k in optional_fields and k in nullable_fields
-            is_set = (
-                self.__pydantic_fields_set__.intersection({n})
-                or k in null_default_fields
-            )  # pylint: disable=no-member
-
-            if val is not None and val != UNSET_SENTINEL:
-                m[k] = val
-            elif val != UNSET_SENTINEL and (
-                not k in optional_fields or (optional_nullable and is_set)
-            ):
-                m[k] = val
-
-        return m
+        return serialize_fields(
+            self, serialized, optional_fields, nullable_fields, null_default_fields
+        )
 
 
 class XAxisAggregationTypedDict(TypedDict):
@@ -253,40 +219,22 @@ class XAxisAggregation(BaseModel):
 
     @model_serializer(mode="wrap")
     def serialize_model(self, handler):
-        optional_fields = ["outcome", "value", "unit", "validators"]
-        nullable_fields = ["outcome", "value", "unit", "validators"]
-        null_default_fields = []
+        optional_fields = ("outcome", "value", "unit", "validators")
+        nullable_fields = ("outcome", "value", "unit", "validators")
+        null_default_fields = ()
 
         serialized = handler(self)
 
-        m = {}
-
-        for n, f in type(self).model_fields.items():
-            k = f.alias or n
-            val = serialized.get(k)
-            serialized.pop(k, None)
-
-            optional_nullable = k in optional_fields and k in nullable_fields
-            is_set = (
-                self.__pydantic_fields_set__.intersection({n})
-                or k in null_default_fields
-            )  # pylint: disable=no-member
-
-            if val is not None and val != UNSET_SENTINEL:
-                m[k] = val
-            elif val != UNSET_SENTINEL and (
-                not k in optional_fields or (optional_nullable and is_set)
-            ):
-                m[k] = val
-
-        return m
+        return serialize_fields(
+            self, serialized, optional_fields, nullable_fields, null_default_fields
+        )
 
 
 class XAxisTypedDict(TypedDict):
     r"""Data series with numeric data, unit, and optional validators/aggregations."""
 
-    data: List[float]
-    r"""Array of numeric data points for this axis."""
+    data: FloatArrayTypedDict
+    r"""Array of numeric data points for this axis, a list or a 1-D buffer such as a NumPy array."""
     units: NotRequired[Nullable[str]]
     r"""Unit for this axis."""
     description: NotRequired[Nullable[str]]
@@ -300,8 +248,8 @@ class XAxisTypedDict(TypedDict):
 class XAxis(BaseModel):
     r"""Data series with numeric data, unit, and optional validators/aggregations."""
 
-    data: List[float]
-    r"""Array of numeric data points for this axis."""
+    data: FloatArray
+    r"""Array of numeric data points for this axis, a list or a 1-D buffer such as a NumPy array."""
 
     units: OptionalNullable[str] = UNSET
     r"""Unit for this axis."""
@@ -317,33 +265,15 @@ class XAxis(BaseModel):
 
     @model_serializer(mode="wrap")
     def serialize_model(self, handler):
-        optional_fields = ["units", "description", "validators", "aggregations"]
-        nullable_fields = ["units", "description", "validators", "aggregations"]
-        null_default_fields = []
+        optional_fields = ("units", "description", "validators", "aggregations")
+        nullable_fields = ("units", "description", "validators", "aggregations")
+        null_default_fields = ()
 
         serialized = handler(self)
 
-        m = {}
-
-        for n, f in type(self).model_fields.items():
-            k = f.alias or n
-            val = serialized.get(k)
-            serialized.pop(k, None)
-
-            optional_nullable = k in optional_fields and k in nullable_fields
-            is_set = (
-                self.__pydantic_fields_set__.intersection({n})
-                or k in null_default_fields
-            )  # pylint: disable=no-member
-
-            if val is not None and val != UNSET_SENTINEL:
-                m[k] = val
-            elif val != UNSET_SENTINEL and (
-                not k in optional_fields or (optional_nullable and is_set)
-            ):
-                m[k] = val
-
-        return m
+        return serialize_fields(
+            self, serialized, optional_fields, nullable_fields, null_default_fields
+        )
 
 
 YAxiValidatorOutcome = Literal["PASS", "FAIL", "UNSET"]
@@ -396,45 +326,27 @@ class YAxiValidator(BaseModel):
 
     @model_serializer(mode="wrap")
     def serialize_model(self, handler):
-        optional_fields = [
+        optional_fields = (
             "outcome",
             "operator",
             "expected_value",
             "expression",
             "is_decisive",
-        ]
-        nullable_fields = [
+        )
+        nullable_fields = (
             "outcome",
             "operator",
             "expected_value",
             "expression",
             "is_decisive",
-        ]
-        null_default_fields = []
+        )
+        null_default_fields = ()
 
         serialized = handler(self)
 
-        m = {}
-
-        for n, f in type(self).model_fields.items():
-            k = f.alias or n
-            val = serialized.get(k)
-            serialized.pop(k, None)
-
-            optional_nullable = k in optional_fields and k in nullable_fields
-            is_set = (
-                self.__pydantic_fields_set__.intersection({n})
-                or k in null_default_fields
-            )  # pylint: disable=no-member
-
-            if val is not None and val != UNSET_SENTINEL:
-                m[k] = val
-            elif val != UNSET_SENTINEL and (
-                not k in optional_fields or (optional_nullable and is_set)
-            ):
-                m[k] = val
-
-        return m
+        return serialize_fields(
+            self, serialized, optional_fields, nullable_fields, null_default_fields
+        )
 
 
 YAxiAggregationOutcome = Literal["PASS", "FAIL", "UNSET"]
@@ -499,45 +411,27 @@ class YAxiAggregationValidator(BaseModel):
 
     @model_serializer(mode="wrap")
     def serialize_model(self, handler):
-        optional_fields = [
+        optional_fields = (
             "outcome",
             "operator",
             "expected_value",
             "expression",
             "is_decisive",
-        ]
-        nullable_fields = [
+        )
+        nullable_fields = (
             "outcome",
             "operator",
             "expected_value",
             "expression",
             "is_decisive",
-        ]
-        null_default_fields = []
+        )
+        null_default_fields = ()
 
         serialized = handler(self)
 
-        m = {}
-
-        for n, f in type(self).model_fields.items():
-            k = f.alias or n
-            val = serialized.get(k)
-            serialized.pop(k, None)
-
-            optional_nullable = k in optional_fields and k in nullable_fields
-            is_set = (
-                self.__pydantic_fields_set__.intersection({n})
-                or k in null_default_fields
-            )  # pylint: disable=no-member
-
-            if val is not None and val != UNSET_SENTINEL:
-                m[k] = val
-            elif val != UNSET_SENTINEL and (
-                not k in optional_fields or (optional_nullable and is_set)
-            ):
-                m[k] = val
-
-        return m
+        return serialize_fields(
+            self, serialized, optional_fields, nullable_fields, null_default_fields
+        )
 
 
 class YAxiAggregationTypedDict(TypedDict):
@@ -575,40 +469,22 @@ class YAxiAggregation(BaseModel):
 
     @model_serializer(mode="wrap")
     def serialize_model(self, handler):
-        optional_fields = ["outcome", "value", "unit", "validators"]
-        nullable_fields = ["outcome", "value", "unit", "validators"]
-        null_default_fields = []
+        optional_fields = ("outcome", "value", "unit", "validators")
+        nullable_fields = ("outcome", "value", "unit", "validators")
+        null_default_fields = ()
 
         serialized = handler(self)
 
-        m = {}
-
-        for n, f in type(self).model_fields.items():
-            k = f.alias or n
-            val = serialized.get(k)
-            serialized.pop(k, None)
-
-            optional_nullable = k in optional_fields and k in nullable_fields
-            is_set = (
-                self.__pydantic_fields_set__.intersection({n})
-                or k in null_default_fields
-            )  # pylint: disable=no-member
-
-            if val is not None and val != UNSET_SENTINEL:
-                m[k] = val
-            elif val != UNSET_SENTINEL and (
-                not k in optional_fields or (optional_nullable and is_set)
-            ):
-                m[k] = val
-
-        return m
+        return serialize_fields(
+            self, serialized, optional_fields, nullable_fields, null_default_fields
+        )
 
 
 class YAxiTypedDict(TypedDict):
     r"""Data series with numeric data, unit, and optional validators/aggregations."""
 
-    data: List[float]
-    r"""Array of numeric data points for this axis."""
+    data: FloatArrayTypedDict
+    r"""Array of numeric data points for this axis, a list or a 1-D buffer such as a NumPy array."""
     units: NotRequired[Nullable[str]]
     r"""Unit for this axis."""
     description: NotRequired[Nullable[str]]
@@ -622,8 +498,8 @@ class YAxiTypedDict(TypedDict):
 class YAxi(BaseModel):
     r"""Data series with numeric data, unit, and optional validators/aggregations."""
 
-    data: List[float]
-    r"""Array of numeric data points for this axis."""
+    data: FloatArray
+    r"""Array of numeric data points for this axis, a list or a 1-D buffer such as a NumPy array."""
 
     units: OptionalNullable[str] = UNSET
     r"""Unit for this axis."""
@@ -639,33 +515,15 @@ class YAxi(BaseModel):
 
     @model_serializer(mode="wrap")
     def serialize_model(self, handler):
-        optional_fields = ["units", "description", "validators", "aggregations"]
-        nullable_fields = ["units", "description", "validators", "aggregations"]
-        null_default_fields = []
+        optional_fields = ("units", "description", "validators", "aggregations")
+        nullable_fields = ("units", "description", "validators", "aggregations")
+        null_default_fields = ()
 
         serialized = handler(self)
 
-        m = {}
-
-        for n, f in type(self).model_fields.items():
-            k = f.alias or n
-            val = serialized.get(k)
-            serialized.pop(k, None)
-
-            optional_nullable = k in optional_fields and k in nullable_fields
-            is_set = (
-                self.__pydantic_fields_set__.intersection({n})
-                or k in null_default_fields
-            )  # pylint: disable=no-member
-
-            if val is not None and val != UNSET_SENTINEL:
-                m[k] = val
-            elif val != UNSET_SENTINEL and (
-                not k in optional_fields or (optional_nullable and is_set)
-            ):
-                m[k] = val
-
-        return m
+        return serialize_fields(
+            self, serialized, optional_fields, nullable_fields, null_default_fields
+        )
 
 
 RunCreateMeasuredValue2TypedDict = TypeAliasType(
@@ -752,45 +610,27 @@ class RunCreateValidator(BaseModel):
 
     @model_serializer(mode="wrap")
     def serialize_model(self, handler):
-        optional_fields = [
+        optional_fields = (
             "outcome",
             "operator",
             "expected_value",
             "expression",
             "is_decisive",
-        ]
-        nullable_fields = [
+        )
+        nullable_fields = (
             "outcome",
             "operator",
             "expected_value",
             "expression",
             "is_decisive",
-        ]
-        null_default_fields = []
+        )
+        null_default_fields = ()
 
         serialized = handler(self)
 
-        m = {}
-
-        for n, f in type(self).model_fields.items():
-            k = f.alias or n
-            val = serialized.get(k)
-            serialized.pop(k, None)
-
-            optional_nullable = k in optional_fields and k in nullable_fields
-            is_set = (
-                self.__pydantic_fields_set__.intersection({n})
-                or k in null_default_fields
-            )  # pylint: disable=no-member
-
-            if val is not None and val != UNSET_SENTINEL:
-                m[k] = val
-            elif val != UNSET_SENTINEL and (
-                not k in optional_fields or (optional_nullable and is_set)
-            ):
-                m[k] = val
-
-        return m
+        return serialize_fields(
+            self, serialized, optional_fields, nullable_fields, null_default_fields
+        )
 
 
 RunCreateAggregationOutcome = Literal["PASS", "FAIL", "UNSET"]
@@ -857,45 +697,27 @@ class RunCreateAggregationValidator(BaseModel):
 
     @model_serializer(mode="wrap")
     def serialize_model(self, handler):
-        optional_fields = [
+        optional_fields = (
             "outcome",
             "operator",
             "expected_value",
             "expression",
             "is_decisive",
-        ]
-        nullable_fields = [
+        )
+        nullable_fields = (
             "outcome",
             "operator",
             "expected_value",
             "expression",
             "is_decisive",
-        ]
-        null_default_fields = []
+        )
+        null_default_fields = ()
 
         serialized = handler(self)
 
-        m = {}
-
-        for n, f in type(self).model_fields.items():
-            k = f.alias or n
-            val = serialized.get(k)
-            serialized.pop(k, None)
-
-            optional_nullable = k in optional_fields and k in nullable_fields
-            is_set = (
-                self.__pydantic_fields_set__.intersection({n})
-                or k in null_default_fields
-            )  # pylint: disable=no-member
-
-            if val is not None and val != UNSET_SENTINEL:
-                m[k] = val
-            elif val != UNSET_SENTINEL and (
-                not k in optional_fields or (optional_nullable and is_set)
-            ):
-                m[k] = val
-
-        return m
+        return serialize_fields(
+            self, serialized, optional_fields, nullable_fields, null_default_fields
+        )
 
 
 class RunCreateAggregationTypedDict(TypedDict):
@@ -933,33 +755,15 @@ class RunCreateAggregation(BaseModel):
 
     @model_serializer(mode="wrap")
     def serialize_model(self, handler):
-        optional_fields = ["outcome", "value", "unit", "validators"]
-        nullable_fields = ["outcome", "value", "unit", "validators"]
-        null_default_fields = []
+        optional_fields = ("outcome", "value", "unit", "validators")
+        nullable_fields = ("outcome", "value", "unit", "validators")
+        null_default_fields = ()
 
         serialized = handler(self)
 
-        m = {}
-
-        for n, f in type(self).model_fields.items():
-            k = f.alias or n
-            val = serialized.get(k)
-            serialized.pop(k, None)
-
-            optional_nullable = k in optional_fields and k in nullable_fields
-            is_set = (
-                self.__pydantic_fields_set__.intersection({n})
-                or k in null_default_fields
-            )  # pylint: disable=no-member
-
-            if val is not None and val != UNSET_SENTINEL:
-                m[k] = val
-            elif val != UNSET_SENTINEL and (
-                not k in optional_fields or (optional_nullable and is_set)
-            ):
-                m[k] = val
-
-        return m
+        return serialize_fields(
+            self, serialized, optional_fields, nullable_fields, null_default_fields
+        )
 
 
 class RunCreateMeasurementTypedDict(TypedDict):
@@ -1033,7 +837,7 @@ class RunCreateMeasurement(BaseModel):
 
     @model_serializer(mode="wrap")
     def serialize_model(self, handler):
-        optional_fields = [
+        optional_fields = (
             "x_axis",
             "y_axis",
             "measured_value",
@@ -1043,8 +847,8 @@ class RunCreateMeasurement(BaseModel):
             "validators",
             "aggregations",
             "docstring",
-        ]
-        nullable_fields = [
+        )
+        nullable_fields = (
             "x_axis",
             "y_axis",
             "measured_value",
@@ -1052,32 +856,14 @@ class RunCreateMeasurement(BaseModel):
             "validators",
             "aggregations",
             "docstring",
-        ]
-        null_default_fields = []
+        )
+        null_default_fields = ()
 
         serialized = handler(self)
 
-        m = {}
-
-        for n, f in type(self).model_fields.items():
-            k = f.alias or n
-            val = serialized.get(k)
-            serialized.pop(k, None)
-
-            optional_nullable = k in optional_fields and k in nullable_fields
-            is_set = (
-                self.__pydantic_fields_set__.intersection({n})
-                or k in null_default_fields
-            )  # pylint: disable=no-member
-
-            if val is not None and val != UNSET_SENTINEL:
-                m[k] = val
-            elif val != UNSET_SENTINEL and (
-                not k in optional_fields or (optional_nullable and is_set)
-            ):
-                m[k] = val
-
-        return m
+        return serialize_fields(
+            self, serialized, optional_fields, nullable_fields, null_default_fields
+        )
 
 
 class RunCreatePhaseTypedDict(TypedDict):
@@ -1121,33 +907,15 @@ class RunCreatePhase(BaseModel):
 
     @model_serializer(mode="wrap")
     def serialize_model(self, handler):
-        optional_fields = ["docstring", "measurements", "retry_count"]
-        nullable_fields = ["docstring", "measurements"]
-        null_default_fields = []
+        optional_fields = ("docstring", "measurements", "retry_count")
+        nullable_fields = ("docstring", "measurements")
+        null_default_fields = ()
 
         serialized = handler(self)
 
-        m = {}
-
-        for n, f in type(self).model_fields.items():
-            k = f.alias or n
-            val = serialized.get(k)
-            serialized.pop(k, None)
-
-            optional_nullable = k in optional_fields and k in nullable_fields
-            is_set = (
-                self.__pydantic_fields_set__.intersection({n})
-                or k in null_default_fields
-            )  # pylint: disable=no-member
-
-            if val is not None and val != UNSET_SENTINEL:
-                m[k] = val
-            elif val != UNSET_SENTINEL and (
-                not k in optional_fields or (optional_nullable and is_set)
-            ):
-                m[k] = val
-
-        return m
+        return serialize_fields(
+            self, serialized, optional_fields, nullable_fields, null_default_fields
+        )
 
 
 RunCreateLevel = Literal["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]
@@ -1260,7 +1028,7 @@ class RunCreateRequest(BaseModel):
 
     @model_serializer(mode="wrap")
     def serialize_model(self, handler):
-        optional_fields = [
+        optional_fields = (
             "procedure_version",
             "operated_by",
             "part_number",
@@ -1270,33 +1038,15 @@ class RunCreateRequest(BaseModel):
             "docstring",
             "phases",
             "logs",
-        ]
-        nullable_fields = ["procedure_version"]
-        null_default_fields = []
+        )
+        nullable_fields = ("procedure_version",)
+        null_default_fields = ()
 
         serialized = handler(self)
 
-        m = {}
-
-        for n, f in type(self).model_fields.items():
-            k = f.alias or n
-            val = serialized.get(k)
-            serialized.pop(k, None)
-
-            optional_nullable = k in optional_fields and k in nullable_fields
-            is_set = (
-                self.__pydantic_fields_set__.intersection({n})
-                or k in null_default_fields
-            )  # pylint: disable=no-member
-
-            if val is not None and val != UNSET_SENTINEL:
-                m[k] = val
-            elif val != UNSET_SENTINEL and (
-                not k in optional_fields or (optional_nullable and is_set)
-            ):
-                m[k] = val
-
-        return m
+        return serialize_fields(
+            self, serialized, optional_fields, nullable_fields, null_default_fields
+        )
 
 
 class RunCreateResponseTypedDict(TypedDict):
@@ -0,0 +1,112 @@
+"""Cursor pagination helpers for the v2 `list` endpoints.
+
+List responses carry a page of `data` and a `meta` with `has_more` and
+`next_cursor`. These generators follow the cursor and yield pages or items
+lazily, optionally fetching the next page while the current one is consumed:
+
+    for run in iter_items(client.runs.list, procedure_ids=[procedure_id]):
+        ...
+"""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, AsyncIterator, Awaitable, Callable, Iterator, Optional
+
+
+def _next_cursor(page: Any) -> Optional[Any]:
+    """Returns the cursor of the page after `page`, or None if it is the last one."""
+    meta = getattr(page, "meta", None)
+    if meta is None or not meta.has_more:
+        return None
+    return meta.next_cursor
+
+
+def iter_pages(
+    list_page: Callable[..., Any], *, prefetch: bool = False, **kwargs: Any
+) -> Iterator[Any]:
+    """
+    Yields the pages returned by `list_page`, following `meta.next_cursor`.
+
+    Args:
+        list_page: A `list` method, e.g. `client.runs.list`.
+        prefetch: Request the next page in a background thread while the current one is consumed.
+        **kwargs: Arguments for `list_page`; `cursor` sets the first page.
+    """
+    if not prefetch:
+        while True:
+            page = list_page(**kwargs)
+            yield page
+            cursor = _next_cursor(page)
+            if cursor is None:
+                return
+            kwargs["cursor"] = cursor
+
+    pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="tofupilot-page")
+    future = pool.submit(list_page, **kwargs)
+    try:
+        while future is not None:
+            page = future.result()
+            cursor = _next_cursor(page)
+            if cursor is None:
+                future = None
+            else:
+                kwargs["cursor"] = cursor
+                future = pool.submit(list_page, **kwargs)
+            yield page
+    finally:
+        # If the consumer stopped early, don't wait for the page being prefetched
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
+def iter_items(
+    list_page: Callable[..., Any], *, prefetch: bool = False, **kwargs: Any
+) -> Iterator[Any]:
+    """Yields the items of every page returned by `list_page`, see `iter_pages`."""
+    for page in iter_pages(list_page, prefetch=prefetch, **kwargs):
+        yield from page.data
+
+
+async def iter_pages_async(
+    list_page: Callable[..., Awaitable[Any]], *, prefetch: bool = False, **kwargs: Any
+) -> AsyncIterator[Any]:
+    """
+    Yields the pages returned by `list_page`, following `meta.next_cursor`.
+
+    Args:
+        list_page: A `list_async` method, e.g. `client.runs.list_async`.
+        prefetch: Request the next page in a separate task while the current one is consumed.
+        **kwargs: Arguments for `list_page`; `cursor` sets the first page.
+    """
+    if not prefetch:
+        while True:
+            page = await list_page(**kwargs)
+            yield page
+            cursor = _next_cursor(page)
+            if cursor is None:
+                return
+            kwargs["cursor"] = cursor
+
+    task: Optional[asyncio.Task] = asyncio.ensure_future(list_page(**kwargs))
+    try:
+        while task is not None:
+            page = await task
+            cursor = _next_cursor(page)
+            if cursor is None:
+                task = None
+            else:
+                kwargs["cursor"] = cursor
+                task = asyncio.ensure_future(list_page(**kwargs))
+            yield page
+    finally:
+        # The consumer stopped early, drop the page being prefetched
+        if task is not None:
+            task.cancel()
+
+
+async def iter_items_async(
+    list_page: Callable[..., Awaitable[Any]], *, prefetch: bool = False, **kwargs: Any
+) -> AsyncIterator[Any]:
+    """Yields the items of every page returned by `list_page`, see `iter_pages_async`."""
+    async for page in iter_pages_async(list_page, prefetch=prefetch, **kwargs):
+        for item in page.data:
+            yield item
@@ -41,6 +41,8 @@ class Runs(BaseSDK):
 
         Create a new test run, linking it to a procedure and unit. Existing entities are reused automatically.
 
+        The request carries a random `Idempotency-Key` reused by its retries, so retrying it can't create the run twice. Set the header in `http_headers` to use your own key.
+
         :param outcome: Overall test result. Use PASS when test succeeds, FAIL when test fails but script execution completed successfully, ERROR when script execution fails, TIMEOUT when test exceeds time limit, ABORTED for manual script interruption.
         :param procedure_id: Procedure ID. Create the procedure in the app first, then find the auto-generated ID on the procedure page.
         :param started_at: ISO 8601 timestamp when the test run began execution. This timestamp will be used to track when the test execution started and for historical analysis of test runs. A separate created_at timestamp is stored internally server side to track upload date.
@@ -103,10 +105,20 @@ class Runs(BaseSDK):
             http_headers=http_headers,
             security=self.sdk_configuration.security,
             get_serialized_body=lambda: utils.serialize_request_body(
-                request, False, False, "json", models.RunCreateRequest
+                request,
+                False,
+                False,
+                "json",
+                models.RunCreateRequest,
+                streamed_fields=(
+                    {"phases": models.RunCreatePhase, "logs": models.RunCreateLog}
+                    if self.sdk_configuration.stream_request_bodies
+                    else None
+                ),
             ),
             timeout_ms=timeout_ms,
         )
+        utils.set_idempotency_key(req)
 
         if retries == UNSET:
             if self.sdk_configuration.retry_config is not UNSET:
@@ -199,6 +211,8 @@ class Runs(BaseSDK):
 
         Create a new test run, linking it to a procedure and unit. Existing entities are reused automatically.
 
+        The request carries a random `Idempotency-Key` reused by its retries, so retrying it can't create the run twice. Set the header in `http_headers` to use your own key.
+
         :param outcome: Overall test result. Use PASS when test succeeds, FAIL when test fails but script execution completed successfully, ERROR when script execution fails, TIMEOUT when test exceeds time limit, ABORTED for manual script interruption.
         :param procedure_id: Procedure ID. Create the procedure in the app first, then find the auto-generated ID on the procedure page.
         :param started_at: ISO 8601 timestamp when the test run began execution. This timestamp will be used to track when the test execution started and for historical analysis of test runs. A separate created_at timestamp is stored internally server side to track upload date.
@@ -261,10 +275,20 @@ class Runs(BaseSDK):
             http_headers=http_headers,
             security=self.sdk_configuration.security,
             get_serialized_body=lambda: utils.serialize_request_body(
-                request, False, False, "json", models.RunCreateRequest
+                request,
+                False,
+                False,
+                "json",
+                models.RunCreateRequest,
+                streamed_fields=(
+                    {"phases": models.RunCreatePhase, "logs": models.RunCreateLog}
+                    if self.sdk_configuration.stream_request_bodies
+                    else None
+                ),
             ),
             timeout_ms=timeout_ms,
         )
+        utils.set_idempotency_key(req)
 
         if retries == UNSET:
             if self.sdk_configuration.retry_config is not UNSET:
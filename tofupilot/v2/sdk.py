@@ -3,8 +3,13 @@
 from .basesdk import BaseSDK
 from .httpclient import AsyncHttpClient, ClientOwner, HttpClient, close_clients
 from .sdkconfiguration import SDKConfiguration
+from .utils.circuit_breaker import CircuitBreaker
+from .utils.compression import CompressionConfig
 from .utils.logger import Logger, get_default_logger
 from .utils.retries import RetryConfig
+from .utils.security import SecurityCache
+from .utils.storage import StorageClient
+from .utils.transport import TransportConfig
 import httpx
 import importlib
 from tofupilot.v2 import models, utils
@@ -59,6 +64,12 @@ class TofuPilot(BaseSDK):
         retry_config: OptionalNullable[RetryConfig] = UNSET,
         timeout_ms: Optional[int] = None,
         debug_logger: Optional[Logger] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        compression: Optional[CompressionConfig] = None,
+        stream_request_bodies: bool = False,
+        transport: Optional[TransportConfig] = None,
+        storage: Optional[StorageClient] = None,
+        api_key_ttl_ms: Optional[int] = None,
     ) -> None:
         r"""Instantiates the SDK configuring it with the provided parameters.
 
@@ -70,10 +81,16 @@ class TofuPilot(BaseSDK):
         :param async_client: The Async HTTP client to use for all asynchronous methods
         :param retry_config: The retry configuration to use for all supported methods
         :param timeout_ms: Optional request timeout applied to each operation in milliseconds
+        :param circuit_breaker: Fail requests fast while their host keeps failing
+        :param compression: Compress request bodies above a size threshold
+        :param stream_request_bodies: Send run bodies as they are rendered, phase by phase, to bound memory use
+        :param transport: Connection pool limits, HTTP/2 and per operation timeouts of the clients
+        :param storage: The clients, retries and checksum checks of attachment file transfers
+        :param api_key_ttl_ms: Call an api_key callable at most once per TTL in milliseconds, instead of for every request
         """
         client_supplied = True
         if client is None:
-            client = httpx.Client()
+            client = transport.client() if transport is not None else httpx.Client()
             client_supplied = False
 
         assert issubclass(
@@ -82,12 +99,21 @@ class TofuPilot(BaseSDK):
 
         async_client_supplied = True
         if async_client is None:
-            async_client = httpx.AsyncClient()
+            async_client = (
+                transport.async_client()
+                if transport is not None
+                else httpx.AsyncClient()
+            )
             async_client_supplied = False
 
         if debug_logger is None:
             debug_logger = get_default_logger()
 
+        storage_supplied = True
+        if storage is None:
+            storage = StorageClient()
+            storage_supplied = False
+
         assert issubclass(
             type(async_client), AsyncHttpClient
         ), "The provided async_client must implement the AsyncHttpClient protocol."
@@ -116,6 +142,13 @@ class TofuPilot(BaseSDK):
                 retry_config=retry_config,
                 timeout_ms=timeout_ms,
                 debug_logger=debug_logger,
+                circuit_breaker=circuit_breaker,
+                compression=compression,
+                stream_request_bodies=stream_request_bodies,
+                transport=transport,
+                storage=storage,
+                storage_supplied=storage_supplied,
+                security_cache=SecurityCache(api_key_ttl_ms),
             ),
         )
 
@@ -135,6 +168,15 @@ class TofuPilot(BaseSDK):
             self.sdk_configuration.async_client,
             self.sdk_configuration.async_client_supplied,
         )
+        if not storage_supplied:
+            weakref.finalize(self, storage.close)
+
+    def refresh_api_key(self) -> None:
+        r"""Drops the cached credentials, the api_key callable is called again on the next request.
+
+        Also done when a request is rejected with a 401 response.
+        """
+        self.sdk_configuration.security_cache.invalidate()
 
     def __getattr__(self, name: str):
         if name in self._sub_sdk_map:
@@ -176,6 +218,8 @@ class TofuPilot(BaseSDK):
         ):
             self.sdk_configuration.client.close()
         self.sdk_configuration.client = None
+        if not self.sdk_configuration.storage_supplied:
+            self.sdk_configuration.storage.close()
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         if (
@@ -184,3 +228,5 @@ class TofuPilot(BaseSDK):
         ):
             await self.sdk_configuration.async_client.aclose()
         self.sdk_configuration.async_client = None
+        if not self.sdk_configuration.storage_supplied:
+            await self.sdk_configuration.storage.aclose()
@@ -7,8 +7,18 @@ from ._version import (
     __version__,
 )
 from .httpclient import AsyncHttpClient, HttpClient
-from .utils import Logger, RetryConfig, remove_suffix
-from dataclasses import dataclass
+from .utils import (
+    CircuitBreaker,
+    CompressionConfig,
+    Logger,
+    RetryBudget,
+    RetryConfig,
+    SecurityCache,
+    StorageClient,
+    TransportConfig,
+    remove_suffix,
+)
+from dataclasses import dataclass, field
 from pydantic import Field
 from tofupilot.v2 import models
 from tofupilot.v2.types import OptionalNullable, UNSET
@@ -38,6 +48,21 @@ class SDKConfiguration:
     user_agent: str = __user_agent__
     retry_config: OptionalNullable[RetryConfig] = Field(default_factory=lambda: UNSET)
     timeout_ms: Optional[int] = None
+    retry_budget: RetryBudget = field(default_factory=RetryBudget)
+    """Retry token bucket shared by every request of the client."""
+    circuit_breaker: Optional[CircuitBreaker] = None
+    """Fails requests fast while their host is failing, disabled when None."""
+    compression: Optional[CompressionConfig] = None
+    """Compresses large request bodies, disabled when None."""
+    stream_request_bodies: bool = False
+    """Renders run bodies phase by phase while sending them, instead of all at once."""
+    transport: Optional[TransportConfig] = None
+    """Pool limits, HTTP/2 and timeouts of the clients, httpx's defaults when None."""
+    storage: StorageClient = field(default_factory=StorageClient)
+    """Pooled clients transferring attachment files to and from storage."""
+    storage_supplied: bool = False
+    security_cache: SecurityCache = field(default_factory=SecurityCache)
+    """Auth headers resolved from `security`, shared by every request of the client."""
 
     def get_server_details(self) -> Tuple[str, Dict[str, str]]:
         if self.server_url is not None and self.server_url:
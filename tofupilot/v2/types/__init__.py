@@ -1,5 +1,6 @@
 """Code generated by Speakeasy (https://speakeasy.com). DO NOT EDIT."""
 
+from .arrays import FloatArray, FloatArrayTypedDict
 from .basemodel import (
     BaseModel,
     Nullable,
@@ -9,13 +10,17 @@ from .basemodel import (
     UNSET,
     UNSET_SENTINEL,
 )
+from .serialization import serialize_fields
 
 __all__ = [
     "BaseModel",
+    "FloatArray",
+    "FloatArrayTypedDict",
     "Nullable",
     "OptionalNullable",
     "UnrecognizedInt",
     "UnrecognizedStr",
     "UNSET",
     "UNSET_SENTINEL",
+    "serialize_fields",
 ]
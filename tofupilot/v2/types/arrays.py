@@ -0,0 +1,84 @@
+"""Numeric array fields accepting buffers.
+
+`FloatArray` fields take a list of floats, or a NumPy array, an `array.array`
+or any other 1-D object exposing numbers through the buffer protocol. Buffers
+are copied once into an `array.array("d")` instead of being validated number by
+number, and only become Python floats when the model is dumped, so `model_dump()`
+returns lists in both Python and JSON modes.
+"""
+
+import array
+from typing import Any, List, Union
+
+from pydantic import GetCoreSchemaHandler, GetJsonSchemaHandler
+from pydantic.json_schema import JsonSchemaValue
+from pydantic_core import core_schema
+from typing_extensions import Annotated, Buffer, TypeAlias
+
+_NUMERIC_FORMATS = frozenset("bBhHiIlLqQfd")
+
+
+def to_float_array(value: Any) -> Any:
+    """Returns numeric buffers as an `array.array("d")` and other values unchanged."""
+    if isinstance(value, (list, tuple, str, bytes, bytearray)):
+        return value
+    if isinstance(value, array.array) and value.typecode == "d":
+        return value
+
+    try:
+        view = memoryview(value)
+    except TypeError:
+        # Array-likes without a buffer, e.g. pandas series
+        if not hasattr(value, "__array__"):
+            return value
+        view = memoryview(value.__array__())
+
+    if view.format.lstrip("@") not in _NUMERIC_FORMATS:
+        raise ValueError(f"Expected a buffer of numbers, got format {view.format!r}")
+    if view.ndim != 1:
+        raise ValueError(f"Expected a 1-D buffer, got {view.ndim} dimensions")
+
+    if view.format.lstrip("@") == "d" and view.c_contiguous:
+        floats = array.array("d")
+        floats.frombytes(view.cast("B"))
+        return floats
+    return array.array("d", view)
+
+
+def _serialize(value: Any) -> Any:
+    # Bodies are dumped to Python objects before pydantic_core renders them, which
+    # has no way to embed pre-rendered JSON: samples become floats here, in one C
+    # loop, and are formatted in Rust. Only validation skips the per-sample work.
+    if isinstance(value, array.array):
+        return value.tolist()
+    return value
+
+
+class _FloatArraySchema:
+    def __get_pydantic_core_schema__(
+        self, source: Any, handler: GetCoreSchemaHandler
+    ) -> core_schema.CoreSchema:
+        floats = core_schema.list_schema(core_schema.float_schema())
+        return core_schema.no_info_before_validator_function(
+            to_float_array,
+            core_schema.union_schema(
+                [
+                    core_schema.is_instance_schema(array.array),
+                    handler.generate_schema(List[float]),
+                ],
+                mode="left_to_right",
+            ),
+            serialization=core_schema.plain_serializer_function_ser_schema(
+                _serialize, return_schema=floats, when_used="always"
+            ),
+        )
+
+    def __get_pydantic_json_schema__(
+        self, schema: core_schema.CoreSchema, handler: GetJsonSchemaHandler
+    ) -> JsonSchemaValue:
+        return handler(core_schema.list_schema(core_schema.float_schema()))
+
+
+FloatArrayTypedDict: TypeAlias = Union[List[float], Buffer]
+
+FloatArray = Annotated[Union[List[float], Buffer], _FloatArraySchema()]
@@ -0,0 +1,76 @@
+"""Serialization of the generated models.
+
+The generated `serialize_model` methods call `serialize_fields` with their
+field lists (`custom_code.py apply-serializer-plans` rewrites them after each
+SDK generation), so the rules of each model class are worked out only once.
+"""
+
+from typing import Any, Dict, Tuple
+
+from pydantic import BaseModel as PydanticBaseModel
+
+from .basemodel import UNSET_SENTINEL
+
+_NEVER, _IF_SET, _ALWAYS = 0, 1, 2
+
+_SerializationPlan = Tuple[Tuple[str, str, int, Any], ...]
+
+_SERIALIZATION_PLANS: Dict[type, _SerializationPlan] = {}
+
+
+def _serialization_plan(
+    cls: type,
+    optional_fields: Tuple[str, ...],
+    nullable_fields: Tuple[str, ...],
+    null_default_fields: Tuple[str, ...],
+) -> _SerializationPlan:
+    plan = []
+    optional, nullable = frozenset(optional_fields), frozenset(nullable_fields)
+    for n, f in cls.model_fields.items():  # type: ignore[attr-defined]
+        k = f.alias or n
+        if k not in optional:
+            keep_null = _ALWAYS
+        elif k in nullable:
+            keep_null = _ALWAYS if k in null_default_fields else _IF_SET
+        else:
+            keep_null = _NEVER
+        default = f.default if isinstance(f.default, (bool, int, float, str)) else None
+        plan.append((n, k, keep_null, default))
+    return tuple(plan)
+
+
+def serialize_fields(
+    model: PydanticBaseModel,
+    serialized: Dict[str, Any],
+    optional_fields: Tuple[str, ...],
+    nullable_fields: Tuple[str, ...],
+    null_default_fields: Tuple[str, ...],
+) -> Dict[str, Any]:
+    """Drops unset fields, and null optional fields unless they were set to null.
+
+    Which fields may be null is worked out once per model class, then each
+    instance only costs a lookup per field. Scalar defaults of unset fields are
+    kept, also when the model was dumped with `exclude_unset`.
+    """
+    cls = type(model)
+    plan = _SERIALIZATION_PLANS.get(cls)
+    if plan is None:
+        plan = _SERIALIZATION_PLANS[cls] = _serialization_plan(
+            cls, optional_fields, nullable_fields, null_default_fields
+        )
+
+    fields_set = model.__pydantic_fields_set__
+    m = {}
+    for n, k, keep_null, default in plan:
+        val = serialized.get(k)
+        if val is None:
+            if n not in fields_set:
+                if default is not None:
+                    m[k] = default
+                elif keep_null == _ALWAYS:
+                    m[k] = None
+            elif keep_null != _NEVER:
+                m[k] = None
+        elif val != UNSET_SENTINEL:
+            m[k] = val
+    return m
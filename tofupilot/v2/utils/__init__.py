@@ -20,11 +20,26 @@ if TYPE_CHECKING:
         SecurityMetadata,
     )
     from .queryparams import get_query_params
-    from .retries import BackoffStrategy, Retries, retry, retry_async, RetryConfig
+    from .circuit_breaker import CircuitBreaker
+    from .compression import compress_body, CompressionConfig
+    from .retries import (
+        BackoffStrategy,
+        is_idempotent,
+        Retries,
+        retry,
+        retry_async,
+        RetryBudget,
+        RetryConfig,
+        set_idempotency_key,
+    )
     from .requestbodies import serialize_request_body, SerializedRequestBody
-    from .security import get_security, get_security_from_env
+    from .security import get_security, get_security_from_env, SecurityCache
+    from .storage import StorageClient
+    from .streaming import JsonStream
+    from .transport import Timeouts, TransportConfig
 
     from .serializers import (
+        clear_body_model_cache,
         get_pydantic_model,
         marshal_json,
         unmarshal,
@@ -54,6 +69,7 @@ if TYPE_CHECKING:
 
 __all__ = [
     "BackoffStrategy",
+    "clear_body_model_cache",
     "FieldMetadata",
     "find_metadata",
     "FormMetadata",
@@ -69,6 +85,7 @@ __all__ = [
     "get_response_headers",
     "get_security",
     "get_security_from_env",
+    "JsonStream",
     "HeaderMetadata",
     "Logger",
     "marshal_json",
@@ -80,22 +97,32 @@ __all__ = [
     "PathParamMetadata",
     "QueryParamMetadata",
     "remove_suffix",
+    "CircuitBreaker",
+    "compress_body",
+    "CompressionConfig",
+    "is_idempotent",
     "Retries",
     "retry",
     "retry_async",
+    "RetryBudget",
     "RetryConfig",
+    "set_idempotency_key",
     "RequestMetadata",
+    "SecurityCache",
     "SecurityMetadata",
     "serialize_decimal",
     "serialize_float",
     "serialize_int",
     "serialize_request_body",
     "SerializedRequestBody",
+    "StorageClient",
     "stream_to_text",
     "stream_to_text_async",
     "stream_to_bytes",
     "stream_to_bytes_async",
     "template_url",
+    "Timeouts",
+    "TransportConfig",
     "unmarshal",
     "unmarshal_json",
     "validate_decimal",
@@ -108,6 +135,7 @@ __all__ = [
 
 _dynamic_imports: dict[str, str] = {
     "BackoffStrategy": ".retries",
+    "clear_body_model_cache": ".serializers",
     "FieldMetadata": ".metadata",
     "find_metadata": ".metadata",
     "FormMetadata": ".metadata",
@@ -123,6 +151,7 @@ _dynamic_imports: dict[str, str] = {
     "get_response_headers": ".headers",
     "get_security": ".security",
     "get_security_from_env": ".security",
+    "JsonStream": ".streaming",
     "HeaderMetadata": ".metadata",
     "Logger": ".logger",
     "marshal_json": ".serializers",
@@ -134,22 +163,32 @@ _dynamic_imports: dict[str, str] = {
     "PathParamMetadata": ".metadata",
     "QueryParamMetadata": ".metadata",
     "remove_suffix": ".url",
+    "CircuitBreaker": ".circuit_breaker",
+    "compress_body": ".compression",
+    "CompressionConfig": ".compression",
+    "is_idempotent": ".retries",
     "Retries": ".retries",
     "retry": ".retries",
     "retry_async": ".retries",
+    "RetryBudget": ".retries",
     "RetryConfig": ".retries",
+    "set_idempotency_key": ".retries",
     "RequestMetadata": ".metadata",
+    "SecurityCache": ".security",
     "SecurityMetadata": ".metadata",
     "serialize_decimal": ".serializers",
     "serialize_float": ".serializers",
     "serialize_int": ".serializers",
     "serialize_request_body": ".requestbodies",
     "SerializedRequestBody": ".requestbodies",
+    "StorageClient": ".storage",
     "stream_to_text": ".serializers",
     "stream_to_text_async": ".serializers",
     "stream_to_bytes": ".serializers",
     "stream_to_bytes_async": ".serializers",
     "template_url": ".url",
+    "Timeouts": ".transport",
+    "TransportConfig": ".transport",
     "unmarshal": ".serializers",
     "unmarshal_json": ".serializers",
     "validate_decimal": ".serializers",
@@ -0,0 +1,145 @@
+"""Per-host circuit breaker for the SDK transport.
+
+After `failure_threshold` consecutive failures (connection errors, timeouts or
+5xx responses) to a host, its circuit opens and requests to it fail right away
+with `CircuitOpenError`, instead of waiting for timeouts and retries. After
+`reset_timeout` seconds one probe request is let through (half-open): the
+circuit closes if it succeeds and opens again if it fails.
+
+    breaker = CircuitBreaker(on_state_change=lambda host, old, new: ...)
+    client = TofuPilot(circuit_breaker=breaker)
+
+    if client.circuit_state == OPEN:
+        ...  # Spool runs locally instead of waiting for the server
+"""
+
+import threading
+import time
+from typing import Callable, Dict, Optional
+
+from tofupilot.v2.errors.circuit_open_error import CircuitOpenError
+
+CLOSED = "closed"
+"""Requests are sent normally."""
+
+OPEN = "open"
+"""Requests fail fast until `reset_timeout` has elapsed."""
+
+HALF_OPEN = "half_open"
+"""One probe request may be sent to find out whether the host recovered."""
+
+StateChangeCallback = Callable[[str, str, str], None]
+"""Called with the host, its previous state and its new state."""
+
+
+class _Circuit:
+    __slots__ = ("state", "failures", "opened_at", "probing")
+
+    def __init__(self):
+        self.state = CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self.probing = False
+
+
+class CircuitBreaker:
+    """
+    Tracks the health of every host the client sends requests to.
+
+    Args:
+        failure_threshold: Consecutive failures after which a host's circuit opens.
+        reset_timeout: Seconds a circuit stays open before a probe request is allowed.
+        on_state_change: Called whenever a host's circuit changes state.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        reset_timeout: float = 30.0,
+        on_state_change: Optional[StateChangeCallback] = None,
+    ):
+        self.failure_threshold = max(1, failure_threshold)
+        self.reset_timeout = reset_timeout
+        self.on_state_change = on_state_change
+        self._circuits: Dict[str, _Circuit] = {}
+        self._lock = threading.Lock()
+
+    def state(self, host: str) -> str:
+        """Returns the state of the circuit of `host`, `HALF_OPEN` once a probe is allowed."""
+        with self._lock:
+            circuit = self._circuits.get(host)
+            if circuit is None:
+                return CLOSED
+            if circuit.state == OPEN and self._remaining(circuit) <= 0:
+                return HALF_OPEN
+            return circuit.state
+
+    def before_request(self, host: str):
+        """Raises `CircuitOpenError` if a request to `host` must not be sent now."""
+        with self._lock:
+            circuit = self._circuits.get(host)
+            if circuit is None or circuit.state == CLOSED:
+                return
+
+            remaining = self._remaining(circuit)
+            if circuit.state == OPEN and remaining <= 0:
+                old = self._set_state(circuit, HALF_OPEN)
+            elif circuit.state == HALF_OPEN and not circuit.probing:
+                old = None
+            else:
+                raise CircuitOpenError(host, max(remaining, 0.0))
+            circuit.probing = True
+
+        if old is not None:
+            self._notify(host, old, HALF_OPEN)
+
+    def record_success(self, host: str):
+        with self._lock:
+            circuit = self._circuits.get(host)
+            if circuit is None:
+                return
+            circuit.failures = 0
+            circuit.probing = False
+            old = self._set_state(circuit, CLOSED)
+        if old is not None:
+            self._notify(host, old, CLOSED)
+
+    def record_failure(self, host: str):
+        with self._lock:
+            circuit = self._circuits.setdefault(host, _Circuit())
+            circuit.failures += 1
+            circuit.probing = False
+            old = None
+            if circuit.state == HALF_OPEN or circuit.failures >= self.failure_threshold:
+                circuit.opened_at = time.monotonic()
+                old = self._set_state(circuit, OPEN)
+        if old is not None:
+            self._notify(host, old, OPEN)
+
+    def reset(self, host: Optional[str] = None):
+        """Closes the circuit of `host`, or of every host."""
+        with self._lock:
+            hosts = list(self._circuits) if host is None else [host]
+            changes = []
+            for name in hosts:
+                circuit = self._circuits.pop(name, None)
+                if circuit is not None and circuit.state != CLOSED:
+                    changes.append((name, circuit.state))
+        for name, old in changes:
+            self._notify(name, old, CLOSED)
+
+    def _remaining(self, circuit: _Circuit) -> float:
+        return circuit.opened_at + self.reset_timeout - time.monotonic()
+
+    @staticmethod
+    def _set_state(circuit: _Circuit, state: str) -> Optional[str]:
+        """Changes the state of `circuit`, returning the previous one if it changed."""
+        old = circuit.state
+        if old == state:
+            return None
+        circuit.state = state
+        return old
+
+    def _notify(self, host: str, old: str, new: str):
+        if self.on_state_change is not None:
+            self.on_state_change(host, old, new)
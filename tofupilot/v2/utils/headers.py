@@ -14,6 +14,7 @@ from .metadata import (
     HeaderMetadata,
     find_field_metadata,
 )
+from .requestplan import request_plan
 
 from .values import _is_set, _populate_from_globals, _val_to_string
 
@@ -41,18 +42,12 @@ def _populate_headers(
     if not isinstance(headers_params, BaseModel):
         return globals_already_populated
 
-    param_fields: Dict[str, FieldInfo] = headers_params.__class__.model_fields
-    for name in param_fields:
+    for name, f_name, metadata, _ in request_plan(
+        headers_params.__class__
+    ).headers:
         if name in skip_fields:
             continue
 
-        field = param_fields[name]
-        f_name = field.alias if field.alias is not None else name
-
-        metadata = find_field_metadata(field, HeaderMetadata)
-        if metadata is None:
-            continue
-
         value, global_found = _populate_from_globals(
             name, getattr(headers_params, name), HeaderMetadata, gbls
         )
@@ -3,18 +3,14 @@
 from typing import (
     Any,
     Dict,
-    get_type_hints,
     List,
     Optional,
 )
 
 from pydantic import BaseModel
-from pydantic.fields import FieldInfo
 
-from .metadata import (
-    QueryParamMetadata,
-    find_field_metadata,
-)
+from .metadata import QueryParamMetadata
+from .requestplan import request_plan
 from .values import (
     _get_serialized_params,
     _is_set,
@@ -48,18 +44,12 @@ def _populate_query_params(
     if not isinstance(query_params, BaseModel):
         return globals_already_populated
 
-    param_fields: Dict[str, FieldInfo] = query_params.__class__.model_fields
-    param_field_types = get_type_hints(query_params.__class__)
-    for name in param_fields:
+    for name, f_name, metadata, typ in request_plan(
+        query_params.__class__
+    ).query_params:
         if name in skip_fields:
             continue
 
-        field = param_fields[name]
-
-        metadata = find_field_metadata(field, QueryParamMetadata)
-        if not metadata:
-            continue
-
         value = getattr(query_params, name) if _is_set(query_params) else None
 
         value, global_found = _populate_from_globals(
@@ -68,12 +58,9 @@ def _populate_query_params(
         if global_found:
             globals_already_populated.append(name)
 
-        f_name = field.alias if field.alias is not None else name
         serialization = metadata.serialization
         if serialization is not None:
-            serialized_parms = _get_serialized_params(
-                metadata, f_name, value, param_field_types[name]
-            )
+            serialized_parms = _get_serialized_params(metadata, f_name, value, typ)
             for key, value in serialized_parms.items():
                 if key in query_param_values:
                     query_param_values[key].extend(value)
@@ -121,18 +108,9 @@ def _populate_deep_object_query_params_basemodel(
     if not _is_set(obj) or not isinstance(obj, BaseModel):
         return
 
-    obj_fields: Dict[str, FieldInfo] = obj.__class__.model_fields
-    for name in obj_fields:
-        obj_field = obj_fields[name]
-
-        f_name = obj_field.alias if obj_field.alias is not None else name
-
+    for name, f_name, _, _ in request_plan(obj.__class__).query_params:
         params_key = f"{prior_params_key}[{f_name}]"
 
-        obj_param_metadata = find_field_metadata(obj_field, QueryParamMetadata)
-        if not _is_set(obj_param_metadata):
-            continue
-
         obj_val = getattr(obj, name)
         if not _is_set(obj_val):
             continue
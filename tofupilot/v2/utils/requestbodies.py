@@ -1,16 +1,19 @@
 """Code generated by Speakeasy (https://speakeasy.com). DO NOT EDIT."""
 
+import functools
 import io
 from dataclasses import dataclass
 import re
 from typing import (
     Any,
+    Mapping,
     Optional,
 )
 
 from .forms import serialize_form_data, serialize_multipart_form
 
 from .serializers import marshal_json
+from .streaming import JsonStream
 
 SERIALIZATION_METHOD_TO_CONTENT_TYPE = {
     "json": "application/json",
@@ -21,6 +24,21 @@ SERIALIZATION_METHOD_TO_CONTENT_TYPE = {
 }
 
 
+_JSON, _MULTIPART, _FORM, _RAW = "json", "multipart", "form", "raw"
+
+
+@functools.lru_cache(maxsize=None)
+def _media_type_kind(media_type: str) -> str:
+    """How bodies of `media_type` are serialized, matched once per media type."""
+    if re.match(r"(application|text)\/.*?\+*json.*", media_type) is not None:
+        return _JSON
+    if re.match(r"multipart\/.*", media_type) is not None:
+        return _MULTIPART
+    if re.match(r"application\/x-www-form-urlencoded.*", media_type) is not None:
+        return _FORM
+    return _RAW
+
+
 @dataclass
 class SerializedRequestBody:
     media_type: Optional[str] = None
@@ -35,6 +53,7 @@ def serialize_request_body(
     optional: bool,
     serialization_method: str,
     request_body_type,
+    streamed_fields: Optional[Mapping[str, Any]] = None,
 ) -> Optional[SerializedRequestBody]:
     if request_body is None:
         if not nullable and optional:
@@ -44,15 +63,23 @@ def serialize_request_body(
 
     serialized_request_body = SerializedRequestBody(media_type)
 
-    if re.match(r"(application|text)\/.*?\+*json.*", media_type) is not None:
-        serialized_request_body.content = marshal_json(request_body, request_body_type)
-    elif re.match(r"multipart\/.*", media_type) is not None:
+    kind = _media_type_kind(media_type)
+    if kind == _JSON:
+        if streamed_fields and request_body is not None:
+            serialized_request_body.content = JsonStream(
+                request_body, request_body_type, streamed_fields
+            )
+        else:
+            serialized_request_body.content = marshal_json(
+                request_body, request_body_type
+            )
+    elif kind == _MULTIPART:
         (
             serialized_request_body.media_type,
             serialized_request_body.data,
             serialized_request_body.files,
         ) = serialize_multipart_form(media_type, request_body)
-    elif re.match(r"application\/x-www-form-urlencoded.*", media_type) is not None:
+    elif kind == _FORM:
         serialized_request_body.data = serialize_form_data(request_body)
     elif isinstance(request_body, (bytes, bytearray, io.BytesIO, io.BufferedReader)):
         serialized_request_body.content = request_body
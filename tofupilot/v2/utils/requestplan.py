@@ -0,0 +1,65 @@
+"""Per-class plans of the request fields sent in the URL and the headers.
+
+Which fields of a request model are path parameters, query parameters or
+headers, under which name and with which style, only depends on the model
+class. It is worked out from the field metadata the first time a class is
+seen, so building a request only loops over the fields it sends.
+"""
+
+from typing import Any, Dict, Optional, Tuple, get_type_hints
+
+from .metadata import (
+    HeaderMetadata,
+    ParamMetadata,
+    PathParamMetadata,
+    QueryParamMetadata,
+    find_field_metadata,
+)
+
+ParamField = Tuple[str, str, Any, Optional[type]]
+"""Field name, name in the request, metadata, and type if the value is serialized."""
+
+
+class RequestPlan:
+    __slots__ = ("path_params", "query_params", "headers")
+
+    path_params: Tuple[ParamField, ...]
+    query_params: Tuple[ParamField, ...]
+    headers: Tuple[ParamField, ...]
+
+    def __init__(self, cls: type):
+        fields = cls.model_fields  # type: ignore[attr-defined]
+        found: Dict[type, list] = {
+            PathParamMetadata: [],
+            QueryParamMetadata: [],
+            HeaderMetadata: [],
+        }
+        type_hints: Optional[Dict[str, Any]] = None
+        for name, field in fields.items():
+            for metadata_type, params in found.items():
+                metadata: Optional[ParamMetadata] = find_field_metadata(
+                    field, metadata_type
+                )
+                if metadata is None:
+                    continue
+                typ = None
+                if metadata.serialization is not None:
+                    if type_hints is None:
+                        type_hints = get_type_hints(cls)
+                    typ = type_hints[name]
+                f_name = field.alias if field.alias is not None else name
+                params.append((name, f_name, metadata, typ))
+
+        self.path_params = tuple(found[PathParamMetadata])
+        self.query_params = tuple(found[QueryParamMetadata])
+        self.headers = tuple(found[HeaderMetadata])
+
+
+_REQUEST_PLANS: Dict[type, RequestPlan] = {}
+
+
+def request_plan(cls: type) -> RequestPlan:
+    plan = _REQUEST_PLANS.get(cls)
+    if plan is None:
+        plan = _REQUEST_PLANS[cls] = RequestPlan(cls)
+    return plan
@@ -2,11 +2,25 @@
 
 import asyncio
 import random
+import threading
 import time
-from typing import List
+import uuid
+from email.utils import parsedate_to_datetime
+from typing import List, Mapping, Optional
 
 import httpx
 
+FULL_JITTER = "full"
+"""Sleep a random time between 0 and the exponential backoff."""
+
+DECORRELATED_JITTER = "decorrelated"
+"""Sleep a random time between the initial interval and 3 times the previous sleep."""
+
+IDEMPOTENCY_KEY_HEADER = "Idempotency-Key"
+"""Header making a POST safe to send again, the server applies it at most once."""
+
+IDEMPOTENT_METHODS = frozenset(["GET", "HEAD", "OPTIONS", "PUT", "DELETE"])
+
 
 class BackoffStrategy:
     initial_interval: int
@@ -31,22 +45,173 @@ class RetryConfig:
     strategy: str
     backoff: BackoffStrategy
     retry_connection_errors: bool
+    jitter: str
+    respect_retry_after: bool
 
     def __init__(
-        self, strategy: str, backoff: BackoffStrategy, retry_connection_errors: bool
+        self,
+        strategy: str,
+        backoff: BackoffStrategy,
+        retry_connection_errors: bool,
+        jitter: str = FULL_JITTER,
+        respect_retry_after: bool = True,
     ):
         self.strategy = strategy
         self.backoff = backoff
         self.retry_connection_errors = retry_connection_errors
+        self.jitter = jitter
+        self.respect_retry_after = respect_retry_after
+
+
+class RetryBudget:
+    """Token bucket bounding the retries of a client to a fraction of its requests.
+
+    Every request deposits `deposit_per_request` tokens, up to `capacity`, and every
+    retry withdraws one. When the bucket is empty, failures are returned instead of
+    retried, so stations failing together don't multiply the load on a degraded server.
+    """
+
+    def __init__(self, capacity: float = 10.0, deposit_per_request: float = 0.1):
+        self.capacity = capacity
+        self.deposit_per_request = deposit_per_request
+        self._tokens = capacity
+        self._lock = threading.Lock()
+
+    @property
+    def tokens(self) -> float:
+        return self._tokens
+
+    def deposit(self):
+        with self._lock:
+            self._tokens = min(self.capacity, self._tokens + self.deposit_per_request)
+
+    def withdraw(self) -> bool:
+        """Takes the token of one retry, returns False if none is left."""
+        with self._lock:
+            if self._tokens < 1:
+                return False
+            self._tokens -= 1
+            return True
+
+
+def is_idempotent(method: str, headers: Mapping[str, str]) -> bool:
+    """Whether a request can be sent again without risking a duplicate side effect."""
+    return method.upper() in IDEMPOTENT_METHODS or IDEMPOTENCY_KEY_HEADER in headers
+
+
+def set_idempotency_key(request: httpx.Request) -> httpx.Request:
+    """Keys a request with a random key unless the caller set one.
+
+    Set once per operation, before the retry loop: the retries of the request
+    send the same key and are applied once by the server, while another call
+    with the same body is a new operation."""
+    if IDEMPOTENCY_KEY_HEADER not in request.headers:
+        request.headers[IDEMPOTENCY_KEY_HEADER] = uuid.uuid4().hex
+    return request
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Returns the seconds to wait from a `Retry-After` value, in seconds or as an HTTP date."""
+    if not value:
+        return None
+    try:
+        delay = float(value)
+    except ValueError:
+        try:
+            delay = parsedate_to_datetime(value).timestamp() - time.time()
+        except (TypeError, ValueError):
+            return None
+    return max(delay, 0.0)
 
 
 class Retries:
+    """Retry policy of one request: what to retry, when, and within which budget.
+
+    Args:
+        config: Backoff, jitter and `Retry-After` settings.
+        status_codes: Response status codes to retry, e.g. "429" or "5XX".
+        idempotent: Whether the request may be sent twice. Non-idempotent requests
+            are only retried when the server can't have processed them: connection
+            failures before the request was sent, and 429 responses.
+        budget: Retry token bucket of the client sending the request.
+    """
+
     config: RetryConfig
     status_codes: List[str]
+    idempotent: bool
+    budget: Optional[RetryBudget]
 
-    def __init__(self, config: RetryConfig, status_codes: List[str]):
+    def __init__(
+        self,
+        config: RetryConfig,
+        status_codes: List[str],
+        idempotent: bool = True,
+        budget: Optional[RetryBudget] = None,
+    ):
         self.config = config
         self.status_codes = status_codes
+        self.idempotent = idempotent
+        self.budget = budget
+        self._previous_sleep = config.backoff.initial_interval / 1000
+
+    def retries_status(self, status_code: int) -> bool:
+        if not self.idempotent and status_code != 429:
+            return False
+
+        for code in self.status_codes:
+            if "X" in code.upper():
+                code_range = int(code[0])
+
+                status_major = status_code / 100
+
+                if code_range <= status_major < code_range + 1:
+                    return True
+            elif status_code == int(code):
+                return True
+        return False
+
+    def retries_error(self, sent: bool) -> bool:
+        """Whether to retry a connection error or timeout, `sent` once the request went out."""
+        return self.config.retry_connection_errors and (self.idempotent or not sent)
+
+    def next_sleep(
+        self,
+        attempt: int,
+        elapsed: float,
+        headers: Optional[Mapping[str, str]] = None,
+    ) -> Optional[float]:
+        """
+        Returns the seconds to sleep before retry number `attempt` (from 0), or None to give up.
+
+        Args:
+            attempt: Number of retries done so far.
+            elapsed: Seconds since the first attempt.
+            headers: Headers of the failed response, if any.
+        """
+        backoff = self.config.backoff
+        sleep = None
+        if self.config.respect_retry_after and headers is not None:
+            sleep = parse_retry_after(headers.get("retry-after"))
+        if sleep is None:
+            sleep = self._backoff_sleep(attempt)
+
+        if (elapsed + sleep) * 1000 > backoff.max_elapsed_time:
+            return None
+        if self.budget is not None and not self.budget.withdraw():
+            return None
+        return sleep
+
+    def _backoff_sleep(self, attempt: int) -> float:
+        backoff = self.config.backoff
+        initial = backoff.initial_interval / 1000
+        cap = backoff.max_interval / 1000
+
+        if self.config.jitter == DECORRELATED_JITTER:
+            sleep = min(cap, random.uniform(initial, self._previous_sleep * 3))
+            self._previous_sleep = sleep
+            return sleep
+
+        return random.uniform(0, min(cap, initial * backoff.exponent**attempt))
 
 
 class TemporaryError(Exception):
@@ -71,26 +236,16 @@ def retry(func, retries: Retries):
             try:
                 res = func()
 
-                for code in retries.status_codes:
-                    if "X" in code.upper():
-                        code_range = int(code[0])
-
-                        status_major = res.status_code / 100
-
-                        if code_range <= status_major < code_range + 1:
-                            raise TemporaryError(res)
-                    else:
-                        parsed_code = int(code)
-
-                        if res.status_code == parsed_code:
-                            raise TemporaryError(res)
+                if retries.retries_status(res.status_code):
+                    raise TemporaryError(res)
             except httpx.ConnectError as exception:
-                if retries.config.retry_connection_errors:
+                if retries.retries_error(sent=False):
                     raise
 
                 raise PermanentError(exception) from exception
             except httpx.TimeoutException as exception:
-                if retries.config.retry_connection_errors:
+                sent = not isinstance(exception, httpx.ConnectTimeout)
+                if retries.retries_error(sent=sent):
                     raise
 
                 raise PermanentError(exception) from exception
@@ -107,6 +262,7 @@ def retry(func, retries: Retries):
             retries.config.backoff.max_interval,
             retries.config.backoff.exponent,
             retries.config.backoff.max_elapsed_time,
+            policy=retries,
         )
 
     return func()
@@ -120,26 +276,16 @@ async def retry_async(func, retries: Retries):
             try:
                 res = await func()
 
-                for code in retries.status_codes:
-                    if "X" in code.upper():
-                        code_range = int(code[0])
-
-                        status_major = res.status_code / 100
-
-                        if code_range <= status_major < code_range + 1:
-                            raise TemporaryError(res)
-                    else:
-                        parsed_code = int(code)
-
-                        if res.status_code == parsed_code:
-                            raise TemporaryError(res)
+                if retries.retries_status(res.status_code):
+                    raise TemporaryError(res)
             except httpx.ConnectError as exception:
-                if retries.config.retry_connection_errors:
+                if retries.retries_error(sent=False):
                     raise
 
                 raise PermanentError(exception) from exception
             except httpx.TimeoutException as exception:
-                if retries.config.retry_connection_errors:
+                sent = not isinstance(exception, httpx.ConnectTimeout)
+                if retries.retries_error(sent=sent):
                     raise
 
                 raise PermanentError(exception) from exception
@@ -156,19 +302,33 @@ async def retry_async(func, retries: Retries):
             retries.config.backoff.max_interval,
             retries.config.backoff.exponent,
             retries.config.backoff.max_elapsed_time,
+            policy=retries,
         )
 
     return await func()
 
 
+def _default_policy(
+    initial_interval: int, max_interval: int, exponent: float, max_elapsed_time: int
+) -> Retries:
+    backoff = BackoffStrategy(initial_interval, max_interval, exponent, max_elapsed_time)
+    return Retries(RetryConfig("backoff", backoff, True), [])
+
+
 def retry_with_backoff(
     func,
     initial_interval=500,
     max_interval=60000,
     exponent=1.5,
     max_elapsed_time=3600000,
+    policy: Optional[Retries] = None,
 ):
-    start = round(time.time() * 1000)
+    if policy is None:
+        policy = _default_policy(initial_interval, max_interval, exponent, max_elapsed_time)
+    if policy.budget is not None:
+        policy.budget.deposit()
+
+    start = time.monotonic()
     retries = 0
 
     while True:
@@ -177,14 +337,19 @@ def retry_with_backoff(
         except PermanentError as exception:
             raise exception.inner
         except Exception as exception:  # pylint: disable=broad-exception-caught
-            now = round(time.time() * 1000)
-            if now - start > max_elapsed_time:
-                if isinstance(exception, TemporaryError):
-                    return exception.response
+            response = (
+                exception.response if isinstance(exception, TemporaryError) else None
+            )
+            sleep = policy.next_sleep(
+                retries,
+                time.monotonic() - start,
+                response.headers if response is not None else None,
+            )
+            if sleep is None:
+                if response is not None:
+                    return response
 
                 raise
-            sleep = (initial_interval / 1000) * exponent**retries + random.uniform(0, 1)
-            sleep = min(sleep, max_interval / 1000)
             time.sleep(sleep)
             retries += 1
 
@@ -195,8 +360,14 @@ async def retry_with_backoff_async(
     max_interval=60000,
     exponent=1.5,
     max_elapsed_time=3600000,
+    policy: Optional[Retries] = None,
 ):
-    start = round(time.time() * 1000)
+    if policy is None:
+        policy = _default_policy(initial_interval, max_interval, exponent, max_elapsed_time)
+    if policy.budget is not None:
+        policy.budget.deposit()
+
+    start = time.monotonic()
     retries = 0
 
     while True:
@@ -205,13 +376,18 @@ async def retry_with_backoff_async(
         except PermanentError as exception:
             raise exception.inner
         except Exception as exception:  # pylint: disable=broad-exception-caught
-            now = round(time.time() * 1000)
-            if now - start > max_elapsed_time:
-                if isinstance(exception, TemporaryError):
-                    return exception.response
+            response = (
+                exception.response if isinstance(exception, TemporaryError) else None
+            )
+            sleep = policy.next_sleep(
+                retries,
+                time.monotonic() - start,
+                response.headers if response is not None else None,
+            )
+            if sleep is None:
+                if response is not None:
+                    return response
 
                 raise
-            sleep = (initial_interval / 1000) * exponent**retries + random.uniform(0, 1)
-            sleep = min(sleep, max_interval / 1000)
             await asyncio.sleep(sleep)
             retries += 1
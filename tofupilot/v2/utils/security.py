@@ -1,6 +1,8 @@
 """Code generated by Speakeasy (https://speakeasy.com). DO NOT EDIT."""
 
 import base64
+import threading
+import time
 
 from typing import (
     Any,
@@ -70,6 +72,62 @@ def get_security_from_env(security: Any, security_class: Any) -> Optional[BaseMo
     return security_class(**security_dict) if security_dict else None
 
 
+_SecurityEntry = Tuple[Optional[BaseModel], Dict[str, str], Dict[str, List[str]]]
+
+
+class SecurityCache:
+    """Auth headers and query params of a client, resolved once instead of per request.
+
+    They are resolved again when the security changes, e.g. when an `api_key`
+    callable returns a rotated key. Without `ttl_ms` the callable is still called
+    for every request, with `ttl_ms` at most once per TTL, for providers that
+    fetch or refresh tokens. `invalidate` makes the next request call it again.
+    """
+
+    def __init__(self, ttl_ms: Optional[int] = None):
+        self.ttl_ms = ttl_ms
+        self._lock = threading.Lock()
+        self._source: Any = None
+        self._expires = 0.0
+        # Swapped as a whole, so concurrent requests never mix two keys
+        self._entry: Optional[_SecurityEntry] = None
+
+    def get(
+        self, security: Any, security_class: Any
+    ) -> Tuple[Dict[str, str], Dict[str, List[str]]]:
+        """Returns the headers and query params of `security`, not to be modified."""
+        if not callable(security):
+            return self._resolve(security, security_class)
+        if self.ttl_ms is None:
+            return self._resolve(security(), security_class)
+
+        with self._lock:
+            entry = self._entry
+            now = time.monotonic()
+            if entry is None or security is not self._source or now >= self._expires:
+                self._resolve(security(), security_class)
+                self._source = security
+                self._expires = now + self.ttl_ms / 1000
+                entry = self._entry
+            assert entry is not None
+            return entry[1], entry[2]
+
+    def invalidate(self) -> None:
+        """Resolves the security again on the next request, calling the `api_key` callable."""
+        with self._lock:
+            self._entry = None
+
+    def _resolve(
+        self, security: Any, security_class: Any
+    ) -> Tuple[Dict[str, str], Dict[str, List[str]]]:
+        security = get_security_from_env(security, security_class)
+        entry = self._entry
+        if entry is None or (security is not entry[0] and security != entry[0]):
+            entry = (security, *get_security(security))
+            self._entry = entry
+        return entry[1], entry[2]
+
+
 def _parse_security_option(
     headers: Dict[str, str], query_params: Dict[str, List[str]], option: Any
 ):
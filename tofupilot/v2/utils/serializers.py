@@ -2,7 +2,6 @@
 
 from decimal import Decimal
 import functools
-import json
 import typing
 from typing import Any, Dict, List, Tuple, Union, get_args
 import typing_extensions
@@ -10,7 +9,7 @@ from typing_extensions import get_origin
 
 import httpx
 from pydantic import ConfigDict, create_model
-from pydantic_core import from_json
+from pydantic_core import from_json, to_json
 
 from ..types.basemodel import BaseModel, Nullable, OptionalNullable, Unset
 
@@ -141,11 +140,7 @@ def unmarshal_json(raw, typ: Any) -> Any:
 
 
 def unmarshal(val, typ: Any) -> Any:
-    unmarshaller = create_model(
-        "Unmarshaller",
-        body=(typ, ...),
-        __config__=ConfigDict(populate_by_name=True, arbitrary_types_allowed=True),
-    )
+    unmarshaller = _get_body_model("Unmarshaller", typ)
 
     m = unmarshaller(body=val)
 
@@ -157,20 +152,55 @@ def marshal_json(val, typ):
     if is_nullable(typ) and val is None:
         return "null"
 
-    marshaller = create_model(
-        "Marshaller",
-        body=(typ, ...),
-        __config__=ConfigDict(populate_by_name=True, arbitrary_types_allowed=True),
-    )
+    marshaller = _get_body_model("Marshaller", typ)
 
     m = marshaller(body=val)
 
-    d = m.model_dump(by_alias=True, mode="json", exclude_none=True)
+    # Unset fields are left out by the generated serializers anyway, excluding
+    # them natively skips serializing every UNSET default
+    d = m.model_dump(by_alias=True, mode="json", exclude_none=True, exclude_unset=True)
 
     if len(d) == 0:
         return ""
 
-    return json.dumps(d[next(iter(d))], separators=(",", ":"))
+    # Compact like json.dumps with separators=(",", ":"), with numbers formatted in
+    # Rust: several times faster on bodies carrying long measurement series
+    return to_json(d[next(iter(d))]).decode("utf-8")
+
+
+BODY_MODEL_CACHE_SIZE = 512
+"""Maximum number of compiled models kept, marshallers and unmarshallers sharing one LRU cache."""
+
+
+def _create_body_model(name: str, typ: Any) -> Any:
+    return create_model(
+        name,
+        body=(typ, ...),
+        __config__=ConfigDict(populate_by_name=True, arbitrary_types_allowed=True),
+    )
+
+
+@functools.lru_cache(maxsize=BODY_MODEL_CACHE_SIZE)
+def _create_body_model_cached(name: str, typ: Any) -> Any:
+    return _create_body_model(name, typ)
+
+
+def _get_body_model(name: str, typ: Any) -> Any:
+    """
+    Returns the single-field wrapper model used to validate and dump values of
+    `typ`. Building a pydantic model compiles a new core schema, which costs far
+    more than the (de)serialization itself, so models are cached per type with
+    LRU eviction. Unhashable type annotations fall back to an uncached build.
+    """
+    try:
+        return _create_body_model_cached(name, typ)
+    except TypeError:
+        return _create_body_model(name, typ)
+
+
+def clear_body_model_cache() -> None:
+    """Drops every cached (un)marshaller model."""
+    _create_body_model_cached.cache_clear()
 
 
 def is_nullable(field):
@@ -0,0 +1,325 @@
+"""Transfers of attachment files to and from storage.
+
+Attachments are uploaded to and downloaded from pre-signed URLs of the storage
+host, not the API. A `StorageClient` keeps its own pooled clients for that
+host, so consecutive and concurrent transfers share warm connections, and
+retries failed transfers: a PUT to a pre-signed URL replaces the whole object,
+so sending it again is safe.
+
+Files are hashed while they stream, and checked against the ETag storage
+returns when it is the MD5 of the object (single part objects without KMS
+encryption). A mismatch raises `ChecksumMismatchError`.
+
+    client = TofuPilot(
+        storage=StorageClient(transport=TransportConfig(max_connections=32))
+    )
+"""
+
+import asyncio
+import hashlib
+import os
+import re
+from pathlib import Path
+from typing import Any, AsyncIterator, Iterator, Mapping, Optional, Set
+
+import httpx
+
+from tofupilot.v2.errors.checksum_mismatch_error import ChecksumMismatchError
+
+from .retries import BackoffStrategy, Retries, RetryConfig, retry, retry_async
+from .transport import Timeouts, TransportConfig
+
+CHUNK_SIZE = 1024 * 1024
+"""Size of the blocks files are streamed in, in bytes."""
+
+RETRY_STATUS_CODES = ["408", "429", "5XX"]
+
+DEFAULT_RETRY_CONFIG = RetryConfig(
+    "backoff", BackoffStrategy(500, 10_000, 2.0, 60_000), True
+)
+
+DEFAULT_TRANSPORT = TransportConfig(
+    max_connections=16,
+    max_keepalive_connections=16,
+    keepalive_expiry_ms=60_000,
+    timeouts=Timeouts(connect_ms=10_000, read_ms=60_000, write_ms=60_000),
+)
+"""Timeouts bound the wait for each block, not whole transfers of large files."""
+
+_MD5_ETAG = re.compile(r"[0-9a-fA-F]{32}")
+
+
+def _md5() -> Any:
+    return hashlib.md5(usedforsecurity=False)
+
+
+def _expected_md5(resp: httpx.Response) -> Optional[str]:
+    """The MD5 of the object from the response ETag, None if the ETag is something else."""
+    if resp.headers.get("x-amz-server-side-encryption") == "aws:kms":
+        return None
+    etag = resp.headers.get("etag", "").removeprefix("W/").strip('"')
+    return etag.lower() if _MD5_ETAG.fullmatch(etag) else None
+
+
+def iter_file_chunks(f) -> Iterator[bytes]:
+    """Yield the content of a binary file object in `CHUNK_SIZE` blocks."""
+    while True:
+        chunk = f.read(CHUNK_SIZE)
+        if not chunk:
+            return
+        yield chunk
+
+
+async def aiter_file_chunks(f) -> AsyncIterator[bytes]:
+    """Async version of `iter_file_chunks`, reading in a worker thread."""
+    while True:
+        chunk = await asyncio.to_thread(f.read, CHUNK_SIZE)
+        if not chunk:
+            return
+        yield chunk
+
+
+def _hashed(chunks: Iterator[bytes], md5: Any) -> Iterator[bytes]:
+    for chunk in chunks:
+        md5.update(chunk)
+        yield chunk
+
+
+async def _ahashed(chunks: AsyncIterator[bytes], md5: Any) -> AsyncIterator[bytes]:
+    async for chunk in chunks:
+        md5.update(chunk)
+        yield chunk
+
+
+def _upload_headers(f, content_type: str) -> Mapping[str, str]:
+    # An explicit Content-Length keeps the streamed body a plain (non-chunked)
+    # PUT, which pre-signed storage URLs require.
+    return {
+        "Content-Type": content_type,
+        "Content-Length": str(os.fstat(f.fileno()).st_size),
+    }
+
+
+def _open_download(resp: httpx.Response, dest: Path, offset: int, md5: Any):
+    """Open `dest` to write a download response to, or None if there is nothing left to fetch.
+
+    When resuming, the kept first `offset` bytes are hashed into `md5`."""
+    if offset and resp.status_code == 416:
+        # Requested range starts at the end of the file: nothing left to fetch
+        return None
+    if resp.status_code not in (200, 206):
+        raise RuntimeError(f"Download failed with status {resp.status_code}")
+
+    resumed = resp.status_code == 206
+    f = open(dest, "r+b" if resumed and dest.exists() else "wb")
+    if resumed:
+        if md5 is not None:
+            remaining = offset
+            while remaining:
+                chunk = f.read(min(CHUNK_SIZE, remaining))
+                if not chunk:
+                    break
+                md5.update(chunk)
+                remaining -= len(chunk)
+        f.seek(offset)
+        f.truncate()
+    return f
+
+
+class StorageClient:
+    """
+    Pooled clients for the transfers of attachment files to and from storage.
+
+    Args:
+        transport: Pool limits and timeouts of the clients, `DEFAULT_TRANSPORT` when None.
+        retry_config: Retries of failed transfers, disabled when None.
+        verify_checksums: Check transferred files against the MD5 storage reports.
+        client: The HTTP client to use for synchronous transfers, created on first use when None.
+        async_client: The async HTTP client to use for asynchronous transfers, created on first use when None.
+    """
+
+    client: Optional[httpx.Client]
+    async_client: Optional[httpx.AsyncClient]
+
+    def __init__(
+        self,
+        transport: Optional[TransportConfig] = None,
+        retry_config: Optional[RetryConfig] = DEFAULT_RETRY_CONFIG,
+        verify_checksums: bool = True,
+        client: Optional[httpx.Client] = None,
+        async_client: Optional[httpx.AsyncClient] = None,
+    ):
+        self.transport = transport if transport is not None else DEFAULT_TRANSPORT
+        self.retry_config = retry_config
+        self.verify_checksums = verify_checksums
+        self.client = client
+        self.client_supplied = client is not None
+        self.async_client = async_client
+        self.async_client_supplied = async_client is not None
+        self._closing: Set["asyncio.Task[None]"] = set()
+
+    def _client(self) -> httpx.Client:
+        if self.client is None:
+            self.client = self.transport.client()
+        return self.client
+
+    def _async_client(self) -> httpx.AsyncClient:
+        if self.async_client is None:
+            self.async_client = self.transport.async_client()
+        return self.async_client
+
+    def _retries(self) -> Optional[Retries]:
+        if self.retry_config is None:
+            return None
+        return Retries(self.retry_config, RETRY_STATUS_CODES)
+
+    def _verify(self, url: str, resp: httpx.Response, md5: Any) -> None:
+        expected = _expected_md5(resp) if md5 is not None else None
+        if expected is not None and expected != md5.hexdigest():
+            raise ChecksumMismatchError(url, expected, md5.hexdigest())
+
+    def upload(self, url: str, file: Path, content_type: str) -> None:
+        """Upload `file` to a pre-signed URL, streaming it in chunks."""
+        client = self._client()
+        md5 = None
+
+        with open(file, "rb") as f:
+            headers = _upload_headers(f, content_type)
+
+            def do() -> httpx.Response:
+                nonlocal md5
+                f.seek(0)
+                md5 = _md5() if self.verify_checksums else None
+                chunks = iter_file_chunks(f)
+                return client.put(
+                    url,
+                    content=_hashed(chunks, md5) if md5 is not None else chunks,
+                    headers=headers,
+                )
+
+            retries = self._retries()
+            resp = retry(do, retries) if retries is not None else do()
+
+        if resp.status_code != 200:
+            raise RuntimeError(f"File upload failed with status {resp.status_code}")
+        self._verify(url, resp, md5)
+
+    async def upload_async(self, url: str, file: Path, content_type: str) -> None:
+        """Async version of `upload`. The file is read in a worker thread."""
+        client = self._async_client()
+        md5 = None
+
+        with open(file, "rb") as f:
+            headers = _upload_headers(f, content_type)
+
+            async def do() -> httpx.Response:
+                nonlocal md5
+                await asyncio.to_thread(f.seek, 0)
+                md5 = _md5() if self.verify_checksums else None
+                chunks = aiter_file_chunks(f)
+                return await client.put(
+                    url,
+                    content=_ahashed(chunks, md5) if md5 is not None else chunks,
+                    headers=headers,
+                )
+
+            retries = self._retries()
+            resp = await retry_async(do, retries) if retries is not None else await do()
+
+        if resp.status_code != 200:
+            raise RuntimeError(f"File upload failed with status {resp.status_code}")
+        self._verify(url, resp, md5)
+
+    def download(self, url: str, dest: Path, offset: int = 0) -> Path:
+        """Download a pre-signed URL to `dest`, from byte `offset` on when resuming."""
+        client = self._client()
+        request = client.build_request(
+            "GET", url, headers={"Range": f"bytes={offset}-"} if offset else None
+        )
+
+        def do() -> httpx.Response:
+            resp = client.send(request, stream=True)
+            if resp.status_code not in (200, 206):
+                # Error bodies are small, read them to give the connection back
+                resp.read()
+            return resp
+
+        retries = self._retries()
+        resp = retry(do, retries) if retries is not None else do()
+        try:
+            md5 = _md5() if self.verify_checksums else None
+            f = _open_download(resp, dest, offset, md5)
+            if f is None:
+                return dest
+            with f:
+                for chunk in resp.iter_bytes(CHUNK_SIZE):
+                    f.write(chunk)
+                    if md5 is not None:
+                        md5.update(chunk)
+        finally:
+            resp.close()
+        self._verify(url, resp, md5)
+        return dest
+
+    async def download_async(self, url: str, dest: Path, offset: int = 0) -> Path:
+        """Async version of `download`. The file is written in a worker thread."""
+        client = self._async_client()
+        request = client.build_request(
+            "GET", url, headers={"Range": f"bytes={offset}-"} if offset else None
+        )
+
+        async def do() -> httpx.Response:
+            resp = await client.send(request, stream=True)
+            if resp.status_code not in (200, 206):
+                await resp.aread()
+            return resp
+
+        retries = self._retries()
+        resp = await retry_async(do, retries) if retries is not None else await do()
+        try:
+            md5 = _md5() if self.verify_checksums else None
+            f = await asyncio.to_thread(_open_download, resp, dest, offset, md5)
+            if f is None:
+                return dest
+            with f:
+                async for chunk in resp.aiter_bytes(CHUNK_SIZE):
+                    await asyncio.to_thread(f.write, chunk)
+                    if md5 is not None:
+                        md5.update(chunk)
+        finally:
+            await resp.aclose()
+        self._verify(url, resp, md5)
+        return dest
+
+    def close(self) -> None:
+        """
+        Closes the clients created by the storage client, they are created again on next use.
+
+        Called from a running event loop, the async client is closed by a task
+        scheduled on that loop: await `aclose()` there instead to wait for it.
+        """
+        if self.client is not None and not self.client_supplied:
+            client, self.client = self.client, None
+            client.close()
+
+        if self.async_client is not None and not self.async_client_supplied:
+            async_client, self.async_client = self.async_client, None
+            try:
+                loop = asyncio.get_running_loop()
+            except RuntimeError:
+                try:
+                    asyncio.run(async_client.aclose())
+                except RuntimeError:
+                    # best effort
+                    pass
+            else:
+                # The loop only keeps a weak reference to its tasks
+                task = loop.create_task(async_client.aclose())
+                self._closing.add(task)
+                task.add_done_callback(self._closing.discard)
+
+    async def aclose(self) -> None:
+        """Closes the async client created by the storage client."""
+        if self.async_client is not None and not self.async_client_supplied:
+            async_client, self.async_client = self.async_client, None
+            await async_client.aclose()
@@ -0,0 +1,125 @@
+"""Streaming JSON encoding of large request bodies.
+
+`marshal_json` renders a whole body as one string, after dumping the whole
+model into nested dicts, so a run with many phases peaks at several times its
+JSON size. A `JsonStream` renders the model without its list fields, then
+renders the items of these lists one at a time, so only one phase (or one batch
+of logs) is held as JSON at once:
+
+    client = TofuPilot(stream_request_bodies=True)
+
+Streamed bodies are sent with `Transfer-Encoding: chunked`. The stream can be
+iterated several times, so requests sending one can be retried.
+"""
+
+import asyncio
+import zlib
+from typing import Any, AsyncIterator, Iterator, Mapping, Optional
+
+from .compression import GZIP, GZIP_LEVEL, ZSTD, CompressionConfig, _zstd_stream
+from .serializers import marshal_json
+
+STREAM_CHUNK_SIZE = 64 * 1024
+"""Rendered items are buffered until this many bytes before being sent."""
+
+
+class JsonStream:
+    """JSON body of `model`, rendering the lists in `streamed_fields` item by item.
+
+    `streamed_fields` maps field names to the type of their items.
+    """
+
+    def __init__(
+        self,
+        model: Any,
+        typ: Any,
+        streamed_fields: Mapping[str, Any],
+        chunk_size: int = STREAM_CHUNK_SIZE,
+    ):
+        self.model = model
+        self.typ = typ
+        self.streamed_fields = streamed_fields
+        self.chunk_size = chunk_size
+        self.compression: Optional[CompressionConfig] = None
+
+    def compress(self, config: Optional[CompressionConfig]) -> Optional[str]:
+        """Compresses the stream as it is rendered, returns its content encoding."""
+        if config is None:
+            return None
+        self.compression = config
+        if config.encoding == ZSTD and _zstd_stream() is not None:
+            return ZSTD
+        return GZIP
+
+    def __iter__(self) -> Iterator[bytes]:
+        if self.compression is None:
+            yield from self._chunks()
+            return
+
+        compressor = self._compressor()
+        for chunk in self._chunks():
+            compressed = compressor.compress(chunk)
+            if compressed:
+                yield compressed
+        yield compressor.flush()
+
+    def async_iterable(self) -> "AsyncJsonStream":
+        """The same stream, for requests sent by an async client."""
+        return AsyncJsonStream(self)
+
+    def _compressor(self) -> Any:
+        config = self.compression
+        assert config is not None
+        if config.encoding == ZSTD:
+            zstd = _zstd_stream()
+            if zstd is not None:
+                return zstd(config.level)
+        level = config.level if config.encoding == GZIP else None
+        # wbits=31 writes a gzip container, with a zero mtime like compress_body
+        return zlib.compressobj(
+            GZIP_LEVEL if level is None else level, zlib.DEFLATED, 31
+        )
+
+    def _chunks(self) -> Iterator[bytes]:
+        fields = type(self.model).model_fields
+        items = {}
+        for name in self.streamed_fields:
+            value = getattr(self.model, name)
+            # Like exclude_none in marshal_json, unset lists are left out
+            if value is not None:
+                items[fields[name].alias or name] = (name, value)
+
+        head = marshal_json(
+            self.model.model_copy(update=dict.fromkeys(self.streamed_fields)),
+            self.typ,
+        )
+        buffer = bytearray(head[:-1].encode("utf-8"))
+        separator = b"," if len(head) > 2 else b""
+
+        for key, (name, values) in items.items():
+            buffer += separator + f'"{key}":['.encode("utf-8")
+            separator = b","
+            item_type = self.streamed_fields[name]
+            for index, value in enumerate(values):
+                if index:
+                    buffer += b","
+                buffer += marshal_json(value, item_type).encode("utf-8")
+                if len(buffer) >= self.chunk_size:
+                    yield bytes(buffer)
+                    buffer.clear()
+            buffer += b"]"
+
+        buffer += b"}"
+        yield bytes(buffer)
+
+
+class AsyncJsonStream:
+    """Async iterable over a `JsonStream`, yielding to the event loop between chunks."""
+
+    def __init__(self, stream: JsonStream):
+        self.stream = stream
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        for chunk in self.stream:
+            yield chunk
+            await asyncio.sleep(0)
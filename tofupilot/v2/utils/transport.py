@@ -0,0 +1,143 @@
+"""HTTP transport configuration of the SDK clients.
+
+By default the SDK sends requests over HTTP/1.1 with httpx's default pool, and
+without timeouts unless `timeout_ms` is set. A `TransportConfig` sizes the
+connection pool, enables HTTP/2 multiplexing and sets separate connect, read,
+write and pool timeouts, for all operations or per operation:
+
+    client = TofuPilot(
+        transport=TransportConfig(
+            http2=True,
+            max_connections=200,
+            timeouts=Timeouts(connect_ms=5_000, read_ms=30_000),
+            operation_timeouts={
+                "run-create": Timeouts(write_ms=300_000),
+                "station-getCurrent": Timeouts(read_ms=2_000),
+            },
+        )
+    )
+
+Operations are named by their operation id (`run-create`, `unit-get`...). Their
+timeouts fall back field by field on `timeouts`. An explicit `timeout_ms`, per
+call or for the client, takes precedence over both.
+
+HTTP/2 needs the `h2` package (`pip install tofupilot[http2]`).
+"""
+
+from typing import Any, Mapping, Optional
+
+import httpx
+
+
+class Timeouts:
+    """Timeouts of the phases of a request, in milliseconds, None for no limit.
+
+    Args:
+        connect_ms: Time to establish a connection.
+        read_ms: Time between two chunks of the response.
+        write_ms: Time between two chunks of the request body.
+        pool_ms: Time to wait for a connection from the pool.
+    """
+
+    connect_ms: Optional[int]
+    read_ms: Optional[int]
+    write_ms: Optional[int]
+    pool_ms: Optional[int]
+
+    def __init__(
+        self,
+        connect_ms: Optional[int] = None,
+        read_ms: Optional[int] = None,
+        write_ms: Optional[int] = None,
+        pool_ms: Optional[int] = None,
+    ):
+        self.connect_ms = connect_ms
+        self.read_ms = read_ms
+        self.write_ms = write_ms
+        self.pool_ms = pool_ms
+
+    def fallback_to(self, default: "Timeouts") -> "Timeouts":
+        """These timeouts, with the unset ones taken from `default`."""
+        return Timeouts(
+            default.connect_ms if self.connect_ms is None else self.connect_ms,
+            default.read_ms if self.read_ms is None else self.read_ms,
+            default.write_ms if self.write_ms is None else self.write_ms,
+            default.pool_ms if self.pool_ms is None else self.pool_ms,
+        )
+
+    def to_httpx(self) -> httpx.Timeout:
+        return httpx.Timeout(
+            connect=_seconds(self.connect_ms),
+            read=_seconds(self.read_ms),
+            write=_seconds(self.write_ms),
+            pool=_seconds(self.pool_ms),
+        )
+
+
+def _seconds(ms: Optional[int]) -> Optional[float]:
+    return ms / 1000 if ms is not None else None
+
+
+class TransportConfig:
+    """
+    Connection pool, protocol and timeouts of the clients created by the SDK.
+
+    Args:
+        http2: Multiplex concurrent requests over HTTP/2 connections.
+        max_connections: Connections open at once, further requests wait for one.
+        max_keepalive_connections: Idle connections kept open for reuse.
+        keepalive_expiry_ms: Time after which an idle connection is closed.
+        timeouts: Timeouts of every operation.
+        operation_timeouts: Timeouts of single operations, by operation id.
+    """
+
+    def __init__(
+        self,
+        http2: bool = False,
+        max_connections: Optional[int] = 100,
+        max_keepalive_connections: Optional[int] = 20,
+        keepalive_expiry_ms: Optional[int] = 5_000,
+        timeouts: Optional[Timeouts] = None,
+        operation_timeouts: Optional[Mapping[str, Timeouts]] = None,
+    ):
+        self.http2 = http2
+        self.max_connections = max_connections
+        self.max_keepalive_connections = max_keepalive_connections
+        self.keepalive_expiry_ms = keepalive_expiry_ms
+        self.timeouts = timeouts if timeouts is not None else Timeouts()
+        self._timeout = self.timeouts.to_httpx()
+        self._operation_timeouts = {
+            operation_id: operation.fallback_to(self.timeouts).to_httpx()
+            for operation_id, operation in (operation_timeouts or {}).items()
+        }
+
+    def limits(self) -> httpx.Limits:
+        return httpx.Limits(
+            max_connections=self.max_connections,
+            max_keepalive_connections=self.max_keepalive_connections,
+            keepalive_expiry=_seconds(self.keepalive_expiry_ms),
+        )
+
+    def client(self, **kwargs: Any) -> httpx.Client:
+        """A client with this configuration, `kwargs` are passed to `httpx.Client`."""
+        return httpx.Client(
+            http2=self.http2, limits=self.limits(), timeout=self._timeout, **kwargs
+        )
+
+    def async_client(self, **kwargs: Any) -> httpx.AsyncClient:
+        """An async client with this configuration, `kwargs` are passed to `httpx.AsyncClient`."""
+        return httpx.AsyncClient(
+            http2=self.http2, limits=self.limits(), timeout=self._timeout, **kwargs
+        )
+
+    def timeout(self) -> httpx.Timeout:
+        """Timeout of requests without a `timeout_ms`."""
+        return self._timeout
+
+    def set_operation_timeout(self, request: httpx.Request, operation_id: str) -> None:
+        """Applies the timeouts of `operation_id` to a request without a `timeout_ms`."""
+        timeout = self._operation_timeouts.get(operation_id)
+        if timeout is None:
+            return
+        if request.extensions.get("timeout") == self._timeout.as_dict():
+            request.extensions["timeout"] = timeout.as_dict()
@@ -4,7 +4,6 @@ from decimal import Decimal
 from typing import (
     Any,
     Dict,
-    get_type_hints,
     List,
     Optional,
     Union,
@@ -18,6 +17,7 @@ from .metadata import (
     PathParamMetadata,
     find_field_metadata,
 )
+from .requestplan import request_plan
 from .values import (
     _get_serialized_params,
     _is_set,
@@ -57,18 +57,12 @@ def _populate_path_params(
     if not isinstance(path_params, BaseModel):
         return globals_already_populated
 
-    path_param_fields: Dict[str, FieldInfo] = path_params.__class__.model_fields
-    path_param_field_types = get_type_hints(path_params.__class__)
-    for name in path_param_fields:
+    for name, f_name, param_metadata, typ in request_plan(
+        path_params.__class__
+    ).path_params:
         if name in skip_fields:
             continue
 
-        field = path_param_fields[name]
-
-        param_metadata = find_field_metadata(field, PathParamMetadata)
-        if param_metadata is None:
-            continue
-
         param = getattr(path_params, name) if _is_set(path_params) else None
         param, global_found = _populate_from_globals(
             name, param, PathParamMetadata, gbls
@@ -79,11 +73,10 @@ def _populate_path_params(
         if not _is_set(param):
             continue
 
-        f_name = field.alias if field.alias is not None else name
         serialization = param_metadata.serialization
         if serialization is not None:
             serialized_params = _get_serialized_params(
-                param_metadata, f_name, param, path_param_field_types[name]
+                param_metadata, f_name, param, typ
             )
             for key, value in serialized_params.items():
                 path_param_values[key] = value